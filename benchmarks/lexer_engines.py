@@ -0,0 +1,90 @@
+"""
+Lexer engines
++++++++++++++
+
+Tokenize MIB files with ply lexer and with *FastLexer*, make sure both
+engines yield the same tokens, line numbers and errors for every lexer
+dialect, and tell how long each engine takes.
+
+Usage: python benchmarks/lexer_engines.py <MIB-FILE-OR-DIRECTORY> [...]
+"""  #
+import os
+import sys
+import time
+
+import ply.lex as lex
+from pysmi import error
+from pysmi.lexer.smi import lexerFactory
+
+if len(sys.argv) < 2:
+    sys.stderr.write(__doc__.split("\n\n")[-1])
+    sys.exit(1)
+
+mibs = {}
+
+for location in sys.argv[1:]:
+    if os.path.isdir(location):
+        paths = [os.path.join(location, x) for x in sorted(os.listdir(location))]
+
+    else:
+        paths = [location]
+
+    for path in paths:
+        if os.path.isfile(path):
+            with open(path, encoding="utf-8", errors="ignore") as f:
+                mibs[path] = f.read()
+
+dialects = {
+    "smi_v2": lexerFactory(),
+    "smi_v1_relaxed": lexerFactory(supportSmiV1Keywords=True),
+}
+
+
+def tokenize(lexer, data):
+    lexer.lineno = 1
+    lexer.begin("INITIAL")
+    lexer.input(data)
+
+    tokens = []
+
+    try:
+        for t in iter(lexer.token, None):
+            tokens.append((t.type, t.value, t.lineno, t.lexpos))
+
+    except (error.PySmiLexerError, lex.LexError) as exc:
+        tokens.append((exc.__class__.__name__, str(exc)))
+
+    return tokens
+
+
+failures = 0
+
+for dialect, lexerClass in dialects.items():
+    timings = {}
+    streams = {}
+
+    for engine in lexerClass.engines:
+        lexer = lexerClass(engine=engine).lexer
+
+        started = time.perf_counter()
+
+        streams[engine] = [tokenize(lexer, data) for data in mibs.values()]
+
+        timings[engine] = time.perf_counter() - started
+
+    for path, ply, fast in zip(mibs, streams["ply"], streams["fast"]):
+        if ply != fast:
+            failures += 1
+            print(f"{dialect}: {path}: token streams differ")
+
+    count = sum(len(x) for x in streams["ply"])
+
+    print(
+        f"{dialect}: {len(mibs)} MIBs, {count} tokens, "
+        + ", ".join(
+            f"{engine} {timing:.3f} s ({timing / count * 1e6:.2f} us/token)"
+            for engine, timing in timings.items()
+        )
+    )
+
+sys.exit(failures and 1 or 0)
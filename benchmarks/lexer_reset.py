@@ -0,0 +1,73 @@
+"""
+Lexer set up overhead
++++++++++++++++++++++
+
+Parse many small MIB modules with one parser, as *MibCompiler* does,
+and tell how much of the time goes to getting the lexer ready for the
+next module: resetting its state versus building it afresh, which is
+what the parser used to do after every module.
+
+Usage: python benchmarks/lexer_reset.py [NUMBER-OF-MIBS]
+"""  #
+import sys
+import textwrap
+import time
+
+from pysmi.parser.dialect import smi_v1_relaxed
+from pysmi.parser.smi import parserFactory
+
+MIB = textwrap.dedent(
+    """
+    TEST{index}-MIB DEFINITIONS ::= BEGIN
+    IMPORTS
+      OBJECT-TYPE, Integer32
+        FROM SNMPv2-SMI;
+
+    testRoot OBJECT IDENTIFIER ::= {{ 1 3 6 1 4 1 {index} }}
+
+    testValue OBJECT-TYPE
+        SYNTAX Integer32
+        ACCESS read-only
+        STATUS mandatory
+        DESCRIPTION "test"
+        ::= {{ testRoot 1 }}
+
+    END
+    """
+)
+
+count = len(sys.argv) > 1 and int(sys.argv[1]) or 1000
+
+mibs = [MIB.format(index=index) for index in range(count)]
+
+parser = parserFactory(**smi_v1_relaxed)()
+
+
+def rebuild():
+    parser.lexer.lexer = None
+    parser.lexer.reset()
+
+
+def measure(setup):
+    parseTime = setupTime = 0
+
+    for mib in mibs:
+        started = time.perf_counter()
+        parser.parser.parse(mib, lexer=parser.lexer.lexer)
+        parseTime += time.perf_counter() - started
+
+        started = time.perf_counter()
+        setup()
+        setupTime += time.perf_counter() - started
+
+    return parseTime, setupTime
+
+
+for title, setup in (("reset", parser.lexer.reset), ("rebuild", rebuild)):
+    parseTime, setupTime = measure(setup)
+
+    print(
+        f"{title}: {count} MIBs, parsing {parseTime / count * 1e6:.1f} us/MIB, "
+        f"lexer set up {setupTime / count * 1e6:.1f} us/MIB "
+        f"({setupTime / (parseTime + setupTime) * 100:.1f}% of the total)"
+    )
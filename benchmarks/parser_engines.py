@@ -0,0 +1,75 @@
+"""
+Parser engines
+++++++++++++++
+
+Parse MIB files with ply parser and with *DescentParser*, make sure both
+engines yield the same MIB trees and errors for every parser dialect,
+and tell how long each engine takes.
+
+Usage: python benchmarks/parser_engines.py <MIB-FILE-OR-DIRECTORY> [...]
+"""  #
+import os
+import sys
+import time
+
+from pysmi import error
+from pysmi.parser import dialect
+from pysmi.parser.smi import parserFactory
+
+if len(sys.argv) < 2:
+    sys.stderr.write(__doc__.split("\n\n")[-1])
+    sys.exit(1)
+
+mibs = {}
+
+for location in sys.argv[1:]:
+    if os.path.isdir(location):
+        paths = [os.path.join(location, x) for x in sorted(os.listdir(location))]
+
+    else:
+        paths = [location]
+
+    for path in paths:
+        if os.path.isfile(path):
+            with open(path, encoding="utf-8", errors="ignore") as f:
+                mibs[path] = f.read()
+
+
+def parse(parser, data):
+    try:
+        return parser.parse(data)
+
+    except error.PySmiError as exc:
+        return exc.__class__.__name__, str(exc)
+
+
+failures = 0
+
+for name in ("smi_v2", "smi_v1", "smi_v1_relaxed"):
+    parserClass = parserFactory(**getattr(dialect, name))
+
+    timings = {}
+    trees = {}
+
+    for engine in parserClass.engines:
+        parser = parserClass(engine=engine)
+
+        started = time.perf_counter()
+
+        trees[engine] = [parse(parser, data) for data in mibs.values()]
+
+        timings[engine] = time.perf_counter() - started
+
+    for path, ply, descent in zip(mibs, trees["ply"], trees["descent"]):
+        if ply != descent:
+            failures += 1
+            print(f"{name}: {path}: MIB trees differ")
+
+    parsed = sum(isinstance(x, list) for x in trees["ply"])
+
+    print(
+        f"{name}: {len(mibs)} MIBs, {parsed} parsed, "
+        + ", ".join(f"{engine} {timing:.3f} s" for engine, timing in timings.items())
+    )
+
+sys.exit(failures and 1 or 0)
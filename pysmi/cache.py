@@ -0,0 +1,302 @@
+#
+# This file is part of pysmi software.
+#
+# Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
+# License: https://www.pysnmp.com/pysmi/license.html
+#
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+import threading
+
+from pysmi import __version__ as package_version
+from pysmi import debug
+from pysmi import error
+from pysmi.compat import decode
+
+
+class FileCache:
+    """Stores Python objects in files at specified location.
+
+    Objects are stored and looked up by a string key, typically built by
+    the *make_key* method. Once the files grow beyond *maxSize* bytes,
+    least recently used objects are removed from the cache.
+
+    Cache failures are never fatal, they just make the cache miss.
+    """
+
+    suffix = ".pickle"
+
+    #: default cache size limit, in bytes
+    maxSize = 256 * 1024 * 1024
+
+    def __init__(self, path, maxSize=None):
+        """Creates an instance of *FileCache* class.
+
+        Args:
+            path: writable directory to store cached objects at
+
+        Keyword Args:
+            maxSize: cache size limit, in bytes
+        """
+        self._path = decode(os.path.normpath(path))
+
+        if maxSize is not None:
+            self.maxSize = maxSize
+
+        # total size of cache files, figured out on first store
+        self._size = None
+
+    def __str__(self):
+        """Return a string representation of the instance."""
+        return f'{self.__class__.__name__}{{"{self._path}"}}'
+
+    @staticmethod
+    def make_key(*parts):
+        """Build cache key out of given strings, bytes or other objects.
+
+        Keys built by different pysmi versions never match.
+        """
+        digest = hashlib.sha256(package_version.encode())
+
+        for part in parts:
+            if isinstance(part, str):
+                part = part.encode("utf-8", "surrogatepass")
+
+            elif not isinstance(part, bytes):
+                part = repr(part).encode()
+
+            digest.update(len(part).to_bytes(8, "big"))
+            digest.update(part)
+
+        return digest.hexdigest()
+
+    def _get_filename(self, key):
+        return os.path.join(self._path, key + self.suffix)
+
+    def get_data(self, key):
+        """Return object stored under *key* or *None* if there is none."""
+        filename = self._get_filename(key)
+
+        try:
+            with open(filename, "rb") as f:
+                data = pickle.load(f)
+
+            # cache hits make files recently used
+            os.utime(filename)
+
+        except FileNotFoundError:
+            debug.logger & debug.FLAG_CACHE and debug.logger(
+                f"{key} not found in {self}"
+            )
+            return None
+
+        except Exception:
+            debug.logger & debug.FLAG_CACHE and debug.logger(
+                f"failure reading {filename}: {sys.exc_info()[1]}"
+            )
+            return None
+
+        debug.logger & debug.FLAG_CACHE and debug.logger(f"{key} found in {self}")
+
+        return data
+
+    def put_data(self, key, data):
+        """Store *data* object under *key*, evicting old objects if needed."""
+        filename = self._get_filename(key)
+
+        tfile = None
+
+        try:
+            os.makedirs(self._path, exist_ok=True)
+
+            fd, tfile = tempfile.mkstemp(dir=self._path)
+
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+            os.replace(tfile, filename)
+
+        except Exception:
+            if tfile and os.access(tfile, os.F_OK):
+                os.unlink(tfile)
+
+            debug.logger & debug.FLAG_CACHE and debug.logger(
+                f"failure writing {filename}: {sys.exc_info()[1]}"
+            )
+            return
+
+        debug.logger & debug.FLAG_CACHE and debug.logger(f"{key} stored in {self}")
+
+        if self._size is None:
+            self._size = sum(x[2] for x in self._list_files())
+
+        else:
+            try:
+                self._size += os.stat(filename).st_size
+
+            except OSError:
+                pass
+
+        if self._size > self.maxSize:
+            self.evict()
+
+    def _list_files(self):
+        files = []
+
+        try:
+            entries = os.scandir(self._path)
+
+        except OSError:
+            return files
+
+        with entries:
+            for entry in entries:
+                if not entry.name.endswith(self.suffix):
+                    continue
+
+                try:
+                    stat = entry.stat()
+
+                except OSError:
+                    continue
+
+                files.append((stat.st_mtime, entry.path, stat.st_size))
+
+        return files
+
+    def evict(self):
+        """Remove least recently used objects until the cache fits *maxSize*.
+
+        Cache is shrunk somewhat below the limit for the eviction not to
+        run on every store.
+        """
+        files = sorted(self._list_files())
+
+        size = sum(x[2] for x in files)
+
+        for mtime, filename, filesize in files:
+            if size <= self.maxSize * 3 // 4:
+                break
+
+            try:
+                os.unlink(filename)
+
+            except OSError:
+                continue
+
+            size -= filesize
+
+            debug.logger & debug.FLAG_CACHE and debug.logger(
+                f"evicted {filename} from {self}"
+            )
+
+        self._size = size
+
+    def purge(self):
+        """Remove all objects from the cache."""
+        for mtime, filename, filesize in self._list_files():
+            try:
+                os.unlink(filename)
+
+            except OSError:
+                raise error.PySmiError(
+                    f"failure removing {filename}: {sys.exc_info()[1]}"
+                )
+
+        self._size = 0
+
+        debug.logger & debug.FLAG_CACHE and debug.logger(f"{self} purged")
+
+
+class MemoryCache:
+    """Keeps Python objects in memory, much like *FileCache* does in files.
+
+    Objects are kept pickled, so what is taken from the cache is never
+    the object that has been stored. Once pickled objects grow beyond
+    *maxSize* bytes, least recently used ones are dropped. The cache may
+    be shared by threads.
+    """
+
+    #: default cache size limit, in bytes
+    maxSize = 64 * 1024 * 1024
+
+    def __init__(self, maxSize=None):
+        """Creates an instance of *MemoryCache* class.
+
+        Keyword Args:
+            maxSize: cache size limit, in bytes
+        """
+        if maxSize is not None:
+            self.maxSize = maxSize
+
+        self._objects = {}
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop("_lock")
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __str__(self):
+        """Return a string representation of the instance."""
+        return f"{self.__class__.__name__}{{{len(self._objects)} objects}}"
+
+    make_key = staticmethod(FileCache.make_key)
+
+    def get_data(self, key):
+        """Return object stored under *key* or *None* if there is none."""
+        with self._lock:
+            data = self._objects.pop(key, None)
+
+            # dictionary order tells how recently objects were used
+            if data is not None:
+                self._objects[key] = data
+
+        if data is None:
+            debug.logger & debug.FLAG_CACHE and debug.logger(
+                f"{key} not found in {self}"
+            )
+            return None
+
+        debug.logger & debug.FLAG_CACHE and debug.logger(f"{key} found in {self}")
+
+        return pickle.loads(data)
+
+    def put_data(self, key, data):
+        """Store *data* object under *key*, dropping old objects if needed."""
+        try:
+            data = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+
+        except Exception:
+            debug.logger & debug.FLAG_CACHE and debug.logger(
+                f"failure pickling {key}: {sys.exc_info()[1]}"
+            )
+            return
+
+        with self._lock:
+            self._size -= len(self._objects.pop(key, b""))
+
+            self._objects[key] = data
+            self._size += len(data)
+
+            while self._size > self.maxSize and len(self._objects) > 1:
+                oldKey = next(iter(self._objects))
+                self._size -= len(self._objects.pop(oldKey))
+
+                debug.logger & debug.FLAG_CACHE and debug.logger(
+                    f"evicted {oldKey} from {self}"
+                )
+
+    def purge(self):
+        """Remove all objects from the cache."""
+        with self._lock:
+            self._objects.clear()
+            self._size = 0
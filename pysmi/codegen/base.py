@@ -4,6 +4,7 @@
 # Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
 # License: https://www.pysnmp.com/pysmi/license.html
 #
+import copy
 from keyword import iskeyword
 import warnings
 
@@ -291,6 +292,21 @@ class AbstractCodeGen:
     def gen_index(self, mibsMap, **kwargs):
         raise NotImplementedError()
 
+    def merge_index(self, indexes, **kwargs):
+        raise NotImplementedError()
+
+    def new_context(self):
+        """Return a copy of the instance to transform a single MIB with.
+
+        Code generators keep the state of the MIB being transformed in
+        instance attributes. Each *gen_code* call works on a context of its
+        own, with the state initialized afresh, so one code generator can
+        serve concurrent calls from many threads.
+        """
+        context = copy.copy(self)
+        context.__init__()
+        return context
+
     @staticmethod
     def is_binary(s):
         return isinstance(s, str) and s[0] == "'" and s[-2:] in ("'b", "'B")
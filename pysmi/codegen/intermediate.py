@@ -1080,6 +1080,9 @@ class IntermediateCodeGen(AbstractCodeGen):
     # have it prepared at the intermediate stage...?
 
     def gen_code(self, ast, symbolTable, **kwargs):
+        return self.new_context()._gen_code(ast, symbolTable, **kwargs)
+
+    def _gen_code(self, ast, symbolTable, **kwargs):
         self.genRules["text"] = kwargs.get("genTexts", False)
         self.textFilter = kwargs.get("textFilter") or (
             lambda symbol, text: re.sub(r"\s+", " ", text)
@@ -1123,7 +1126,7 @@ class IntermediateCodeGen(AbstractCodeGen):
                 identity=self._moduleIdentityOid,
                 name=self.moduleName[0],
                 revision=self._moduleRevision,
-                oids=self._oids,
+                oids=tuple(sorted(self._oids)),
                 enterprise=self._enterpriseOid,
                 compliance=self._complianceOids,
                 imported=tuple(x for x in importedModules if x not in self.fakeMibs),
@@ -4,6 +4,7 @@
 # Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
 # License: https://www.pysnmp.com/pysmi/license.html
 #
+import contextlib
 import os
 import sys
 from collections import OrderedDict
@@ -13,6 +14,7 @@ import jinja2
 from pysmi import debug, error
 from pysmi.codegen import jfilters
 from pysmi.codegen.intermediate import IntermediateCodeGen
+from pysmi.stats import PhaseEvent
 
 try:
     import json
@@ -53,9 +55,20 @@ class JsonCodeGen(IntermediateCodeGen):
 
         env.filters["capfirst"] = jfilters.capfirst
 
+        stats = kwargs.get("stats")
+
+        if stats is None:
+            timer = contextlib.nullcontext(PhaseEvent("render", mibInfo.name))
+
+        else:
+            timer = stats.timer("render", mibInfo.name)
+
         try:
-            tmpl = env.get_template(dstTemplate or self.TEMPLATE_NAME)
-            text = tmpl.render(mib=context)
+            with timer as event:
+                tmpl = env.get_template(dstTemplate or self.TEMPLATE_NAME)
+                text = tmpl.render(mib=context)
+
+                event.size = len(text)
 
         except jinja2.exceptions.TemplateError:
             err = sys.exc_info()[1]
@@ -83,28 +96,6 @@ class JsonCodeGen(IntermediateCodeGen):
             except Exception:
                 raise error.PySmiCodegenError(f"Index load error: {sys.exc_info()[1]}")
 
-        def order(top):
-            if isinstance(top, dict):
-                new_top = OrderedDict()
-                try:
-                    # first try to sort keys as OIDs
-                    for k in sorted(top, key=lambda x: [int(y) for y in x.split(".")]):
-                        new_top[k] = order(top[k])
-
-                except ValueError:
-                    for k in sorted(top):
-                        new_top[k] = order(top[k])
-
-                return new_top
-            elif isinstance(top, list):
-                new_top = []
-                for e in sorted(set(top)):
-                    new_top.append(order(e))
-
-                return new_top
-
-            return top
-
         for module, status in processed.items():
             modData = outDict["identity"]
             identity_oid = getattr(status, "identity", None)
@@ -138,17 +129,7 @@ class JsonCodeGen(IntermediateCodeGen):
                 modData[object_oid].append(module)
 
             if modData:
-                unique_prefixes = {}
-                for oid in sorted(modData, key=lambda x: x.count(".")):
-                    for oid_prefix, modules in unique_prefixes.items():
-                        if oid.startswith(oid_prefix) and set(modules).issuperset(
-                            modData[oid]
-                        ):
-                            break
-                    else:
-                        unique_prefixes[oid] = modData[oid]
-
-                outDict["oids"] = unique_prefixes
+                outDict["oids"] = self._reduce_oids(modData)
 
         if "comments" in kwargs:
             outDict["meta"]["comments"] = kwargs["comments"]
@@ -157,4 +138,91 @@ class JsonCodeGen(IntermediateCodeGen):
             f"OID->MIB index built, {len(processed)} entries"
         )
 
-        return json.dumps(order(outDict), indent=2)
+        return json.dumps(self._order(outDict), indent=2)
+
+    def merge_index(self, indexes, **kwargs):
+        """Combine OID->MIB indexes built by *gen_index* into one.
+
+        Indexes built for separate sets of MIBs, e.g. by shards of a
+        compilation, are merged section by section, without looking at
+        the MIBs themselves.
+
+        Args:
+            indexes: JSON documents produced by *gen_index*
+
+        Keyword Args:
+            old_index_data: JSON document of the existing index to merge
+                the *indexes* into
+            comments: list of comments to put into the merged index
+
+        Returns:
+            JSON document of the merged index
+        """
+        outDict = {
+            "meta": {},
+            "identity": {},
+            "enterprise": {},
+            "compliance": {},
+            "oids": {},
+        }
+
+        if kwargs.get("old_index_data"):
+            indexes = [kwargs["old_index_data"], *indexes]
+
+        for index in indexes:
+            try:
+                inDict = json.loads(index)
+
+            except Exception:
+                raise error.PySmiCodegenError(f"Index load error: {sys.exc_info()[1]}")
+
+            for section in ("identity", "enterprise", "compliance", "oids"):
+                for oid, modules in inDict.get(section, {}).items():
+                    outDict[section].setdefault(oid, []).extend(modules)
+
+        outDict["oids"] = self._reduce_oids(outDict["oids"])
+
+        if "comments" in kwargs:
+            outDict["meta"]["comments"] = kwargs["comments"]
+
+        debug.logger & debug.FLAG_CODEGEN and debug.logger(
+            f"OID->MIB index merged out of {len(indexes)} indexes"
+        )
+
+        return json.dumps(self._order(outDict), indent=2)
+
+    @staticmethod
+    def _reduce_oids(oids):
+        # drop OIDs served by the same MIBs as their prefixes
+        unique_prefixes = {}
+        for oid in sorted(oids, key=lambda x: x.count(".")):
+            for oid_prefix, modules in unique_prefixes.items():
+                if oid.startswith(oid_prefix) and set(modules).issuperset(oids[oid]):
+                    break
+            else:
+                unique_prefixes[oid] = oids[oid]
+
+        return unique_prefixes
+
+    @classmethod
+    def _order(cls, top):
+        if isinstance(top, dict):
+            new_top = OrderedDict()
+            try:
+                # first try to sort keys as OIDs
+                for k in sorted(top, key=lambda x: [int(y) for y in x.split(".")]):
+                    new_top[k] = cls._order(top[k])
+
+            except ValueError:
+                for k in sorted(top):
+                    new_top[k] = cls._order(top[k])
+
+            return new_top
+        elif isinstance(top, list):
+            new_top = []
+            for e in sorted(set(top)):
+                new_top.append(cls._order(e))
+
+            return new_top
+
+        return top
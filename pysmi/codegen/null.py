@@ -23,3 +23,6 @@ class NullCodeGen(AbstractCodeGen):
 
     def gen_index(self, mibsMap, **kwargs):
         return ""
+
+    def merge_index(self, indexes, **kwargs):
+        return ""
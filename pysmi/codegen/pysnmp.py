@@ -4,6 +4,7 @@
 # Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
 # License: https://www.pysnmp.com/pysmi/license.html
 #
+import contextlib
 import os
 import sys
 from collections import OrderedDict
@@ -13,6 +14,7 @@ from pysmi import debug, error
 from pysmi.codegen import jfilters
 from pysmi.codegen.intermediate import IntermediateCodeGen
 from pysmi.mibinfo import MibInfo
+from pysmi.stats import PhaseEvent
 
 
 class PySnmpCodeGen(IntermediateCodeGen):
@@ -148,9 +150,20 @@ class PySnmpCodeGen(IntermediateCodeGen):
         env.filters["pythonsym"] = jfilters.pythonsym
         env.filters["pythonstr"] = jfilters.pythonstr
 
+        stats = kwargs.get("stats")
+
+        if stats is None:
+            timer = contextlib.nullcontext(PhaseEvent("render", mibInfo.name))
+
+        else:
+            timer = stats.timer("render", mibInfo.name)
+
         try:
-            tmpl = env.get_template(dstTemplate or self.TEMPLATE_NAME)
-            text = tmpl.render(mib=context)
+            with timer as event:
+                tmpl = env.get_template(dstTemplate or self.TEMPLATE_NAME)
+                text = tmpl.render(mib=context)
+
+                event.size = len(text)
 
         except jinja2.exceptions.TemplateError:
             err = sys.exc_info()[1]
@@ -640,6 +640,9 @@ class SymtableCodeGen(AbstractCodeGen):
         self.reg_postponed_syms()
 
     def gen_code(self, ast, symbolTable, **kwargs):
+        return self.new_context()._gen_code(ast, symbolTable, **kwargs)
+
+    def _gen_code(self, ast, symbolTable, **kwargs):
         self.genRules["text"] = kwargs.get("genTexts", False)
         self._rows.clear()
         self._cols.clear()
@@ -673,7 +676,7 @@ class SymtableCodeGen(AbstractCodeGen):
 
         self._out["_symtable_order"] = list(self._symsOrder)
         self._out["_symtable_cols"] = list(self._cols)
-        self._out["_symtable_rows"] = list(self._rows)
+        self._out["_symtable_rows"] = sorted(self._rows)
 
         debug.logger & debug.FLAG_CODEGEN and debug.logger(
             f"canonical MIB name {self.moduleName[0]} ({moduleOid}), imported MIB(s) {','.join(importedModules) or '<none>'}, Symbol table size {len(self._out)} symbols"
@@ -4,22 +4,43 @@
 # Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
 # License: https://www.pysnmp.com/pysmi/license.html
 #
+import asyncio
+import collections
+import copy
 import getpass
+import multiprocessing
+import os
 import platform
 import sys
+import threading
 import time
 import warnings
+from concurrent.futures import CancelledError, ProcessPoolExecutor, ThreadPoolExecutor
+
+try:
+    import resource
+
+except ImportError:
+    resource = None
 
 from pysmi import __name__ as package_name
 from pysmi import __version__ as package_version
+from pysmi import config
 from pysmi import debug
 from pysmi import error
 from pysmi.borrower.base import AbstractBorrower
+from pysmi.cache import FileCache
 from pysmi.codegen.base import AbstractCodeGen
 from pysmi.codegen.symtable import SymtableCodeGen
+from pysmi.graph import DependencyGraph
+from pysmi.journal import get_output_digest
+from pysmi.manifest import get_symtable_digest
 from pysmi.mibinfo import MibInfo
 from pysmi.reader.base import AbstractReader
+from pysmi.reader.corpus import CorpusReader, scan_mib_text
 from pysmi.searcher.base import AbstractSearcher
+from pysmi.stats import CompileStats
+from pysmi.symtablemap import SymbolTableMap
 from pysmi.writer.base import AbstractWriter
 
 
@@ -37,6 +58,9 @@ class MibStatus(str):
     * *unprocessed* - MIB transformation required but waived for some reason
     * *missing* - ASN.1 MIB source can't be found
     * *borrowed* - MIB transformation failed but pre-transformed version was used
+
+    Statuses returned by *MibCompiler* carry *stats* attribute mapping
+    compilation phases to the *PhaseStats* of the MIB.
     """
 
     def set_options(self, **kwargs):
@@ -53,578 +77,2240 @@ status_unprocessed = MibStatus("unprocessed")
 status_missing = MibStatus("missing")
 status_borrowed = MibStatus("borrowed")
 
+# exception attributes referring to compiler components, these can't
+# (and need not) travel between worker processes
+COMPONENT_ATTRIBUTES = ("reader", "source", "searcher", "handler", "writer")
 
-class MibCompiler:
-    """Top-level, user-facing, composite MIB compiler object.
+# worker state, populated once per worker process or thread on pool start up
+_worker = threading.local()
 
-    MibCompiler implements high-level MIB transformation processing logic.
-    It executes its actions by calling the following specialized objects:
 
-      * *readers* - to acquire ASN.1 MIB data
-      * *searchers* - to see if transformed MIB already exists and no processing is necessary
-      * *parser* - to parse ASN.1 MIB into AST
-      * *code generator* - to perform actual MIB transformation
-      * *borrowers* - to fetch pre-transformed MIB if transformation is impossible
-      * *writer* - to store transformed MIB data
+def _init_worker(state):
+    _worker.state = state
 
-    Required components must be passed to MibCompiler on instantiation. Those
-    components are: *parser*, *codegenerator* and *writer*.
 
-    Optional components could be set or modified at later phases of MibCompiler
-    life. Unlike singular, required components, optional one can be present
-    in sequences to address many possible sources of data. They are
-    *readers*, *searchers* and *borrowers*.
-    """
+def _detach_components(exc):
+    for attr in COMPONENT_ATTRIBUTES:
+        if attr in exc.__dict__:
+            exc.__dict__[attr] = None
 
-    indexFile = "index"
-    _searchers: list[AbstractSearcher]
-    _sources: list[AbstractReader]
-    _borrowers: list[AbstractBorrower]
-    _parsedMibs: dict[str, tuple]
+    return exc
 
-    failedMibs: dict[str, error.PySmiError]
 
-    def __init__(self, parser, codegen: AbstractCodeGen, writer: AbstractWriter):
-        """Creates an instance of *MibCompiler* class.
+def _attach_components(exc, **components):
+    for attr, component in components.items():
+        if attr in exc.__dict__ and exc.__dict__[attr] is None:
+            setattr(exc, attr, component)
 
-        Args:
-            parser: ASN.1 MIB parser object
-            codegen: MIB transformation object
-            writer: transformed MIB storing object
-        """
-        self._parser = parser
-        self._codegen = codegen
-        self._symbolgen = SymtableCodeGen()
-        self._writer = writer
-        self._sources = []
-        self._searchers = []
-        self._borrowers = []
+    return exc
 
-    def add_sources(self, *sources):
-        """Add more ASN.1 MIB source repositories.
 
-        MibCompiler.compile will invoke each of configured source objects
-        in order of their addition asking each to fetch MIB module specified
-        by name.
+def _get_symtable_key(parser, fileData):
+    return FileCache.make_key(
+        "symtable",
+        parser.__class__.__name__,
+        getattr(parser, "grammarOptions", ()),
+        config.STRICT_MODE,
+        fileData,
+    )
 
-        Args:
-            sources: reader object(s)
 
-        Returns:
-            reference to itself (can be used for call chaining)
+def _fetch_mib(
+    sources, parser, mibname, start=0, cache=None, stats=None, resolver=None
+):
+    """Read and parse ASN.1 MIB from the first source that can serve it.
 
-        """
-        self._sources.extend(sources)
+    Returns a list of *(index, fileInfo, fileData, mibTrees, symbolTables,
+    exc)* tuples, one per source tried starting from *start* index. The
+    list ends at the first source that was read and parsed successfully.
+
+    If symbol tables of the MIB text are found in the *cache*, the MIB is
+    not parsed. Then *symbolTables* carry *(mibInfo, symbolTable)* pairs
+    and *mibTrees* is *None*.
 
+    Reading and parsing is timed into *stats* if given. MIB sources are
+    consulted through the *resolver* if given.
+    """
+    if stats is None:
+        stats = CompileStats()
+
+    outcomes = []
+
+    for index in range(start, len(sources)):
         debug.logger & debug.FLAG_COMPILER and debug.logger(
-            f"current MIB source(s): {', '.join(map(str, self._sources))}"
+            f"trying source {sources[index]}"
         )
 
-        return self
+        stats.count("sourceProbes")
 
-    def add_searchers(self, *searchers):
-        """Add more transformed MIBs repositories.
+        try:
+            with stats.timer("read", mibname) as event:
+                if resolver is None:
+                    fileInfo, fileData = sources[index].get_data(mibname)
 
-        MibCompiler.compile will invoke each of configured searcher objects
-        in order of their addition asking each if already transformed MIB
-        module already exists and is more recent than specified.
+                else:
+                    fileInfo, fileData = resolver.get_data(sources[index], mibname)
 
-        Args:
-            searchers: searcher object(s)
+                event.size = len(fileData)
 
-        Returns:
-            reference to itself (can be used for call chaining)
+            mibTrees, symbolTables = _load_mib(parser, fileData, cache, stats, mibname)
 
-        """
-        self._searchers.extend(searchers)
+        except (UnicodeDecodeError, error.PySmiError) as exc:
+            outcomes.append((index, None, None, None, None, exc))
+            continue
 
-        debug.logger & debug.FLAG_COMPILER and debug.logger(
-            f"current compiled MIBs location(s): {', '.join(map(str, self._searchers))}"
-        )
+        outcomes.append((index, fileInfo, fileData, mibTrees, symbolTables, None))
+        break
 
-        return self
+    return outcomes
 
-    def add_borrowers(self, *borrowers):
-        """Add more transformed MIBs repositories to borrow MIBs from.
 
-        Whenever MibCompiler.compile encounters MIB module which neither of
-        the *searchers* can find or fetched ASN.1 MIB module can not be
-        parsed (due to syntax errors), these *borrowers* objects will be
-        invoked in order of their addition asking each if already transformed
-        MIB can be fetched (borrowed).
+def _load_mib(parser, fileData, cache=None, stats=None, mibname=None):
+    """Parse MIB text unless its symbol tables are found in the *cache*.
 
-        Args:
-            borrowers: borrower object(s)
+    Returns *(mibTrees, symbolTables)* tuple with one of the items
+    being *None*.
+    """
+    if cache is not None:
+        symbolTables = cache.get_data(_get_symtable_key(parser, fileData))
 
-        Returns:
-            reference to itself (can be used for call chaining)
+        if symbolTables is not None:
+            if stats is not None:
+                stats.count("symbolTableCacheHits")
 
-        """
-        self._borrowers.extend(borrowers)
+            return None, symbolTables
 
-        debug.logger & debug.FLAG_COMPILER and debug.logger(
-            f"current MIB borrower(s): {', '.join(map(str, self._borrowers))}"
-        )
+    if stats is None:
+        return parser.parse(fileData), None
 
-        return self
+    with stats.timer("parse", mibname) as event:
+        event.size = len(fileData)
 
-    def _get_system_info(self):
-        # Gather platform information
-        platform_info = (
-            platform.system(),  # Operating system (e.g., 'Linux', 'Windows', 'Darwin')
-            platform.node(),  # Hostname
-            platform.release(),  # Version of the OS
+        return parser.parse(fileData), None
+
+
+async def _read_mib_async(sources, mibname, start=0, stats=None, resolver=None):
+    """Read ASN.1 MIB from the first source that can serve it.
+
+    Works like *_fetch_mib*, except that MIB text is not parsed, so
+    *mibTrees* and *symbolTables* of the outcomes are always *None*.
+    """
+    if stats is None:
+        stats = CompileStats()
+
+    outcomes = []
+
+    for index in range(start, len(sources)):
+        debug.logger & debug.FLAG_COMPILER and debug.logger(
+            f"trying source {sources[index]}"
         )
 
-        # Gather user information
-        user_info = (getpass.getuser(),)  # Current logged-in user
+        stats.count("sourceProbes")
 
-        return platform_info, user_info
+        try:
+            with stats.timer("read", mibname) as event:
+                if resolver is None:
+                    fileInfo, fileData = await sources[index].get_data_async(mibname)
 
-    def compile(self, *mibnames, **options):
-        """Transform requested and possibly referred MIBs.
+                else:
+                    fileInfo, fileData = await resolver.get_data_async(
+                        sources[index], mibname
+                    )
 
-        The *compile* method should be invoked when *MibCompiler* object
-        is operational meaning at least *sources* are specified.
+                event.size = len(fileData)
 
-        Once called with a MIB module name, *compile* will:
+        except (UnicodeDecodeError, error.PySmiError) as exc:
+            outcomes.append((index, None, None, None, None, exc))
+            continue
 
-        * fetch ASN.1 MIB module with given name by calling *sources*
-        * make sure no such transformed MIB already exists (with *searchers*)
-        * parse ASN.1 MIB text with *parser*
-        * perform actual MIB transformation into target format with *code generator*
-        * may attempt to borrow pre-transformed MIB through *borrowers*
-        * write transformed MIB through *writer*
+        outcomes.append((index, fileInfo, fileData, None, None, None))
+        break
 
-        The above sequence will be performed for each MIB name given in
-        *mibnames* and may be performed for all MIBs referred to from
-        MIBs being processed.
+    return outcomes
 
-        Args:
-            mibnames: list of ASN.1 MIBs names
-            options: options that affect the way PySMI components work
 
-        Returns:
-            A dictionary of MIB module names processed (keys) and *MibStatus*
-            class instances (values)
+def _get_worker_stats():
+    stats = CompileStats()
 
-        """
-        processed = {}
-        parsedMibs = {}
-        failedMibs = {}
-        borrowedMibs = {}
-        builtMibs = {}
-        symbolTableMap = {}
-        mibsToParse = [x for x in mibnames]
-        canonicalMibNames = {}
-        seenMibNames = set()
+    if _worker.state.get("observed"):
+        # observers live in the parent process, events are replayed there
+        stats.events = []
 
-        while mibsToParse:
-            mibname = mibsToParse.pop(0)
+    return stats
 
-            if mibname in parsedMibs:
-                debug.logger & debug.FLAG_COMPILER and debug.logger(
-                    f"MIB {mibname} already parsed"
-                )
-                continue
 
-            if mibname in failedMibs:
-                debug.logger & debug.FLAG_COMPILER and debug.logger(
-                    f"MIB {mibname} already failed"
-                )
-                continue
+def _fetch_mib_in_worker(mibname, start=0):
+    stats = _get_worker_stats()
 
-            if mibname in seenMibNames:
-                debug.logger & debug.FLAG_COMPILER and debug.logger(
-                    f"MIB {mibname} already seen (cyclic dependency)"
-                )
-                continue
+    outcomes = _fetch_mib(
+        _worker.state["sources"],
+        _worker.state["parser"],
+        mibname,
+        start,
+        _worker.state["cache"],
+        stats,
+        _worker.state["resolver"],
+    )
 
-            seenMibNames.add(mibname)
+    return [
+        outcome[:-1] + (outcome[-1] and _detach_components(outcome[-1]),)
+        for outcome in outcomes
+    ], stats
 
-            for source in self._sources:
-                debug.logger & debug.FLAG_COMPILER and debug.logger(
-                    f"trying source {source}"
-                )
 
-                try:
-                    fileInfo, fileData = source.get_data(mibname)
+def _parse_mib(parser, symbolgen, mibname, fileData):
+    """Parse MIB text again for the tree of one of its MIB modules.
 
-                    for mibTree in self._parser.parse(fileData):
-                        mibInfo, symbolTable = self._symbolgen.gen_code(
-                            mibTree, symbolTableMap
-                        )
+    The tree is run through symbol table generator once again, as code
+    generators rely on the adjustments it makes to the tree.
+    """
+    for mibTree in parser.parse(fileData):
+        if mibTree[0] == mibname:
+            symbolgen.gen_code(mibTree, {})
+            return mibTree
 
-                        symbolTableMap[mibInfo.name] = symbolTable
+    raise error.PySmiError(f"MIB {mibname} not found in its own MIB text")
 
-                        parsedMibs[mibInfo.name] = fileInfo, mibInfo, mibTree
 
-                        if mibname in failedMibs:
-                            del failedMibs[mibname]
+def _build_in_worker(mibname, comments, options):
+    fileInfo, mibInfo, mibTree = _worker.state["parsedMibs"][mibname]
 
-                        mibsToParse.extend(mibInfo.imported)
+    stats = _get_worker_stats()
 
-                        if fileInfo.name in mibnames:
-                            if mibInfo.name not in canonicalMibNames:
-                                canonicalMibNames[mibInfo.name] = []
-                            canonicalMibNames[mibInfo.name].append(fileInfo.name)
+    try:
+        if mibTree is None:
+            with stats.timer("parse", mibname) as event:
+                event.size = len(_worker.state["mibTexts"][mibname])
 
-                        debug.logger & debug.FLAG_COMPILER and debug.logger(
-                            f"{mibInfo.name} ({mibname}) read from {fileInfo.path}, immediate dependencies: {', '.join(mibInfo.imported) or '<none>'}"
-                        )
+                mibTree = _parse_mib(
+                    _worker.state["parser"],
+                    _worker.state["symbolgen"],
+                    mibname,
+                    _worker.state["mibTexts"][mibname],
+                )
 
-                    break
-                except UnicodeDecodeError:
-                    debug.logger & debug.FLAG_COMPILER and debug.logger(
-                        f"http exception {mibname} found at {source}"
-                    )
-                    continue
+        with stats.timer("codegen", mibname) as event:
+            mibInfo, mibData = _worker.state["codegen"].gen_code(
+                mibTree,
+                _worker.state["symbolTableMap"],
+                comments=comments,
+                stats=stats,
+                **options,
+            )
 
-                except error.PySmiReaderFileNotFoundError:
-                    debug.logger & debug.FLAG_COMPILER and debug.logger(
-                        f"no {mibname} found at {source}"
-                    )
-                    continue
+            event.size = len(mibData)
 
-                except error.PySmiError as exc:
-                    exc.source = source
-                    exc.mibname = mibname
-                    exc.msg += f" at MIB {mibname}"
+    except error.PySmiError as exc:
+        return None, None, _detach_components(exc), stats
 
-                    debug.logger & debug.FLAG_COMPILER and debug.logger(
-                        f"{options.get('ignoreErrors') and 'ignoring ' or 'failing on '} {exc} from {source}"
-                    )
+    if "writer" not in _worker.state:
+        return mibInfo, mibData, None, stats
 
-                    failedMibs[mibname] = exc
+    try:
+        with stats.timer("write", mibname) as event:
+            event.size = len(mibData)
 
-                    processed[mibname] = status_failed.set_options(error=exc)
+            _worker.state["writer"].put_data(
+                mibname, mibData, dryRun=_worker.state["dryRun"]
+            )
 
-            else:
-                exc = error.PySmiError(f"MIB source {mibname} not found")
-                exc.mibname = mibname
-                debug.logger & debug.FLAG_COMPILER and debug.logger(
-                    f"no {mibname} found anywhere"
-                )
+    except error.PySmiError as exc:
+        return mibInfo, mibData, _detach_components(exc), stats
 
-                if mibname not in failedMibs:
-                    failedMibs[mibname] = exc
+    return mibInfo, mibData, None, stats
 
-                if mibname not in processed:
-                    processed[mibname] = status_missing
 
-        debug.logger & debug.FLAG_COMPILER and debug.logger(
-            f"MIBs analyzed {len(parsedMibs)}, MIBs failed {len(failedMibs)}"
-        )
+def _put_data_in_worker(mibname, mibData, dryRun):
+    try:
+        _worker.state["writer"].put_data(mibname, mibData, dryRun=dryRun)
 
-        #
-        # See what MIBs need generating
-        #
+    except error.PySmiError as exc:
+        return _detach_components(exc)
 
-        for mibname in tuple(parsedMibs):
-            fileInfo, mibInfo, mibTree = parsedMibs[mibname]
 
-            debug.logger & debug.FLAG_COMPILER and debug.logger(
-                f"checking if {mibname} requires updating"
-            )
+def _get_peak_memory():
+    """Return peak resident memory size of the process in bytes or *None*."""
+    if resource is None:
+        return None
 
-            for searcher in self._searchers:
-                try:
-                    searcher.file_exists(
-                        mibname, fileInfo.mtime, rebuild=options.get("rebuild")  # type: ignore
-                    )
+    peakMemory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
 
-                except error.PySmiFileNotFoundError:
-                    debug.logger & debug.FLAG_COMPILER and debug.logger(
-                        f"no compiled MIB {mibname} available through {searcher}"
-                    )
-                    continue
+    # kilobytes everywhere, but on macOS
+    if sys.platform != "darwin":
+        peakMemory *= 1024
 
-                except error.PySmiFileNotModifiedError:
-                    debug.logger & debug.FLAG_COMPILER and debug.logger(
-                        f"will be using existing compiled MIB {mibname} found by {searcher}"
-                    )
-                    del parsedMibs[mibname]
-                    processed[mibname] = status_untouched
-                    break
+    return peakMemory
 
-                except error.PySmiError as exc:
-                    exc.searcher = searcher
-                    exc.mibname = mibname
-                    exc.msg += f" at MIB {mibname}"
-                    debug.logger & debug.FLAG_COMPILER and debug.logger(
-                        f"error from {searcher}: {exc}"
-                    )
-                    continue
 
-            else:
-                debug.logger & debug.FLAG_COMPILER and debug.logger(
-                    f"no suitable compiled MIB {mibname} found anywhere"
-                )
+def _get_mp_context():
+    # forked workers inherit compiler components rather than unpickle them
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
 
-                if options.get("noDeps") and mibname not in canonicalMibNames:
-                    debug.logger & debug.FLAG_COMPILER and debug.logger(
-                        f"excluding imported MIB {mibname} from code generation"
-                    )
-                    del parsedMibs[mibname]
-                    processed[mibname] = status_untouched
-                    continue
+    return multiprocessing.get_context()
 
-        debug.logger & debug.FLAG_COMPILER and debug.logger(
-            f"MIBs parsed {len(parsedMibs)}, MIBs failed {len(failedMibs)}"
-        )
 
-        #
-        # Generate code for parsed MIBs
-        #
+def _get_executor(jobs, state, threads=False):
+    """Return a pool of worker processes or, if *threads* is set, threads.
 
-        for mibname in parsedMibs.copy():
-            fileInfo, mibInfo, mibTree = parsedMibs[mibname]
+    The *state* is handed over to each worker once, on its start up.
+    """
+    if threads:
+        return ThreadPoolExecutor(
+            max_workers=jobs, initializer=_init_worker, initargs=(state,)
+        )
 
-            debug.logger & debug.FLAG_COMPILER and debug.logger(
-                f"compiling {mibname} read from {fileInfo.path}"
-            )
+    return ProcessPoolExecutor(
+        max_workers=jobs,
+        mp_context=_get_mp_context(),
+        initializer=_init_worker,
+        initargs=(state,),
+    )
 
-            platform_info, user_info = self._get_system_info()
 
-            comments = [
-                f"ASN.1 source {fileInfo.path}",
-                f"Produced by {package_name}-{package_version} at {time.asctime()}",
-                f"On host {platform_info[1]} platform {platform_info[0]} version {platform_info[2]} by user {user_info[0]}",
-                f"Using Python version {sys.version.splitlines()[0]}",
-            ]
+def _map_in_pool(jobs, state, func, *iterables, threads=False):
+    """Run *func* over *iterables* in a pool of worker processes or threads.
 
-            try:
-                mibInfo, mibData = self._codegen.gen_code(
-                    mibTree,
-                    symbolTableMap,
-                    comments=comments,
-                    dstTemplate=options.get("dstTemplate"),
-                    genTexts=options.get("genTexts"),
-                    textFilter=options.get("textFilter"),
-                )
+    Results are returned in the order of *iterables*.
+    """
+    with _get_executor(jobs, state, threads) as executor:
+        return list(executor.map(func, *iterables))
 
-                builtMibs[mibname] = fileInfo, mibInfo, mibData
-                del parsedMibs[mibname]
 
-                debug.logger & debug.FLAG_COMPILER and debug.logger(
-                    f"{mibname} read from {fileInfo.path} and compiled by {self._writer}"
-                )
+def _limit_memory(memoryLimit):
+    # forked process shares the address space of its parent, the limit
+    # applies on top of that
+    try:
+        with open("/proc/self/statm") as f:
+            memoryLimit += int(f.read().split()[0]) * resource.getpagesize()
 
-            except error.PySmiError as exc:
-                exc.handler = self._codegen
-                exc.mibname = mibname
-                exc.msg += f" at MIB {mibname}"
+    except (OSError, ValueError, IndexError):
+        pass
 
-                debug.logger & debug.FLAG_COMPILER and debug.logger(
-                    f"error from {self._codegen}: {exc}"
-                )
+    resource.setrlimit(resource.RLIMIT_AS, (memoryLimit, memoryLimit))
 
-                processed[mibname] = status_failed.set_options(error=exc)
 
-                failedMibs[mibname] = exc
-                del parsedMibs[mibname]
+def _run_isolated_worker(conn, state, memoryLimit, func, args):
+    try:
+        if memoryLimit:
+            _limit_memory(memoryLimit)
 
-        debug.logger & debug.FLAG_COMPILER and debug.logger(
-            f"MIBs built {len(parsedMibs)}, MIBs failed {len(failedMibs)}"
-        )
+        _init_worker(state)
 
-        #
-        # Try to borrow pre-compiled MIBs for failed ones
-        #
+        result = None, func(*args)
 
-        for mibname in failedMibs.copy():
-            if options.get("noDeps") and mibname not in canonicalMibNames:
-                debug.logger & debug.FLAG_COMPILER and debug.logger(
-                    f"excluding imported MIB {mibname} from borrowing"
-                )
-                continue
+    # running out of memory or recursion limit included
+    except BaseException as exc:
+        result = f"{exc.__class__.__name__}: {exc}", None
 
-            for borrower in self._borrowers:
-                debug.logger & debug.FLAG_COMPILER and debug.logger(
-                    f"trying to borrow {mibname} from {borrower}"
-                )
-                try:
-                    fileInfo, fileData = borrower.get_data(
-                        mibname, genTexts=options.get("genTexts")
-                    )
+    try:
+        conn.send(result)
 
-                    borrowedMibs[mibname] = (
-                        fileInfo,
-                        MibInfo(name=mibname, imported=[]),
-                        fileData,
-                    )
+    except Exception:
+        conn.send((f"failure sending result: {sys.exc_info()[1]}", None))
 
-                    del failedMibs[mibname]
+    conn.close()
 
-                    debug.logger & debug.FLAG_COMPILER and debug.logger(
-                        f"{mibname} borrowed with {borrower}"
-                    )
-                    break
 
-                except error.PySmiError:
-                    debug.logger & debug.FLAG_COMPILER and debug.logger(
-                        f"error from {borrower}: {sys.exc_info()[1]}"
-                    )
+def _run_isolated(state, func, *args, timeout=None, memoryLimit=None):
+    """Run *func* in a process of its own, within time and memory limits.
 
+    The *state* is handed over to the process as to pool workers. Should
+    the process run out of time, fail or die, *PySmiWorkerError* is raised.
+    """
+    if memoryLimit and resource is None:
         debug.logger & debug.FLAG_COMPILER and debug.logger(
-            f"MIBs available for borrowing {len(borrowedMibs)}, MIBs failed {len(failedMibs)}"
+            "memory limit not supported on this platform"
         )
+        memoryLimit = None
 
-        #
-        # See what MIBs need borrowing
-        #
+    context = _get_mp_context()
 
-        for mibname in borrowedMibs.copy():
-            debug.logger & debug.FLAG_COMPILER and debug.logger(
-                f"checking if failed MIB {mibname} requires borrowing"
-            )
+    reader, writer = context.Pipe(duplex=False)
 
-            fileInfo, mibInfo, mibData = borrowedMibs[mibname]
+    process = context.Process(
+        target=_run_isolated_worker,
+        args=(writer, state, memoryLimit, func, args),
+        daemon=True,
+    )
 
-            for searcher in self._searchers:
-                try:
-                    searcher.file_exists(
-                        mibname, fileInfo.mtime, rebuild=options.get("rebuild")  # type: ignore
-                    )
+    process.start()
 
-                except error.PySmiFileNotFoundError:
-                    debug.logger & debug.FLAG_COMPILER and debug.logger(
-                        f"no compiled MIB {mibname} available through {searcher}"
-                    )
-                    continue
+    writer.close()
 
-                except error.PySmiFileNotModifiedError:
-                    debug.logger & debug.FLAG_COMPILER and debug.logger(
-                        f"will be using existing compiled MIB {mibname} found by {searcher}"
-                    )
-                    del borrowedMibs[mibname]
-                    processed[mibname] = status_untouched
-                    break
+    try:
+        if not reader.poll(timeout):
+            raise error.PySmiTimeoutError(f"timed out after {timeout} seconds")
+
+        try:
+            failure, result = reader.recv()
 
-                except error.PySmiError as exc:
-                    exc.searcher = searcher
-                    exc.mibname = mibname
-                    exc.msg += f" at MIB {mibname}"
+        except EOFError:
+            process.join()
 
-                    debug.logger & debug.FLAG_COMPILER and debug.logger(
-                        f"error from {searcher}: {exc}"
+            raise error.PySmiWorkerError(
+                f"worker process died with exit code {process.exitcode}"
+            )
+
+    finally:
+        reader.close()
+
+        if process.is_alive():
+            process.kill()
+
+        process.join()
+
+    if failure:
+        raise error.PySmiWorkerError(f"worker process failed: {failure}")
+
+    return result
+
+
+class _Compilation:
+    """State of a single compilation run by *MibCompiler*.
+
+    Each phase of the compilation is a method of this object, sharing
+    the MIBs read, parsed, built and failed so far. *MibCompiler.compile*
+    and its siblings drive the compilation through *run* generator.
+    """
+
+    def __init__(self, compiler, mibnames, options, loop=None):
+        self.compiler = compiler
+        self.mibnames = mibnames
+        self.options = options
+
+        # with an event loop given, components run on that loop
+        self.loop = loop
+
+        self.processed = {}
+
+        self.parsedMibs = {}
+        self.failedMibs = {}
+        self.borrowedMibs = {}
+        self.builtMibs = {}
+        self.mibsToParse = []
+        self.canonicalMibNames = {}
+        self.seenMibNames = set()
+        self.parsedMibNames = set()
+
+        # texts of MIBs, whose symbol tables came from the cache
+        self.mibTexts = {}
+
+        # MIB names that won't change their read or parsed status anymore
+        self.settledMibNames = set()
+
+        # parsed MIBs waiting for the MIBs they IMPORT to get settled
+        self.waitingMibs = {}
+
+        # MIBs ready for code generation in worker processes
+        self.readyMibs = []
+
+        # MIBs with final status, along with their data, to be yielded
+        self.finishedMibs = collections.deque()
+        self.yieldedMibNames = set()
+
+        # journal records what is actually stored
+        self.journaling = (
+            compiler.journal is not None
+            and options.get("writeMibs", True)
+            and not options.get("dryRun")
+        )
+
+        # MIBs already in the journal, found there finished included
+        self.recordedMibNames = set()
+
+        # hashes of MIB texts and digests of symbol tables, for the manifest
+        self.sourceHashes = {}
+        self.symbolTableDigests = {}
+        self.signatures = {}
+
+        self.graph = DependencyGraph()
+
+        self.stats = CompileStats(tuple(compiler._observers))
+
+        self.memoryBudget = options.get("memoryBudget")
+
+        if self.memoryBudget:
+            self.symbolTableMap = SymbolTableMap(self.memoryBudget)
+
+        else:
+            self.symbolTableMap = {}
+
+        self.mibTimeout = options.get("mibTimeout")
+        self.mibMemoryLimit = options.get("mibMemoryLimit")
+
+        # each MIB is read, parsed and transformed by a process of its own
+        self.isolate = loop is None and (
+            options.get("isolate") or self.mibTimeout or self.mibMemoryLimit
+        )
+
+        # with errors ignored, nothing holds built MIBs back from storing
+        self.storeEarly = (
+            options.get("ignoreErrors")
+            or self.memoryBudget
+            or self.isolate
+            or compiler.journal is not None
+        )
+
+        self.jobs = loop is None and not self.isolate and options.get("jobs") or 1
+
+        # workers are threads rather than processes
+        self.threads = options.get("threads")
+
+        self.workerKind = self.threads and "threads" or "processes"
+
+        self.genOptions = dict(
+            dstTemplate=options.get("dstTemplate"),
+            genTexts=options.get("genTexts"),
+            textFilter=options.get("textFilter"),
+        )
+
+        self.executor = None
+        self.pendingMibs = {}
+
+        # futures of the event loop the compilation is waiting for
+        self.futures = set()
+
+        self.cancelled = False
+        self.lock = threading.Lock()
+
+        # workers generating code for ready MIBs, if any
+        self.wave = None
+
+    def run(self):
+        """Run the compilation.
+
+        Yields:
+            *(mibname, MibStatus, data)* tuples, see *MibCompiler.compile_iter*
+        """
+        compiler = self.compiler
+
+        shard = self.options.get("shard")
+
+        if shard:
+            self.mibnames = compiler.get_shard(
+                self.mibnames, *shard, noDeps=self.options.get("noDeps")
+            )
+
+            # MIBs built by the other shards are read for their symbol tables
+            self.options = dict(self.options, noDeps=True)
+
+        self.mibsToParse.extend(self.mibnames)
+
+        compiler.graph = self.graph
+        compiler.stats = self.stats
+
+        if self.jobs > 1:
+            debug.logger & debug.FLAG_COMPILER and debug.logger(
+                f"reading and parsing MIBs with {self.jobs} worker {self.workerKind}"
+            )
+
+            self.executor = _get_executor(
+                self.jobs,
+                dict(
+                    sources=compiler._sources,
+                    parser=compiler._parser,
+                    cache=compiler.symbolTableCache,
+                    resolver=compiler.resolver,
+                    observed=bool(compiler._observers),
+                ),
+                self.threads,
+            )
+
+        try:
+            self.prefetch(*self.mibsToParse)
+
+            while self.mibsToParse:
+                self.check_cancelled()
+
+                self.read(self.mibsToParse.pop(0))
+
+                yield from self.drain()
+
+            # everything is read by now, IMPORT cycles can't hold MIBs back
+            self.schedule(*self.waitingMibs, force=True)
+
+            while self.wave is not None:
+                self.schedule(force=True)
+
+            yield from self.drain()
+
+        finally:
+            self.close()
+
+        debug.logger & debug.FLAG_COMPILER and debug.logger(
+            f"MIBs analyzed {len(self.parsedMibNames)}, MIBs built {len(self.builtMibs)}, MIBs failed {len(self.failedMibs)}"
+        )
+
+        self.borrow()
+
+        yield from self.finish()
+
+    def close(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+
+        for future in self.pendingMibs.values():
+            future.cancel()
+
+        if self.wave is not None:
+            self.wave[0].shutdown(wait=True, cancel_futures=True)
+
+        if self.memoryBudget:
+            debug.logger & debug.FLAG_COMPILER and debug.logger(
+                f"symbol tables in memory peaked at {self.symbolTableMap.peakSize} bytes"
+            )
+
+            self.symbolTableMap.close()
+
+        self.compiler.peakMemory = _get_peak_memory()
+
+        debug.logger & debug.FLAG_COMPILER and debug.logger(
+            f"peak memory usage {self.compiler.peakMemory or 'unknown'} bytes"
+        )
+
+    def drain(self):
+        processed = self.processed
+
+        while self.finishedMibs:
+            mibname, mibData = self.finishedMibs.popleft()
+
+            if mibname not in self.yieldedMibNames:
+                self.yieldedMibNames.add(mibname)
+
+                # statuses may be shared, attributes go to a copy
+                processed[mibname] = processed[mibname].set_options(
+                    **dict(
+                        processed[mibname].__dict__,
+                        stats=self.stats.get_mib_stats(mibname),
                     )
+                )
+
+                self.record(mibname, mibData)
+
+                yield mibname, processed[mibname], mibData
+
+    def record(self, mibname, mibData=None):
+        if self.journaling and mibname not in self.recordedMibNames:
+            self.recordedMibNames.add(mibname)
+
+            self.compiler.journal.add_record(
+                mibname,
+                self.sourceHashes.get(mibname),
+                self.signatures.get(mibname),
+                self.processed[mibname],
+                mibData and get_output_digest(mibData),
+            )
+
+    def cancel(self):
+        """Stop the compilation run by another thread as soon as possible."""
+        with self.lock:
+            self.cancelled = True
+
+            for future in self.futures:
+                future.cancel()
+
+    def check_cancelled(self):
+        if self.cancelled:
+            raise asyncio.CancelledError()
+
+    def wait(self, future):
+        """Wait for the future of the event loop, unless cancelled."""
+        with self.lock:
+            self.futures.add(future)
+
+            if self.cancelled:
+                future.cancel()
+
+        try:
+            return future.result()
+
+        except CancelledError:
+            # the future is cancelled along with the compilation only
+            raise asyncio.CancelledError()
+
+        finally:
+            with self.lock:
+                self.futures.discard(future)
+
+    def call(self, func, asyncFunc, *args, **kwargs):
+        self.check_cancelled()
+
+        if self.loop is None:
+            return func(*args, **kwargs)
+
+        return self.wait(
+            asyncio.run_coroutine_threadsafe(asyncFunc(*args, **kwargs), self.loop)
+        )
+
+    def prefetch(self, *names):
+        if self.executor is None and self.loop is None:
+            return
+
+        for name in names:
+            if (
+                name in self.pendingMibs
+                or name in self.parsedMibNames
+                or name in self.failedMibs
+                or name in self.seenMibNames
+            ):
+                continue
+
+            if self.loop is None:
+                self.pendingMibs[name] = self.executor.submit(
+                    _fetch_mib_in_worker, name
+                )
 
-                    continue
             else:
-                debug.logger & debug.FLAG_COMPILER and debug.logger(
-                    f"no suitable compiled MIB {mibname} found anywhere"
+                future = asyncio.run_coroutine_threadsafe(
+                    _read_mib_async(
+                        self.compiler._sources,
+                        name,
+                        stats=self.stats,
+                        resolver=self.compiler.resolver,
+                    ),
+                    self.loop,
                 )
 
-                if options.get("noDeps") and mibname not in canonicalMibNames:
-                    debug.logger & debug.FLAG_COMPILER and debug.logger(
-                        f"excluding imported MIB {mibname} from borrowing"
+                with self.lock:
+                    self.futures.add(future)
+
+                    if self.cancelled:
+                        future.cancel()
+
+                self.pendingMibs[name] = future
+
+    def fetch(self, mibname, start=0):
+        compiler = self.compiler
+
+        if start == 0 and mibname in self.pendingMibs:
+            future = self.pendingMibs.pop(mibname)
+
+            if self.loop is None:
+                outcomes = future.result()
+
+            else:
+                outcomes = self.wait(future)
+
+        elif self.loop is not None:
+            outcomes = self.wait(
+                asyncio.run_coroutine_threadsafe(
+                    _read_mib_async(
+                        compiler._sources, mibname, start, self.stats, compiler.resolver
+                    ),
+                    self.loop,
+                )
+            )
+
+        elif self.isolate:
+            if start >= len(compiler._sources):
+                return []
+
+            try:
+                outcomes = _run_isolated(
+                    dict(
+                        sources=compiler._sources,
+                        parser=compiler._parser,
+                        cache=compiler.symbolTableCache,
+                        resolver=compiler.resolver,
+                        observed=bool(compiler._observers),
+                    ),
+                    _fetch_mib_in_worker,
+                    mibname,
+                    start,
+                    timeout=self.mibTimeout,
+                    memoryLimit=self.mibMemoryLimit,
+                )
+
+            except error.PySmiWorkerError as exc:
+                # blame the first source tried, the rest get their chance
+                outcomes = [(start, None, None, None, None, exc)], CompileStats()
+
+        else:
+            return _fetch_mib(
+                compiler._sources,
+                compiler._parser,
+                mibname,
+                start,
+                compiler.symbolTableCache,
+                self.stats,
+                compiler.resolver,
+            )
+
+        if self.loop is None:
+            # worker processes keep statistics of their own
+            outcomes, workerStats = outcomes
+            self.stats.update(workerStats)
+
+        return outcomes
+
+    def get_comments(self, fileInfo):
+        return self.compiler._get_comments(fileInfo, self.options.get("reproducible"))
+
+    #
+    # Read and parse MIB, along with the other MIBs in the same file
+    #
+
+    def read(self, mibname):
+        compiler = self.compiler
+        stats = self.stats
+        options = self.options
+
+        if mibname in self.parsedMibNames:
+            debug.logger & debug.FLAG_COMPILER and debug.logger(
+                f"MIB {mibname} already parsed"
+            )
+            return
+
+        if mibname in self.failedMibs:
+            debug.logger & debug.FLAG_COMPILER and debug.logger(
+                f"MIB {mibname} already failed"
+            )
+            return
+
+        if mibname in self.seenMibNames:
+            debug.logger & debug.FLAG_COMPILER and debug.logger(
+                f"MIB {mibname} already seen (cyclic dependency)"
+            )
+            return
+
+        self.seenMibNames.add(mibname)
+
+        outcomes = self.fetch(mibname)
+
+        newMibNames = []
+
+        while outcomes:
+            (
+                index,
+                fileInfo,
+                fileData,
+                mibTrees,
+                symbolTables,
+                exc,
+            ) = outcomes.pop(0)
+
+            source = compiler._sources[index]
+
+            try:
+                if exc is not None:
+                    raise _attach_components(exc, reader=source)
+
+                if mibTrees is None and symbolTables is None:
+                    # MIB read, but not parsed yet
+                    mibTrees, symbolTables = _load_mib(
+                        compiler._parser,
+                        fileData,
+                        compiler.symbolTableCache,
+                        stats,
+                        mibname,
                     )
-                    processed[mibname] = status_untouched
+
+                if symbolTables is None:
+                    with stats.timer("symtable", mibname):
+                        symbolTables = [
+                            compiler._symbolgen.gen_code(mibTree, self.symbolTableMap)
+                            for mibTree in mibTrees
+                        ]
+
+                    if compiler.symbolTableCache is not None:
+                        compiler.symbolTableCache.put_data(
+                            _get_symtable_key(compiler._parser, fileData),
+                            symbolTables,
+                        )
 
                 else:
                     debug.logger & debug.FLAG_COMPILER and debug.logger(
-                        f"will borrow MIB {mibname}"
+                        f"symbol tables of {mibname} taken from {compiler.symbolTableCache}"
                     )
-                    builtMibs[mibname] = borrowedMibs[mibname]
 
-                    processed[mibname] = status_borrowed.set_options(
-                        path=fileInfo.path, file=fileInfo.file, alias=fileInfo.name
+                    # MIB text gets parsed only if code is to be generated
+                    mibTrees = [None] * len(symbolTables)
+
+                if compiler.manifest is not None or compiler.journal is not None:
+                    sourceHash = FileCache.make_key(fileData)
+
+                for (mibInfo, symbolTable), mibTree in zip(symbolTables, mibTrees):
+                    self.symbolTableMap[mibInfo.name] = symbolTable
+
+                    self.parsedMibs[mibInfo.name] = fileInfo, mibInfo, mibTree
+
+                    if compiler.manifest is not None or compiler.journal is not None:
+                        self.sourceHashes[mibInfo.name] = sourceHash
+
+                    if mibTree is None:
+                        self.mibTexts[mibInfo.name] = fileData
+
+                    self.parsedMibNames.add(mibInfo.name)
+
+                    self.graph.add_module(mibInfo.name, mibInfo.imported)
+
+                    self.waitingMibs[mibInfo.name] = None
+
+                    newMibNames.append(mibInfo.name)
+
+                    if mibname in self.failedMibs:
+                        del self.failedMibs[mibname]
+
+                    self.mibsToParse.extend(mibInfo.imported)
+
+                    self.prefetch(*mibInfo.imported)
+
+                    if fileInfo.name in self.mibnames:
+                        if mibInfo.name not in self.canonicalMibNames:
+                            self.canonicalMibNames[mibInfo.name] = []
+                        self.canonicalMibNames[mibInfo.name].append(fileInfo.name)
+
+                    debug.logger & debug.FLAG_COMPILER and debug.logger(
+                        f"{mibInfo.name} ({mibname}) read from {fileInfo.path}, immediate dependencies: {', '.join(mibInfo.imported) or '<none>'}"
                     )
 
-                del borrowedMibs[mibname]
+                break
 
-        debug.logger & debug.FLAG_COMPILER and debug.logger(
-            f"MIBs built {len(builtMibs)}, MIBs failed {len(failedMibs)}"
-        )
+            except UnicodeDecodeError:
+                debug.logger & debug.FLAG_COMPILER and debug.logger(
+                    f"http exception {mibname} found at {source}"
+                )
+                continue
 
-        #
-        # We could attempt to ignore missing/failed MIBs
-        #
+            except error.PySmiReaderFileNotFoundError:
+                debug.logger & debug.FLAG_COMPILER and debug.logger(
+                    f"no {mibname} found at {source}"
+                )
+                continue
+
+            except error.PySmiError as exc:
+                exc.source = source
+                exc.mibname = mibname
+                exc.msg += f" at MIB {mibname}"
+
+                debug.logger & debug.FLAG_COMPILER and debug.logger(
+                    f"{options.get('ignoreErrors') and 'ignoring ' or 'failing on '} {exc} from {source}"
+                )
+
+                self.failedMibs[mibname] = exc
+
+                self.processed[mibname] = status_failed.set_options(error=exc)
 
-        if failedMibs and not options.get("ignoreErrors"):
+                if not outcomes:
+                    # parsed MIB failed later on, try the remaining sources
+                    outcomes = self.fetch(mibname, index + 1)
+
+        else:
+            exc = error.PySmiError(f"MIB source {mibname} not found")
+            exc.mibname = mibname
             debug.logger & debug.FLAG_COMPILER and debug.logger(
-                "failing with problem MIBs: " + ", ".join(failedMibs)
+                f"no {mibname} found anywhere"
             )
 
-            for mibname in builtMibs:
-                processed[mibname] = status_unprocessed
+            if mibname not in self.failedMibs:
+                self.failedMibs[mibname] = exc
+
+            if mibname not in self.processed:
+                self.processed[mibname] = status_missing
+
+        if mibname in self.failedMibs and not compiler._borrowers:
+            self.finishedMibs.append((mibname, None))
+
+        self.settledMibNames.add(mibname)
+        self.settledMibNames.update(newMibNames)
+
+        self.schedule(mibname, *newMibNames)
+
+        if self.memoryBudget:
+            # MIBs still waiting get parsed once again later on
+            for name in newMibNames:
+                if name in self.waitingMibs and self.parsedMibs[name][2] is not None:
+                    self.parsedMibs[name] = self.parsedMibs[name][:2] + (None,)
+                    self.mibTexts[name] = fileData
+
+    #
+    # Sum up everything that affects MIB transformation
+    #
+
+    def get_signature(self, mibname):
+        compiler = self.compiler
+
+        dependencies = []
+
+        for name in sorted(self.graph.closure(mibname)):
+            if name not in self.symbolTableDigests and name in self.symbolTableMap:
+                self.symbolTableDigests[name] = get_symtable_digest(
+                    self.symbolTableMap[name]
+                )
+
+            dependencies.append((name, self.symbolTableDigests.get(name)))
+
+        return FileCache.make_key(
+            "signature",
+            self.sourceHashes[mibname],
+            compiler._parser.__class__.__name__,
+            getattr(compiler._parser, "grammarOptions", ()),
+            config.STRICT_MODE,
+            compiler._codegen.__class__.__name__,
+            self.genOptions["dstTemplate"],
+            self.genOptions["genTexts"],
+            bool(self.options.get("reproducible")),
+            dependencies,
+        )
+
+    def skip(self, mibname):
+        """Report parsed MIB untouched, with no code generated for it."""
+        del self.parsedMibs[mibname]
+        self.mibTexts.pop(mibname, None)
+        self.processed[mibname] = status_untouched
+        self.finishedMibs.append((mibname, None))
 
-            return processed
+    #
+    # See if MIB needs generating
+    #
+
+    def check(self, mibname):
+        compiler = self.compiler
+        options = self.options
+
+        fileInfo, mibInfo, mibTree = self.parsedMibs[mibname]
 
         debug.logger & debug.FLAG_COMPILER and debug.logger(
-            f"proceeding with built MIBs {', '.join(builtMibs)}, failed MIBs {', '.join(failedMibs)}"
+            f"checking if {mibname} requires updating"
         )
 
-        #
-        # Store compiled MIBs
-        #
+        mtime = fileInfo.mtime
+        rebuild = options.get("rebuild")
+
+        if compiler.manifest is not None or compiler.journal is not None:
+            signature = self.signatures[mibname] = self.get_signature(mibname)
+
+        if compiler.journal is not None and options.get("resume") and not rebuild:
+            record = compiler.journal.get_record(mibname)
+
+            if (
+                record
+                and record.get("signature") == signature
+                and record.get("status") == status_compiled
+                and self.is_stored(mibname, record.get("digest"))
+            ):
+                debug.logger & debug.FLAG_COMPILER and debug.logger(
+                    f"{mibname} already {record['status']} according to {compiler.journal}"
+                )
+                self.recordedMibNames.add(mibname)
+                self.skip(mibname)
+                return False
+
+        if compiler.manifest is not None:
+            recordedSignature = compiler.manifest.get_signature(mibname)
+
+            if recordedSignature == signature:
+                debug.logger & debug.FLAG_COMPILER and debug.logger(
+                    f"{mibname} signature matches {compiler.manifest}"
+                )
+                # any existing compiled MIB is fresh enough
+                mtime = 0
+
+            elif recordedSignature is not None:
+                debug.logger & debug.FLAG_COMPILER and debug.logger(
+                    f"{mibname} signature differs from {compiler.manifest}"
+                )
+                rebuild = True
+
+        if self.search(mibname, mtime, rebuild):
+            self.skip(mibname)
+            return False
+
+        debug.logger & debug.FLAG_COMPILER and debug.logger(
+            f"no suitable compiled MIB {mibname} found anywhere"
+        )
+
+        if options.get("noDeps") and mibname not in self.canonicalMibNames:
+            debug.logger & debug.FLAG_COMPILER and debug.logger(
+                f"excluding imported MIB {mibname} from code generation"
+            )
+            # not built here, so not to be taken as built on resume
+            self.recordedMibNames.add(mibname)
+            self.skip(mibname)
+            return False
+
+        return True
+
+    def is_stored(self, mibname, digest):
+        """Tell if the writer still holds the transformed MIB journaled."""
+        try:
+            storedDigest = self.compiler._writer.get_digest(mibname)
+
+        except NotImplementedError:
+            # nothing to tell by, the journal is taken at its word
+            return True
+
+        if storedDigest != digest:
+            debug.logger & debug.FLAG_COMPILER and debug.logger(
+                f"{mibname} stored by {self.compiler._writer} differs from {self.compiler.journal}"
+            )
+            return False
 
-        for mibname in builtMibs.copy():
-            fileInfo, mibInfo, mibData = builtMibs[mibname]
+        return True
+
+    def search(self, mibname, mtime, rebuild):
+        """Tell if compiled MIB is up to date according to any searcher."""
+        for searcher in self.compiler._searchers:
+            self.stats.count("searcherProbes")
 
             try:
-                if options.get("writeMibs", True):
-                    self._writer.put_data(
-                        mibname, mibData, dryRun=options.get("dryRun")  # type: ignore
+                with self.stats.timer("search", mibname):
+                    self.call(
+                        searcher.file_exists,
+                        searcher.file_exists_async,
+                        mibname,
+                        mtime,
+                        rebuild=rebuild,
                     )
 
+            except error.PySmiFileNotFoundError:
                 debug.logger & debug.FLAG_COMPILER and debug.logger(
-                    f"{mibname} stored by {self._writer}"
+                    f"no compiled MIB {mibname} available through {searcher}"
                 )
+                continue
 
-                del builtMibs[mibname]
-
-                if mibname not in processed:
-                    processed[mibname] = status_compiled.set_options(
-                        path=fileInfo.path,
-                        file=fileInfo.file,
-                        alias=fileInfo.name,
-                        oid=mibInfo.oid,
-                        oids=mibInfo.oids,
-                        identity=mibInfo.identity,
-                        revision=mibInfo.revision,
-                        enterprise=mibInfo.enterprise,
-                        compliance=mibInfo.compliance,
-                    )
+            except error.PySmiFileNotModifiedError:
+                debug.logger & debug.FLAG_COMPILER and debug.logger(
+                    f"will be using existing compiled MIB {mibname} found by {searcher}"
+                )
+                self.stats.count("searcherHits")
+                return True
 
             except error.PySmiError as exc:
-                exc.handler = self._codegen
+                exc.searcher = searcher
                 exc.mibname = mibname
                 exc.msg += f" at MIB {mibname}"
-
                 debug.logger & debug.FLAG_COMPILER and debug.logger(
-                    f"error {exc} from {self._writer}"
+                    f"error from {searcher}: {exc}"
                 )
+                continue
 
-                processed[mibname] = status_failed.set_options(error=exc)
-                failedMibs[mibname] = exc
-                del builtMibs[mibname]
+        return False
+
+    #
+    # Generate code for parsed MIB
+    #
+
+    def generate(self, mibname):
+        compiler = self.compiler
+        stats = self.stats
+
+        fileInfo, mibInfo, mibTree = self.parsedMibs[mibname]
 
-        modified_mibs = [
-            x for x in processed if processed[x] in ("compiled", "borrowed")
-        ]
         debug.logger & debug.FLAG_COMPILER and debug.logger(
-            f"MIBs modified: {', '.join(modified_mibs)}"
+            f"compiling {mibname} read from {fileInfo.path}"
         )
 
-        return processed
+        if self.isolate:
+            try:
+                mibInfo, mibData, exc, workerStats = _run_isolated(
+                    dict(
+                        codegen=compiler._codegen,
+                        parser=compiler._parser,
+                        symbolgen=compiler._symbolgen,
+                        symbolTableMap=self.symbolTableMap,
+                        parsedMibs={mibname: self.parsedMibs[mibname]},
+                        mibTexts=self.mibTexts,
+                        observed=bool(compiler._observers),
+                    ),
+                    _build_in_worker,
+                    mibname,
+                    self.get_comments(fileInfo),
+                    self.genOptions,
+                    timeout=self.mibTimeout,
+                    memoryLimit=self.mibMemoryLimit,
+                )
+
+            except error.PySmiWorkerError as exc:
+                self.build(mibname, None, None, exc)
+
+            else:
+                stats.update(workerStats)
+                self.build(mibname, mibInfo, mibData, exc)
+
+            return
+
+        try:
+            if mibTree is None:
+                with stats.timer("parse", mibname) as event:
+                    event.size = len(self.mibTexts[mibname])
+
+                    mibTree = _parse_mib(
+                        compiler._parser,
+                        compiler._symbolgen,
+                        mibname,
+                        self.mibTexts[mibname],
+                    )
+
+            with stats.timer("codegen", mibname) as event:
+                mibInfo, mibData = compiler._codegen.gen_code(
+                    mibTree,
+                    self.symbolTableMap,
+                    comments=self.get_comments(fileInfo),
+                    stats=stats,
+                    **self.genOptions,
+                )
+
+                event.size = len(mibData)
+
+        except error.PySmiError as exc:
+            self.build(mibname, None, None, exc)
+
+        else:
+            self.build(mibname, mibInfo, mibData)
+
+    def build(self, mibname, mibInfo, mibData, exc=None, stored=False):
+        compiler = self.compiler
+
+        fileInfo = self.parsedMibs.pop(mibname)[0]
+
+        self.mibTexts.pop(mibname, None)
+
+        if mibInfo is None:
+            exc.handler = compiler._codegen
+            exc.mibname = mibname
+            exc.msg += f" at MIB {mibname}"
+
+            debug.logger & debug.FLAG_COMPILER and debug.logger(
+                f"error from {compiler._codegen}: {exc}"
+            )
+
+            self.processed[mibname] = status_failed.set_options(error=exc)
+
+            self.failedMibs[mibname] = exc
+
+            # borrowed MIB, if any, is not what the signature stands for
+            self.signatures.pop(mibname, None)
+
+            if not compiler._borrowers:
+                self.finishedMibs.append((mibname, None))
+
+            return
+
+        self.builtMibs[mibname] = fileInfo, mibInfo, mibData
+
+        debug.logger & debug.FLAG_COMPILER and debug.logger(
+            f"{mibname} read from {fileInfo.path} and compiled by {compiler._writer}"
+        )
+
+        if self.storeEarly:
+            self.store(mibname, exc, stored)
+
+    #
+    # Store compiled MIB
+    #
+
+    def store(self, mibname, exc=None, stored=False):
+        compiler = self.compiler
+        options = self.options
+
+        fileInfo, mibInfo, mibData = self.builtMibs.pop(mibname)
+
+        try:
+            if exc is not None:
+                raise _attach_components(exc, writer=compiler._writer)
+
+            if not stored and options.get("writeMibs", True):
+                with self.stats.timer("write", mibname) as event:
+                    event.size = len(mibData)
+
+                    self.call(
+                        compiler._writer.put_data,
+                        compiler._writer.put_data_async,
+                        mibname,
+                        mibData,
+                        dryRun=options.get("dryRun"),
+                    )
+
+            debug.logger & debug.FLAG_COMPILER and debug.logger(
+                f"{mibname} stored by {compiler._writer}"
+            )
+
+            if (
+                compiler.manifest is not None
+                and mibname in self.signatures
+                and options.get("writeMibs", True)
+                and not options.get("dryRun")
+            ):
+                compiler.manifest.set_signature(mibname, self.signatures[mibname])
+
+            if mibname not in self.processed:
+                self.processed[mibname] = status_compiled.set_options(
+                    path=fileInfo.path,
+                    file=fileInfo.file,
+                    alias=fileInfo.name,
+                    oid=mibInfo.oid,
+                    oids=mibInfo.oids,
+                    identity=mibInfo.identity,
+                    revision=mibInfo.revision,
+                    enterprise=mibInfo.enterprise,
+                    compliance=mibInfo.compliance,
+                )
+
+            # right away, as the process may get killed any moment
+            self.record(mibname, mibData)
+
+            self.finishedMibs.append((mibname, mibData))
+
+        except error.PySmiError as exc:
+            exc.handler = compiler._codegen
+            exc.mibname = mibname
+            exc.msg += f" at MIB {mibname}"
+
+            debug.logger & debug.FLAG_COMPILER and debug.logger(
+                f"error {exc} from {compiler._writer}"
+            )
+
+            # unlike the MIBs failed earlier on, this one is not
+            # subject to borrowing
+            self.processed[mibname] = status_failed.set_options(error=exc)
+
+            self.finishedMibs.append((mibname, None))
+
+    #
+    # Generate code for ready MIBs in worker processes, wave by wave
+    #
+
+    def launch_wave(self):
+        compiler = self.compiler
+        options = self.options
+        readyMibs = self.readyMibs
+
+        if self.wave is not None or not readyMibs:
+            return
+
+        state = dict(
+            codegen=compiler._codegen,
+            parser=compiler._parser,
+            symbolgen=compiler._symbolgen,
+            symbolTableMap=self.get_symbol_tables(readyMibs),
+            parsedMibs={x: self.parsedMibs[x] for x in readyMibs},
+            mibTexts={x: self.mibTexts[x] for x in readyMibs if x in self.mibTexts},
+            observed=bool(compiler._observers),
+        )
+
+        if (
+            self.storeEarly
+            and options.get("writeMibs", True)
+            and compiler._writer.concurrentWrites
+        ):
+            state.update(writer=compiler._writer, dryRun=options.get("dryRun"))
+
+        debug.logger & debug.FLAG_COMPILER and debug.logger(
+            f"generating code for {', '.join(readyMibs)} with {self.jobs} worker {self.workerKind}"
+        )
+
+        # symbol tables needed go to each worker once
+        waveExecutor = _get_executor(
+            min(self.jobs, len(readyMibs)), state, self.threads
+        )
+
+        self.wave = (
+            waveExecutor,
+            "writer" in state,
+            {
+                mibname: waveExecutor.submit(
+                    _build_in_worker,
+                    mibname,
+                    self.get_comments(self.parsedMibs[mibname][0]),
+                    self.genOptions,
+                )
+                for mibname in readyMibs
+            },
+        )
+
+        readyMibs.clear()
+
+    def get_symbol_tables(self, mibnames):
+        """Return symbol tables needed to generate code for the MIBs.
+
+        These are the tables of the MIBs and of all the MIBs they IMPORT,
+        directly or not. Other tables, possibly spilled, are not touched.
+        """
+        names = set(mibnames).union(*(self.graph.closure(x) for x in mibnames))
+
+        return {
+            name: self.symbolTableMap[name]
+            for name in sorted(names)
+            if name in self.symbolTableMap
+        }
+
+    def finish_wave(self, wait=True):
+        if self.wave is None:
+            return
+
+        waveExecutor, stored, futures = self.wave
+
+        if not wait and not all(x.done() for x in futures.values()):
+            return
+
+        self.wave = None
+
+        try:
+            for mibname, future in futures.items():
+                mibInfo, mibData, exc, workerStats = future.result()
+
+                self.stats.update(workerStats)
+
+                if mibInfo is None:
+                    self.build(mibname, None, None, exc)
+
+                else:
+                    self.build(mibname, mibInfo, mibData, exc, stored)
+
+        finally:
+            waveExecutor.shutdown(wait=True, cancel_futures=True)
+
+    #
+    # Move parsed MIBs on as soon as the MIBs they IMPORT are settled
+    #
+
+    def schedule(self, *mibnames, force=False):
+        graph = self.graph
+
+        candidates = set()
+
+        for mibname in mibnames:
+            candidates.add(mibname)
+            candidates.update(graph.dependents(mibname))
+
+        closures = {x: graph.closure(x) for x in self.waitingMibs if x in candidates}
+
+        # IMPORT'ed MIBs have smaller closures, so they come first
+        for mibname in sorted(closures, key=lambda x: len(closures[x])):
+            if not force and not closures[mibname].issubset(self.settledMibNames):
+                continue
+
+            del self.waitingMibs[mibname]
+
+            if not self.check(mibname):
+                continue
+
+            if self.jobs > 1:
+                self.readyMibs.append(mibname)
+
+            else:
+                self.generate(mibname)
+
+        if self.jobs > 1:
+            self.finish_wave(wait=force)
+            self.launch_wave()
+
+    #
+    # Try to borrow pre-compiled MIBs for failed ones
+    #
+
+    def borrow(self):
+        compiler = self.compiler
+        stats = self.stats
+        options = self.options
+
+        failedMibs = self.failedMibs
+        borrowedMibs = self.borrowedMibs
+
+        for mibname in failedMibs.copy():
+            if options.get("noDeps") and mibname not in self.canonicalMibNames:
+                debug.logger & debug.FLAG_COMPILER and debug.logger(
+                    f"excluding imported MIB {mibname} from borrowing"
+                )
+                continue
+
+            for borrower in compiler._borrowers:
+                debug.logger & debug.FLAG_COMPILER and debug.logger(
+                    f"trying to borrow {mibname} from {borrower}"
+                )
+                stats.count("borrowAttempts")
+
+                try:
+                    with stats.timer("borrow", mibname) as event:
+                        fileInfo, fileData = borrower.get_data(
+                            mibname, genTexts=options.get("genTexts")
+                        )
+
+                        event.size = len(fileData)
+
+                    stats.count("borrowHits")
+
+                    borrowedMibs[mibname] = (
+                        fileInfo,
+                        MibInfo(name=mibname, imported=[]),
+                        fileData,
+                    )
+
+                    del failedMibs[mibname]
+
+                    debug.logger & debug.FLAG_COMPILER and debug.logger(
+                        f"{mibname} borrowed with {borrower}"
+                    )
+                    break
+
+                except error.PySmiError:
+                    debug.logger & debug.FLAG_COMPILER and debug.logger(
+                        f"error from {borrower}: {sys.exc_info()[1]}"
+                    )
+
+        debug.logger & debug.FLAG_COMPILER and debug.logger(
+            f"MIBs available for borrowing {len(borrowedMibs)}, MIBs failed {len(failedMibs)}"
+        )
+
+        #
+        # See what MIBs need borrowing
+        #
+
+        for mibname in borrowedMibs.copy():
+            debug.logger & debug.FLAG_COMPILER and debug.logger(
+                f"checking if failed MIB {mibname} requires borrowing"
+            )
+
+            fileInfo, mibInfo, mibData = borrowedMibs[mibname]
+
+            if self.search(mibname, fileInfo.mtime, options.get("rebuild")):
+                self.processed[mibname] = status_untouched
+
+            else:
+                debug.logger & debug.FLAG_COMPILER and debug.logger(
+                    f"no suitable compiled MIB {mibname} found anywhere"
+                )
+
+                if options.get("noDeps") and mibname not in self.canonicalMibNames:
+                    debug.logger & debug.FLAG_COMPILER and debug.logger(
+                        f"excluding imported MIB {mibname} from borrowing"
+                    )
+                    self.processed[mibname] = status_untouched
+
+                else:
+                    debug.logger & debug.FLAG_COMPILER and debug.logger(
+                        f"will borrow MIB {mibname}"
+                    )
+                    self.builtMibs[mibname] = borrowedMibs[mibname]
+
+                    self.processed[mibname] = status_borrowed.set_options(
+                        path=fileInfo.path, file=fileInfo.file, alias=fileInfo.name
+                    )
+
+            del borrowedMibs[mibname]
+
+        debug.logger & debug.FLAG_COMPILER and debug.logger(
+            f"MIBs built {len(self.builtMibs)}, MIBs failed {len(failedMibs)}"
+        )
+
+    #
+    # Store compiled MIBs, unless failed MIBs hold them back
+    #
+
+    def finish(self):
+        compiler = self.compiler
+        options = self.options
+        processed = self.processed
+        builtMibs = self.builtMibs
+
+        if self.failedMibs and not options.get("ignoreErrors"):
+            debug.logger & debug.FLAG_COMPILER and debug.logger(
+                "failing with problem MIBs: " + ", ".join(self.failedMibs)
+            )
+
+            for mibname in builtMibs:
+                processed[mibname] = status_unprocessed
+
+            self.finishedMibs.extend((x, None) for x in processed)
+
+            yield from self.drain()
+
+            return
+
+        debug.logger & debug.FLAG_COMPILER and debug.logger(
+            f"proceeding with built MIBs {', '.join(builtMibs)}, failed MIBs {', '.join(self.failedMibs)}"
+        )
+
+        storedMibs = {}
+
+        if (
+            self.jobs > 1
+            and len(builtMibs) > 1
+            and options.get("writeMibs", True)
+            and compiler._writer.concurrentWrites
+        ):
+            debug.logger & debug.FLAG_COMPILER and debug.logger(
+                f"storing {len(builtMibs)} MIBs with {self.jobs} worker {self.workerKind}"
+            )
+
+            with self.stats.timer("write") as event:
+                event.size = sum(len(x[2]) for x in builtMibs.values())
+
+                storedMibs = dict(
+                    zip(
+                        builtMibs,
+                        _map_in_pool(
+                            self.jobs,
+                            dict(writer=compiler._writer),
+                            _put_data_in_worker,
+                            builtMibs,
+                            [x[2] for x in builtMibs.values()],
+                            [options.get("dryRun")] * len(builtMibs),
+                            threads=self.threads,
+                        ),
+                    )
+                )
+
+        for mibname in tuple(builtMibs):
+            if mibname in storedMibs:
+                self.store(mibname, storedMibs[mibname], stored=True)
+
+            else:
+                self.store(mibname)
+
+            yield from self.drain()
+
+        if compiler.manifest is not None:
+            compiler.manifest.save()
+
+        modified_mibs = [
+            x for x in processed if processed[x] in ("compiled", "borrowed")
+        ]
+        debug.logger & debug.FLAG_COMPILER and debug.logger(
+            f"MIBs modified: {', '.join(modified_mibs)}"
+        )
+
+        # failed MIBs that could not be borrowed and the like
+        self.finishedMibs.extend((x, None) for x in processed)
+
+        yield from self.drain()
+
+        # all done, next run has nothing to resume
+        if self.journaling and not any(
+            x in ("failed", "missing") for x in processed.values()
+        ):
+            debug.logger & debug.FLAG_COMPILER and debug.logger(
+                f"compilation finished without errors, clearing {compiler.journal}"
+            )
+
+            compiler.journal.clear()
+
+
+class MibCompiler:
+    """Top-level, user-facing, composite MIB compiler object.
+
+    MibCompiler implements high-level MIB transformation processing logic.
+    It executes its actions by calling the following specialized objects:
+
+      * *readers* - to acquire ASN.1 MIB data
+      * *searchers* - to see if transformed MIB already exists and no processing is necessary
+      * *parser* - to parse ASN.1 MIB into AST
+      * *code generator* - to perform actual MIB transformation
+      * *borrowers* - to fetch pre-transformed MIB if transformation is impossible
+      * *writer* - to store transformed MIB data
+
+    Required components must be passed to MibCompiler on instantiation. Those
+    components are: *parser*, *codegenerator* and *writer*.
+
+    Optional components could be set or modified at later phases of MibCompiler
+    life. Unlike singular, required components, optional one can be present
+    in sequences to address many possible sources of data. They are
+    *readers*, *searchers* and *borrowers*.
+    """
+
+    indexFile = "index"
+
+    #: optional *FileCache* for MIB symbol tables
+    symbolTableCache = None
+
+    #: optional *BuildManifest* for deciding what MIBs to rebuild
+    manifest = None
+
+    #: optional *MibResolver* remembering what MIB sources serve what MIBs
+    resolver = None
+
+    #: optional *BuildJournal* recording each MIB as soon as it is finished
+    journal = None
+
+    #: peak resident memory size of the process by the end of the last
+    #: compilation, in bytes, if known
+    peakMemory = None
+
+    #: *CompileStats* of the last compilation
+    stats = None
+
+    _searchers: list[AbstractSearcher]
+    _sources: list[AbstractReader]
+    _borrowers: list[AbstractBorrower]
+    _parsedMibs: dict[str, tuple]
+
+    failedMibs: dict[str, error.PySmiError]
+
+    graph: DependencyGraph
+
+    def __init__(self, parser, codegen: AbstractCodeGen, writer: AbstractWriter):
+        """Creates an instance of *MibCompiler* class.
+
+        Args:
+            parser: ASN.1 MIB parser object
+            codegen: MIB transformation object
+            writer: transformed MIB storing object
+        """
+        self._parser = parser
+        self._codegen = codegen
+        self._symbolgen = SymtableCodeGen()
+        self._writer = writer
+        self._sources = []
+        self._searchers = []
+        self._borrowers = []
+        self._observers = []
+        self.graph = DependencyGraph()
+
+    def set_options(self, **kwargs):
+        for k in kwargs:
+            setattr(self, k, kwargs[k])
+        return self
+
+    def add_sources(self, *sources):
+        """Add more ASN.1 MIB source repositories.
+
+        MibCompiler.compile will invoke each of configured source objects
+        in order of their addition asking each to fetch MIB module specified
+        by name.
+
+        Args:
+            sources: reader object(s)
+
+        Returns:
+            reference to itself (can be used for call chaining)
+
+        """
+        self._sources.extend(sources)
+
+        debug.logger & debug.FLAG_COMPILER and debug.logger(
+            f"current MIB source(s): {', '.join(map(str, self._sources))}"
+        )
+
+        return self
+
+    def add_searchers(self, *searchers):
+        """Add more transformed MIBs repositories.
+
+        MibCompiler.compile will invoke each of configured searcher objects
+        in order of their addition asking each if already transformed MIB
+        module already exists and is more recent than specified.
+
+        Args:
+            searchers: searcher object(s)
+
+        Returns:
+            reference to itself (can be used for call chaining)
+
+        """
+        self._searchers.extend(searchers)
+
+        debug.logger & debug.FLAG_COMPILER and debug.logger(
+            f"current compiled MIBs location(s): {', '.join(map(str, self._searchers))}"
+        )
+
+        return self
+
+    def add_borrowers(self, *borrowers):
+        """Add more transformed MIBs repositories to borrow MIBs from.
+
+        Whenever MibCompiler.compile encounters MIB module which neither of
+        the *searchers* can find or fetched ASN.1 MIB module can not be
+        parsed (due to syntax errors), these *borrowers* objects will be
+        invoked in order of their addition asking each if already transformed
+        MIB can be fetched (borrowed).
+
+        Args:
+            borrowers: borrower object(s)
+
+        Returns:
+            reference to itself (can be used for call chaining)
+
+        """
+        self._borrowers.extend(borrowers)
+
+        debug.logger & debug.FLAG_COMPILER and debug.logger(
+            f"current MIB borrower(s): {', '.join(map(str, self._borrowers))}"
+        )
+
+        return self
+
+    def add_observers(self, *observers):
+        """Add more observers of MIB compilation phases.
+
+        MibCompiler.compile will call *phase_started* and *phase_finished*
+        methods of each of configured observers around every phase of
+        MIB compilation, see *AbstractObserver*.
+
+        Args:
+            observers: observer object(s)
+
+        Returns:
+            reference to itself (can be used for call chaining)
+
+        """
+        self._observers.extend(observers)
+
+        debug.logger & debug.FLAG_COMPILER and debug.logger(
+            f"current observer(s): {', '.join(map(str, self._observers))}"
+        )
+
+        return self
+
+    def _get_system_info(self):
+        # Gather platform information
+        platform_info = (
+            platform.system(),  # Operating system (e.g., 'Linux', 'Windows', 'Darwin')
+            platform.node(),  # Hostname
+            platform.release(),  # Version of the OS
+        )
+
+        # Gather user information
+        user_info = (getpass.getuser(),)  # Current logged-in user
+
+        return platform_info, user_info
+
+    def _get_comments(self, fileInfo=None, reproducible=False):
+        comments = []
+
+        if reproducible:
+            # paths vary from one checkout to another
+            if fileInfo is not None:
+                comments.append(f"ASN.1 source {fileInfo.file or fileInfo.name}")
+
+            # see https://reproducible-builds.org/specs/source-date-epoch/
+            try:
+                timestamp = time.asctime(
+                    time.gmtime(int(os.environ["SOURCE_DATE_EPOCH"]))
+                )
+
+            except (KeyError, ValueError):
+                comments.append(f"Produced by {package_name}-{package_version}")
+
+            else:
+                comments.append(
+                    f"Produced by {package_name}-{package_version} at {timestamp}"
+                )
+
+            return comments
 
-    def build_index(self, processedMibs, **options):
         platform_info, user_info = self._get_system_info()
 
-        comments = [
-            f"Produced by {package_name}-{package_version} at {time.asctime()}",
-            f"On host {platform_info[1]} platform {platform_info[0]} version {platform_info[2]} by user {user_info[0]}",
-            f"Using Python version {sys.version.splitlines()[0]}",
+        if fileInfo is not None:
+            comments.append(f"ASN.1 source {fileInfo.path}")
+
+        comments.extend(
+            [
+                f"Produced by {package_name}-{package_version} at {time.asctime()}",
+                f"On host {platform_info[1]} platform {platform_info[0]} version {platform_info[2]} by user {user_info[0]}",
+                f"Using Python version {sys.version.splitlines()[0]}",
+            ]
+        )
+
+        return comments
+
+    def compile(self, *mibnames, **options):
+        """Transform requested and possibly referred MIBs.
+
+        The *compile* method should be invoked when *MibCompiler* object
+        is operational meaning at least *sources* are specified.
+
+        Once called with a MIB module name, *compile* will:
+
+        * fetch ASN.1 MIB module with given name by calling *sources*
+        * make sure no such transformed MIB already exists (with *searchers*)
+        * parse ASN.1 MIB text with *parser*
+        * perform actual MIB transformation into target format with *code generator*
+        * may attempt to borrow pre-transformed MIB through *borrowers*
+        * write transformed MIB through *writer*
+
+        The above sequence will be performed for each MIB name given in
+        *mibnames* and may be performed for all MIBs referred to from
+        MIBs being processed.
+
+        MIBs IMPORT'ed by each other make up the *graph* of dependencies.
+        A parsed MIB moves on to code generation as soon as all MIBs it
+        depends on are read, without waiting for the rest of the MIBs.
+        Unless *ignoreErrors* is set, storing is still postponed until
+        it is known that no MIB failed.
+
+        If *resolver* is set, MIB sources are asked for the files known
+        to serve the MIBs right away, and not asked for the MIBs known to
+        be missing there.
+
+        If *symbolTableCache* is set, symbol tables of MIBs are stored
+        there and taken from there next time the same MIB text is read.
+        Such MIBs are parsed only if code is to be generated for them.
+
+        With *jobs* option greater than one, ASN.1 MIBs are fetched and
+        parsed by a pool of that many worker processes. MIBs IMPORT'ed by
+        just parsed modules are handed over to the pool right away. Code
+        generation, and storing if the writer allows concurrent writes,
+        are then spread over worker processes too. MIBs that get ready
+        at about the same time make up a wave served by a pool of its
+        own, each worker of the pool receiving the symbol tables of these
+        MIBs and of the MIBs they IMPORT once.
+        The outcome is the same as in the single process mode.
+
+        With *threads* option set along with *jobs*, the workers are
+        threads rather than processes. Parsers and code generators keep
+        the state of each MIB apart, so they are shared by the threads.
+        Nothing has to be copied to worker processes then, which pays off
+        on free-threaded Python builds. Likewise, concurrent *compile*
+        calls can share one *MibCompiler*, though attributes describing
+        the last compilation, like *stats*, refer to one of them.
+
+        If *manifest* is set, each stored MIB is recorded there along with
+        a signature of its MIB text, symbol tables of all the MIBs it
+        depends on, directly or not, and code generation options. Next
+        time, a MIB having a signature recorded is rebuilt if and only if
+        the signature has changed, whatever the files modification times.
+
+        Observers added with *add_observers* are called around each phase
+        of the compilation with the MIB name, duration and size of the data
+        involved, see *AbstractObserver*. Without observers, this costs
+        nothing.
+
+        With *reproducible* option set, transformed MIBs carry no comments
+        telling when, where and by whom they were produced, so the same
+        ASN.1 MIBs always turn into the same bytes. If *SOURCE_DATE_EPOCH*
+        environment variable is set, that time is mentioned instead.
+
+        With *memoryBudget* option set, symbol tables kept in memory are
+        limited to about that many bytes, least recently used tables being
+        spilled to temporary files. Parse trees of the MIBs waiting for
+        the MIBs they IMPORT are dropped, to be parsed once again when the
+        time comes, and transformed MIBs are stored as soon as they are
+        built, as if *ignoreErrors* were set.
+
+        If *journal* is set, each MIB is recorded there as soon as it is
+        finished, along with the hash of its MIB text, its signature and
+        the digest of the transformed MIB. With *resume* option set, MIBs
+        recorded as compiled before with the same signature, whose
+        transformed MIB is still stored by the writer as recorded, are not
+        transformed again, but reported *untouched*, so that a compilation
+        killed half way through can be picked up where it stopped. The
+        *rebuild* option takes precedence over the journal. Transformed
+        MIBs are then stored as soon as they are built, as if
+        *ignoreErrors* were set. Once a compilation finishes with no MIB
+        failed or missing, the journal is cleared.
+
+        With *isolate* option set, each MIB is read, parsed and transformed
+        by a process of its own, so that a pathological MIB can't bring
+        down the whole compilation. The *mibTimeout* option limits the
+        time such a process may take, in seconds, and *mibMemoryLimit*
+        limits the memory it may allocate on top of what the compiler
+        holds, in bytes. Either of them implies *isolate*. The MIB failing
+        that way gets *failed* status with *PySmiWorkerError*, or with
+        *PySmiTimeoutError* if it ran out of time, and the rest of the
+        MIBs are processed as usual. Transformed MIBs are then stored as
+        soon as they are built, as if *ignoreErrors* were set. The *jobs*
+        option is ignored in this mode.
+
+        With *shard* option set to *(index, count)* tuple, just one of
+        *count* shards of the compilation is run, building the share of
+        the MIBs *get_shard* returns. The MIBs built by the other shards
+        are only read for their symbol tables, which come from the
+        *symbolTableCache*, if any, and reported *untouched*. Partial
+        OID->MIB indexes of the shards, see *build_index*, can then be
+        combined by *merge_index*.
+
+        Args:
+            mibnames: list of ASN.1 MIBs names
+            options: options that affect the way PySMI components work
+
+        Returns:
+            A dictionary of MIB module names processed (keys) and *MibStatus*
+            class instances (values)
+
+        """
+        compilation = _Compilation(self, mibnames, options)
+
+        for _ in compilation.run():
+            pass
+
+        return compilation.processed
+
+    def compile_iter(self, *mibnames, **options):
+        """Transform requested and possibly referred MIBs one by one.
+
+        Works like *compile*, but rather than returning all the results at
+        once, yields the result for each MIB module as soon as it is final.
+        That is, once the transformed MIB is stored, or once it becomes known
+        that the MIB is up to date, has failed or is missing. Transformed
+        MIB data is not kept around once it is yielded.
+
+        Unless *ignoreErrors* is set, transformed MIBs are not stored until
+        all MIBs are processed, so these are yielded at the end.
+
+        Args:
+            mibnames: list of ASN.1 MIBs names
+            options: options that affect the way PySMI components work
+
+        Yields:
+            *(mibname, MibStatus, data)* tuples, where *data* is transformed
+            MIB for compiled and borrowed MIBs and *None* otherwise
+        """
+        return _Compilation(self, mibnames, options).run()
+
+    async def compile_async(self, *mibnames, **options):
+        """Transform requested and possibly referred MIBs asynchronously.
+
+        Works like *compile*, but does not block the running event loop.
+        MIBs are read through *get_data_async* method of the *sources*,
+        MIBs IMPORT'ed by just read modules being read concurrently.
+        Searchers and writer are called through their *file_exists_async*
+        and *put_data_async* methods. Components not having their own
+        asynchronous methods are called in separate threads.
+
+        MIB parsing and code generation run in a thread of their own, so
+        do borrowers. The *jobs* option is not supported.
+
+        Once the awaiting task is cancelled, MIBs being read or stored are
+        abandoned and the compilation stops as soon as the thread is done
+        with the MIB it is working on, storing nothing else.
+
+        Args:
+            mibnames: list of ASN.1 MIBs names
+            options: options that affect the way PySMI components work
+
+        Returns:
+            A dictionary of MIB module names processed (keys) and *MibStatus*
+            class instances (values)
+        """
+        compilation = _Compilation(self, mibnames, options, asyncio.get_running_loop())
+
+        def run():
+            for _ in compilation.run():
+                pass
+
+        # not in the default executor: the thread waits for components
+        # which may need a thread from there
+        executor = ThreadPoolExecutor(max_workers=1)
+
+        try:
+            await compilation.loop.run_in_executor(executor, run)
+
+        except asyncio.CancelledError:
+            # the thread is not waited for, but stops at the next step
+            compilation.cancel()
+            raise
+
+        finally:
+            executor.shutdown(wait=False)
+
+        return compilation.processed
+
+    def compile_all(self, source, **options):
+        """Transform all MIBs found at given MIB source.
+
+        Every file of the *source* is looked at once to find out what MIB
+        modules it defines and what MIBs they IMPORT. The MIBs are then
+        compiled in the order of their dependencies, each file being read
+        from the *source* directly and parsed only once. MIBs IMPORT'ed,
+        but not found at the *source*, are looked up through the *sources*
+        configured, as usual.
+
+        Parse trees and transformed MIBs are not kept any longer than
+        needed. Therefore, unlike *compile*, this method does not let
+        failed MIBs hold other MIBs back, unless *ignoreErrors* option is
+        explicitly unset.
+
+        Args:
+            source: *FileReader*, *ZipReader* or *CorpusReader* object
+            options: options that affect the way PySMI components work
+
+        Keyword Args:
+            progress: callable invoked with MIB name, *MibStatus*, the number
+                of MIBs processed so far and the number of MIBs found at
+                the *source* or IMPORT'ed from there, once per MIB processed
+            buildIndex: build OID->MIB index once MIBs are compiled
+
+        Returns:
+            A dictionary of MIB module names processed (keys) and *MibStatus*
+            class instances (values)
+        """
+        if not isinstance(source, CorpusReader):
+            source = CorpusReader(source)
+
+        # MIBs from elsewhere go first, not to hold the rest back
+        mibnames = source.get_mib_names(external=True)
+
+        debug.logger & debug.FLAG_COMPILER and debug.logger(
+            f"compiling {len(mibnames)} MIBs found in {source}"
+        )
+
+        options.setdefault("ignoreErrors", True)
+
+        progress = options.get("progress")
+
+        # the source goes first, for this call only
+        mibCompiler = copy.copy(self)
+        mibCompiler._sources = [source, *self._sources]
+
+        compilation = _Compilation(mibCompiler, mibnames, options)
+
+        for count, (mibname, status, mibData) in enumerate(compilation.run(), 1):
+            if progress:
+                progress(mibname, status, count, len(mibnames))
+
+        processed = compilation.processed
+
+        if options.get("buildIndex"):
+            mibCompiler.build_index(
+                {k: v for k, v in processed.items() if v != "failed"},
+                dryRun=options.get("dryRun"),
+                ignoreErrors=options.get("ignoreErrors"),
+                reproducible=options.get("reproducible"),
+                shard=options.get("shard"),
+            )
+
+        return processed
+
+    def get_shard(self, mibnames, index, count, **options):
+        """Return names of the MIBs a shard of the compilation should build.
+
+        Compilation of the MIBs requested along with all the MIBs they
+        depend on can be split into *count* shards, each run separately,
+        possibly at different machines. Requested MIBs and their
+        dependencies are read through the *sources* and quickly scanned
+        for IMPORTs, with no actual parsing. They are then split so that
+        each MIB is built by exactly one shard, and MIBs IMPORT'ing the
+        same MIBs are likely to be built by the same shard, see
+        *DependencyGraph.partition*.
+
+        Args:
+            mibnames: list of ASN.1 MIBs names
+            index: shard number, from 0 to *count* - 1
+            count: number of shards
+
+        Keyword Args:
+            noDeps: build the requested MIBs only, not their dependencies
+
+        Returns:
+            list of names of the MIBs to build, the requested ones under
+            the names they were requested with
+        """
+        if not 0 <= index < count:
+            raise error.PySmiError(f"no shard {index} out of {count} shards")
+
+        graph = DependencyGraph()
+
+        # requested MIB names to names of MIB modules found there
+        requestedMibs = {}
+
+        names = list(mibnames)
+        seenMibNames = set()
+
+        while names:
+            name = names.pop(0)
+
+            if name in seenMibNames:
+                continue
+
+            seenMibNames.add(name)
+
+            mibs = []
+
+            for source in self._sources:
+                try:
+                    if self.resolver is None:
+                        fileInfo, fileData = source.get_data(name)
+
+                    else:
+                        fileInfo, fileData = self.resolver.get_data(source, name)
+
+                except (UnicodeDecodeError, error.PySmiError):
+                    continue
+
+                mibs = scan_mib_text(fileData)
+
+                if mibs:
+                    break
+
+            for mibname, imported in mibs:
+                seenMibNames.add(mibname)
+                graph.add_module(mibname, imported)
+                names.extend(imported)
+
+            if name in mibnames:
+                # missing MIBs still need a shard to be reported by
+                requestedMibs[name] = [x[0] for x in mibs] or [name]
+
+        requestedMibNames = set().union(*requestedMibs.values())
+
+        shardMibNames = graph.partition(sorted(requestedMibNames), count)[index]
+
+        if options.get("noDeps"):
+            shardMibNames &= requestedMibNames
+
+        mibsToBuild = [
+            name for name in mibnames if shardMibNames.intersection(requestedMibs[name])
         ]
 
+        # dependencies this shard builds are requested by their own names
+        mibsToBuild.extend(sorted(shardMibNames - requestedMibNames))
+
+        debug.logger & debug.FLAG_COMPILER and debug.logger(
+            f"shard {index} out of {count} builds {len(mibsToBuild)} MIBs: {', '.join(mibsToBuild)}"
+        )
+
+        return mibsToBuild
+
+    def build_index(self, processedMibs, **options):
+        comments = self._get_comments(reproducible=options.get("reproducible"))
+
+        indexFile = self.get_index_file(options.get("shard"))
+
         try:
             self._writer.put_data(
-                self.indexFile,
+                indexFile,
                 self._codegen.genIndex(
                     processedMibs,
                     comments=comments,
+                    old_index_data=self._writer.get_data(indexFile),
+                ),
+                dryRun=options.get("dryRun"),  # type: ignore
+            )
+        except error.PySmiError as exc:
+            exc.msg += f" at MIB index {indexFile}"
+
+            debug.logger & debug.FLAG_COMPILER and debug.logger(
+                f"error {exc} when building {indexFile}"
+            )
+
+            if options.get("ignoreErrors"):
+                return
+
+            raise exc
+
+    def get_index_file(self, shard=None):
+        """Return name of the OID->MIB index, or of the partial index of a shard.
+
+        Args:
+            shard: *(index, count)* tuple of the shard or *None*
+        """
+        if shard:
+            index, count = shard
+
+            return f"{self.indexFile}-{index + 1}-of-{count}"
+
+        return self.indexFile
+
+    def merge_index(self, indexes, **options):
+        """Merge OID->MIB indexes into the index stored by the writer.
+
+        Partial indexes built by shards of a compilation, each by its own
+        *build_index* call with *shard* option, are combined by the code
+        generator, with no MIBs read again.
+
+        Args:
+            indexes: index documents as produced by the code generator
+        """
+        comments = self._get_comments(reproducible=options.get("reproducible"))
+
+        try:
+            self._writer.put_data(
+                self.indexFile,
+                self._codegen.merge_index(
+                    indexes,
+                    comments=comments,
                     old_index_data=self._writer.get_data(self.indexFile),
                 ),
                 dryRun=options.get("dryRun"),  # type: ignore
@@ -633,7 +2319,7 @@ class MibCompiler:
             exc.msg += f" at MIB index {self.indexFile}"
 
             debug.logger & debug.FLAG_COMPILER and debug.logger(
-                f"error {exc} when building {self.indexFile}"
+                f"error {exc} when merging into {self.indexFile}"
             )
 
             if options.get("ignoreErrors"):
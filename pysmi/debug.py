@@ -19,6 +19,7 @@ FLAG_CODEGEN = 0x0020
 FLAG_WRITER = 0x0040
 FLAG_COMPILER = 0x0080
 FLAG_BORROWER = 0x0100
+FLAG_CACHE = 0x0200
 FLAG_ALL = 0xFFFF
 
 FLAG_MAP = {
@@ -31,6 +32,7 @@ FLAG_MAP = {
     "writer": FLAG_WRITER,
     "compiler": FLAG_COMPILER,
     "borrower": FLAG_BORROWER,
+    "cache": FLAG_CACHE,
     "all": FLAG_ALL,
 }
 
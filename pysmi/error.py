@@ -81,6 +81,10 @@ class PySmiReaderFileNotFoundError(PySmiReaderError):
     pass
 
 
+class PySmiReaderUnavailableError(PySmiReaderFileNotFoundError):
+    pass
+
+
 class PySmiCodegenError(PySmiError):
     pass
 
@@ -91,3 +95,11 @@ class PySmiSemanticError(PySmiCodegenError):
 
 class PySmiWriterError(PySmiError):
     pass
+
+
+class PySmiWorkerError(PySmiError):
+    pass
+
+
+class PySmiTimeoutError(PySmiWorkerError):
+    pass
@@ -0,0 +1,252 @@
+#
+# This file is part of pysmi software.
+#
+# Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
+# License: https://www.pysnmp.com/pysmi/license.html
+#
+
+
+class DependencyGraph:
+    """MIB modules dependency graph.
+
+    Nodes of the graph are MIB module names, edges lead from a MIB module
+    to the MIB modules it IMPORTs. MIB modules that are IMPORT'ed, but
+    have not been added themselves (e.g. missing ones) are also nodes
+    of the graph, just without edges of their own.
+
+    *MibCompiler* builds the graph while reading MIBs and uses it for
+    deciding when a MIB is ready for code generation. The graph of the
+    last *compile* call remains available as *MibCompiler.graph*.
+    """
+
+    def __init__(self):
+        self._imports = {}
+        self._importers = {}
+
+    def __str__(self):
+        """Return a string representation of the instance."""
+        return f"{self.__class__.__name__}{{{len(self._imports)} MIBs}}"
+
+    def __contains__(self, mibname):
+        return mibname in self._imports
+
+    def __iter__(self):
+        return iter(self._imports)
+
+    def __len__(self):
+        return len(self._imports)
+
+    def add_module(self, mibname, imported=()):
+        """Add MIB module along with the MIB modules it IMPORTs.
+
+        Args:
+            mibname: MIB module name
+            imported: names of the IMPORT'ed MIB modules
+        """
+        self._imports.setdefault(mibname, [])
+        self._importers.setdefault(mibname, [])
+
+        for name in imported:
+            self._imports.setdefault(name, [])
+            self._importers.setdefault(name, [])
+
+            if name not in self._imports[mibname]:
+                self._imports[mibname].append(name)
+                self._importers[name].append(mibname)
+
+    def imports(self, mibname):
+        """Return names of MIB modules IMPORT'ed by given MIB module."""
+        return tuple(self._imports.get(mibname, ()))
+
+    def importers(self, mibname):
+        """Return names of MIB modules IMPORT'ing given MIB module."""
+        return tuple(self._importers.get(mibname, ()))
+
+    def closure(self, mibname):
+        """Return names of all MIB modules given MIB module depends on."""
+        return self._walk(mibname, self._imports)
+
+    def dependents(self, mibname):
+        """Return names of all MIB modules depending on given MIB module."""
+        return self._walk(mibname, self._importers)
+
+    @staticmethod
+    def _walk(mibname, edges):
+        seen = set()
+        names = list(edges.get(mibname, ()))
+
+        while names:
+            name = names.pop()
+
+            if name in seen:
+                continue
+
+            seen.add(name)
+
+            names.extend(edges.get(name, ()))
+
+        return seen
+
+    def partition(self, mibnames, count):
+        """Split MIB modules along with their dependencies into groups.
+
+        Each of the given MIB modules and each MIB module they depend on
+        goes to exactly one of *count* groups of about the same size. MIB
+        modules go together with their dependencies, or to the group
+        holding most of them, so that each group needs as few MIB modules
+        from the other groups as possible. The same graph and arguments
+        always give the same groups.
+
+        Args:
+            mibnames: names of MIB modules to split
+            count: number of groups
+
+        Returns:
+            list of *count* sets of MIB module names
+        """
+        closures = {x: self.closure(x) | {x} for x in mibnames}
+
+        capacity = -(-len(set().union(*closures.values())) // count)
+
+        groups = [set() for _ in range(count)]
+        covered = [set() for _ in range(count)]
+        assigned = set()
+
+        # larger closures first, smaller ones then fill the gaps
+        for mibname in sorted(closures, key=lambda x: (-len(closures[x]), x)):
+            members = closures[mibname] - assigned
+
+            if not members:
+                continue
+
+            candidates = [
+                index
+                for index in range(count)
+                if len(groups[index]) + len(members) <= capacity
+            ] or [min(range(count), key=lambda x: len(groups[x]))]
+
+            index = max(
+                candidates,
+                key=lambda x: (
+                    len(closures[mibname] & covered[x]),
+                    -len(groups[x]),
+                    -x,
+                ),
+            )
+
+            groups[index].update(members)
+            covered[index].update(closures[mibname])
+            assigned.update(members)
+
+        return groups
+
+    def cycles(self):
+        """Return groups of MIB modules IMPORT'ing each other.
+
+        Returns:
+            list of sets of MIB module names, one per strongly connected
+            component of more than one MIB module or of a MIB module
+            IMPORT'ing itself
+        """
+        return [
+            component
+            for component in self._components()
+            if len(component) > 1
+            or next(iter(component)) in self._imports[next(iter(component))]
+        ]
+
+    def waves(self):
+        """Return MIB modules in the order they can be processed.
+
+        The first wave holds MIB modules that IMPORT nothing, each
+        following wave holds MIB modules that IMPORT MIB modules from
+        the preceding waves only. MIB modules IMPORT'ing each other
+        fall into the same wave.
+
+        Returns:
+            list of lists of MIB module names
+        """
+        components = self._components()
+
+        componentOf = {}
+
+        for index, component in enumerate(components):
+            for name in component:
+                componentOf[name] = index
+
+        levels = []
+
+        # Tarjan's algorithm yields components in reverse topological
+        # order, so imported components always come first
+        for index, component in enumerate(components):
+            level = 0
+
+            for name in component:
+                for imported in self._imports[name]:
+                    if componentOf[imported] != index:
+                        level = max(level, levels[componentOf[imported]] + 1)
+
+            levels.append(level)
+
+        waves = [[] for _ in range(max(levels, default=-1) + 1)]
+
+        for name in self._imports:
+            waves[levels[componentOf[name]]].append(name)
+
+        return waves
+
+    def _components(self):
+        # iterative Tarjan's strongly connected components algorithm
+        index = {}
+        lowlink = {}
+        stack = []
+        onStack = set()
+        components = []
+
+        for root in self._imports:
+            if root in index:
+                continue
+
+            work = [(root, 0)]
+
+            while work:
+                name, position = work.pop()
+
+                if position == 0:
+                    index[name] = lowlink[name] = len(index)
+                    stack.append(name)
+                    onStack.add(name)
+
+                imported = self._imports[name]
+
+                while position < len(imported):
+                    nextName = imported[position]
+                    position += 1
+
+                    if nextName not in index:
+                        work.append((name, position))
+                        work.append((nextName, 0))
+                        break
+
+                    if nextName in onStack:
+                        lowlink[name] = min(lowlink[name], index[nextName])
+
+                else:
+                    if lowlink[name] == index[name]:
+                        component = set()
+
+                        while True:
+                            member = stack.pop()
+                            onStack.discard(member)
+                            component.add(member)
+
+                            if member == name:
+                                break
+
+                        components.append(component)
+
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[name])
+
+        return components
@@ -0,0 +1,155 @@
+#
+# This file is part of pysmi software.
+#
+# Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
+# License: https://www.pysnmp.com/pysmi/license.html
+#
+import hashlib
+import json
+import os
+import sys
+
+from pysmi import debug
+from pysmi import error
+from pysmi.compat import decode
+
+
+def get_output_digest(mibData):
+    """Return SHA-256 digest of transformed MIB as stored by writers."""
+    if isinstance(mibData, str):
+        mibData = mibData.encode("utf-8")
+
+    return hashlib.sha256(mibData).hexdigest()
+
+
+class BuildJournal:
+    """Records each MIB module as soon as its compilation is finished.
+
+    The journal is an append-only file, typically next to the transformed
+    MIBs, holding one JSON record per line. A record carries MIB module
+    name, hash of its MIB text, signature of everything the transformed
+    MIB depends on, *MibStatus* and digest of the transformed MIB, if any.
+
+    Records are written out right away, so the journal survives the
+    compilation being killed half way through. Given the journal and
+    *resume* option, *MibCompiler* skips the MIBs already compiled
+    from identical inputs and still stored as recorded. A broken last
+    record, as may be left by a killed process, is ignored. Once
+    a compilation finishes with no errors, *MibCompiler* clears the
+    journal.
+    """
+
+    def __init__(self, path):
+        """Creates an instance of *BuildJournal* class.
+
+        Args:
+            path: journal file name
+        """
+        self._path = decode(os.path.normpath(path))
+        self._records = None
+
+        # a killed process may leave the last line unterminated
+        self._truncated = False
+
+    def __str__(self):
+        """Return a string representation of the instance."""
+        return f'{self.__class__.__name__}{{"{self._path}"}}'
+
+    def _load(self):
+        if self._records is not None:
+            return self._records
+
+        self._records = {}
+
+        try:
+            with open(self._path) as f:
+                lines = f.readlines()
+
+        except FileNotFoundError:
+            return self._records
+
+        except OSError:
+            debug.logger & debug.FLAG_COMPILER and debug.logger(
+                f"ignoring unreadable journal {self._path}: {sys.exc_info()[1]}"
+            )
+            return self._records
+
+        self._truncated = bool(lines) and not lines[-1].endswith("\n")
+
+        for lineno, line in enumerate(lines, 1):
+            try:
+                record = json.loads(line)
+
+            except ValueError:
+                debug.logger & debug.FLAG_COMPILER and debug.logger(
+                    f"ignoring broken record at {self._path}:{lineno}"
+                )
+                continue
+
+            if isinstance(record, dict) and "mib" in record:
+                # later records take precedence
+                self._records[record["mib"]] = record
+
+        return self._records
+
+    def get_record(self, mibname):
+        """Return the latest record of MIB module or *None*."""
+        return self._load().get(mibname)
+
+    def add_record(self, mibname, source, signature, status, digest=None):
+        """Append a record of just finished MIB module to the journal.
+
+        Args:
+            mibname: MIB module name
+            source: hash of the MIB text or *None*
+            signature: signature of the MIB inputs or *None*
+            status: *MibStatus* of the MIB module
+            digest: digest of the transformed MIB or *None*
+        """
+        record = dict(
+            mib=mibname,
+            source=source,
+            signature=signature,
+            status=str(status),
+            digest=digest,
+        )
+
+        if self._load().get(mibname) == record:
+            return
+
+        dirname = os.path.dirname(self._path) or os.curdir
+
+        try:
+            os.makedirs(dirname, exist_ok=True)
+
+            # a line at a time, so a killed process leaves one broken line at most
+            with open(self._path, "a") as f:
+                if self._truncated:
+                    f.write("\n")
+
+                f.write(json.dumps(record, sort_keys=True) + "\n")
+
+            self._truncated = False
+
+        except OSError:
+            raise error.PySmiError(
+                f"failure writing journal {self._path}: {sys.exc_info()[1]}"
+            )
+
+        self._records[mibname] = record
+
+    def clear(self):
+        """Drop all records, starting the journal afresh."""
+        self._records = {}
+        self._truncated = False
+
+        try:
+            os.unlink(self._path)
+
+        except FileNotFoundError:
+            pass
+
+        except OSError:
+            raise error.PySmiError(
+                f"failure removing journal {self._path}: {sys.exc_info()[1]}"
+            )
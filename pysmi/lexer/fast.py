@@ -0,0 +1,292 @@
+#
+# This file is part of pysmi software.
+#
+# Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
+# License: https://www.pysnmp.com/pysmi/license.html
+#
+import functools
+import re
+import sys
+
+import ply.lex as lex
+from pysmi import error
+
+# INITIAL state rules of SmiV2Lexer in the order ply tries them: rules
+# defined by functions by line number, then string rules, longest first
+INITIAL_RULES = (
+    "t_MACRO",
+    "t_EXPORTS",
+    "t_CHOICE",
+    "t_UPPERCASE_IDENTIFIER",
+    "t_LOWERCASE_IDENTIFIER",
+    "t_NUMBER",
+    "t_BIN_STRING",
+    "t_HEX_STRING",
+    "t_QUOTED_STRING",
+    "t_DOT_DOT",
+    "t_COLON_COLON_EQUAL",
+)
+
+# exclusive states skipping MACRO, EXPORTS and CHOICE bodies
+STATE_RULES = {
+    "macro": ("t_macro_newline", "t_macro_END", "t_macro_body"),
+    "exports": ("t_exports_newline", "t_exports_end", "t_exports_body"),
+    "choice": ("t_choice_newline", "t_choice_end", "t_choice_body"),
+}
+
+STATE_TOKENS = {"MACRO": "macro", "EXPORTS": "exports", "CHOICE": "choice"}
+
+# tokens values of which are checked by SmiV2Lexer rules
+CHECKED_TOKENS = ("NUMBER", "BIN_STRING", "HEX_STRING")
+
+
+def _get_regex(rule):
+    return rule if isinstance(rule, str) else rule.__doc__
+
+
+def _count_lines(text):
+    lines = text.count("\n")
+
+    if "\r" in text:
+        lines += text.count("\r") - text.count("\r\n")
+
+    return lines
+
+
+class FastLexer:
+    """Tokenizes MIB text just like ply lexer built out of *SmiV2Lexer*.
+
+    All rules of the INITIAL state are joined into one master regexp
+    each match of which takes a token along with blanks and comments
+    preceding it, MIB text is then scanned with *finditer*. Line breaks
+    are counted a run of blanks at a time. MACRO, EXPORTS and CHOICE
+    bodies are skipped by the rules of the exclusive states of
+    *SmiV2Lexer*.
+
+    Tokens, their line numbers and errors are the same as those of ply
+    lexer, for *lexerFactory* lexers as well. The instance quacks like
+    ply lexer as far as ply parser is concerned.
+    """
+
+    # compiled rules for each lexer class
+    _compiled = {}
+
+    def __init__(self, module):
+        """Create an instance of *FastLexer* class.
+
+        Args:
+            module: *SmiV2Lexer* object defining the tokens
+        """
+        self._module = module
+        self._rules = self._compile(module)
+        self._state = "INITIAL"
+        self.lexstatestack = []
+        self.lineno = 1
+        self.input("")
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop("token")
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.input("")
+
+    @classmethod
+    def _compile(cls, module):
+        try:
+            return cls._compiled[module.__class__]
+
+        except KeyError:
+            pass
+
+        literals = f"(?P<literal>[{re.escape(module.literals)}])"
+
+        # comments go along with blanks, no other rule starts like them
+        blanks = (
+            rf"(?P<blank>(?:[{re.escape(module.t_ignore)}\r\n]+"
+            rf"|{module.t_begin_comment.__doc__}"
+            rf"(?:{module.t_comment_body.__doc__})?)+)?"
+        )
+
+        initialRe = re.compile(
+            blanks
+            + "(?:"
+            + "|".join(
+                [
+                    f"(?P<{rule[2:]}>{_get_regex(getattr(module, rule))})"
+                    for rule in INITIAL_RULES
+                ]
+                + [literals, r"(?P<error>.)", r"(?P<eof>\Z)"]
+            )
+            + ")",
+            re.DOTALL,
+        )
+
+        stateRes = {
+            state: re.compile(
+                "|".join(
+                    [
+                        f"(?P<{kind}>{_get_regex(getattr(module, rule))})"
+                        for kind, rule in zip(("newline", "end", "body"), rules)
+                    ]
+                    + [literals]
+                ),
+                re.DOTALL,
+            )
+            for state, rules in STATE_RULES.items()
+        }
+
+        # keyword token types are looked up a lot
+        reserved = {sys.intern(k): sys.intern(v) for k, v in module.reserved.items()}
+
+        rules = cls._compiled[module.__class__] = (
+            initialRe,
+            stateRes,
+            reserved,
+            frozenset(module.forbidden_words),
+        )
+
+        return rules
+
+    def begin(self, state):
+        self._state = state
+
+    def current_state(self):
+        return self._state
+
+    def input(self, data):
+        self.lexdata = data
+        self.lexpos = 0
+
+        # no Python frame per token on top of the scanner
+        self.token = functools.partial(next, self._scan(data), None)
+
+    def _scan(self, data):
+        initialRe, stateRes, reserved, forbidden = self._rules
+        module = self._module
+        LexToken = lex.LexToken
+        length = len(data)
+        pos = 0
+
+        while pos < length:
+            if self._state != "INITIAL":
+                m = stateRes[self._state].match(data, pos)
+
+                if not m:
+                    self.lexpos = pos
+                    raise lex.LexError(
+                        f"Illegal character '{data[pos]}' at index {pos}", data[pos:]
+                    )
+
+                kind = m.lastgroup
+                state = self._state
+                start, pos = m.span()
+
+                if kind == "newline":
+                    self.lineno += 1
+                    continue
+
+                if kind == "body":
+                    continue
+
+                if kind == "end":
+                    self._state = "INITIAL"
+
+                    # only MACRO end makes a token
+                    if state != "macro":
+                        continue
+
+                    kind = "END"
+
+                tok = LexToken()
+                tok.type = kind == "literal" and m.group() or kind
+                tok.value = m.group()
+                tok.lineno = self.lineno
+                tok.lexpos = start
+                self.lexpos = pos
+
+                yield tok
+
+                continue
+
+            lineno = self.lineno
+
+            for m in initialRe.finditer(data, pos):
+                kind = m.lastgroup
+                blank = m.group(1)
+
+                if blank:
+                    lineno += _count_lines(blank)
+
+                if kind == "eof":
+                    # ply lexer stays in a comment that runs to the end
+                    if blank and blank.rfind("--") > max(
+                        blank.rfind("\n"), blank.rfind("\r")
+                    ):
+                        self._state = "comment"
+
+                    break
+
+                value = m.group(kind)
+
+                tok = LexToken()
+                tok.type = kind
+                tok.value = value
+                tok.lineno = self.lineno = lineno
+                tok.lexpos = m.start(kind)
+
+                if kind == "literal":
+                    tok.type = value
+
+                elif kind == "UPPERCASE_IDENTIFIER":
+                    if value in forbidden:
+                        raise error.PySmiLexerError(
+                            f"{value} is forbidden", lineno=lineno
+                        )
+
+                    if value[-1] == "-":
+                        raise error.PySmiLexerError(
+                            f"Identifier should not end with '-': {value}",
+                            lineno=lineno,
+                        )
+
+                    tok.type = reserved.get(value, kind)
+
+                elif kind == "LOWERCASE_IDENTIFIER":
+                    if value[-1] == "-":
+                        raise error.PySmiLexerError(
+                            f"Identifier should not end with '-': {value}",
+                            lineno=lineno,
+                        )
+
+                elif kind == "QUOTED_STRING":
+                    lineno += _count_lines(value)
+
+                    self.lineno = lineno
+
+                elif kind == "error":
+                    raise error.PySmiLexerError(
+                        f"Illegal character '{value}', {length - tok.lexpos - 1} characters left unparsed at this stage",
+                        lineno=lineno,
+                    )
+
+                elif kind in CHECKED_TOKENS:
+                    # out of range numbers and odd strings are rejected there
+                    tok = getattr(module, "t_" + kind)(tok)
+
+                self.lexpos = pos = m.end()
+
+                yield tok
+
+                if kind in STATE_TOKENS:
+                    self._state = STATE_TOKENS[kind]
+                    break
+
+            self.lineno = lineno
+
+            if self._state not in STATE_RULES:
+                break
+
+        self.lexpos = length
@@ -5,11 +5,13 @@
 # License: https://www.pysnmp.com/pysmi/license.html
 #
 import re
+import threading
 
 import ply.lex as lex
 from pysmi import config, error
 from pysmi import debug
 from pysmi.lexer.base import AbstractLexer
+from pysmi.lexer.fast import FastLexer
 
 UNSIGNED32_MAX = 4294967295
 UNSIGNED64_MAX = 18446744073709551615
@@ -176,14 +178,36 @@ class SmiV2Lexer(AbstractLexer):
 
     t_ignore = " \t"
 
-    def __init__(self, tempdir=""):
+    #: lexer engines: *ply* lexer or *FastLexer* tokenizing the same way
+    engines = ("ply", "fast")
+
+    def __init__(self, tempdir="", engine="ply"):
+        if engine not in self.engines:
+            raise error.PySmiError(f"Unknown lexer engine: {engine}")
+
         self._tempdir = tempdir
+        self._engine = engine
         self.lexer = None
         self.reset()
 
     def reset(self):
+        if self.lexer is None:
+            self.lexer = self._build()
+            return
+
+        # building the lexer takes validating all the rules and compiling
+        # them into regexps, so the lexer is reused, its state is reset
+        self.lexer.begin("INITIAL")
+        self.lexer.lexstatestack = []
+        self.lexer.lineno = 1
+        self.lexer.input("")
+
+    def _build(self):
+        if self._engine == "fast":
+            return FastLexer(self)
+
         if LEX_VERSION < [3, 0]:
-            self.lexer = lex.lex(
+            return lex.lex(
                 module=self, reflags=re.DOTALL, outputdir=self._tempdir, debug=False
             )
         else:
@@ -197,7 +221,7 @@ class SmiV2Lexer(AbstractLexer):
             else:
                 debuglogger = None
 
-            self.lexer = lex.lex(
+            return lex.lex(
                 module=self,
                 reflags=re.DOTALL,
                 outputdir=self._tempdir,
@@ -537,15 +561,38 @@ relaxedGrammar = {
 }
 
 
-def lexerFactory(**grammarOptions):
-    classAttr = {}
+# lexer classes by grammar options
+_lexerClasses = {}
+_lock = threading.Lock()
+
 
+def lexerFactory(**grammarOptions):
     for option in grammarOptions:
-        if grammarOptions[option]:
-            if option not in relaxedGrammar:
-                raise error.PySmiError(f"Unknown lexer relaxation option: {option}")
+        if grammarOptions[option] and option not in relaxedGrammar:
+            raise error.PySmiError(f"Unknown lexer relaxation option: {option}")
+
+    # options that make no difference to the lexer share the class
+    options = tuple(
+        sorted(
+            option
+            for option in grammarOptions
+            if grammarOptions[option] and relaxedGrammar[option]
+        )
+    )
+
+    with _lock:
+        try:
+            return _lexerClasses[options]
 
+        except KeyError:
+            pass
+
+        classAttr = {}
+
+        for option in options:
             for func in relaxedGrammar[option]:
                 classAttr[func.__name__] = func()
 
-    return type("SmiLexer", (SmiV2Lexer,), classAttr)
+        lexerClass = _lexerClasses[options] = type("SmiLexer", (SmiV2Lexer,), classAttr)
+
+        return lexerClass
@@ -0,0 +1,129 @@
+#
+# This file is part of pysmi software.
+#
+# Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
+# License: https://www.pysnmp.com/pysmi/license.html
+#
+import json
+import os
+import sys
+import tempfile
+
+from pysmi import debug
+from pysmi import error
+from pysmi.cache import FileCache
+from pysmi.compat import decode
+
+
+def get_symtable_digest(symbolTable):
+    """Return a digest of MIB symbol table stable from run to run.
+
+    Table rows are collected in a set, so their order carries no meaning
+    and is not taken into account.
+    """
+    symbolTable = dict(symbolTable)
+
+    if "_symtable_rows" in symbolTable:
+        symbolTable["_symtable_rows"] = sorted(symbolTable["_symtable_rows"])
+
+    return FileCache.make_key(json.dumps(symbolTable, sort_keys=True, default=repr))
+
+
+class BuildManifest:
+    """Records what each transformed MIB has been built from.
+
+    For every MIB module stored by *MibCompiler* the manifest keeps a
+    signature covering the MIB text, the symbol tables of all MIB modules
+    it depends on and the code generation options. The manifest is kept
+    in a JSON file, typically next to the transformed MIBs.
+
+    Once a manifest is given to *MibCompiler*, a MIB with a recorded
+    signature is rebuilt if and only if its signature has changed,
+    regardless of files modification times.
+    """
+
+    version = 1
+
+    def __init__(self, path):
+        """Creates an instance of *BuildManifest* class.
+
+        Args:
+            path: manifest file name
+        """
+        self._path = decode(os.path.normpath(path))
+        self._signatures = None
+        self._modified = False
+
+    def __str__(self):
+        """Return a string representation of the instance."""
+        return f'{self.__class__.__name__}{{"{self._path}"}}'
+
+    def _load(self):
+        if self._signatures is not None:
+            return self._signatures
+
+        self._signatures = {}
+
+        try:
+            with open(self._path) as f:
+                manifest = json.load(f)
+
+        except FileNotFoundError:
+            return self._signatures
+
+        except (OSError, ValueError):
+            debug.logger & debug.FLAG_COMPILER and debug.logger(
+                f"ignoring broken manifest {self._path}: {sys.exc_info()[1]}"
+            )
+            return self._signatures
+
+        if isinstance(manifest, dict) and manifest.get("version") == self.version:
+            self._signatures.update(manifest.get("mibs", {}))
+
+        return self._signatures
+
+    def get_signature(self, mibname):
+        """Return recorded signature of MIB module or *None*."""
+        return self._load().get(mibname)
+
+    def set_signature(self, mibname, signature):
+        """Record signature of just stored MIB module."""
+        if self._load().get(mibname) != signature:
+            self._signatures[mibname] = signature
+            self._modified = True
+
+    def save(self):
+        """Write manifest file out if there is anything new to record."""
+        if not self._modified:
+            return
+
+        dirname = os.path.dirname(self._path) or os.curdir
+
+        tfile = None
+
+        try:
+            os.makedirs(dirname, exist_ok=True)
+
+            fd, tfile = tempfile.mkstemp(dir=dirname)
+
+            with os.fdopen(fd, "w") as f:
+                json.dump(
+                    dict(version=self.version, mibs=self._signatures),
+                    f,
+                    indent=1,
+                    sort_keys=True,
+                )
+
+            os.replace(tfile, self._path)
+
+        except OSError:
+            if tfile and os.access(tfile, os.F_OK):
+                os.unlink(tfile)
+
+            raise error.PySmiError(
+                f"failure writing manifest {self._path}: {sys.exc_info()[1]}"
+            )
+
+        self._modified = False
+
+        debug.logger & debug.FLAG_COMPILER and debug.logger(f"{self} saved")
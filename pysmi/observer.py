@@ -0,0 +1,30 @@
+#
+# This file is part of pysmi software.
+#
+# Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
+# License: https://www.pysnmp.com/pysmi/license.html
+#
+
+
+class AbstractObserver:
+    """Watches MIB compilation phase by phase.
+
+    Observers added to *MibCompiler* are called around each phase of
+    MIB compilation: *read*, *parse*, *symtable*, *search*, *codegen*,
+    *render*, *write* and *borrow*, see *CompileStats*. Both methods
+    receive the same *PhaseEvent* object, which carries the phase name,
+    the MIB module name and, once the phase is finished, its duration,
+    size of the data involved and the exception it failed with, if any.
+
+    Phases run in worker processes are reported once their outcome
+    reaches the compiler, with both methods called in a row.
+
+    Unless observers are added, phases are not reported at all, so
+    there is no cost to pay.
+    """
+
+    def phase_started(self, event):
+        """Called when a phase begins."""
+
+    def phase_finished(self, event):
+        """Called when a phase is over, successfully or not."""
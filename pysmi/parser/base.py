@@ -7,6 +7,11 @@
 
 
 class AbstractParser:
+    def set_options(self, **kwargs):
+        for k in kwargs:
+            setattr(self, k, kwargs[k])
+        return self
+
     def reset(self):
         raise NotImplementedError()
 
@@ -0,0 +1,1222 @@
+#
+# This file is part of pysmi software.
+#
+# Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
+# License: https://www.pysnmp.com/pysmi/license.html
+#
+from pysmi import error
+
+# tokens object identifier components start with
+SUBIDENTIFIERS = frozenset(("LOWERCASE_IDENTIFIER", "UPPERCASE_IDENTIFIER", "NUMBER"))
+
+# importedKeyword and importedSMIKeyword rules
+IMPORTED_KEYWORDS = frozenset(
+    (
+        "AGENT_CAPABILITIES",
+        "COUNTER32",
+        "COUNTER64",
+        "GAUGE32",
+        "NOTIFICATION_GROUP",
+        "NOTIFICATION_TYPE",
+        "TRAP_TYPE",
+        "BITS",
+        "INTEGER32",
+        "IPADDRESS",
+        "MANDATORY_GROUPS",
+        "MODULE_COMPLIANCE",
+        "MODULE_IDENTITY",
+        "OBJECT_GROUP",
+        "OBJECT_IDENTITY",
+        "OBJECT_TYPE",
+        "OPAQUE",
+        "TEXTUAL_CONVENTION",
+        "TIMETICKS",
+        "UNSIGNED32",
+    )
+)
+
+# typeSMI rule
+SMI_TYPES = frozenset(
+    (
+        "IPADDRESS",
+        "TIMETICKS",
+        "OPAQUE",
+        "INTEGER32",
+        "UNSIGNED32",
+        "COUNTER32",
+        "GAUGE32",
+        "COUNTER64",
+    )
+)
+
+# macroName rule
+MACRO_NAMES = frozenset(
+    (
+        "MODULE_IDENTITY",
+        "OBJECT_TYPE",
+        "TRAP_TYPE",
+        "NOTIFICATION_TYPE",
+        "OBJECT_IDENTITY",
+        "TEXTUAL_CONVENTION",
+        "OBJECT_GROUP",
+        "NOTIFICATION_GROUP",
+        "MODULE_COMPLIANCE",
+        "AGENT_CAPABILITIES",
+    )
+)
+
+# ApplicationSyntax types taking any sub-type
+APPLICATION_TYPES = frozenset(("IPADDRESS", "TIMETICKS"))
+
+# ApplicationSyntax types taking integer sub-type
+APPLICATION_INTEGER_TYPES = frozenset(
+    ("COUNTER32", "GAUGE32", "UNSIGNED32", "COUNTER64")
+)
+
+# sequenceApplicationSyntax types taking any sub-type
+SEQUENCE_APPLICATION_TYPES = frozenset(
+    ("IPADDRESS", "COUNTER32", "GAUGE32", "UNSIGNED32", "TIMETICKS", "COUNTER64")
+)
+
+# value rule
+VALUES = frozenset(
+    (
+        "NEGATIVENUMBER",
+        "NUMBER",
+        "NEGATIVENUMBER64",
+        "NUMBER64",
+        "HEX_STRING",
+        "BIN_STRING",
+    )
+)
+
+# valueofSimpleSyntax rule, but for object identifiers
+DEFVAL_VALUES = VALUES | frozenset(("LOWERCASE_IDENTIFIER", "QUOTED_STRING"))
+
+# typeSMIv1 rule
+SMI_V1_INDEX_TYPES = frozenset(("INTEGER", "OCTET", "IPADDRESS", "NETWORKADDRESS"))
+
+
+class _EndOfInput(Exception):
+    """MIB text ends where the grammar does not let it."""
+
+
+class DescentParser:
+    """Parses MIB text the way ply parser built out of *SmiV2Parser* does.
+
+    The SMI grammar of *SmiV2Parser*, relaxations included, is coded
+    as a recursive descent parser, one method per grammar rule or per a
+    few related ones. Lists are collected by loops rather than left
+    recursive rules and rules with no use for the AST are merely
+    checked, so most tokens cost a comparison or two.
+
+    The parser yields the same AST as ply parser does and, as the
+    grammar is LALR(1) with no conflicts changing the language, fails
+    at the same token and the same way: by calling *p_error* of the
+    *SmiV2Parser* object or, if MIB text ends prematurely, by returning
+    `None`. The instance quacks like ply parser as far as *SmiV2Parser*
+    is concerned.
+    """
+
+    def __init__(self, module):
+        """Create an instance of *DescentParser* class.
+
+        Args:
+            module: *SmiV2Parser* object holding the grammar
+        """
+        if module.startSym != "mibFile":
+            raise error.PySmiError(
+                f"Start symbol {module.startSym} is not supported by descent parser"
+            )
+
+        self._module = module
+
+        options = module.grammarOptions
+
+        self._supportIndex = "supportIndex" in options
+        self._commaAtTheEndOfImport = "commaAtTheEndOfImport" in options
+        self._commaAtTheEndOfSequence = "commaAtTheEndOfSequence" in options
+        self._mixOfCommasAndSpaces = "mixOfCommasAndSpaces" in options
+        self._curlyBracesAroundEnterpriseInTrap = (
+            "curlyBracesAroundEnterpriseInTrap" in options
+        )
+        self._noCells = "noCells" in options
+
+        self._importable = IMPORTED_KEYWORDS | {
+            "LOWERCASE_IDENTIFIER",
+            "UPPERCASE_IDENTIFIER",
+        }
+        self._smiTypes = SMI_TYPES
+        self._applicationTypes = APPLICATION_TYPES
+        self._sequenceApplicationTypes = SEQUENCE_APPLICATION_TYPES
+
+        if "supportSmiV1Keywords" in options:
+            self._importable |= {"NETWORKADDRESS"}
+            self._smiTypes |= {"NETWORKADDRESS"}
+            self._applicationTypes |= {"NETWORKADDRESS"}
+            self._sequenceApplicationTypes |= {"NETWORKADDRESS"}
+
+        self._enumNames = {"LOWERCASE_IDENTIFIER"}
+
+        if "uppercaseIdentifier" in options:
+            self._enumNames.add("UPPERCASE_IDENTIFIER")
+
+        cls = self.__class__
+
+        # clauses by the token following symbol name
+        self._lowercaseClauses = {
+            "OBJECT": cls._valueDeclaration,
+            "OBJECT_IDENTITY": cls._objectIdentityClause,
+            "OBJECT_TYPE": cls._objectTypeClause,
+            "TRAP_TYPE": cls._trapTypeClause,
+            "NOTIFICATION_TYPE": cls._notificationTypeClause,
+            "MODULE_IDENTITY": cls._moduleIdentityClause,
+            "MODULE_COMPLIANCE": cls._moduleComplianceClause,
+            "OBJECT_GROUP": cls._objectGroupClause,
+            "NOTIFICATION_GROUP": cls._notificationGroupClause,
+            "AGENT_CAPABILITIES": cls._agentCapabilitiesClause,
+        }
+
+        self._uppercaseClauses = {
+            "COLON_COLON_EQUAL": cls._typeDeclaration,
+            "OBJECT": cls._valueDeclaration,
+            "TRAP_TYPE": cls._trapTypeClause,
+        }
+
+        if "lowcaseIdentifier" in options:
+            self._uppercaseClauses["NOTIFICATION_TYPE"] = cls._notificationTypeClause
+
+        self._token = None
+        self._tok = None
+        self._type = None
+
+    def parse(self, data, lexer, **kwargs):
+        lexer.input(data)
+
+        self._token = lexer.token
+
+        try:
+            self._next()
+
+            return self._mibFile()
+
+        except _EndOfInput:
+            return None
+
+        finally:
+            self._token = self._tok = None
+
+    # Tokens
+
+    def _next(self):
+        tok = self._tok = self._token()
+        self._type = tok is None and "$end" or tok.type
+
+    def _take(self):
+        value = self._tok.value
+        self._next()
+        return value
+
+    def _expect(self, type):
+        if self._type != type:
+            self._fail()
+
+        value = self._tok.value
+        self._next()
+        return value
+
+    def _fail(self):
+        if self._tok is not None:
+            self._module.p_error(self._tok)
+
+        raise _EndOfInput()
+
+    # Module
+
+    def _mibFile(self):
+        modules = []
+
+        while self._type != "$end":
+            modules.append(self._moduleDefinition())
+
+        return ("mibFile", modules or None)
+
+    def _moduleDefinition(self):
+        name = self._expect("UPPERCASE_IDENTIFIER")
+
+        oid = None
+
+        if self._type == "{":
+            self._next()
+            oid = self._objectIdentifier()
+            self._expect("}")
+
+        self._expect("DEFINITIONS")
+        self._expect("COLON_COLON_EQUAL")
+        self._expect("BEGIN")
+
+        if self._type == "EXPORTS":
+            self._next()
+
+        imports = None
+
+        if self._type == "IMPORTS":
+            self._next()
+            imports = self._importPart()
+            self._expect(";")
+
+        declarations = []
+
+        while self._type != "END":
+            declarations.append(self._declaration())
+
+        self._next()
+
+        return name, oid, imports or {}, declarations or None
+
+    def _importPart(self):
+        if self._type == ";":
+            return None
+
+        importDict = {}
+
+        while True:
+            symbols = self._importIdentifiers()
+
+            self._expect("FROM")
+
+            fromModule = self._expect("UPPERCASE_IDENTIFIER")
+
+            if fromModule in importDict:
+                importDict[fromModule] += symbols
+            else:
+                importDict[fromModule] = symbols
+
+            if self._type == ";":
+                return importDict
+
+    def _importIdentifiers(self):
+        symbols = [self._importIdentifier()]
+
+        while self._type == ",":
+            self._next()
+
+            if self._commaAtTheEndOfImport and self._type not in self._importable:
+                continue
+
+            symbols.append(self._importIdentifier())
+
+        return symbols
+
+    def _importIdentifier(self):
+        if self._type not in self._importable:
+            self._fail()
+
+        return self._take()
+
+    # Declarations
+
+    def _declaration(self):
+        type = self._type
+
+        if type == "LOWERCASE_IDENTIFIER":
+            name = self._take()
+
+            clause = self._lowercaseClauses.get(self._type)
+
+        elif type == "UPPERCASE_IDENTIFIER":
+            name = self._take()
+
+            clause = self._uppercaseClauses.get(self._type)
+
+        elif type in self._smiTypes:
+            name = self._take()
+
+            clause = self.__class__._typeDeclaration
+
+        elif type in MACRO_NAMES:
+            self._next()
+            self._expect("MACRO")
+            self._expect("END")
+            return None
+
+        else:
+            clause = None
+
+        if clause is None:
+            self._fail()
+
+        return clause(self, name)
+
+    def _valueDeclaration(self, name):
+        self._expect("OBJECT")
+        self._expect("IDENTIFIER")
+        self._expect("COLON_COLON_EQUAL")
+
+        return "valueDeclaration", name, self._objectIdentifierValue()
+
+    def _typeDeclaration(self, name):
+        self._expect("COLON_COLON_EQUAL")
+
+        if self._type == "TEXTUAL_CONVENTION":
+            self._next()
+
+            display = self._optionalText("DISPLAY_HINT")
+            status = self._status()
+            description = self._text("DESCRIPTION")
+            reference = self._optionalText("REFERENCE")
+
+            self._expect("SYNTAX")
+
+            rhs = (
+                "typeDeclarationRHS",
+                display,
+                status,
+                description,
+                reference,
+                self._syntax(),
+            )
+
+        elif self._type == "CHOICE":
+            self._next()
+
+            rhs = None
+
+        else:
+            rhs = ("typeDeclarationRHS", self._syntax())
+
+        return "typeDeclaration", name, rhs
+
+    def _objectIdentityClause(self, name):
+        self._expect("OBJECT_IDENTITY")
+
+        status = self._status()
+        description = self._text("DESCRIPTION")
+        reference = self._optionalText("REFERENCE")
+
+        self._expect("COLON_COLON_EQUAL")
+
+        return (
+            "objectIdentityClause",
+            name,
+            status,
+            description,
+            reference,
+            self._objectIdentifierValue(),
+        )
+
+    def _objectTypeClause(self, name):
+        self._expect("OBJECT_TYPE")
+        self._expect("SYNTAX")
+
+        syntax = self._syntax()
+        units = self._optionalText("UNITS")
+
+        access = None
+
+        if self._type == "MAX_ACCESS" or self._type == "ACCESS":
+            self._next()
+            access = ("MaxAccessPart", self._expect("LOWERCASE_IDENTIFIER"))
+
+        status = self._status()
+        description = self._optionalText("DESCRIPTION")
+        reference = self._optionalText("REFERENCE")
+
+        augmention = None
+
+        if self._type == "AUGMENTS":
+            self._next()
+            self._expect("{")
+            augmention = self._objectIdentifier()[1][0]
+            self._expect("}")
+
+        index = None
+
+        if self._type == "INDEX":
+            value = self._take()
+
+            self._expect("{")
+
+            indexTypes = [self._indexType()]
+
+            while self._type == ",":
+                self._next()
+                indexTypes.append(self._indexType())
+
+            self._expect("}")
+
+            index = (value, indexTypes)
+
+        defval = self._defValPart()
+
+        self._expect("COLON_COLON_EQUAL")
+
+        return (
+            "objectTypeClause",
+            name,
+            syntax,
+            units,
+            access,
+            status,
+            description,
+            reference,
+            augmention,
+            index,
+            defval,
+            self._objectIdentifierValue(),
+        )
+
+    def _indexType(self):
+        if self._type == "IMPLIED":
+            self._next()
+            return 1, self._index()
+
+        return 0, self._index()
+
+    def _index(self):
+        if self._supportIndex:
+            if self._type == "OCTET":
+                octet = self._take()
+                return octet + " " + self._expect("STRING")
+
+            if self._type in SMI_V1_INDEX_TYPES:
+                return self._take()
+
+            objectName = self._objectIdentifier()
+
+            return objectName[1][0] or objectName
+
+        return self._objectIdentifier()[1][0]
+
+    def _defValPart(self):
+        if self._type != "DEFVAL":
+            return None
+
+        defval = self._take()
+
+        self._expect("{")
+
+        if self._type == "{":
+            self._next()
+
+            if self._type == "}":
+                value = []
+
+            elif self._type == "NUMBER":
+                self._subidentifiersDefval()
+                value = None
+
+            elif self._type == "LOWERCASE_IDENTIFIER":
+                bitName = self._take()
+
+                if self._type == "(":
+                    self._subidentifierDefvalNumber()
+                    self._subidentifiersDefval()
+                    value = None
+
+                else:
+                    bitNames = [bitName]
+
+                    while self._type == ",":
+                        self._next()
+                        bitNames.append(self._expect("LOWERCASE_IDENTIFIER"))
+
+                    value = ("BitNames", bitNames)
+
+            else:
+                self._fail()
+
+            self._expect("}")
+
+        elif self._type in DEFVAL_VALUES:
+            value = self._take()
+
+        else:
+            self._fail()
+
+        self._expect("}")
+
+        if value is not None:
+            return defval, value
+
+    def _subidentifiersDefval(self):
+        while True:
+            if self._type == "NUMBER":
+                self._next()
+
+            elif self._type == "LOWERCASE_IDENTIFIER":
+                self._next()
+                self._subidentifierDefvalNumber()
+
+            else:
+                return
+
+    def _subidentifierDefvalNumber(self):
+        self._expect("(")
+        self._expect("NUMBER")
+        self._expect(")")
+
+    def _trapTypeClause(self, name):
+        self._expect("TRAP_TYPE")
+        self._expect("ENTERPRISE")
+
+        if self._curlyBracesAroundEnterpriseInTrap and self._type == "{":
+            self._next()
+            enterprise = self._objectIdentifier()
+            self._expect("}")
+
+        else:
+            enterprise = self._objectIdentifier()
+
+        variables = []
+
+        if self._type == "VARIABLES":
+            self._next()
+            self._expect("{")
+            variables = ("VarTypes", self._objectNames())
+            self._expect("}")
+
+        description = self._optionalText("DESCRIPTION")
+        reference = self._optionalText("REFERENCE")
+
+        self._expect("COLON_COLON_EQUAL")
+
+        return (
+            "trapTypeClause",
+            name,
+            enterprise,
+            variables,
+            description,
+            reference,
+            self._expect("NUMBER"),
+        )
+
+    def _notificationTypeClause(self, name):
+        self._expect("NOTIFICATION_TYPE")
+
+        objects = []
+
+        if self._type == "OBJECTS":
+            self._next()
+            self._expect("{")
+            objects = ("Objects", self._objectNames())
+            self._expect("}")
+
+        status = self._status()
+        description = self._text("DESCRIPTION")
+        reference = self._optionalText("REFERENCE")
+
+        self._expect("COLON_COLON_EQUAL")
+
+        return (
+            "notificationTypeClause",
+            name,
+            objects,
+            status,
+            description,
+            reference,
+            self._objectIdentifierValue(),
+        )
+
+    def _moduleIdentityClause(self, name):
+        self._expect("MODULE_IDENTITY")
+
+        if self._type == "SUBJECT_CATEGORIES":
+            self._next()
+            self._expect("{")
+
+            while True:
+                self._expect("LOWERCASE_IDENTIFIER")
+
+                if self._type == "(":
+                    self._subidentifierDefvalNumber()
+
+                if self._type != ",":
+                    break
+
+                self._next()
+
+            self._expect("}")
+
+        lastUpdated = self._text("LAST_UPDATED")
+        organization = self._text("ORGANIZATION")
+        contactInfo = self._text("CONTACT_INFO")
+        description = self._text("DESCRIPTION")
+
+        revisions = None
+
+        if self._type == "REVISION":
+            revisions = ("Revisions", [])
+
+            while self._type == "REVISION":
+                self._next()
+
+                revision = self._expect("QUOTED_STRING")[1:-1]
+
+                revisions[1].append((revision, self._text("DESCRIPTION")))
+
+        self._expect("COLON_COLON_EQUAL")
+
+        return (
+            "moduleIdentityClause",
+            name,
+            lastUpdated,
+            organization,
+            contactInfo,
+            description,
+            revisions,
+            self._objectIdentifierValue(),
+        )
+
+    def _moduleComplianceClause(self, name):
+        self._expect("MODULE_COMPLIANCE")
+
+        status = self._status()
+        description = self._text("DESCRIPTION")
+        reference = self._optionalText("REFERENCE")
+
+        modules = [self._complianceModule()]
+
+        while self._type == "MODULE":
+            modules.append(self._complianceModule())
+
+        self._expect("COLON_COLON_EQUAL")
+
+        return (
+            "moduleComplianceClause",
+            name,
+            status,
+            description,
+            reference,
+            ("ComplianceModules", modules),
+            self._objectIdentifierValue(),
+        )
+
+    def _complianceModule(self):
+        self._expect("MODULE")
+
+        moduleName = None
+
+        if self._type == "UPPERCASE_IDENTIFIER":
+            moduleName = self._take()
+
+        objects = []
+
+        if self._type == "MANDATORY_GROUPS":
+            self._next()
+            self._expect("{")
+
+            objects.append(self._objectIdentifier()[1][0])
+
+            while self._type == ",":
+                self._next()
+                objects.append(self._objectIdentifier()[1][0])
+
+            self._expect("}")
+
+        # compliances following an OBJECT one are dropped, so is
+        # a GROUP evaluating to false
+        compliances = None
+
+        if self._type == "GROUP" or self._type == "OBJECT":
+            compliance = self._compliance()
+
+            compliances = compliance and [compliance] or None
+
+            while self._type == "GROUP" or self._type == "OBJECT":
+                compliance = self._compliance()
+
+                if compliances and compliance:
+                    compliances.append(compliance)
+
+        return moduleName, objects + (compliances or [])
+
+    def _compliance(self):
+        if self._type == "GROUP":
+            self._next()
+
+            group = self._objectIdentifier()[1][0]
+
+            self._text("DESCRIPTION")
+
+            return group
+
+        self._next()
+        self._objectIdentifier()
+        self._syntaxPart()
+        self._writeSyntaxPart()
+
+        if self._type == "MIN_ACCESS":
+            self._next()
+            self._expect("LOWERCASE_IDENTIFIER")
+
+        self._text("DESCRIPTION")
+
+    def _objectGroupClause(self, name):
+        self._expect("OBJECT_GROUP")
+        self._expect("OBJECTS")
+        self._expect("{")
+
+        objects = ("Objects", self._objectNames())
+
+        self._expect("}")
+
+        status = self._status()
+        description = self._text("DESCRIPTION")
+        reference = self._optionalText("REFERENCE")
+
+        self._expect("COLON_COLON_EQUAL")
+
+        return (
+            "objectGroupClause",
+            name,
+            objects,
+            status,
+            description,
+            reference,
+            self._objectIdentifierValue(),
+        )
+
+    def _notificationGroupClause(self, name):
+        self._expect("NOTIFICATION_GROUP")
+        self._expect("NOTIFICATIONS")
+        self._expect("{")
+
+        notifications = ("Notifications", self._objectNames())
+
+        self._expect("}")
+
+        status = self._status()
+        description = self._text("DESCRIPTION")
+        reference = self._optionalText("REFERENCE")
+
+        self._expect("COLON_COLON_EQUAL")
+
+        return (
+            "notificationGroupClause",
+            name,
+            notifications,
+            status,
+            description,
+            reference,
+            self._objectIdentifierValue(),
+        )
+
+    def _agentCapabilitiesClause(self, name):
+        self._expect("AGENT_CAPABILITIES")
+
+        productRelease = self._text("PRODUCT_RELEASE")
+        status = self._status()
+        description = self._text("DESCRIPTION")
+        reference = self._optionalText("REFERENCE")
+
+        while self._type == "SUPPORTS":
+            self._next()
+            self._expect("UPPERCASE_IDENTIFIER")
+
+            if self._type in SUBIDENTIFIERS:
+                self._objectIdentifier()
+
+            self._expect("INCLUDES")
+            self._expect("{")
+            self._objectNames()
+            self._expect("}")
+
+            while self._type == "VARIATION":
+                self._variation()
+
+        self._expect("COLON_COLON_EQUAL")
+
+        return (
+            "agentCapabilitiesClause",
+            name,
+            productRelease,
+            status,
+            description,
+            reference,
+            self._objectIdentifierValue(),
+        )
+
+    def _variation(self):
+        self._expect("VARIATION")
+        self._objectIdentifier()
+        self._syntaxPart()
+        self._writeSyntaxPart()
+
+        if self._type == "ACCESS":
+            self._next()
+            self._expect("LOWERCASE_IDENTIFIER")
+
+        if self._type == "CREATION_REQUIRES":
+            self._next()
+            self._expect("{")
+
+            if not self._noCells or self._type != "}":
+                self._objectNames()
+
+            self._expect("}")
+
+        self._defValPart()
+        self._text("DESCRIPTION")
+
+    # Clause parts
+
+    def _status(self):
+        self._expect("STATUS")
+
+        return "Status", self._expect("LOWERCASE_IDENTIFIER")
+
+    def _text(self, type):
+        value = self._expect(type)
+
+        return value, self._expect("QUOTED_STRING")[1:-1]
+
+    def _optionalText(self, type):
+        if self._type == type:
+            return self._text(type)
+
+    def _syntaxPart(self):
+        if self._type == "SYNTAX":
+            self._next()
+            self._syntax()
+
+    def _writeSyntaxPart(self):
+        if self._type == "WRITE_SYNTAX":
+            self._next()
+            self._syntax()
+
+    def _objectNames(self):
+        names = [self._objectIdentifier()[1][0]]
+
+        while self._type == ",":
+            self._next()
+            names.append(self._objectIdentifier()[1][0])
+
+        return names
+
+    # Syntax
+
+    def _syntax(self):
+        type = self._type
+
+        if type == "BITS":
+            bits = self._take()
+
+            self._expect("{")
+
+            namedBits = [self._namedBit()]
+
+            while self._type == ",":
+                self._next()
+                namedBits.append(self._namedBit())
+
+            self._expect("}")
+
+            return bits, namedBits
+
+        if type == "SEQUENCE":
+            sequence = self._take()
+
+            if self._type == "OF":
+                self._next()
+                return "conceptualTable", ("row", self._expect("UPPERCASE_IDENTIFIER"))
+
+            self._expect("{")
+
+            sequenceItems = self._sequenceItems()
+
+            self._expect("}")
+
+            return sequence, sequenceItems
+
+        if type == "[":
+            self._next()
+
+            if self._type != "APPLICATION" and self._type != "UNIVERSAL":
+                self._fail()
+
+            self._next()
+            self._expect("NUMBER")
+            self._expect("]")
+            self._expect("IMPLICIT")
+
+            return self._simpleSyntax(False)
+
+        if type in self._applicationTypes:
+            return "ApplicationSyntax", self._take(), self._anySubType()
+
+        if type in APPLICATION_INTEGER_TYPES:
+            value = self._take()
+
+            if self._type == "(":
+                return "ApplicationSyntax", value, self._integerSubType()
+
+            return ("ApplicationSyntax", value)
+
+        if type == "OPAQUE":
+            value = self._take()
+
+            if self._type == "(":
+                return "ApplicationSyntax", value, self._octetStringSubType()
+
+            return ("ApplicationSyntax", value)
+
+        return self._simpleSyntax(True)
+
+    def _simpleSyntax(self, row):
+        type = self._type
+
+        if type == "INTEGER":
+            value = self._take()
+
+            if self._type == "(":
+                return "SimpleSyntax", value, self._integerSubType()
+
+            if self._type == "{":
+                return "SimpleSyntax", value, self._enumSpec()
+
+            return ("SimpleSyntax", value)
+
+        if type == "UPPERCASE_IDENTIFIER":
+            value = self._take()
+
+            if self._type == "{":
+                return "SimpleSyntax", value, self._enumSpec()
+
+            if self._type == "(":
+                return "SimpleSyntax", value, self._subType()
+
+            if not row:
+                self._fail()
+
+            return ("row", value)
+
+        if type == "INTEGER32":
+            value = self._take()
+
+            if self._type == "(":
+                return "SimpleSyntax", value, self._integerSubType()
+
+            return ("SimpleSyntax", value)
+
+        if type == "OCTET":
+            value = self._take() + " " + self._expect("STRING")
+
+            if self._type == "(":
+                return "SimpleSyntax", value, self._octetStringSubType()
+
+            return ("SimpleSyntax", value)
+
+        if type == "OBJECT":
+            value = self._take() + " " + self._expect("IDENTIFIER")
+
+            return "SimpleSyntax", value, self._anySubType()
+
+        self._fail()
+
+    def _sequenceItems(self):
+        sequenceItems = [self._sequenceItem()]
+
+        while self._type == ",":
+            self._next()
+
+            if self._commaAtTheEndOfSequence and self._type != "LOWERCASE_IDENTIFIER":
+                continue
+
+            sequenceItems.append(self._sequenceItem())
+
+        return sequenceItems
+
+    def _sequenceItem(self):
+        name = self._expect("LOWERCASE_IDENTIFIER")
+
+        type = self._type
+
+        if type == "BITS" or type == "OPAQUE":
+            return name, self._take()
+
+        if (
+            type == "UPPERCASE_IDENTIFIER"
+            or type == "INTEGER"
+            or type == "INTEGER32"
+            or type in self._sequenceApplicationTypes
+        ):
+            value = self._take()
+
+        elif type == "OCTET":
+            value = self._take() + " " + self._expect("STRING")
+
+        elif type == "OBJECT":
+            value = self._take() + " " + self._expect("IDENTIFIER")
+
+        else:
+            self._fail()
+
+        # sub-types are not kept
+        self._anySubType()
+
+        return name, value
+
+    def _namedBit(self):
+        name = self._expect("LOWERCASE_IDENTIFIER")
+
+        self._expect("(")
+
+        number = self._expect("NUMBER")
+
+        self._expect(")")
+
+        return name, number
+
+    def _anySubType(self):
+        if self._type == "(":
+            return self._subType()
+
+        if self._type == "{":
+            return self._enumSpec()
+
+    def _subType(self):
+        self._expect("(")
+
+        if self._type == "SIZE":
+            self._next()
+            self._expect("(")
+
+            ranges = self._ranges()
+
+            self._expect(")")
+            self._expect(")")
+
+            return "octetStringSubType", ranges
+
+        ranges = self._ranges()
+
+        self._expect(")")
+
+        return "integerSubType", ranges
+
+    def _integerSubType(self):
+        self._expect("(")
+
+        ranges = self._ranges()
+
+        self._expect(")")
+
+        return "integerSubType", ranges
+
+    def _octetStringSubType(self):
+        self._expect("(")
+        self._expect("SIZE")
+        self._expect("(")
+
+        ranges = self._ranges()
+
+        self._expect(")")
+        self._expect(")")
+
+        return "octetStringSubType", ranges
+
+    def _ranges(self):
+        ranges = [self._range()]
+
+        while self._type == "|":
+            self._next()
+            ranges.append(self._range())
+
+        return ranges
+
+    def _range(self):
+        if self._type not in VALUES:
+            self._fail()
+
+        value = self._take()
+
+        if self._type == "DOT_DOT":
+            self._next()
+
+            if self._type not in VALUES:
+                self._fail()
+
+            return value, self._take()
+
+        return (value,)
+
+    def _enumSpec(self):
+        self._expect("{")
+
+        enumItems = [self._enumItem()]
+
+        if self._mixOfCommasAndSpaces:
+            while True:
+                if self._type == ",":
+                    self._next()
+
+                elif self._type in self._enumNames:
+                    enumItems.append(self._enumItem())
+
+                else:
+                    break
+
+        else:
+            while self._type == ",":
+                self._next()
+                enumItems.append(self._enumItem())
+
+        self._expect("}")
+
+        return "enumSpec", enumItems
+
+    def _enumItem(self):
+        if self._type not in self._enumNames:
+            self._fail()
+
+        name = self._take()
+
+        self._expect("(")
+
+        if self._type != "NUMBER" and self._type != "NEGATIVENUMBER":
+            self._fail()
+
+        number = self._take()
+
+        self._expect(")")
+
+        return name, number
+
+    # Object identifiers
+
+    def _objectIdentifierValue(self):
+        self._expect("{")
+
+        objectIdentifier = self._objectIdentifier()
+
+        self._expect("}")
+
+        return objectIdentifier
+
+    def _objectIdentifier(self):
+        subidentifiers = []
+
+        while True:
+            type = self._type
+
+            if type == "LOWERCASE_IDENTIFIER":
+                value = self._take()
+
+                if self._type == "(":
+                    self._next()
+
+                    value = (value, self._expect("NUMBER"))
+
+                    self._expect(")")
+
+                subidentifiers.append(value)
+
+            elif type == "UPPERCASE_IDENTIFIER" or type == "NUMBER":
+                subidentifiers.append(self._take())
+
+            elif subidentifiers:
+                return "objectIdentifier", subidentifiers
+
+            else:
+                self._fail()
@@ -4,14 +4,19 @@
 # Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
 # License: https://www.pysnmp.com/pysmi/license.html
 #
+import copy
 import os
 import sys
+import threading
 
 import ply.yacc as yacc
+from pysmi import config
 from pysmi import debug
 from pysmi import error
 from pysmi.lexer.smi import lexerFactory
 from pysmi.parser.base import AbstractParser
+from pysmi.parser.descent import DescentParser
+from pysmi.parser.tables import get_signature, get_table
 
 YACC_VERSION = [int(x) for x in yacc.__version__.split(".")]
 
@@ -20,7 +25,24 @@ YACC_VERSION = [int(x) for x in yacc.__version__.split(".")]
 class SmiV2Parser(AbstractParser):
     defaultLexer = lexerFactory()
 
-    def __init__(self, startSym="mibFile", tempdir=""):
+    #: names of grammar relaxation options this parser is built with
+    grammarOptions = ()
+
+    #: optional *FileCache* for parsed MIBs
+    cache = None
+
+    # signature of the grammar, for the keys of parsed MIBs in the cache
+    _grammarSignature = None
+
+    #: parser engines: ply LR parser or *DescentParser* parsing the same way
+    engines = ("ply", "descent")
+
+    def __init__(self, startSym="mibFile", tempdir="", lexerEngine="ply", engine="ply"):
+        if engine not in self.engines:
+            raise error.PySmiError(f"Unknown parser engine: {engine}")
+
+        self.startSym = startSym
+
         if tempdir:
             tempdir = os.path.join(tempdir, startSym)
             try:
@@ -31,12 +53,23 @@ class SmiV2Parser(AbstractParser):
                         f"Failed to create cache directory {tempdir}: {sys.exc_info()[1]}"
                     )
 
-        self.lexer = self.defaultLexer(tempdir=tempdir)
+        self.lexer = self.defaultLexer(tempdir=tempdir, engine=lexerEngine)
+
+        self._tempdir = tempdir
+        self._lexerEngine = lexerEngine
+
+        # lexer and LR parser keep state while parsing, so threads other
+        # than the one the parser is created in get copies of their own
+        self._thread = threading.get_ident()
+        self._local = threading.local()
 
         # tokens are required for parser
         self.tokens = self.lexer.tokens
 
-        if YACC_VERSION < [3, 0]:
+        if engine == "descent":
+            self.parser = DescentParser(self)
+
+        elif YACC_VERSION < [3, 0]:
             self.parser = yacc.yacc(
                 module=self,
                 start=startSym,
@@ -55,33 +88,118 @@ class SmiV2Parser(AbstractParser):
             else:
                 debuglogger = None
 
-            self.parser = yacc.yacc(
-                module=self,
-                start=startSym,
-                write_tables=bool(tempdir),
-                debug=False,
-                outputdir=tempdir,
-                debuglog=debuglogger,
-                errorlog=logger,
-            )
+            # standard dialects come with LR tables, grammar analysis
+            # is only needed for its debugging or for custom grammars
+            tabmodule = debuglogger is None and get_table(self, startSym)
+
+            if tabmodule:
+                debug.logger & debug.FLAG_PARSER and debug.logger(
+                    f"using LR tables from {tabmodule.__name__}"
+                )
+
+                self.parser = yacc.yacc(
+                    module=self,
+                    start=startSym,
+                    tabmodule=tabmodule,
+                    optimize=True,
+                    write_tables=False,
+                    debug=False,
+                    errorlog=logger,
+                )
+
+            else:
+                self.parser = yacc.yacc(
+                    module=self,
+                    start=startSym,
+                    write_tables=bool(tempdir),
+                    debug=False,
+                    outputdir=tempdir,
+                    debuglog=debuglogger,
+                    errorlog=logger,
+                )
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop("_local")
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._local = threading.local()
 
     def reset(self):
-        # Ply requires lexer reinitialization for (at least) resetting lineno
+        # lexer keeps lineno and state from the last MIB
         self.lexer.reset()
 
+    def _get_machinery(self):
+        """Return lexer and LR parser for the calling thread to use."""
+        if threading.get_ident() == self._thread:
+            return self.lexer, self.parser
+
+        try:
+            return self._local.machinery
+
+        except AttributeError:
+            self._local.machinery = (
+                self.defaultLexer(tempdir=self._tempdir, engine=self._lexerEngine),
+                copy.copy(self.parser),
+            )
+
+            return self._local.machinery
+
+    def _get_cache_key(self, data):
+        """Return key of parsed MIB text in the cache.
+
+        Subclasses may change the grammar or the way parse trees are built,
+        so the key covers the parser class and the grammar it implements,
+        not just the grammar options.
+        """
+        if self._grammarSignature is None:
+            self._grammarSignature = get_signature(self, self.startSym)
+
+        return self.cache.make_key(
+            f"{type(self).__module__}.{type(self).__qualname__}",
+            self._grammarSignature,
+            self.startSym,
+            self.grammarOptions,
+            config.STRICT_MODE,
+            data,
+        )
+
     def parse(self, data, **kwargs):
         debug.logger & debug.FLAG_PARSER and debug.logger(
             f'source MIB size is {len(data)} characters, first 50 characters are "{data[:50]}..."'
         )
 
-        ast = self.parser.parse(data, lexer=self.lexer.lexer)
+        if self.cache is not None:
+            key = self._get_cache_key(data)
+
+            mibTrees = self.cache.get_data(key)
+
+            if mibTrees is not None:
+                debug.logger & debug.FLAG_PARSER and debug.logger(
+                    f"parsed MIB taken from {self.cache}"
+                )
+                return mibTrees
 
-        self.reset()
+        lexer, parser = self._get_machinery()
+
+        try:
+            ast = parser.parse(data, lexer=lexer.lexer)
+
+        finally:
+            # lexer keeps lineno and state from the last MIB
+            lexer.reset()
 
         if ast and ast[0] == "mibFile" and ast[1]:  # mibfile is not empty
-            return ast[1]
+            mibTrees = ast[1]
         else:
-            return []
+            mibTrees = []
+
+        if self.cache is not None:
+            self.cache.put_data(key, mibTrees)
+
+        return mibTrees
 
     #
     # SMIv2 grammar follows
@@ -1441,6 +1559,12 @@ relaxedGrammar = {
 }
 
 
+# parser classes and shared parser instances by grammar options
+_parserClasses = {}
+_parsers = {}
+_lock = threading.Lock()
+
+
 def parserFactory(**grammarOptions):
     """Factory function producing custom specializations of base *SmiV2Parser*
     class.
@@ -1465,22 +1589,77 @@ def parserFactory(**grammarOptions):
         * curlyBracesAroundEnterpriseInTrap - tolerate curly braces around enterprise ID in TRAP MACRO
         * noCells - tolerate missing cells (XXX)
 
+        The same class is returned for the same set of enabled options,
+        no matter the order options are given in or disabled ones.
+
     Examples:
 
     >>> from pysmi.parser import smi
     >>> SmiV1Parser = smi.parserFactory(supportSmiV1Keywords=True, supportIndex=True)
 
     """
-    classAttr = {}
+    options = tuple(
+        sorted(option for option in grammarOptions if grammarOptions[option])
+    )
+
+    with _lock:
+        try:
+            return _parserClasses[options]
+
+        except KeyError:
+            pass
 
-    for option in grammarOptions:
-        if grammarOptions[option]:
+        classAttr = {}
+
+        for option in options:
             if option not in relaxedGrammar:
                 raise error.PySmiError(f"Unknown parser relaxation option: {option}")
 
             for func in relaxedGrammar[option]:
                 classAttr[func.__name__] = func
 
-    classAttr["defaultLexer"] = lexerFactory(**grammarOptions)
+        classAttr["defaultLexer"] = lexerFactory(**grammarOptions)
+
+        classAttr["grammarOptions"] = options
+
+        parserClass = _parserClasses[options] = type(
+            "SmiParser", (SmiV2Parser,), classAttr
+        )
+
+        return parserClass
+
+
+def get_parser(**grammarOptions):
+    """Return parser shared within the process for a set of grammar options.
+
+    The parser is created on the first call for the options and handed
+    out to all later callers, so the grammar is set up at most once per
+    process and dialect. The parser may be used by many threads at once.
+    Callers that need a parser configured differently, e.g. with a cache
+    of parsed MIBs, should instantiate their own one.
+
+    Keyword Args:
+        grammarOptions: SMIv2 grammar relaxations, as for *parserFactory*
+
+    Returns:
+        *SmiV2Parser* specialization object
+
+    Examples:
+
+    >>> from pysmi.parser.dialect import smi_v1_relaxed
+    >>> from pysmi.parser.smi import get_parser
+    >>> parser = get_parser(**smi_v1_relaxed)
+
+    """
+    parserClass = parserFactory(**grammarOptions)
+
+    with _lock:
+        try:
+            return _parsers[parserClass.grammarOptions]
+
+        except KeyError:
+            pass
+
+        parser = _parsers[parserClass.grammarOptions] = parserClass()
 
-    return type("SmiParser", (SmiV2Parser,), classAttr)
+        return parser
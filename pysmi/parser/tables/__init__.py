@@ -0,0 +1,120 @@
+#
+# This file is part of pysmi software.
+#
+# Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
+# License: https://www.pysnmp.com/pysmi/license.html
+#
+
+#
+# LR parsing tables prebuilt for the grammars of standard SMI dialects.
+#
+# Every table module is named after the signature of the grammar it is
+# built for, so a parser finds its tables by the grammar it implements,
+# without analysing it. Tables of a grammar that have changed are never
+# found, the parser then builds its tables as usual.
+#
+# Tables are rebuilt by running: python -m pysmi.parser.tables
+#
+import glob
+import hashlib
+import importlib
+import os
+
+import ply.yacc as yacc
+
+#: dialects of *pysmi.parser.dialect* LR tables are shipped for
+DIALECTS = ("smi_v2", "smi_v1", "smi_v1_relaxed")
+
+#: grammar start symbols LR tables are shipped for
+START_SYMBOLS = ("mibFile",)
+
+TABLE_PREFIX = "parsetab_"
+
+
+def get_signature(parser, startSym):
+    """Return signature of the grammar implemented by a parser.
+
+    Args:
+        parser: *SmiV2Parser* object
+        startSym: grammar start symbol
+
+    Returns:
+        :py:class:`str` digest of the grammar rules, tokens and names
+        of the functions implementing the rules
+    """
+    pdict = {attr: getattr(parser, attr) for attr in dir(parser)}
+    pdict["start"] = startSym
+
+    pinfo = yacc.ParserReflect(pdict, log=yacc.NullLogger())
+    pinfo.get_all()
+
+    signature = pinfo.signature() + " ".join(f[2] for f in pinfo.pfuncs)
+
+    return hashlib.sha1(signature.encode()).hexdigest()[:16]
+
+
+def get_table(parser, startSym):
+    """Return module holding prebuilt LR tables for a parser.
+
+    Args:
+        parser: *SmiV2Parser* object
+        startSym: grammar start symbol
+
+    Returns:
+        table module for *ply.yacc* or `None` if no tables are shipped
+        for the grammar
+    """
+    tabmodule = f"{__name__}.{TABLE_PREFIX}{get_signature(parser, startSym)}"
+
+    try:
+        return importlib.import_module(tabmodule)
+
+    except ImportError:
+        return None
+
+
+def write_tables(outputdir=None):
+    """Build LR tables for all standard dialects and write them down.
+
+    Table modules of former grammars are removed from the output
+    directory.
+
+    Args:
+        outputdir: directory to write table modules into, this package
+            directory by default
+
+    Returns:
+        :py:class:`list` of table module file names written
+    """
+    from pysmi.parser import dialect
+    from pysmi.parser.smi import parserFactory
+
+    if outputdir is None:
+        outputdir = os.path.dirname(__file__)
+
+    for path in glob.glob(os.path.join(outputdir, TABLE_PREFIX + "*.py")):
+        os.remove(path)
+
+    filenames = []
+
+    for name in DIALECTS:
+        parserClass = parserFactory(**getattr(dialect, name))
+
+        for startSym in START_SYMBOLS:
+            parser = parserClass(startSym=startSym)
+
+            tabmodule = TABLE_PREFIX + get_signature(parser, startSym)
+
+            yacc.yacc(
+                module=parser,
+                start=startSym,
+                tabmodule=tabmodule,
+                outputdir=outputdir,
+                write_tables=True,
+                debug=False,
+                errorlog=yacc.NullLogger(),
+            )
+
+            filenames.append(os.path.join(outputdir, tabmodule + ".py"))
+
+    return filenames
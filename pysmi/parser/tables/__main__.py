@@ -0,0 +1,10 @@
+#
+# This file is part of pysmi software.
+#
+# Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
+# License: https://www.pysnmp.com/pysmi/license.html
+#
+from pysmi.parser.tables import write_tables
+
+for filename in write_tables():
+    print(filename)
@@ -0,0 +1,355 @@
+
+# parsetab_409b0a72f1d179ff.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = "mibFileACCESS AGENT_CAPABILITIES APPLICATION AUGMENTS BEGIN BIN_STRING BITS CHOICE COLON_COLON_EQUAL CONTACT_INFO COUNTER32 COUNTER64 CREATION_REQUIRES DEFINITIONS DEFVAL DESCRIPTION DISPLAY_HINT DOT_DOT END ENTERPRISE EXPORTS EXTENDS FROM GAUGE32 GROUP HEX_STRING IDENTIFIER IMPLICIT IMPLIED IMPORTS INCLUDES INDEX INSTALL_ERRORS INTEGER INTEGER32 IPADDRESS LAST_UPDATED LOWERCASE_IDENTIFIER MACRO MANDATORY_GROUPS MAX MAX_ACCESS MIN_ACCESS MODULE MODULE_COMPLIANCE MODULE_IDENTITY NEGATIVENUMBER NEGATIVENUMBER64 NETWORKADDRESS NOTIFICATIONS NOTIFICATION_GROUP NOTIFICATION_TYPE NUMBER NUMBER64 OBJECT OBJECTS OBJECT_GROUP OBJECT_IDENTITY OBJECT_TYPE OCTET OF OPAQUE ORGANIZATION PIB_ACCESS PIB_DEFINITIONS PIB_INDEX PIB_MIN_ACCESS PIB_REFERENCES PIB_TAG POLICY_ACCESS PRODUCT_RELEASE QUOTED_STRING REFERENCE REVISION SEQUENCE SIZE STATUS STRING SUBJECT_CATEGORIES SUPPORTS SYNTAX TEXTUAL_CONVENTION TIMETICKS TRAP_TYPE UNIQUENESS UNITS UNIVERSAL UNSIGNED32 UPPERCASE_IDENTIFIER VALUE VARIABLES VARIATION WRITE_SYNTAXmibFile : modules\n        | emptymodules : modules module\n        | modulemodule : moduleName moduleOid DEFINITIONS COLON_COLON_EQUAL BEGIN exportsClause linkagePart declarationPart ENDmoduleOid : '{' objectIdentifier '}'\n        | emptylinkagePart : linkageClause\n        | emptylinkageClause : IMPORTS importPart ';'exportsClause : EXPORTS\n        | emptyimportPart : imports\n        | emptyimports : imports import\n        | importimport : importIdentifiers FROM moduleNameimportIdentifiers : importIdentifiers ',' importIdentifier\n        | importIdentifierimportIdentifier : LOWERCASE_IDENTIFIER\n        | UPPERCASE_IDENTIFIER\n        | importedKeywordimportedSMIKeyword : AGENT_CAPABILITIES\n        | COUNTER32\n        | COUNTER64\n        | GAUGE32\n        | NOTIFICATION_GROUP\n        | NOTIFICATION_TYPE\n        | TRAP_TYPEmoduleName : UPPERCASE_IDENTIFIERdeclarationPart : declarations\n        | emptydeclarations : declarations declaration\n        | declarationdeclaration : typeDeclaration\n        | valueDeclaration\n        | objectIdentityClause\n        | objectTypeClause\n        | trapTypeClause\n        | notificationTypeClause\n        | moduleIdentityClause\n        | moduleComplianceClause\n        | objectGroupClause\n        | notificationGroupClause\n        | agentCapabilitiesClause\n        | macroClausemacroClause : macroName MACRO ENDmacroName : MODULE_IDENTITY\n        | OBJECT_TYPE\n        | TRAP_TYPE\n        | NOTIFICATION_TYPE\n        | OBJECT_IDENTITY\n        | TEXTUAL_CONVENTION\n        | OBJECT_GROUP\n        | NOTIFICATION_GROUP\n        | MODULE_COMPLIANCE\n        | AGENT_CAPABILITIESchoiceClause : CHOICEfuzzy_lowercase_identifier : LOWERCASE_IDENTIFIER\n        | UPPERCASE_IDENTIFIERvalueDeclaration : fuzzy_lowercase_identifier OBJECT IDENTIFIER COLON_COLON_EQUAL '{' objectIdentifier '}'typeDeclaration : typeName COLON_COLON_EQUAL typeDeclarationRHStypeName : UPPERCASE_IDENTIFIER\n        | typeSMItypeSMI : typeSMIandSPPI\n        | typeSMIonlytypeSMIonly : COUNTER32\n        | GAUGE32\n        | COUNTER64typeDeclarationRHS : Syntax\n        | TEXTUAL_CONVENTION DisplayPart STATUS Status DESCRIPTION Text ReferPart SYNTAX Syntax\n        | choiceClauseconceptualTable : SEQUENCE OF rowrow : UPPERCASE_IDENTIFIERentryType : SEQUENCE '{' sequenceItems '}'sequenceItems : sequenceItems ',' sequenceItem\n        | sequenceItemsequenceItem : LOWERCASE_IDENTIFIER sequenceSyntaxSyntax : ObjectSyntax\n        | BITS '{' NamedBits '}'sequenceSyntax : BITS\n        | UPPERCASE_IDENTIFIER anySubType\n        | sequenceObjectSyntaxNamedBits : NamedBits ',' NamedBit\n        | NamedBitNamedBit : LOWERCASE_IDENTIFIER '(' NUMBER ')'objectIdentityClause : LOWERCASE_IDENTIFIER OBJECT_IDENTITY STATUS Status DESCRIPTION Text ReferPart COLON_COLON_EQUAL '{' objectIdentifier '}'objectTypeClause : LOWERCASE_IDENTIFIER OBJECT_TYPE SYNTAX Syntax UnitsPart MaxOrPIBAccessPart STATUS Status descriptionClause ReferPart IndexPart MibIndex DefValPart COLON_COLON_EQUAL '{' ObjectName '}'descriptionClause : DESCRIPTION Text\n        | emptytrapTypeClause : fuzzy_lowercase_identifier TRAP_TYPE ENTERPRISE objectIdentifier VarPart DescrPart ReferPart COLON_COLON_EQUAL NUMBERVarPart : VARIABLES '{' VarTypes '}'\n        | emptyVarTypes : VarTypes ',' VarType\n        | VarTypeVarType : ObjectNameDescrPart : DESCRIPTION Text\n        | emptyMaxOrPIBAccessPart : MaxAccessPart\n        | emptyMaxAccessPart : MAX_ACCESS Access\n        | ACCESS AccessnotificationTypeClause : LOWERCASE_IDENTIFIER NOTIFICATION_TYPE NotificationObjectsPart STATUS Status DESCRIPTION Text ReferPart COLON_COLON_EQUAL '{' NotificationName '}'moduleIdentityClause : LOWERCASE_IDENTIFIER MODULE_IDENTITY SubjectCategoriesPart LAST_UPDATED ExtUTCTime ORGANIZATION Text CONTACT_INFO Text DESCRIPTION Text RevisionPart COLON_COLON_EQUAL '{' objectIdentifier '}'SubjectCategoriesPart : SUBJECT_CATEGORIES '{' SubjectCategories '}'\n        | emptySubjectCategories : CategoryIDsCategoryIDs : CategoryIDs ',' CategoryID\n        | CategoryIDCategoryID : LOWERCASE_IDENTIFIER '(' NUMBER ')'\n        | LOWERCASE_IDENTIFIERObjectSyntax : SimpleSyntax\n        | conceptualTable\n        | row\n        | entryType\n        | ApplicationSyntax\n        | typeTag SimpleSyntaxtypeTag : '[' APPLICATION NUMBER ']' IMPLICIT\n        | '[' UNIVERSAL NUMBER ']' IMPLICITsequenceObjectSyntax : sequenceSimpleSyntax\n        | sequenceApplicationSyntaxvalueofObjectSyntax : valueofSimpleSyntaxSimpleSyntax : INTEGER\n        | INTEGER integerSubType\n        | INTEGER enumSpec\n        | INTEGER32\n        | INTEGER32 integerSubType\n        | UPPERCASE_IDENTIFIER enumSpec\n        | UPPERCASE_IDENTIFIER integerSubType\n        | OCTET STRING\n        | OCTET STRING octetStringSubType\n        | UPPERCASE_IDENTIFIER octetStringSubType\n        | OBJECT IDENTIFIER anySubTypevalueofSimpleSyntax : NUMBER\n        | NEGATIVENUMBER\n        | NUMBER64\n        | NEGATIVENUMBER64\n        | HEX_STRING\n        | BIN_STRING\n        | LOWERCASE_IDENTIFIER\n        | QUOTED_STRING\n        | '{' objectIdentifier_defval '}'sequenceSimpleSyntax : INTEGER anySubType\n        | INTEGER32 anySubType\n        | OCTET STRING anySubType\n        | OBJECT IDENTIFIER anySubTypeanySubType : integerSubType\n        | octetStringSubType\n        | enumSpec\n        | emptyintegerSubType : '(' ranges ')'octetStringSubType : '(' SIZE '(' ranges ')' ')'ranges : ranges '|' range\n        | rangerange : value DOT_DOT value\n        | valuevalue : NEGATIVENUMBER\n        | NUMBER\n        | NEGATIVENUMBER64\n        | NUMBER64\n        | HEX_STRING\n        | BIN_STRINGenumSpec : '{' enumItems '}'enumItems : enumItems ',' enumItem\n        | enumItemenumItem : LOWERCASE_IDENTIFIER '(' enumNumber ')'enumNumber : NUMBER\n        | NEGATIVENUMBERStatus : LOWERCASE_IDENTIFIERDisplayPart : DISPLAY_HINT Text\n        | emptyUnitsPart : UNITS Text\n        | emptyAccess : LOWERCASE_IDENTIFIERIndexPart : AUGMENTS '{' Entry '}'\n        | emptyMibIndex : INDEX '{' IndexTypes '}'\n        | emptyIndexTypes : IndexTypes ',' IndexType\n        | IndexTypeIndexType : IMPLIED Index\n        | IndexEntry : ObjectNameDefValPart : DEFVAL '{' Value '}'\n        | emptyValue : valueofObjectSyntax\n        | '{' BitsValue '}'BitsValue : BitNames\n        | emptyBitNames : BitNames ',' LOWERCASE_IDENTIFIER\n        | LOWERCASE_IDENTIFIERObjectName : objectIdentifierNotificationName : objectIdentifierReferPart : REFERENCE Text\n        | emptyRevisionPart : Revisions\n        | emptyRevisions : Revisions Revision\n        | RevisionRevision : REVISION ExtUTCTime DESCRIPTION TextNotificationObjectsPart : OBJECTS '{' Objects '}'\n        | emptyObjectGroupObjectsPart : OBJECTS '{' Objects '}'Objects : Objects ',' Object\n        | ObjectObject : ObjectNameNotificationsPart : NOTIFICATIONS '{' Notifications '}'Notifications : Notifications ',' Notification\n        | NotificationNotification : NotificationNameText : QUOTED_STRINGExtUTCTime : QUOTED_STRINGobjectIdentifier : subidentifierssubidentifiers : subidentifiers subidentifier\n        | subidentifiersubidentifier : fuzzy_lowercase_identifier\n        | NUMBER\n        | LOWERCASE_IDENTIFIER '(' NUMBER ')'objectIdentifier_defval : subidentifiers_defvalsubidentifiers_defval : subidentifiers_defval subidentifier_defval\n        | subidentifier_defvalsubidentifier_defval : LOWERCASE_IDENTIFIER '(' NUMBER ')'\n        | NUMBERobjectGroupClause : LOWERCASE_IDENTIFIER OBJECT_GROUP ObjectGroupObjectsPart STATUS Status DESCRIPTION Text ReferPart COLON_COLON_EQUAL '{' objectIdentifier '}'notificationGroupClause : LOWERCASE_IDENTIFIER NOTIFICATION_GROUP NotificationsPart STATUS Status DESCRIPTION Text ReferPart COLON_COLON_EQUAL '{' objectIdentifier '}'moduleComplianceClause : LOWERCASE_IDENTIFIER MODULE_COMPLIANCE STATUS Status DESCRIPTION Text ReferPart ComplianceModulePart COLON_COLON_EQUAL '{' objectIdentifier '}'ComplianceModulePart : ComplianceModulesComplianceModules : ComplianceModules ComplianceModule\n        | ComplianceModuleComplianceModule : MODULE ComplianceModuleName MandatoryPart CompliancePartComplianceModuleName : UPPERCASE_IDENTIFIER\n        | emptyMandatoryPart : MANDATORY_GROUPS '{' MandatoryGroups '}'\n        | emptyMandatoryGroups : MandatoryGroups ',' MandatoryGroup\n        | MandatoryGroupMandatoryGroup : objectIdentifierCompliancePart : Compliances\n        | emptyCompliances : Compliances Compliance\n        | ComplianceCompliance : ComplianceGroup\n        | ComplianceObjectComplianceGroup : GROUP objectIdentifier DESCRIPTION TextComplianceObject : OBJECT ObjectName SyntaxPart WriteSyntaxPart AccessPart DESCRIPTION TextSyntaxPart : SYNTAX Syntax\n        | emptyWriteSyntaxPart : WRITE_SYNTAX WriteSyntax\n        | emptyWriteSyntax : SyntaxAccessPart : MIN_ACCESS Access\n        | emptyagentCapabilitiesClause : LOWERCASE_IDENTIFIER AGENT_CAPABILITIES PRODUCT_RELEASE Text STATUS Status DESCRIPTION Text ReferPart ModulePart_Capabilities COLON_COLON_EQUAL '{' objectIdentifier '}'ModulePart_Capabilities : Modules_Capabilities\n        | emptyModules_Capabilities : Modules_Capabilities Module_Capabilities\n        | Module_CapabilitiesModule_Capabilities : SUPPORTS ModuleName_Capabilities INCLUDES '{' CapabilitiesGroups '}' VariationPartCapabilitiesGroups : CapabilitiesGroups ',' CapabilitiesGroup\n        | CapabilitiesGroupCapabilitiesGroup : objectIdentifierModuleName_Capabilities : UPPERCASE_IDENTIFIER objectIdentifier\n        | UPPERCASE_IDENTIFIERVariationPart : Variations\n        | emptyVariations : Variations Variation\n        | VariationVariation : VARIATION ObjectName SyntaxPart WriteSyntaxPart VariationAccessPart CreationPart DefValPart DESCRIPTION TextVariationAccessPart : ACCESS VariationAccess\n        | emptyVariationAccess : LOWERCASE_IDENTIFIERCreationPart : CREATION_REQUIRES '{' Cells '}'\n        | emptyCells : Cells ',' Cell\n        | CellCell : ObjectNameempty :importedKeyword : importedSMIKeyword\n        | BITS\n        | INTEGER32\n        | IPADDRESS\n        | NETWORKADDRESS\n        | MANDATORY_GROUPS\n        | MODULE_COMPLIANCE\n        | MODULE_IDENTITY\n        | OBJECT_GROUP\n        | OBJECT_IDENTITY\n        | OBJECT_TYPE\n        | OPAQUE\n        | TEXTUAL_CONVENTION\n        | TIMETICKS\n        | UNSIGNED32typeSMIandSPPI : IPADDRESS\n        | NETWORKADDRESS\n        | TIMETICKS\n        | OPAQUE\n        | INTEGER32\n        | UNSIGNED32ApplicationSyntax : IPADDRESS anySubType\n        | NETWORKADDRESS anySubType\n        | COUNTER32\n        | COUNTER32 integerSubType\n        | GAUGE32\n        | GAUGE32 integerSubType\n        | UNSIGNED32\n        | UNSIGNED32 integerSubType\n        | TIMETICKS anySubType\n        | OPAQUE\n        | OPAQUE octetStringSubType\n        | COUNTER64\n        | COUNTER64 integerSubTypesequenceApplicationSyntax : IPADDRESS anySubType\n        | NETWORKADDRESS anySubType\n        | COUNTER32 anySubType\n        | GAUGE32 anySubType\n        | UNSIGNED32 anySubType\n        | TIMETICKS anySubType\n        | OPAQUE\n        | COUNTER64 anySubTypeIndex : ObjectName\n        | typeSMIv1typeSMIv1 : INTEGER\n        | OCTET STRING\n        | IPADDRESS\n        | NETWORKADDRESS"
+    
+_lr_action_items = {'$end':([0,1,2,3,4,7,107,],[-277,0,-1,-2,-4,-3,-5,]),'UPPERCASE_IDENTIFIER':([0,2,4,6,7,9,13,14,15,16,17,18,21,23,25,26,27,28,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,77,79,107,108,109,121,122,123,124,125,126,128,129,131,132,133,134,135,136,137,138,139,140,144,145,146,147,148,149,150,151,154,156,169,170,176,178,179,182,183,184,185,187,188,189,191,192,193,194,195,196,197,198,199,200,201,203,212,217,219,240,241,242,243,246,249,278,281,284,288,314,324,334,359,360,361,393,402,407,408,410,424,428,430,434,435,440,441,442,455,456,457,463,467,468,474,481,482,483,489,497,500,502,507,516,520,524,528,542,553,565,572,574,598,605,],[6,6,-4,-30,-3,18,18,-215,-216,-217,-59,-60,-214,-277,-277,-11,-12,-218,62,-8,-9,83,62,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,83,-16,-5,-33,140,-10,-15,6,83,-62,-70,-72,-79,-58,-112,-113,-114,-115,-116,177,-123,-126,-74,-277,-277,-301,-303,-305,-277,-308,-310,18,140,-47,-17,-117,-124,-125,-127,-128,-129,-132,-130,-277,243,-299,-147,-148,-149,-150,-300,-302,-304,-306,-307,-309,-311,18,18,18,-131,-133,-73,-74,292,18,-80,-151,-163,-75,18,18,18,-118,-119,-61,18,419,-152,-91,18,140,18,18,18,18,463,-71,-87,18,18,18,18,18,-103,-226,-224,-225,18,18,140,18,18,18,18,140,-253,18,18,18,-104,18,-88,18,18,]),'{':([5,6,130,138,140,143,144,145,149,158,161,165,167,177,188,206,251,292,296,297,300,301,302,303,304,305,307,350,351,394,414,416,421,422,432,444,460,465,484,487,492,503,504,593,],[9,-30,175,181,181,190,181,181,181,212,214,217,219,181,181,249,314,181,181,181,181,181,181,181,181,181,181,181,181,410,428,430,434,435,457,467,483,489,502,504,516,528,529,598,]),'DEFINITIONS':([5,6,8,10,20,],[-277,-30,11,-7,-6,]),'LOWERCASE_IDENTIFIER':([6,9,13,14,15,16,17,18,21,23,25,26,27,28,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,77,79,108,121,122,124,125,126,128,129,131,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,154,155,163,169,170,175,176,178,179,181,182,183,184,185,187,188,190,191,192,193,194,195,196,197,198,199,200,201,203,211,212,214,216,217,218,219,222,240,241,242,243,249,276,278,279,281,284,285,288,289,314,319,320,324,327,334,361,370,393,407,408,410,428,430,434,435,441,442,455,456,457,463,467,468,474,481,482,483,489,500,502,504,507,516,524,528,529,542,548,553,559,561,562,565,572,574,577,578,587,590,598,605,],[-30,17,17,-215,-216,-217,-59,-60,-214,-277,-277,-11,-12,-218,51,-8,-9,82,51,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,82,-16,-33,-10,-15,82,-62,-70,-72,-79,-58,-112,-113,-114,-115,-116,-123,-126,-74,-277,-277,-301,-303,-305,-277,-308,-310,17,208,208,-47,-17,226,-117,-124,-125,238,-127,-128,-129,-132,-130,-277,246,-299,-147,-148,-149,-150,-300,-302,-304,-306,-307,-309,-311,208,17,267,208,17,208,17,208,-131,-133,-73,-74,17,208,-80,226,-151,-163,238,-75,246,17,372,372,17,267,17,-61,208,17,-152,-91,17,17,17,17,17,-71,-87,17,17,17,17,17,-103,-226,-224,-225,17,17,17,17,539,17,17,-253,17,560,17,372,17,579,-221,-223,-104,17,-88,584,-220,-222,596,17,17,]),'BITS':([6,32,77,79,109,122,124,156,170,246,424,497,520,],[-30,86,86,-16,130,-15,86,130,-17,291,130,130,130,]),'INTEGER32':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,77,79,108,109,121,122,124,125,126,128,129,131,132,133,134,135,136,137,138,139,140,144,145,146,147,148,149,150,151,156,169,170,176,178,179,182,183,184,185,187,188,191,192,193,194,195,196,197,198,199,200,201,203,240,241,242,243,246,278,281,284,288,359,360,361,407,408,424,441,442,468,474,481,482,497,520,524,565,574,],[-30,-277,-277,-11,-12,71,-8,-9,87,71,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,87,-16,-33,139,-10,-15,87,-62,-70,-72,-79,-58,-112,-113,-114,-115,-116,139,-123,-126,-74,-277,-277,-301,-303,-305,-277,-308,-310,139,-47,-17,-117,-124,-125,-127,-128,-129,-132,-130,-277,-299,-147,-148,-149,-150,-300,-302,-304,-306,-307,-309,-311,-131,-133,-73,-74,297,-80,-151,-163,-75,-118,-119,-61,-152,-91,139,-71,-87,-103,-226,-224,-225,139,139,-253,-104,-88,]),'IPADDRESS':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,77,79,108,109,121,122,124,125,126,128,129,131,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,156,169,170,176,178,179,182,183,184,185,187,188,191,192,193,194,195,196,197,198,199,200,201,203,240,241,242,243,246,278,281,284,288,361,407,408,424,441,442,468,474,481,482,489,497,507,520,524,542,565,574,],[-30,-277,-277,-11,-12,67,-8,-9,88,67,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,88,-16,-33,144,-10,-15,88,-62,-70,-72,-79,-58,-112,-113,-114,-115,-116,-123,-126,-74,-277,-277,-301,-303,-305,-277,-308,-310,144,-47,-17,-117,-124,-125,-127,-128,-129,-132,-130,-277,-299,-147,-148,-149,-150,-300,-302,-304,-306,-307,-309,-311,-131,-133,-73,-74,300,-80,-151,-163,-75,-61,-152,-91,144,-71,-87,-103,-226,-224,-225,513,144,513,144,-253,513,-104,-88,]),'NETWORKADDRESS':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,77,79,108,109,121,122,124,125,126,128,129,131,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,156,169,170,176,178,179,182,183,184,185,187,188,191,192,193,194,195,196,197,198,199,200,201,203,240,241,242,243,246,278,281,284,288,361,407,408,424,441,442,468,474,481,482,489,497,507,520,524,542,565,574,],[-30,-277,-277,-11,-12,68,-8,-9,89,68,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,89,-16,-33,145,-10,-15,89,-62,-70,-72,-79,-58,-112,-113,-114,-115,-116,-123,-126,-74,-277,-277,-301,-303,-305,-277,-308,-310,145,-47,-17,-117,-124,-125,-127,-128,-129,-132,-130,-277,-299,-147,-148,-149,-150,-300,-302,-304,-306,-307,-309,-311,-131,-133,-73,-74,301,-80,-151,-163,-75,-61,-152,-91,145,-71,-87,-103,-226,-224,-225,514,145,514,145,-253,514,-104,-88,]),'MANDATORY_GROUPS':([6,32,77,79,122,124,170,402,418,419,420,],[-30,90,90,-16,-15,90,-17,-277,432,-231,-232,]),'MODULE_COMPLIANCE':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,51,77,79,108,121,122,124,125,126,128,129,131,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,169,170,176,178,179,182,183,184,185,187,188,191,192,193,194,195,196,197,198,199,200,201,203,240,241,242,243,278,281,284,288,361,407,408,441,442,468,474,481,482,524,565,574,],[-30,-277,-277,-11,-12,57,-8,-9,91,57,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,116,91,-16,-33,-10,-15,91,-62,-70,-72,-79,-58,-112,-113,-114,-115,-116,-123,-126,-74,-277,-277,-301,-303,-305,-277,-308,-310,-47,-17,-117,-124,-125,-127,-128,-129,-132,-130,-277,-299,-147,-148,-149,-150,-300,-302,-304,-306,-307,-309,-311,-131,-133,-73,-74,-80,-151,-163,-75,-61,-152,-91,-71,-87,-103,-226,-224,-225,-253,-104,-88,]),'MODULE_IDENTITY':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,51,77,79,108,121,122,124,125,126,128,129,131,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,169,170,176,178,179,182,183,184,185,187,188,191,192,193,194,195,196,197,198,199,200,201,203,240,241,242,243,278,281,284,288,361,407,408,441,442,468,474,481,482,524,565,574,],[-30,-277,-277,-11,-12,56,-8,-9,92,56,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,115,92,-16,-33,-10,-15,92,-62,-70,-72,-79,-58,-112,-113,-114,-115,-116,-123,-126,-74,-277,-277,-301,-303,-305,-277,-308,-310,-47,-17,-117,-124,-125,-127,-128,-129,-132,-130,-277,-299,-147,-148,-149,-150,-300,-302,-304,-306,-307,-309,-311,-131,-133,-73,-74,-80,-151,-163,-75,-61,-152,-91,-71,-87,-103,-226,-224,-225,-253,-104,-88,]),'OBJECT_GROUP':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,51,77,79,108,121,122,124,125,126,128,129,131,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,169,170,176,178,179,182,183,184,185,187,188,191,192,193,194,195,196,197,198,199,200,201,203,240,241,242,243,278,281,284,288,361,407,408,441,442,468,474,481,482,524,565,574,],[-30,-277,-277,-11,-12,58,-8,-9,93,58,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,117,93,-16,-33,-10,-15,93,-62,-70,-72,-79,-58,-112,-113,-114,-115,-116,-123,-126,-74,-277,-277,-301,-303,-305,-277,-308,-310,-47,-17,-117,-124,-125,-127,-128,-129,-132,-130,-277,-299,-147,-148,-149,-150,-300,-302,-304,-306,-307,-309,-311,-131,-133,-73,-74,-80,-151,-163,-75,-61,-152,-91,-71,-87,-103,-226,-224,-225,-253,-104,-88,]),'OBJECT_IDENTITY':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,51,77,79,108,121,122,124,125,126,128,129,131,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,169,170,176,178,179,182,183,184,185,187,188,191,192,193,194,195,196,197,198,199,200,201,203,240,241,242,243,278,281,284,288,361,407,408,441,442,468,474,481,482,524,565,574,],[-30,-277,-277,-11,-12,52,-8,-9,94,52,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,112,94,-16,-33,-10,-15,94,-62,-70,-72,-79,-58,-112,-113,-114,-115,-116,-123,-126,-74,-277,-277,-301,-303,-305,-277,-308,-310,-47,-17,-117,-124,-125,-127,-128,-129,-132,-130,-277,-299,-147,-148,-149,-150,-300,-302,-304,-306,-307,-309,-311,-131,-133,-73,-74,-80,-151,-163,-75,-61,-152,-91,-71,-87,-103,-226,-224,-225,-253,-104,-88,]),'OBJECT_TYPE':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,51,77,79,108,121,122,124,125,126,128,129,131,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,169,170,176,178,179,182,183,184,185,187,188,191,192,193,194,195,196,197,198,199,200,201,203,240,241,242,243,278,281,284,288,361,407,408,441,442,468,474,481,482,524,565,574,],[-30,-277,-277,-11,-12,53,-8,-9,95,53,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,113,95,-16,-33,-10,-15,95,-62,-70,-72,-79,-58,-112,-113,-114,-115,-116,-123,-126,-74,-277,-277,-301,-303,-305,-277,-308,-310,-47,-17,-117,-124,-125,-127,-128,-129,-132,-130,-277,-299,-147,-148,-149,-150,-300,-302,-304,-306,-307,-309,-311,-131,-133,-73,-74,-80,-151,-163,-75,-61,-152,-91,-71,-87,-103,-226,-224,-225,-253,-104,-88,]),'OPAQUE':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,77,79,108,109,121,122,124,125,126,128,129,131,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,156,169,170,176,178,179,182,183,184,185,187,188,191,192,193,194,195,196,197,198,199,200,201,203,240,241,242,243,246,278,281,284,288,361,407,408,424,441,442,468,474,481,482,497,520,524,565,574,],[-30,-277,-277,-11,-12,70,-8,-9,96,70,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,96,-16,-33,150,-10,-15,96,-62,-70,-72,-79,-58,-112,-113,-114,-115,-116,-123,-126,-74,-277,-277,-301,-303,-305,-277,-308,-310,150,-47,-17,-117,-124,-125,-127,-128,-129,-132,-130,-277,-299,-147,-148,-149,-150,-300,-302,-304,-306,-307,-309,-311,-131,-133,-73,-74,306,-80,-151,-163,-75,-61,-152,-91,150,-71,-87,-103,-226,-224,-225,150,150,-253,-104,-88,]),'TEXTUAL_CONVENTION':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,77,79,108,109,121,122,124,125,126,128,129,131,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,169,170,176,178,179,182,183,184,185,187,188,191,192,193,194,195,196,197,198,199,200,201,203,240,241,242,243,278,281,284,288,361,407,408,441,442,468,474,481,482,524,565,574,],[-30,-277,-277,-11,-12,64,-8,-9,97,64,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,97,-16,-33,127,-10,-15,97,-62,-70,-72,-79,-58,-112,-113,-114,-115,-116,-123,-126,-74,-277,-277,-301,-303,-305,-277,-308,-310,-47,-17,-117,-124,-125,-127,-128,-129,-132,-130,-277,-299,-147,-148,-149,-150,-300,-302,-304,-306,-307,-309,-311,-131,-133,-73,-74,-80,-151,-163,-75,-61,-152,-91,-71,-87,-103,-226,-224,-225,-253,-104,-88,]),'TIMETICKS':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,77,79,108,109,121,122,124,125,126,128,129,131,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,156,169,170,176,178,179,182,183,184,185,187,188,191,192,193,194,195,196,197,198,199,200,201,203,240,241,242,243,246,278,281,284,288,361,407,408,424,441,442,468,474,481,482,497,520,524,565,574,],[-30,-277,-277,-11,-12,69,-8,-9,98,69,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,98,-16,-33,149,-10,-15,98,-62,-70,-72,-79,-58,-112,-113,-114,-115,-116,-123,-126,-74,-277,-277,-301,-303,-305,-277,-308,-310,149,-47,-17,-117,-124,-125,-127,-128,-129,-132,-130,-277,-299,-147,-148,-149,-150,-300,-302,-304,-306,-307,-309,-311,-131,-133,-73,-74,305,-80,-151,-163,-75,-61,-152,-91,149,-71,-87,-103,-226,-224,-225,149,149,-253,-104,-88,]),'UNSIGNED32':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,77,79,108,109,121,122,124,125,126,128,129,131,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,156,169,170,176,178,179,182,183,184,185,187,188,191,192,193,194,195,196,197,198,199,200,201,203,240,241,242,243,246,278,281,284,288,361,407,408,424,441,442,468,474,481,482,497,520,524,565,574,],[-30,-277,-277,-11,-12,72,-8,-9,99,72,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,99,-16,-33,148,-10,-15,99,-62,-70,-72,-79,-58,-112,-113,-114,-115,-116,-123,-126,-74,-277,-277,-301,-303,-305,-277,-308,-310,148,-47,-17,-117,-124,-125,-127,-128,-129,-132,-130,-277,-299,-147,-148,-149,-150,-300,-302,-304,-306,-307,-309,-311,-131,-133,-73,-74,304,-80,-151,-163,-75,-61,-152,-91,148,-71,-87,-103,-226,-224,-225,148,148,-253,-104,-88,]),'AGENT_CAPABILITIES':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,51,77,79,108,121,122,124,125,126,128,129,131,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,169,170,176,178,179,182,183,184,185,187,188,191,192,193,194,195,196,197,198,199,200,201,203,240,241,242,243,278,281,284,288,361,407,408,441,442,468,474,481,482,524,565,574,],[-30,-277,-277,-11,-12,60,-8,-9,100,60,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,119,100,-16,-33,-10,-15,100,-62,-70,-72,-79,-58,-112,-113,-114,-115,-116,-123,-126,-74,-277,-277,-301,-303,-305,-277,-308,-310,-47,-17,-117,-124,-125,-127,-128,-129,-132,-130,-277,-299,-147,-148,-149,-150,-300,-302,-304,-306,-307,-309,-311,-131,-133,-73,-74,-80,-151,-163,-75,-61,-152,-91,-71,-87,-103,-226,-224,-225,-253,-104,-88,]),'COUNTER32':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,77,79,108,109,121,122,124,125,126,128,129,131,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,156,169,170,176,178,179,182,183,184,185,187,188,191,192,193,194,195,196,197,198,199,200,201,203,240,241,242,243,246,278,281,284,288,361,407,408,424,441,442,468,474,481,482,497,520,524,565,574,],[-30,-277,-277,-11,-12,73,-8,-9,101,73,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,101,-16,-33,146,-10,-15,101,-62,-70,-72,-79,-58,-112,-113,-114,-115,-116,-123,-126,-74,-277,-277,-301,-303,-305,-277,-308,-310,146,-47,-17,-117,-124,-125,-127,-128,-129,-132,-130,-277,-299,-147,-148,-149,-150,-300,-302,-304,-306,-307,-309,-311,-131,-133,-73,-74,302,-80,-151,-163,-75,-61,-152,-91,146,-71,-87,-103,-226,-224,-225,146,146,-253,-104,-88,]),'COUNTER64':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,77,79,108,109,121,122,124,125,126,128,129,131,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,156,169,170,176,178,179,182,183,184,185,187,188,191,192,193,194,195,196,197,198,199,200,201,203,240,241,242,243,246,278,281,284,288,361,407,408,424,441,442,468,474,481,482,497,520,524,565,574,],[-30,-277,-277,-11,-12,75,-8,-9,102,75,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,102,-16,-33,151,-10,-15,102,-62,-70,-72,-79,-58,-112,-113,-114,-115,-116,-123,-126,-74,-277,-277,-301,-303,-305,-277,-308,-310,151,-47,-17,-117,-124,-125,-127,-128,-129,-132,-130,-277,-299,-147,-148,-149,-150,-300,-302,-304,-306,-307,-309,-311,-131,-133,-73,-74,307,-80,-151,-163,-75,-61,-152,-91,151,-71,-87,-103,-226,-224,-225,151,151,-253,-104,-88,]),'GAUGE32':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,77,79,108,109,121,122,124,125,126,128,129,131,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,156,169,170,176,178,179,182,183,184,185,187,188,191,192,193,194,195,196,197,198,199,200,201,203,240,241,242,243,246,278,281,284,288,361,407,408,424,441,442,468,474,481,482,497,520,524,565,574,],[-30,-277,-277,-11,-12,74,-8,-9,103,74,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,103,-16,-33,147,-10,-15,103,-62,-70,-72,-79,-58,-112,-113,-114,-115,-116,-123,-126,-74,-277,-277,-301,-303,-305,-277,-308,-310,147,-47,-17,-117,-124,-125,-127,-128,-129,-132,-130,-277,-299,-147,-148,-149,-150,-300,-302,-304,-306,-307,-309,-311,-131,-133,-73,-74,303,-80,-151,-163,-75,-61,-152,-91,147,-71,-87,-103,-226,-224,-225,147,147,-253,-104,-88,]),'NOTIFICATION_GROUP':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,51,77,79,108,121,122,124,125,126,128,129,131,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,169,170,176,178,179,182,183,184,185,187,188,191,192,193,194,195,196,197,198,199,200,201,203,240,241,242,243,278,281,284,288,361,407,408,441,442,468,474,481,482,524,565,574,],[-30,-277,-277,-11,-12,59,-8,-9,104,59,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,118,104,-16,-33,-10,-15,104,-62,-70,-72,-79,-58,-112,-113,-114,-115,-116,-123,-126,-74,-277,-277,-301,-303,-305,-277,-308,-310,-47,-17,-117,-124,-125,-127,-128,-129,-132,-130,-277,-299,-147,-148,-149,-150,-300,-302,-304,-306,-307,-309,-311,-131,-133,-73,-74,-80,-151,-163,-75,-61,-152,-91,-71,-87,-103,-226,-224,-225,-253,-104,-88,]),'NOTIFICATION_TYPE':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,51,77,79,108,121,122,124,125,126,128,129,131,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,169,170,176,178,179,182,183,184,185,187,188,191,192,193,194,195,196,197,198,199,200,201,203,240,241,242,243,278,281,284,288,361,407,408,441,442,468,474,481,482,524,565,574,],[-30,-277,-277,-11,-12,55,-8,-9,105,55,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,114,105,-16,-33,-10,-15,105,-62,-70,-72,-79,-58,-112,-113,-114,-115,-116,-123,-126,-74,-277,-277,-301,-303,-305,-277,-308,-310,-47,-17,-117,-124,-125,-127,-128,-129,-132,-130,-277,-299,-147,-148,-149,-150,-300,-302,-304,-306,-307,-309,-311,-131,-133,-73,-74,-80,-151,-163,-75,-61,-152,-91,-71,-87,-103,-226,-224,-225,-253,-104,-88,]),'TRAP_TYPE':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,50,51,62,77,79,108,121,122,124,125,126,128,129,131,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,169,170,176,178,179,182,183,184,185,187,188,191,192,193,194,195,196,197,198,199,200,201,203,240,241,242,243,278,281,284,288,361,407,408,441,442,468,474,481,482,524,565,574,],[-30,-277,-277,-11,-12,54,-8,-9,106,54,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,111,-59,-60,106,-16,-33,-10,-15,106,-62,-70,-72,-79,-58,-112,-113,-114,-115,-116,-123,-126,-74,-277,-277,-301,-303,-305,-277,-308,-310,-47,-17,-117,-124,-125,-127,-128,-129,-132,-130,-277,-299,-147,-148,-149,-150,-300,-302,-304,-306,-307,-309,-311,-131,-133,-73,-74,-80,-151,-163,-75,-61,-152,-91,-71,-87,-103,-226,-224,-225,-253,-104,-88,]),';':([6,32,76,77,78,79,122,170,],[-30,-277,121,-13,-14,-16,-15,-17,]),'NUMBER':([9,13,14,15,16,17,18,21,22,28,154,180,186,204,205,212,217,219,249,280,282,283,286,287,314,324,328,334,390,393,410,428,430,434,435,455,456,457,463,467,483,489,500,502,504,507,516,528,529,542,553,559,561,562,572,578,580,587,598,605,],[16,16,-215,-216,-217,-59,-60,-214,24,-218,16,231,231,247,248,16,16,16,16,338,231,231,343,231,16,16,378,16,408,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,533,16,16,16,562,16,16,562,-221,-223,16,-220,585,-222,16,16,]),'COLON_COLON_EQUAL':([11,13,14,15,16,17,18,21,28,49,62,63,65,66,67,68,69,70,71,72,73,74,75,153,207,208,221,250,252,311,313,315,362,364,365,369,374,380,381,391,392,395,396,399,400,401,402,403,404,405,411,413,417,418,419,420,423,426,427,431,433,436,437,438,439,443,445,447,449,450,451,452,453,454,461,464,466,469,470,471,472,475,486,488,493,499,515,518,541,546,552,563,568,569,570,571,581,582,603,],[19,-213,-215,-216,-217,-59,-60,-214,-218,109,-63,-64,-65,-66,-293,-294,-295,-296,-297,-298,-67,-68,-69,206,-277,-169,-211,-277,-93,-277,-98,-277,390,-195,-97,394,-277,-277,-277,-194,-92,-277,414,416,-227,-229,-277,421,422,-277,-277,-90,-228,-277,-231,-232,-277,-277,-89,-277,-234,460,-254,-255,-257,-277,-176,-277,-230,-238,-239,-241,-242,-243,-256,-277,-178,492,-196,-197,-199,-240,503,-185,-198,-233,-175,-244,-177,-200,-277,-184,-258,-264,-265,-267,-245,-266,-268,]),'}':([12,13,14,15,16,17,18,21,28,192,193,194,195,224,225,236,237,244,245,258,259,260,261,264,265,266,267,270,272,273,274,275,281,284,290,291,292,293,294,295,296,297,300,301,302,303,304,305,306,307,310,337,341,346,347,348,349,350,351,352,353,354,355,356,357,358,366,367,368,375,377,382,385,386,388,389,398,407,409,425,446,448,458,459,478,479,480,490,491,501,505,506,508,509,510,511,513,514,523,525,526,527,529,530,531,532,533,534,535,536,537,538,539,540,543,544,545,554,555,556,557,558,559,560,561,562,564,573,575,576,578,584,587,600,601,602,606,],[20,-213,-215,-216,-217,-59,-60,-214,-218,-147,-148,-149,-150,278,-85,284,-165,288,-77,323,-205,-206,-192,326,-107,-109,-111,331,333,-209,-210,-193,-151,-163,-78,-81,-277,-83,-120,-121,-277,-277,-277,-277,-277,-277,-277,-277,-318,-277,361,-84,-164,-76,-82,-143,-144,-277,-277,-312,-313,-314,-315,-316,-317,-319,392,-95,-96,-204,-108,-208,-86,-166,-145,-146,-110,-152,-94,442,468,474,481,482,499,-236,-237,515,-183,524,541,-180,-182,-320,-321,-322,-324,-325,-235,552,-260,-261,-277,563,-186,-122,-134,-135,-136,-137,-138,-139,-140,-141,-181,-323,565,574,575,576,-188,-189,-219,-191,-221,-223,-179,-259,-187,-142,-220,-190,-222,604,-275,-276,-274,]),'VARIABLES':([13,14,15,16,17,18,21,28,207,],[-213,-215,-216,-217,-59,-60,-214,-218,251,]),'DESCRIPTION':([13,14,15,16,17,18,21,28,129,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,176,178,179,182,183,184,185,187,188,191,192,193,194,195,196,197,198,199,200,201,203,207,208,209,215,221,240,241,242,243,250,252,257,261,263,269,271,277,278,281,284,288,335,372,392,395,407,415,476,477,488,494,496,498,519,521,522,547,549,550,551,563,567,583,586,588,589,591,592,594,595,596,597,604,],[-213,-215,-216,-217,-59,-60,-214,-218,-79,-112,-113,-114,-115,-116,-123,-126,-74,-277,-277,-301,-303,-305,-277,-308,-310,-117,-124,-125,-127,-128,-129,-132,-130,-277,-299,-147,-148,-149,-150,-300,-302,-304,-306,-307,-309,-311,-277,-169,253,268,-211,-131,-133,-73,-74,312,-93,322,-192,-212,330,332,336,-80,-151,-163,-75,383,-174,-92,412,-152,429,495,-277,-185,517,-277,-247,-277,-249,-246,566,-252,-248,-250,-184,-251,-277,-277,-277,-277,-270,-277,-273,-269,-271,599,-272,]),'REFERENCE':([13,14,15,16,17,18,21,28,207,208,221,250,252,311,313,315,329,365,374,380,381,384,392,395,405,411,413,427,],[-213,-215,-216,-217,-59,-60,-214,-218,-277,-169,-211,-277,-93,363,-98,363,363,-97,363,363,363,363,-92,-277,363,363,-90,-89,]),',':([13,14,15,16,17,18,21,28,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,171,192,193,194,195,224,225,236,237,244,245,258,259,260,261,265,266,267,270,272,273,274,275,281,284,290,291,292,293,294,295,296,297,300,301,302,303,304,305,306,307,337,341,346,347,348,349,350,351,352,353,354,355,356,357,358,366,367,368,375,377,382,385,386,388,389,398,407,409,478,479,480,505,506,508,509,510,511,513,514,523,525,526,527,543,544,557,560,564,573,584,600,601,602,606,],[-213,-215,-216,-217,-59,-60,-214,-218,124,-19,-20,-21,-22,-278,-279,-280,-281,-282,-283,-284,-285,-286,-287,-288,-289,-290,-291,-292,-23,-24,-25,-26,-27,-28,-29,-18,-147,-148,-149,-150,279,-85,285,-165,289,-77,324,-205,-206,-192,327,-109,-111,324,334,-209,-210,-193,-151,-163,-78,-81,-277,-83,-120,-121,-277,-277,-277,-277,-277,-277,-277,-277,-318,-277,-84,-164,-76,-82,-143,-144,-277,-277,-312,-313,-314,-315,-316,-317,-319,393,-95,-96,-204,-108,-208,-86,-166,-145,-146,-110,-152,-94,500,-236,-237,542,-180,-182,-320,-321,-322,-324,-325,-235,553,-260,-261,-181,-323,577,-191,-179,-259,-190,605,-275,-276,-274,]),'SYNTAX':([13,14,15,16,17,18,21,28,113,221,261,364,384,391,406,477,583,],[-213,-215,-216,-217,-59,-60,-214,-218,156,-211,-192,-195,-277,-194,424,497,497,]),'WRITE_SYNTAX':([13,14,15,16,17,18,21,28,129,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,176,178,179,182,183,184,185,187,188,191,192,193,194,195,196,197,198,199,200,201,203,240,241,242,243,261,278,281,284,288,407,477,496,498,522,583,586,],[-213,-215,-216,-217,-59,-60,-214,-218,-79,-112,-113,-114,-115,-116,-123,-126,-74,-277,-277,-301,-303,-305,-277,-308,-310,-117,-124,-125,-127,-128,-129,-132,-130,-277,-299,-147,-148,-149,-150,-300,-302,-304,-306,-307,-309,-311,-131,-133,-73,-74,-192,-80,-151,-163,-75,-152,-277,520,-247,-246,-277,520,]),'MIN_ACCESS':([13,14,15,16,17,18,21,28,129,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,176,178,179,182,183,184,185,187,188,191,192,193,194,195,196,197,198,199,200,201,203,240,241,242,243,261,278,281,284,288,407,477,496,498,519,521,522,550,551,],[-213,-215,-216,-217,-59,-60,-214,-218,-79,-112,-113,-114,-115,-116,-123,-126,-74,-277,-277,-301,-303,-305,-277,-308,-310,-117,-124,-125,-127,-128,-129,-132,-130,-277,-299,-147,-148,-149,-150,-300,-302,-304,-306,-307,-309,-311,-131,-133,-73,-74,-192,-80,-151,-163,-75,-152,-277,-277,-247,548,-249,-246,-248,-250,]),'INCLUDES':([13,14,15,16,17,18,21,28,462,463,485,],[-213,-215,-216,-217,-59,-60,-214,-218,484,-263,-262,]),'ACCESS':([13,14,15,16,17,18,21,28,129,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,176,178,179,182,183,184,185,187,188,191,192,193,194,195,196,197,198,199,200,201,203,210,221,240,241,242,243,254,256,261,278,281,284,288,321,407,498,521,522,550,551,583,586,588,],[-213,-215,-216,-217,-59,-60,-214,-218,-79,-112,-113,-114,-115,-116,-123,-126,-74,-277,-277,-301,-303,-305,-277,-308,-310,-117,-124,-125,-127,-128,-129,-132,-130,-277,-299,-147,-148,-149,-150,-300,-302,-304,-306,-307,-309,-311,-277,-211,-131,-133,-73,-74,320,-173,-192,-80,-151,-163,-75,-172,-152,-247,-249,-246,-248,-250,-277,-277,590,]),'CREATION_REQUIRES':([13,14,15,16,17,18,21,28,129,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,176,178,179,182,183,184,185,187,188,191,192,193,194,195,196,197,198,199,200,201,203,240,241,242,243,261,278,281,284,288,407,498,521,522,550,551,583,586,588,589,591,595,596,],[-213,-215,-216,-217,-59,-60,-214,-218,-79,-112,-113,-114,-115,-116,-123,-126,-74,-277,-277,-301,-303,-305,-277,-308,-310,-117,-124,-125,-127,-128,-129,-132,-130,-277,-299,-147,-148,-149,-150,-300,-302,-304,-306,-307,-309,-311,-131,-133,-73,-74,-192,-80,-151,-163,-75,-152,-247,-249,-246,-248,-250,-277,-277,-277,593,-270,-269,-271,]),'DEFVAL':([13,14,15,16,17,18,21,28,129,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,176,178,179,182,183,184,185,187,188,191,192,193,194,195,196,197,198,199,200,201,203,208,221,240,241,242,243,261,278,281,284,288,364,391,395,407,411,413,426,427,443,445,464,466,498,515,521,522,541,550,551,583,586,588,589,591,592,594,595,596,604,],[-213,-215,-216,-217,-59,-60,-214,-218,-79,-112,-113,-114,-115,-116,-123,-126,-74,-277,-277,-301,-303,-305,-277,-308,-310,-117,-124,-125,-127,-128,-129,-132,-130,-277,-299,-147,-148,-149,-150,-300,-302,-304,-306,-307,-309,-311,-169,-211,-131,-133,-73,-74,-192,-80,-151,-163,-75,-195,-194,-277,-152,-277,-90,-277,-89,-277,-176,487,-178,-247,-175,-249,-246,-177,-248,-250,-277,-277,-277,-277,-270,487,-273,-269,-271,-272,]),'(':([17,138,139,140,144,145,146,147,148,149,150,151,177,187,188,226,238,239,267,292,296,297,300,301,302,303,304,305,307,350,351,560,579,],[22,180,180,186,186,186,180,180,180,186,202,180,186,202,186,280,286,287,328,186,186,186,186,186,186,186,186,186,186,186,186,580,580,]),'BEGIN':([19,],[23,]),'EXPORTS':([23,],[26,]),'IMPORTS':([23,25,26,27,],[-277,32,-11,-12,]),'END':([23,25,26,27,29,30,31,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,108,120,121,125,126,128,129,131,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,169,176,178,179,182,183,184,185,187,188,191,192,193,194,195,196,197,198,199,200,201,203,240,241,242,243,278,281,284,288,361,407,408,441,442,468,474,481,482,524,565,574,],[-277,-277,-11,-12,-277,-8,-9,107,-31,-32,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-33,169,-10,-62,-70,-72,-79,-58,-112,-113,-114,-115,-116,-123,-126,-74,-277,-277,-301,-303,-305,-277,-308,-310,-47,-117,-124,-125,-127,-128,-129,-132,-130,-277,-299,-147,-148,-149,-150,-300,-302,-304,-306,-307,-309,-311,-131,-133,-73,-74,-80,-151,-163,-75,-61,-152,-91,-71,-87,-103,-226,-224,-225,-253,-104,-88,]),')':([24,227,228,229,230,231,232,233,234,235,338,339,340,342,343,344,345,378,387,585,],[28,281,-154,-156,-157,-158,-159,-160,-161,-162,385,-153,-155,386,-167,-168,387,398,407,587,]),'OBJECT':([50,51,62,109,137,156,221,246,359,360,402,418,419,420,424,431,433,450,452,453,454,475,497,499,518,520,581,],[110,-59,-60,142,142,142,-211,299,-118,-119,-277,-277,-231,-232,142,456,-234,456,-241,-242,-243,-240,142,-233,-244,142,-245,]),'MACRO':([52,53,54,55,56,57,58,59,60,61,64,],[-52,-49,-50,-51,-48,-56,-54,-55,-57,120,-53,]),'FROM':([80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,171,],[123,-19,-20,-21,-22,-278,-279,-280,-281,-282,-283,-284,-285,-286,-287,-288,-289,-290,-291,-292,-23,-24,-25,-26,-27,-28,-29,-18,]),'CHOICE':([109,],[131,]),'INTEGER':([109,137,156,246,359,360,424,489,497,507,520,542,],[138,138,138,296,-118,-119,138,511,138,511,138,511,]),'OCTET':([109,137,156,246,359,360,424,489,497,507,520,542,],[141,141,141,298,-118,-119,141,512,141,512,141,512,]),'SEQUENCE':([109,156,424,497,520,],[143,143,143,143,143,]),'[':([109,156,424,497,520,],[152,152,152,152,152,]),'IDENTIFIER':([110,142,299,],[153,188,351,]),'ENTERPRISE':([111,],[154,]),'STATUS':([112,114,116,127,129,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,157,159,164,166,172,174,176,178,179,182,183,184,185,187,188,191,192,193,194,195,196,197,198,199,200,201,203,210,220,221,223,240,241,242,243,254,256,278,281,284,288,316,317,318,321,323,331,333,371,372,373,407,],[155,-277,163,-277,-79,-112,-113,-114,-115,-116,-123,-126,-74,-277,-277,-301,-303,-305,-277,-308,-310,211,-202,216,218,222,-171,-117,-124,-125,-127,-128,-129,-132,-130,-277,-299,-147,-148,-149,-150,-300,-302,-304,-306,-307,-309,-311,-277,276,-211,-170,-131,-133,-73,-74,-277,-173,-80,-151,-163,-75,370,-99,-100,-172,-201,-203,-207,-101,-174,-102,-152,]),'OBJECTS':([114,117,],[158,165,]),'SUBJECT_CATEGORIES':([115,],[161,]),'LAST_UPDATED':([115,160,162,326,],[-277,213,-106,-105,]),'NOTIFICATIONS':([118,],[167,]),'PRODUCT_RELEASE':([119,],[168,]),'DISPLAY_HINT':([127,],[173,]),'UNITS':([129,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,176,178,179,182,183,184,185,187,188,191,192,193,194,195,196,197,198,199,200,201,203,210,240,241,242,243,278,281,284,288,407,],[-79,-112,-113,-114,-115,-116,-123,-126,-74,-277,-277,-301,-303,-305,-277,-308,-310,-117,-124,-125,-127,-128,-129,-132,-130,-277,-299,-147,-148,-149,-150,-300,-302,-304,-306,-307,-309,-311,255,-131,-133,-73,-74,-80,-151,-163,-75,-152,]),'MAX_ACCESS':([129,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,176,178,179,182,183,184,185,187,188,191,192,193,194,195,196,197,198,199,200,201,203,210,221,240,241,242,243,254,256,278,281,284,288,321,407,],[-79,-112,-113,-114,-115,-116,-123,-126,-74,-277,-277,-301,-303,-305,-277,-308,-310,-117,-124,-125,-127,-128,-129,-132,-130,-277,-299,-147,-148,-149,-150,-300,-302,-304,-306,-307,-309,-311,-277,-211,-131,-133,-73,-74,319,-173,-80,-151,-163,-75,-172,-152,]),'STRING':([141,298,512,],[187,350,544,]),'OF':([143,],[189,]),'APPLICATION':([152,],[204,]),'UNIVERSAL':([152,],[205,]),'QUOTED_STRING':([168,173,213,253,255,268,312,322,325,330,332,336,363,383,397,412,429,473,495,504,517,566,599,],[221,221,263,221,221,221,221,221,221,221,221,221,221,221,221,221,221,263,221,540,221,221,221,]),'NEGATIVENUMBER':([180,186,282,283,286,287,504,],[230,230,230,230,344,230,534,]),'NEGATIVENUMBER64':([180,186,282,283,287,504,],[232,232,232,232,232,536,]),'NUMBER64':([180,186,282,283,287,504,],[233,233,233,233,233,535,]),'HEX_STRING':([180,186,282,283,287,504,],[234,234,234,234,234,537,]),'BIN_STRING':([180,186,282,283,287,504,],[235,235,235,235,235,538,]),'SIZE':([186,202,],[239,239,]),'AUGMENTS':([208,221,364,391,395,411,413,426,427,],[-169,-211,-195,-194,-277,-277,-90,444,-89,]),'INDEX':([208,221,364,391,395,411,413,426,427,443,445,515,],[-169,-211,-195,-194,-277,-277,-90,-277,-89,465,-176,-175,]),'MODULE':([221,329,364,379,391,400,401,402,417,418,419,420,431,433,449,450,451,452,453,454,475,499,518,581,],[-211,-277,-195,402,-194,402,-229,-277,-228,-277,-231,-232,-277,-234,-230,-238,-239,-241,-242,-243,-240,-233,-244,-245,]),'CONTACT_INFO':([221,376,],[-211,397,]),'SUPPORTS':([221,364,391,405,423,437,439,461,552,568,569,570,571,582,603,],[-211,-195,-194,-277,440,440,-257,-256,-277,-258,-264,-265,-267,-266,-268,]),'REVISION':([221,447,470,472,493,546,],[-211,473,473,-199,-198,-200,]),'GROUP':([221,402,418,419,420,431,433,450,452,453,454,475,499,518,581,],[-211,-277,-277,-231,-232,455,-234,455,-241,-242,-243,-240,-233,-244,-245,]),'VARIATION':([221,552,569,571,582,603,],[-211,572,572,-267,-266,-268,]),'|':([227,228,229,230,231,232,233,234,235,339,340,345,],[282,-154,-156,-157,-158,-159,-160,-161,-162,-153,-155,282,]),'DOT_DOT':([229,230,231,232,233,234,235,],[283,-157,-158,-159,-160,-161,-162,]),']':([247,248,],[308,309,]),'ORGANIZATION':([262,263,],[325,-212,]),'IMPLICIT':([308,309,],[359,360,]),'IMPLIED':([489,542,],[507,507,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'mibFile':([0,],[1,]),'modules':([0,],[2,]),'empty':([0,5,23,25,29,32,114,115,127,144,145,149,188,207,210,250,254,292,296,297,300,301,302,303,304,305,307,311,315,329,350,351,374,380,381,384,395,402,405,411,418,423,426,431,443,447,464,477,496,519,529,552,583,586,588,589,592,],[3,10,27,31,35,78,159,162,174,195,195,195,195,252,256,313,318,195,195,195,195,195,195,195,195,195,195,364,364,364,195,195,364,364,364,364,413,420,364,364,433,438,445,451,466,471,488,498,521,549,558,570,498,521,591,594,488,]),'module':([0,2,],[4,7,]),'moduleName':([0,2,123,],[5,5,170,]),'moduleOid':([5,],[8,]),'objectIdentifier':([9,154,212,217,219,249,314,324,334,393,410,428,430,434,435,455,456,457,463,467,483,489,500,502,507,516,528,542,553,572,598,605,],[12,207,261,261,275,310,261,261,275,261,425,275,448,458,459,476,261,480,485,261,501,261,480,527,261,545,261,261,527,261,261,261,]),'subidentifiers':([9,154,212,217,219,249,314,324,334,393,410,428,430,434,435,455,456,457,463,467,483,489,500,502,507,516,528,542,553,572,598,605,],[13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,]),'subidentifier':([9,13,154,212,217,219,249,314,324,334,393,410,428,430,434,435,455,456,457,463,467,483,489,500,502,507,516,528,542,553,572,598,605,],[14,21,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,]),'fuzzy_lowercase_identifier':([9,13,29,34,154,212,217,219,249,314,324,334,393,410,428,430,434,435,455,456,457,463,467,483,489,500,502,507,516,528,542,553,572,598,605,],[15,15,50,50,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,]),'exportsClause':([23,],[25,]),'linkagePart':([25,],[29,]),'linkageClause':([25,],[30,]),'declarationPart':([29,],[33,]),'declarations':([29,],[34,]),'declaration':([29,34,],[36,108,]),'typeDeclaration':([29,34,],[37,37,]),'valueDeclaration':([29,34,],[38,38,]),'objectIdentityClause':([29,34,],[39,39,]),'objectTypeClause':([29,34,],[40,40,]),'trapTypeClause':([29,34,],[41,41,]),'notificationTypeClause':([29,34,],[42,42,]),'moduleIdentityClause':([29,34,],[43,43,]),'moduleComplianceClause':([29,34,],[44,44,]),'objectGroupClause':([29,34,],[45,45,]),'notificationGroupClause':([29,34,],[46,46,]),'agentCapabilitiesClause':([29,34,],[47,47,]),'macroClause':([29,34,],[48,48,]),'typeName':([29,34,],[49,49,]),'macroName':([29,34,],[61,61,]),'typeSMI':([29,34,],[63,63,]),'typeSMIandSPPI':([29,34,],[65,65,]),'typeSMIonly':([29,34,],[66,66,]),'importPart':([32,],[76,]),'imports':([32,],[77,]),'import':([32,77,],[79,122,]),'importIdentifiers':([32,77,],[80,80,]),'importIdentifier':([32,77,124,],[81,81,171,]),'importedKeyword':([32,77,124,],[84,84,84,]),'importedSMIKeyword':([32,77,124,],[85,85,85,]),'typeDeclarationRHS':([109,],[125,]),'Syntax':([109,156,424,497,520,],[126,210,441,522,551,]),'choiceClause':([109,],[128,]),'ObjectSyntax':([109,156,424,497,520,],[129,129,129,129,129,]),'SimpleSyntax':([109,137,156,424,497,520,],[132,176,132,132,132,132,]),'conceptualTable':([109,156,424,497,520,],[133,133,133,133,133,]),'row':([109,156,189,424,497,520,],[134,134,242,134,134,134,]),'entryType':([109,156,424,497,520,],[135,135,135,135,135,]),'ApplicationSyntax':([109,156,424,497,520,],[136,136,136,136,136,]),'typeTag':([109,156,424,497,520,],[137,137,137,137,137,]),'NotificationObjectsPart':([114,],[157,]),'SubjectCategoriesPart':([115,],[160,]),'ObjectGroupObjectsPart':([117,],[164,]),'NotificationsPart':([118,],[166,]),'DisplayPart':([127,],[172,]),'integerSubType':([138,139,140,144,145,146,147,148,149,151,177,188,292,296,297,300,301,302,303,304,305,307,350,351,],[178,182,184,192,192,197,198,199,192,203,184,192,192,192,192,192,192,192,192,192,192,192,192,192,]),'enumSpec':([138,140,144,145,149,177,188,292,296,297,300,301,302,303,304,305,307,350,351,],[179,183,194,194,194,183,194,194,194,194,194,194,194,194,194,194,194,194,194,]),'octetStringSubType':([140,144,145,149,150,177,187,188,292,296,297,300,301,302,303,304,305,307,350,351,],[185,193,193,193,201,185,240,193,193,193,193,193,193,193,193,193,193,193,193,193,]),'anySubType':([144,145,149,188,292,296,297,300,301,302,303,304,305,307,350,351,],[191,196,200,241,347,348,349,352,353,354,355,356,357,358,388,389,]),'Status':([155,163,211,216,218,222,276,370,],[209,215,257,269,271,277,335,395,]),'Text':([168,173,253,255,268,312,322,325,330,332,336,363,383,397,412,429,495,517,566,599,],[220,223,315,321,329,365,374,376,380,381,384,391,405,415,427,447,518,546,581,603,]),'NamedBits':([175,],[224,]),'NamedBit':([175,279,],[225,337,]),'ranges':([180,186,287,],[227,227,345,]),'range':([180,186,282,287,],[228,228,339,228,]),'value':([180,186,282,283,287,],[229,229,229,340,229,]),'enumItems':([181,],[236,]),'enumItem':([181,285,],[237,341,]),'sequenceItems':([190,],[244,]),'sequenceItem':([190,289,],[245,346,]),'VarPart':([207,],[250,]),'UnitsPart':([210,],[254,]),'Objects':([212,217,],[258,270,]),'Object':([212,217,324,],[259,259,375,]),'ObjectName':([212,217,314,324,393,456,467,489,507,528,542,572,598,605,],[260,260,368,260,368,477,491,509,509,554,509,583,602,602,]),'ExtUTCTime':([213,473,],[262,494,]),'SubjectCategories':([214,],[264,]),'CategoryIDs':([214,],[265,]),'CategoryID':([214,327,],[266,377,]),'Notifications':([219,],[272,]),'Notification':([219,334,],[273,382,]),'NotificationName':([219,334,428,],[274,274,446,]),'sequenceSyntax':([246,],[290,]),'sequenceObjectSyntax':([246,],[293,]),'sequenceSimpleSyntax':([246,],[294,]),'sequenceApplicationSyntax':([246,],[295,]),'DescrPart':([250,],[311,]),'MaxOrPIBAccessPart':([254,],[316,]),'MaxAccessPart':([254,],[317,]),'enumNumber':([286,],[342,]),'ReferPart':([311,315,329,374,380,381,384,405,411,],[362,369,379,396,403,404,406,423,426,]),'VarTypes':([314,],[366,]),'VarType':([314,393,],[367,409,]),'Access':([319,320,548,],[371,373,567,]),'ComplianceModulePart':([379,],[399,]),'ComplianceModules':([379,],[400,]),'ComplianceModule':([379,400,],[401,417,]),'descriptionClause':([395,],[411,]),'ComplianceModuleName':([402,],[418,]),'MandatoryPart':([418,],[431,]),'ModulePart_Capabilities':([423,],[436,]),'Modules_Capabilities':([423,],[437,]),'Module_Capabilities':([423,437,],[439,461,]),'IndexPart':([426,],[443,]),'CompliancePart':([431,],[449,]),'Compliances':([431,],[450,]),'Compliance':([431,450,],[452,475,]),'ComplianceGroup':([431,450,],[453,453,]),'ComplianceObject':([431,450,],[454,454,]),'ModuleName_Capabilities':([440,],[462,]),'MibIndex':([443,],[464,]),'RevisionPart':([447,],[469,]),'Revisions':([447,],[470,]),'Revision':([447,470,],[472,493,]),'MandatoryGroups':([457,],[478,]),'MandatoryGroup':([457,500,],[479,523,]),'DefValPart':([464,592,],[486,597,]),'Entry':([467,],[490,]),'SyntaxPart':([477,583,],[496,586,]),'IndexTypes':([489,],[505,]),'IndexType':([489,542,],[506,564,]),'Index':([489,507,542,],[508,543,508,]),'typeSMIv1':([489,507,542,],[510,510,510,]),'WriteSyntaxPart':([496,586,],[519,588,]),'CapabilitiesGroups':([502,],[525,]),'CapabilitiesGroup':([502,553,],[526,573,]),'Value':([504,],[530,]),'valueofObjectSyntax':([504,],[531,]),'valueofSimpleSyntax':([504,],[532,]),'AccessPart':([519,],[547,]),'WriteSyntax':([520,],[550,]),'BitsValue':([529,],[555,]),'objectIdentifier_defval':([529,],[556,]),'BitNames':([529,],[557,]),'subidentifiers_defval':([529,],[559,]),'subidentifier_defval':([529,559,],[561,578,]),'VariationPart':([552,],[568,]),'Variations':([552,],[569,]),'Variation':([552,569,],[571,582,]),'VariationAccessPart':([588,],[589,]),'CreationPart':([589,],[592,]),'VariationAccess':([590,],[595,]),'Cells':([598,],[600,]),'Cell':([598,605,],[601,606,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> mibFile","S'",1,None,None,None),
+  ('mibFile -> modules','mibFile',1,'p_mibFile','smi.py',179),
+  ('mibFile -> empty','mibFile',1,'p_mibFile','smi.py',180),
+  ('modules -> modules module','modules',2,'p_modules','smi.py',184),
+  ('modules -> module','modules',1,'p_modules','smi.py',185),
+  ('module -> moduleName moduleOid DEFINITIONS COLON_COLON_EQUAL BEGIN exportsClause linkagePart declarationPart END','module',9,'p_module','smi.py',193),
+  ('moduleOid -> { objectIdentifier }','moduleOid',3,'p_moduleOid','smi.py',202),
+  ('moduleOid -> empty','moduleOid',1,'p_moduleOid','smi.py',203),
+  ('linkagePart -> linkageClause','linkagePart',1,'p_linkagePart','smi.py',209),
+  ('linkagePart -> empty','linkagePart',1,'p_linkagePart','smi.py',210),
+  ('linkageClause -> IMPORTS importPart ;','linkageClause',3,'p_linkageClause','smi.py',215),
+  ('exportsClause -> EXPORTS','exportsClause',1,'p_exportsClause','smi.py',219),
+  ('exportsClause -> empty','exportsClause',1,'p_exportsClause','smi.py',220),
+  ('importPart -> imports','importPart',1,'p_importPart','smi.py',223),
+  ('importPart -> empty','importPart',1,'p_importPart','smi.py',224),
+  ('imports -> imports import','imports',2,'p_imports','smi.py',238),
+  ('imports -> import','imports',1,'p_imports','smi.py',239),
+  ('import -> importIdentifiers FROM moduleName','import',3,'p_import','smi.py',247),
+  ('importIdentifiers -> importIdentifiers , importIdentifier','importIdentifiers',3,'p_importIdentifiers','smi.py',253),
+  ('importIdentifiers -> importIdentifier','importIdentifiers',1,'p_importIdentifiers','smi.py',254),
+  ('importIdentifier -> LOWERCASE_IDENTIFIER','importIdentifier',1,'p_importIdentifier','smi.py',263),
+  ('importIdentifier -> UPPERCASE_IDENTIFIER','importIdentifier',1,'p_importIdentifier','smi.py',264),
+  ('importIdentifier -> importedKeyword','importIdentifier',1,'p_importIdentifier','smi.py',265),
+  ('importedSMIKeyword -> AGENT_CAPABILITIES','importedSMIKeyword',1,'p_importedSMIKeyword','smi.py',286),
+  ('importedSMIKeyword -> COUNTER32','importedSMIKeyword',1,'p_importedSMIKeyword','smi.py',287),
+  ('importedSMIKeyword -> COUNTER64','importedSMIKeyword',1,'p_importedSMIKeyword','smi.py',288),
+  ('importedSMIKeyword -> GAUGE32','importedSMIKeyword',1,'p_importedSMIKeyword','smi.py',289),
+  ('importedSMIKeyword -> NOTIFICATION_GROUP','importedSMIKeyword',1,'p_importedSMIKeyword','smi.py',290),
+  ('importedSMIKeyword -> NOTIFICATION_TYPE','importedSMIKeyword',1,'p_importedSMIKeyword','smi.py',291),
+  ('importedSMIKeyword -> TRAP_TYPE','importedSMIKeyword',1,'p_importedSMIKeyword','smi.py',292),
+  ('moduleName -> UPPERCASE_IDENTIFIER','moduleName',1,'p_moduleName','smi.py',296),
+  ('declarationPart -> declarations','declarationPart',1,'p_declarationPart','smi.py',300),
+  ('declarationPart -> empty','declarationPart',1,'p_declarationPart','smi.py',301),
+  ('declarations -> declarations declaration','declarations',2,'p_declarations','smi.py',306),
+  ('declarations -> declaration','declarations',1,'p_declarations','smi.py',307),
+  ('declaration -> typeDeclaration','declaration',1,'p_declaration','smi.py',315),
+  ('declaration -> valueDeclaration','declaration',1,'p_declaration','smi.py',316),
+  ('declaration -> objectIdentityClause','declaration',1,'p_declaration','smi.py',317),
+  ('declaration -> objectTypeClause','declaration',1,'p_declaration','smi.py',318),
+  ('declaration -> trapTypeClause','declaration',1,'p_declaration','smi.py',319),
+  ('declaration -> notificationTypeClause','declaration',1,'p_declaration','smi.py',320),
+  ('declaration -> moduleIdentityClause','declaration',1,'p_declaration','smi.py',321),
+  ('declaration -> moduleComplianceClause','declaration',1,'p_declaration','smi.py',322),
+  ('declaration -> objectGroupClause','declaration',1,'p_declaration','smi.py',323),
+  ('declaration -> notificationGroupClause','declaration',1,'p_declaration','smi.py',324),
+  ('declaration -> agentCapabilitiesClause','declaration',1,'p_declaration','smi.py',325),
+  ('declaration -> macroClause','declaration',1,'p_declaration','smi.py',326),
+  ('macroClause -> macroName MACRO END','macroClause',3,'p_macroClause','smi.py',331),
+  ('macroName -> MODULE_IDENTITY','macroName',1,'p_macroName','smi.py',334),
+  ('macroName -> OBJECT_TYPE','macroName',1,'p_macroName','smi.py',335),
+  ('macroName -> TRAP_TYPE','macroName',1,'p_macroName','smi.py',336),
+  ('macroName -> NOTIFICATION_TYPE','macroName',1,'p_macroName','smi.py',337),
+  ('macroName -> OBJECT_IDENTITY','macroName',1,'p_macroName','smi.py',338),
+  ('macroName -> TEXTUAL_CONVENTION','macroName',1,'p_macroName','smi.py',339),
+  ('macroName -> OBJECT_GROUP','macroName',1,'p_macroName','smi.py',340),
+  ('macroName -> NOTIFICATION_GROUP','macroName',1,'p_macroName','smi.py',341),
+  ('macroName -> MODULE_COMPLIANCE','macroName',1,'p_macroName','smi.py',342),
+  ('macroName -> AGENT_CAPABILITIES','macroName',1,'p_macroName','smi.py',343),
+  ('choiceClause -> CHOICE','choiceClause',1,'p_choiceClause','smi.py',346),
+  ('fuzzy_lowercase_identifier -> LOWERCASE_IDENTIFIER','fuzzy_lowercase_identifier',1,'p_fuzzy_lowercase_identifier','smi.py',350),
+  ('fuzzy_lowercase_identifier -> UPPERCASE_IDENTIFIER','fuzzy_lowercase_identifier',1,'p_fuzzy_lowercase_identifier','smi.py',351),
+  ('valueDeclaration -> fuzzy_lowercase_identifier OBJECT IDENTIFIER COLON_COLON_EQUAL { objectIdentifier }','valueDeclaration',7,'p_valueDeclaration','smi.py',355),
+  ('typeDeclaration -> typeName COLON_COLON_EQUAL typeDeclarationRHS','typeDeclaration',3,'p_typeDeclaration','smi.py',359),
+  ('typeName -> UPPERCASE_IDENTIFIER','typeName',1,'p_typeName','smi.py',363),
+  ('typeName -> typeSMI','typeName',1,'p_typeName','smi.py',364),
+  ('typeSMI -> typeSMIandSPPI','typeSMI',1,'p_typeSMI','smi.py',368),
+  ('typeSMI -> typeSMIonly','typeSMI',1,'p_typeSMI','smi.py',369),
+  ('typeSMIonly -> COUNTER32','typeSMIonly',1,'p_typeSMIonly','smi.py',381),
+  ('typeSMIonly -> GAUGE32','typeSMIonly',1,'p_typeSMIonly','smi.py',382),
+  ('typeSMIonly -> COUNTER64','typeSMIonly',1,'p_typeSMIonly','smi.py',383),
+  ('typeDeclarationRHS -> Syntax','typeDeclarationRHS',1,'p_typeDeclarationRHS','smi.py',387),
+  ('typeDeclarationRHS -> TEXTUAL_CONVENTION DisplayPart STATUS Status DESCRIPTION Text ReferPart SYNTAX Syntax','typeDeclarationRHS',9,'p_typeDeclarationRHS','smi.py',388),
+  ('typeDeclarationRHS -> choiceClause','typeDeclarationRHS',1,'p_typeDeclarationRHS','smi.py',389),
+  ('conceptualTable -> SEQUENCE OF row','conceptualTable',3,'p_conceptualTable','smi.py',405),
+  ('row -> UPPERCASE_IDENTIFIER','row',1,'p_row','smi.py',409),
+  ('entryType -> SEQUENCE { sequenceItems }','entryType',4,'p_entryType','smi.py',414),
+  ('sequenceItems -> sequenceItems , sequenceItem','sequenceItems',3,'p_sequenceItems','smi.py',418),
+  ('sequenceItems -> sequenceItem','sequenceItems',1,'p_sequenceItems','smi.py',419),
+  ('sequenceItem -> LOWERCASE_IDENTIFIER sequenceSyntax','sequenceItem',2,'p_sequenceItem','smi.py',428),
+  ('Syntax -> ObjectSyntax','Syntax',1,'p_Syntax','smi.py',432),
+  ('Syntax -> BITS { NamedBits }','Syntax',4,'p_Syntax','smi.py',433),
+  ('sequenceSyntax -> BITS','sequenceSyntax',1,'p_sequenceSyntax','smi.py',443),
+  ('sequenceSyntax -> UPPERCASE_IDENTIFIER anySubType','sequenceSyntax',2,'p_sequenceSyntax','smi.py',444),
+  ('sequenceSyntax -> sequenceObjectSyntax','sequenceSyntax',1,'p_sequenceSyntax','smi.py',445),
+  ('NamedBits -> NamedBits , NamedBit','NamedBits',3,'p_NamedBits','smi.py',449),
+  ('NamedBits -> NamedBit','NamedBits',1,'p_NamedBits','smi.py',450),
+  ('NamedBit -> LOWERCASE_IDENTIFIER ( NUMBER )','NamedBit',4,'p_NamedBit','smi.py',458),
+  ('objectIdentityClause -> LOWERCASE_IDENTIFIER OBJECT_IDENTITY STATUS Status DESCRIPTION Text ReferPart COLON_COLON_EQUAL { objectIdentifier }','objectIdentityClause',11,'p_objectIdentityClause','smi.py',462),
+  ('objectTypeClause -> LOWERCASE_IDENTIFIER OBJECT_TYPE SYNTAX Syntax UnitsPart MaxOrPIBAccessPart STATUS Status descriptionClause ReferPart IndexPart MibIndex DefValPart COLON_COLON_EQUAL { ObjectName }','objectTypeClause',17,'p_objectTypeClause','smi.py',474),
+  ('descriptionClause -> DESCRIPTION Text','descriptionClause',2,'p_descriptionClause','smi.py',492),
+  ('descriptionClause -> empty','descriptionClause',1,'p_descriptionClause','smi.py',493),
+  ('trapTypeClause -> fuzzy_lowercase_identifier TRAP_TYPE ENTERPRISE objectIdentifier VarPart DescrPart ReferPart COLON_COLON_EQUAL NUMBER','trapTypeClause',9,'p_trapTypeClause','smi.py',498),
+  ('VarPart -> VARIABLES { VarTypes }','VarPart',4,'p_VarPart','smi.py',512),
+  ('VarPart -> empty','VarPart',1,'p_VarPart','smi.py',513),
+  ('VarTypes -> VarTypes , VarType','VarTypes',3,'p_VarTypes','smi.py',517),
+  ('VarTypes -> VarType','VarTypes',1,'p_VarTypes','smi.py',518),
+  ('VarType -> ObjectName','VarType',1,'p_VarType','smi.py',526),
+  ('DescrPart -> DESCRIPTION Text','DescrPart',2,'p_DescrPart','smi.py',530),
+  ('DescrPart -> empty','DescrPart',1,'p_DescrPart','smi.py',531),
+  ('MaxOrPIBAccessPart -> MaxAccessPart','MaxOrPIBAccessPart',1,'p_MaxOrPIBAccessPart','smi.py',536),
+  ('MaxOrPIBAccessPart -> empty','MaxOrPIBAccessPart',1,'p_MaxOrPIBAccessPart','smi.py',537),
+  ('MaxAccessPart -> MAX_ACCESS Access','MaxAccessPart',2,'p_MaxAccessPart','smi.py',542),
+  ('MaxAccessPart -> ACCESS Access','MaxAccessPart',2,'p_MaxAccessPart','smi.py',543),
+  ('notificationTypeClause -> LOWERCASE_IDENTIFIER NOTIFICATION_TYPE NotificationObjectsPart STATUS Status DESCRIPTION Text ReferPart COLON_COLON_EQUAL { NotificationName }','notificationTypeClause',12,'p_notificationTypeClause','smi.py',547),
+  ('moduleIdentityClause -> LOWERCASE_IDENTIFIER MODULE_IDENTITY SubjectCategoriesPart LAST_UPDATED ExtUTCTime ORGANIZATION Text CONTACT_INFO Text DESCRIPTION Text RevisionPart COLON_COLON_EQUAL { objectIdentifier }','moduleIdentityClause',16,'p_moduleIdentityClause','smi.py',560),
+  ('SubjectCategoriesPart -> SUBJECT_CATEGORIES { SubjectCategories }','SubjectCategoriesPart',4,'p_SubjectCategoriesPart','smi.py',577),
+  ('SubjectCategoriesPart -> empty','SubjectCategoriesPart',1,'p_SubjectCategoriesPart','smi.py',578),
+  ('SubjectCategories -> CategoryIDs','SubjectCategories',1,'p_SubjectCategories','smi.py',583),
+  ('CategoryIDs -> CategoryIDs , CategoryID','CategoryIDs',3,'p_CategoryIDs','smi.py',587),
+  ('CategoryIDs -> CategoryID','CategoryIDs',1,'p_CategoryIDs','smi.py',588),
+  ('CategoryID -> LOWERCASE_IDENTIFIER ( NUMBER )','CategoryID',4,'p_CategoryID','smi.py',596),
+  ('CategoryID -> LOWERCASE_IDENTIFIER','CategoryID',1,'p_CategoryID','smi.py',597),
+  ('ObjectSyntax -> SimpleSyntax','ObjectSyntax',1,'p_ObjectSyntax','smi.py',607),
+  ('ObjectSyntax -> conceptualTable','ObjectSyntax',1,'p_ObjectSyntax','smi.py',608),
+  ('ObjectSyntax -> row','ObjectSyntax',1,'p_ObjectSyntax','smi.py',609),
+  ('ObjectSyntax -> entryType','ObjectSyntax',1,'p_ObjectSyntax','smi.py',610),
+  ('ObjectSyntax -> ApplicationSyntax','ObjectSyntax',1,'p_ObjectSyntax','smi.py',611),
+  ('ObjectSyntax -> typeTag SimpleSyntax','ObjectSyntax',2,'p_ObjectSyntax','smi.py',612),
+  ('typeTag -> [ APPLICATION NUMBER ] IMPLICIT','typeTag',5,'p_typeTag','smi.py',620),
+  ('typeTag -> [ UNIVERSAL NUMBER ] IMPLICIT','typeTag',5,'p_typeTag','smi.py',621),
+  ('sequenceObjectSyntax -> sequenceSimpleSyntax','sequenceObjectSyntax',1,'p_sequenceObjectSyntax','smi.py',624),
+  ('sequenceObjectSyntax -> sequenceApplicationSyntax','sequenceObjectSyntax',1,'p_sequenceObjectSyntax','smi.py',625),
+  ('valueofObjectSyntax -> valueofSimpleSyntax','valueofObjectSyntax',1,'p_valueofObjectSyntax','smi.py',630),
+  ('SimpleSyntax -> INTEGER','SimpleSyntax',1,'p_SimpleSyntax','smi.py',634),
+  ('SimpleSyntax -> INTEGER integerSubType','SimpleSyntax',2,'p_SimpleSyntax','smi.py',635),
+  ('SimpleSyntax -> INTEGER enumSpec','SimpleSyntax',2,'p_SimpleSyntax','smi.py',636),
+  ('SimpleSyntax -> INTEGER32','SimpleSyntax',1,'p_SimpleSyntax','smi.py',637),
+  ('SimpleSyntax -> INTEGER32 integerSubType','SimpleSyntax',2,'p_SimpleSyntax','smi.py',638),
+  ('SimpleSyntax -> UPPERCASE_IDENTIFIER enumSpec','SimpleSyntax',2,'p_SimpleSyntax','smi.py',639),
+  ('SimpleSyntax -> UPPERCASE_IDENTIFIER integerSubType','SimpleSyntax',2,'p_SimpleSyntax','smi.py',640),
+  ('SimpleSyntax -> OCTET STRING','SimpleSyntax',2,'p_SimpleSyntax','smi.py',641),
+  ('SimpleSyntax -> OCTET STRING octetStringSubType','SimpleSyntax',3,'p_SimpleSyntax','smi.py',642),
+  ('SimpleSyntax -> UPPERCASE_IDENTIFIER octetStringSubType','SimpleSyntax',2,'p_SimpleSyntax','smi.py',643),
+  ('SimpleSyntax -> OBJECT IDENTIFIER anySubType','SimpleSyntax',3,'p_SimpleSyntax','smi.py',644),
+  ('valueofSimpleSyntax -> NUMBER','valueofSimpleSyntax',1,'p_valueofSimpleSyntax','smi.py',659),
+  ('valueofSimpleSyntax -> NEGATIVENUMBER','valueofSimpleSyntax',1,'p_valueofSimpleSyntax','smi.py',660),
+  ('valueofSimpleSyntax -> NUMBER64','valueofSimpleSyntax',1,'p_valueofSimpleSyntax','smi.py',661),
+  ('valueofSimpleSyntax -> NEGATIVENUMBER64','valueofSimpleSyntax',1,'p_valueofSimpleSyntax','smi.py',662),
+  ('valueofSimpleSyntax -> HEX_STRING','valueofSimpleSyntax',1,'p_valueofSimpleSyntax','smi.py',663),
+  ('valueofSimpleSyntax -> BIN_STRING','valueofSimpleSyntax',1,'p_valueofSimpleSyntax','smi.py',664),
+  ('valueofSimpleSyntax -> LOWERCASE_IDENTIFIER','valueofSimpleSyntax',1,'p_valueofSimpleSyntax','smi.py',665),
+  ('valueofSimpleSyntax -> QUOTED_STRING','valueofSimpleSyntax',1,'p_valueofSimpleSyntax','smi.py',666),
+  ('valueofSimpleSyntax -> { objectIdentifier_defval }','valueofSimpleSyntax',3,'p_valueofSimpleSyntax','smi.py',667),
+  ('sequenceSimpleSyntax -> INTEGER anySubType','sequenceSimpleSyntax',2,'p_sequenceSimpleSyntax','smi.py',680),
+  ('sequenceSimpleSyntax -> INTEGER32 anySubType','sequenceSimpleSyntax',2,'p_sequenceSimpleSyntax','smi.py',681),
+  ('sequenceSimpleSyntax -> OCTET STRING anySubType','sequenceSimpleSyntax',3,'p_sequenceSimpleSyntax','smi.py',682),
+  ('sequenceSimpleSyntax -> OBJECT IDENTIFIER anySubType','sequenceSimpleSyntax',3,'p_sequenceSimpleSyntax','smi.py',683),
+  ('anySubType -> integerSubType','anySubType',1,'p_anySubType','smi.py',725),
+  ('anySubType -> octetStringSubType','anySubType',1,'p_anySubType','smi.py',726),
+  ('anySubType -> enumSpec','anySubType',1,'p_anySubType','smi.py',727),
+  ('anySubType -> empty','anySubType',1,'p_anySubType','smi.py',728),
+  ('integerSubType -> ( ranges )','integerSubType',3,'p_integerSubType','smi.py',733),
+  ('octetStringSubType -> ( SIZE ( ranges ) )','octetStringSubType',6,'p_octetStringSubType','smi.py',737),
+  ('ranges -> ranges | range','ranges',3,'p_ranges','smi.py',741),
+  ('ranges -> range','ranges',1,'p_ranges','smi.py',742),
+  ('range -> value DOT_DOT value','range',3,'p_range','smi.py',750),
+  ('range -> value','range',1,'p_range','smi.py',751),
+  ('value -> NEGATIVENUMBER','value',1,'p_value','smi.py',759),
+  ('value -> NUMBER','value',1,'p_value','smi.py',760),
+  ('value -> NEGATIVENUMBER64','value',1,'p_value','smi.py',761),
+  ('value -> NUMBER64','value',1,'p_value','smi.py',762),
+  ('value -> HEX_STRING','value',1,'p_value','smi.py',763),
+  ('value -> BIN_STRING','value',1,'p_value','smi.py',764),
+  ('enumSpec -> { enumItems }','enumSpec',3,'p_enumSpec','smi.py',768),
+  ('enumItems -> enumItems , enumItem','enumItems',3,'p_enumItems','smi.py',772),
+  ('enumItems -> enumItem','enumItems',1,'p_enumItems','smi.py',773),
+  ('enumItem -> LOWERCASE_IDENTIFIER ( enumNumber )','enumItem',4,'p_enumItem','smi.py',781),
+  ('enumNumber -> NUMBER','enumNumber',1,'p_enumNumber','smi.py',785),
+  ('enumNumber -> NEGATIVENUMBER','enumNumber',1,'p_enumNumber','smi.py',786),
+  ('Status -> LOWERCASE_IDENTIFIER','Status',1,'p_Status','smi.py',791),
+  ('DisplayPart -> DISPLAY_HINT Text','DisplayPart',2,'p_DisplayPart','smi.py',795),
+  ('DisplayPart -> empty','DisplayPart',1,'p_DisplayPart','smi.py',796),
+  ('UnitsPart -> UNITS Text','UnitsPart',2,'p_UnitsPart','smi.py',801),
+  ('UnitsPart -> empty','UnitsPart',1,'p_UnitsPart','smi.py',802),
+  ('Access -> LOWERCASE_IDENTIFIER','Access',1,'p_Access','smi.py',807),
+  ('IndexPart -> AUGMENTS { Entry }','IndexPart',4,'p_IndexPart','smi.py',811),
+  ('IndexPart -> empty','IndexPart',1,'p_IndexPart','smi.py',812),
+  ('MibIndex -> INDEX { IndexTypes }','MibIndex',4,'p_MibIndex','smi.py',817),
+  ('MibIndex -> empty','MibIndex',1,'p_MibIndex','smi.py',818),
+  ('IndexTypes -> IndexTypes , IndexType','IndexTypes',3,'p_IndexTypes','smi.py',823),
+  ('IndexTypes -> IndexType','IndexTypes',1,'p_IndexTypes','smi.py',824),
+  ('IndexType -> IMPLIED Index','IndexType',2,'p_IndexType','smi.py',832),
+  ('IndexType -> Index','IndexType',1,'p_IndexType','smi.py',833),
+  ('Entry -> ObjectName','Entry',1,'p_Entry','smi.py',847),
+  ('DefValPart -> DEFVAL { Value }','DefValPart',4,'p_DefValPart','smi.py',851),
+  ('DefValPart -> empty','DefValPart',1,'p_DefValPart','smi.py',852),
+  ('Value -> valueofObjectSyntax','Value',1,'p_Value','smi.py',857),
+  ('Value -> { BitsValue }','Value',3,'p_Value','smi.py',858),
+  ('BitsValue -> BitNames','BitsValue',1,'p_BitsValue','smi.py',866),
+  ('BitsValue -> empty','BitsValue',1,'p_BitsValue','smi.py',867),
+  ('BitNames -> BitNames , LOWERCASE_IDENTIFIER','BitNames',3,'p_BitNames','smi.py',871),
+  ('BitNames -> LOWERCASE_IDENTIFIER','BitNames',1,'p_BitNames','smi.py',872),
+  ('ObjectName -> objectIdentifier','ObjectName',1,'p_ObjectName','smi.py',880),
+  ('NotificationName -> objectIdentifier','NotificationName',1,'p_NotificationName','smi.py',884),
+  ('ReferPart -> REFERENCE Text','ReferPart',2,'p_ReferPart','smi.py',888),
+  ('ReferPart -> empty','ReferPart',1,'p_ReferPart','smi.py',889),
+  ('RevisionPart -> Revisions','RevisionPart',1,'p_RevisionPart','smi.py',894),
+  ('RevisionPart -> empty','RevisionPart',1,'p_RevisionPart','smi.py',895),
+  ('Revisions -> Revisions Revision','Revisions',2,'p_Revisions','smi.py',900),
+  ('Revisions -> Revision','Revisions',1,'p_Revisions','smi.py',901),
+  ('Revision -> REVISION ExtUTCTime DESCRIPTION Text','Revision',4,'p_Revision','smi.py',909),
+  ('NotificationObjectsPart -> OBJECTS { Objects }','NotificationObjectsPart',4,'p_NotificationObjectsPart','smi.py',913),
+  ('NotificationObjectsPart -> empty','NotificationObjectsPart',1,'p_NotificationObjectsPart','smi.py',914),
+  ('ObjectGroupObjectsPart -> OBJECTS { Objects }','ObjectGroupObjectsPart',4,'p_ObjectGroupObjectsPart','smi.py',918),
+  ('Objects -> Objects , Object','Objects',3,'p_Objects','smi.py',922),
+  ('Objects -> Object','Objects',1,'p_Objects','smi.py',923),
+  ('Object -> ObjectName','Object',1,'p_Object','smi.py',931),
+  ('NotificationsPart -> NOTIFICATIONS { Notifications }','NotificationsPart',4,'p_NotificationsPart','smi.py',935),
+  ('Notifications -> Notifications , Notification','Notifications',3,'p_Notifications','smi.py',939),
+  ('Notifications -> Notification','Notifications',1,'p_Notifications','smi.py',940),
+  ('Notification -> NotificationName','Notification',1,'p_Notification','smi.py',948),
+  ('Text -> QUOTED_STRING','Text',1,'p_Text','smi.py',952),
+  ('ExtUTCTime -> QUOTED_STRING','ExtUTCTime',1,'p_ExtUTCTime','smi.py',956),
+  ('objectIdentifier -> subidentifiers','objectIdentifier',1,'p_objectIdentifier','smi.py',960),
+  ('subidentifiers -> subidentifiers subidentifier','subidentifiers',2,'p_subidentifiers','smi.py',964),
+  ('subidentifiers -> subidentifier','subidentifiers',1,'p_subidentifiers','smi.py',965),
+  ('subidentifier -> fuzzy_lowercase_identifier','subidentifier',1,'p_subidentifier','smi.py',973),
+  ('subidentifier -> NUMBER','subidentifier',1,'p_subidentifier','smi.py',974),
+  ('subidentifier -> LOWERCASE_IDENTIFIER ( NUMBER )','subidentifier',4,'p_subidentifier','smi.py',975),
+  ('objectIdentifier_defval -> subidentifiers_defval','objectIdentifier_defval',1,'p_objectIdentifier_defval','smi.py',985),
+  ('subidentifiers_defval -> subidentifiers_defval subidentifier_defval','subidentifiers_defval',2,'p_subidentifiers_defval','smi.py',989),
+  ('subidentifiers_defval -> subidentifier_defval','subidentifiers_defval',1,'p_subidentifiers_defval','smi.py',990),
+  ('subidentifier_defval -> LOWERCASE_IDENTIFIER ( NUMBER )','subidentifier_defval',4,'p_subidentifier_defval','smi.py',998),
+  ('subidentifier_defval -> NUMBER','subidentifier_defval',1,'p_subidentifier_defval','smi.py',999),
+  ('objectGroupClause -> LOWERCASE_IDENTIFIER OBJECT_GROUP ObjectGroupObjectsPart STATUS Status DESCRIPTION Text ReferPart COLON_COLON_EQUAL { objectIdentifier }','objectGroupClause',12,'p_objectGroupClause','smi.py',1007),
+  ('notificationGroupClause -> LOWERCASE_IDENTIFIER NOTIFICATION_GROUP NotificationsPart STATUS Status DESCRIPTION Text ReferPart COLON_COLON_EQUAL { objectIdentifier }','notificationGroupClause',12,'p_notificationGroupClause','smi.py',1019),
+  ('moduleComplianceClause -> LOWERCASE_IDENTIFIER MODULE_COMPLIANCE STATUS Status DESCRIPTION Text ReferPart ComplianceModulePart COLON_COLON_EQUAL { objectIdentifier }','moduleComplianceClause',12,'p_moduleComplianceClause','smi.py',1031),
+  ('ComplianceModulePart -> ComplianceModules','ComplianceModulePart',1,'p_ComplianceModulePart','smi.py',1044),
+  ('ComplianceModules -> ComplianceModules ComplianceModule','ComplianceModules',2,'p_ComplianceModules','smi.py',1048),
+  ('ComplianceModules -> ComplianceModule','ComplianceModules',1,'p_ComplianceModules','smi.py',1049),
+  ('ComplianceModule -> MODULE ComplianceModuleName MandatoryPart CompliancePart','ComplianceModule',4,'p_ComplianceModule','smi.py',1057),
+  ('ComplianceModuleName -> UPPERCASE_IDENTIFIER','ComplianceModuleName',1,'p_ComplianceModuleName','smi.py',1063),
+  ('ComplianceModuleName -> empty','ComplianceModuleName',1,'p_ComplianceModuleName','smi.py',1064),
+  ('MandatoryPart -> MANDATORY_GROUPS { MandatoryGroups }','MandatoryPart',4,'p_MandatoryPart','smi.py',1069),
+  ('MandatoryPart -> empty','MandatoryPart',1,'p_MandatoryPart','smi.py',1070),
+  ('MandatoryGroups -> MandatoryGroups , MandatoryGroup','MandatoryGroups',3,'p_MandatoryGroups','smi.py',1075),
+  ('MandatoryGroups -> MandatoryGroup','MandatoryGroups',1,'p_MandatoryGroups','smi.py',1076),
+  ('MandatoryGroup -> objectIdentifier','MandatoryGroup',1,'p_MandatoryGroup','smi.py',1084),
+  ('CompliancePart -> Compliances','CompliancePart',1,'p_CompliancePart','smi.py',1088),
+  ('CompliancePart -> empty','CompliancePart',1,'p_CompliancePart','smi.py',1089),
+  ('Compliances -> Compliances Compliance','Compliances',2,'p_Compliances','smi.py',1094),
+  ('Compliances -> Compliance','Compliances',1,'p_Compliances','smi.py',1095),
+  ('Compliance -> ComplianceGroup','Compliance',1,'p_Compliance','smi.py',1103),
+  ('Compliance -> ComplianceObject','Compliance',1,'p_Compliance','smi.py',1104),
+  ('ComplianceGroup -> GROUP objectIdentifier DESCRIPTION Text','ComplianceGroup',4,'p_ComplianceGroup','smi.py',1109),
+  ('ComplianceObject -> OBJECT ObjectName SyntaxPart WriteSyntaxPart AccessPart DESCRIPTION Text','ComplianceObject',7,'p_ComplianceObject','smi.py',1115),
+  ('SyntaxPart -> SYNTAX Syntax','SyntaxPart',2,'p_SyntaxPart','smi.py',1124),
+  ('SyntaxPart -> empty','SyntaxPart',1,'p_SyntaxPart','smi.py',1125),
+  ('WriteSyntaxPart -> WRITE_SYNTAX WriteSyntax','WriteSyntaxPart',2,'p_WriteSyntaxPart','smi.py',1130),
+  ('WriteSyntaxPart -> empty','WriteSyntaxPart',1,'p_WriteSyntaxPart','smi.py',1131),
+  ('WriteSyntax -> Syntax','WriteSyntax',1,'p_WriteSyntax','smi.py',1136),
+  ('AccessPart -> MIN_ACCESS Access','AccessPart',2,'p_AccessPart','smi.py',1140),
+  ('AccessPart -> empty','AccessPart',1,'p_AccessPart','smi.py',1141),
+  ('agentCapabilitiesClause -> LOWERCASE_IDENTIFIER AGENT_CAPABILITIES PRODUCT_RELEASE Text STATUS Status DESCRIPTION Text ReferPart ModulePart_Capabilities COLON_COLON_EQUAL { objectIdentifier }','agentCapabilitiesClause',14,'p_agentCapabilitiesClause','smi.py',1146),
+  ('ModulePart_Capabilities -> Modules_Capabilities','ModulePart_Capabilities',1,'p_ModulePart_Capabilities','smi.py',1160),
+  ('ModulePart_Capabilities -> empty','ModulePart_Capabilities',1,'p_ModulePart_Capabilities','smi.py',1161),
+  ('Modules_Capabilities -> Modules_Capabilities Module_Capabilities','Modules_Capabilities',2,'p_Modules_Capabilities','smi.py',1166),
+  ('Modules_Capabilities -> Module_Capabilities','Modules_Capabilities',1,'p_Modules_Capabilities','smi.py',1167),
+  ('Module_Capabilities -> SUPPORTS ModuleName_Capabilities INCLUDES { CapabilitiesGroups } VariationPart','Module_Capabilities',7,'p_Module_Capabilities','smi.py',1175),
+  ('CapabilitiesGroups -> CapabilitiesGroups , CapabilitiesGroup','CapabilitiesGroups',3,'p_CapabilitiesGroups','smi.py',1181),
+  ('CapabilitiesGroups -> CapabilitiesGroup','CapabilitiesGroups',1,'p_CapabilitiesGroups','smi.py',1182),
+  ('CapabilitiesGroup -> objectIdentifier','CapabilitiesGroup',1,'p_CapabilitiesGroup','smi.py',1190),
+  ('ModuleName_Capabilities -> UPPERCASE_IDENTIFIER objectIdentifier','ModuleName_Capabilities',2,'p_ModuleName_Capabilities','smi.py',1194),
+  ('ModuleName_Capabilities -> UPPERCASE_IDENTIFIER','ModuleName_Capabilities',1,'p_ModuleName_Capabilities','smi.py',1195),
+  ('VariationPart -> Variations','VariationPart',1,'p_VariationPart','smi.py',1203),
+  ('VariationPart -> empty','VariationPart',1,'p_VariationPart','smi.py',1204),
+  ('Variations -> Variations Variation','Variations',2,'p_Variations','smi.py',1209),
+  ('Variations -> Variation','Variations',1,'p_Variations','smi.py',1210),
+  ('Variation -> VARIATION ObjectName SyntaxPart WriteSyntaxPart VariationAccessPart CreationPart DefValPart DESCRIPTION Text','Variation',9,'p_Variation','smi.py',1218),
+  ('VariationAccessPart -> ACCESS VariationAccess','VariationAccessPart',2,'p_VariationAccessPart','smi.py',1229),
+  ('VariationAccessPart -> empty','VariationAccessPart',1,'p_VariationAccessPart','smi.py',1230),
+  ('VariationAccess -> LOWERCASE_IDENTIFIER','VariationAccess',1,'p_VariationAccess','smi.py',1235),
+  ('CreationPart -> CREATION_REQUIRES { Cells }','CreationPart',4,'p_CreationPart','smi.py',1239),
+  ('CreationPart -> empty','CreationPart',1,'p_CreationPart','smi.py',1240),
+  ('Cells -> Cells , Cell','Cells',3,'p_Cells','smi.py',1245),
+  ('Cells -> Cell','Cells',1,'p_Cells','smi.py',1246),
+  ('Cell -> ObjectName','Cell',1,'p_Cell','smi.py',1254),
+  ('empty -> <empty>','empty',0,'p_empty','smi.py',1258),
+  ('importedKeyword -> importedSMIKeyword','importedKeyword',1,'p_importedKeyword','smi.py',1287),
+  ('importedKeyword -> BITS','importedKeyword',1,'p_importedKeyword','smi.py',1288),
+  ('importedKeyword -> INTEGER32','importedKeyword',1,'p_importedKeyword','smi.py',1289),
+  ('importedKeyword -> IPADDRESS','importedKeyword',1,'p_importedKeyword','smi.py',1290),
+  ('importedKeyword -> NETWORKADDRESS','importedKeyword',1,'p_importedKeyword','smi.py',1291),
+  ('importedKeyword -> MANDATORY_GROUPS','importedKeyword',1,'p_importedKeyword','smi.py',1292),
+  ('importedKeyword -> MODULE_COMPLIANCE','importedKeyword',1,'p_importedKeyword','smi.py',1293),
+  ('importedKeyword -> MODULE_IDENTITY','importedKeyword',1,'p_importedKeyword','smi.py',1294),
+  ('importedKeyword -> OBJECT_GROUP','importedKeyword',1,'p_importedKeyword','smi.py',1295),
+  ('importedKeyword -> OBJECT_IDENTITY','importedKeyword',1,'p_importedKeyword','smi.py',1296),
+  ('importedKeyword -> OBJECT_TYPE','importedKeyword',1,'p_importedKeyword','smi.py',1297),
+  ('importedKeyword -> OPAQUE','importedKeyword',1,'p_importedKeyword','smi.py',1298),
+  ('importedKeyword -> TEXTUAL_CONVENTION','importedKeyword',1,'p_importedKeyword','smi.py',1299),
+  ('importedKeyword -> TIMETICKS','importedKeyword',1,'p_importedKeyword','smi.py',1300),
+  ('importedKeyword -> UNSIGNED32','importedKeyword',1,'p_importedKeyword','smi.py',1301),
+  ('typeSMIandSPPI -> IPADDRESS','typeSMIandSPPI',1,'p_typeSMIandSPPI','smi.py',1307),
+  ('typeSMIandSPPI -> NETWORKADDRESS','typeSMIandSPPI',1,'p_typeSMIandSPPI','smi.py',1308),
+  ('typeSMIandSPPI -> TIMETICKS','typeSMIandSPPI',1,'p_typeSMIandSPPI','smi.py',1309),
+  ('typeSMIandSPPI -> OPAQUE','typeSMIandSPPI',1,'p_typeSMIandSPPI','smi.py',1310),
+  ('typeSMIandSPPI -> INTEGER32','typeSMIandSPPI',1,'p_typeSMIandSPPI','smi.py',1311),
+  ('typeSMIandSPPI -> UNSIGNED32','typeSMIandSPPI',1,'p_typeSMIandSPPI','smi.py',1312),
+  ('ApplicationSyntax -> IPADDRESS anySubType','ApplicationSyntax',2,'p_ApplicationSyntax','smi.py',1318),
+  ('ApplicationSyntax -> NETWORKADDRESS anySubType','ApplicationSyntax',2,'p_ApplicationSyntax','smi.py',1319),
+  ('ApplicationSyntax -> COUNTER32','ApplicationSyntax',1,'p_ApplicationSyntax','smi.py',1320),
+  ('ApplicationSyntax -> COUNTER32 integerSubType','ApplicationSyntax',2,'p_ApplicationSyntax','smi.py',1321),
+  ('ApplicationSyntax -> GAUGE32','ApplicationSyntax',1,'p_ApplicationSyntax','smi.py',1322),
+  ('ApplicationSyntax -> GAUGE32 integerSubType','ApplicationSyntax',2,'p_ApplicationSyntax','smi.py',1323),
+  ('ApplicationSyntax -> UNSIGNED32','ApplicationSyntax',1,'p_ApplicationSyntax','smi.py',1324),
+  ('ApplicationSyntax -> UNSIGNED32 integerSubType','ApplicationSyntax',2,'p_ApplicationSyntax','smi.py',1325),
+  ('ApplicationSyntax -> TIMETICKS anySubType','ApplicationSyntax',2,'p_ApplicationSyntax','smi.py',1326),
+  ('ApplicationSyntax -> OPAQUE','ApplicationSyntax',1,'p_ApplicationSyntax','smi.py',1327),
+  ('ApplicationSyntax -> OPAQUE octetStringSubType','ApplicationSyntax',2,'p_ApplicationSyntax','smi.py',1328),
+  ('ApplicationSyntax -> COUNTER64','ApplicationSyntax',1,'p_ApplicationSyntax','smi.py',1329),
+  ('ApplicationSyntax -> COUNTER64 integerSubType','ApplicationSyntax',2,'p_ApplicationSyntax','smi.py',1330),
+  ('sequenceApplicationSyntax -> IPADDRESS anySubType','sequenceApplicationSyntax',2,'p_sequenceApplicationSyntax','smi.py',1340),
+  ('sequenceApplicationSyntax -> NETWORKADDRESS anySubType','sequenceApplicationSyntax',2,'p_sequenceApplicationSyntax','smi.py',1341),
+  ('sequenceApplicationSyntax -> COUNTER32 anySubType','sequenceApplicationSyntax',2,'p_sequenceApplicationSyntax','smi.py',1342),
+  ('sequenceApplicationSyntax -> GAUGE32 anySubType','sequenceApplicationSyntax',2,'p_sequenceApplicationSyntax','smi.py',1343),
+  ('sequenceApplicationSyntax -> UNSIGNED32 anySubType','sequenceApplicationSyntax',2,'p_sequenceApplicationSyntax','smi.py',1344),
+  ('sequenceApplicationSyntax -> TIMETICKS anySubType','sequenceApplicationSyntax',2,'p_sequenceApplicationSyntax','smi.py',1345),
+  ('sequenceApplicationSyntax -> OPAQUE','sequenceApplicationSyntax',1,'p_sequenceApplicationSyntax','smi.py',1346),
+  ('sequenceApplicationSyntax -> COUNTER64 anySubType','sequenceApplicationSyntax',2,'p_sequenceApplicationSyntax','smi.py',1347),
+  ('Index -> ObjectName','Index',1,'p_Index','smi.py',1360),
+  ('Index -> typeSMIv1','Index',1,'p_Index','smi.py',1361),
+  ('typeSMIv1 -> INTEGER','typeSMIv1',1,'p_typeSMIv1','smi.py',1370),
+  ('typeSMIv1 -> OCTET STRING','typeSMIv1',2,'p_typeSMIv1','smi.py',1371),
+  ('typeSMIv1 -> IPADDRESS','typeSMIv1',1,'p_typeSMIv1','smi.py',1372),
+  ('typeSMIv1 -> NETWORKADDRESS','typeSMIv1',1,'p_typeSMIv1','smi.py',1373),
+]
@@ -0,0 +1,363 @@
+
+# parsetab_9d46d51b4691b619.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = "mibFileACCESS AGENT_CAPABILITIES APPLICATION AUGMENTS BEGIN BIN_STRING BITS CHOICE COLON_COLON_EQUAL CONTACT_INFO COUNTER32 COUNTER64 CREATION_REQUIRES DEFINITIONS DEFVAL DESCRIPTION DISPLAY_HINT DOT_DOT END ENTERPRISE EXPORTS EXTENDS FROM GAUGE32 GROUP HEX_STRING IDENTIFIER IMPLICIT IMPLIED IMPORTS INCLUDES INDEX INSTALL_ERRORS INTEGER INTEGER32 IPADDRESS LAST_UPDATED LOWERCASE_IDENTIFIER MACRO MANDATORY_GROUPS MAX MAX_ACCESS MIN_ACCESS MODULE MODULE_COMPLIANCE MODULE_IDENTITY NEGATIVENUMBER NEGATIVENUMBER64 NETWORKADDRESS NOTIFICATIONS NOTIFICATION_GROUP NOTIFICATION_TYPE NUMBER NUMBER64 OBJECT OBJECTS OBJECT_GROUP OBJECT_IDENTITY OBJECT_TYPE OCTET OF OPAQUE ORGANIZATION PIB_ACCESS PIB_DEFINITIONS PIB_INDEX PIB_MIN_ACCESS PIB_REFERENCES PIB_TAG POLICY_ACCESS PRODUCT_RELEASE QUOTED_STRING REFERENCE REVISION SEQUENCE SIZE STATUS STRING SUBJECT_CATEGORIES SUPPORTS SYNTAX TEXTUAL_CONVENTION TIMETICKS TRAP_TYPE UNIQUENESS UNITS UNIVERSAL UNSIGNED32 UPPERCASE_IDENTIFIER VALUE VARIABLES VARIATION WRITE_SYNTAXmibFile : modules\n        | emptymodules : modules module\n        | modulemodule : moduleName moduleOid DEFINITIONS COLON_COLON_EQUAL BEGIN exportsClause linkagePart declarationPart ENDmoduleOid : '{' objectIdentifier '}'\n        | emptylinkagePart : linkageClause\n        | emptylinkageClause : IMPORTS importPart ';'exportsClause : EXPORTS\n        | emptyimportPart : imports\n        | emptyimports : imports import\n        | importimport : importIdentifiers FROM moduleNameimportIdentifier : LOWERCASE_IDENTIFIER\n        | UPPERCASE_IDENTIFIER\n        | importedKeywordimportedSMIKeyword : AGENT_CAPABILITIES\n        | COUNTER32\n        | COUNTER64\n        | GAUGE32\n        | NOTIFICATION_GROUP\n        | NOTIFICATION_TYPE\n        | TRAP_TYPEmoduleName : UPPERCASE_IDENTIFIERdeclarationPart : declarations\n        | emptydeclarations : declarations declaration\n        | declarationdeclaration : typeDeclaration\n        | valueDeclaration\n        | objectIdentityClause\n        | objectTypeClause\n        | trapTypeClause\n        | notificationTypeClause\n        | moduleIdentityClause\n        | moduleComplianceClause\n        | objectGroupClause\n        | notificationGroupClause\n        | agentCapabilitiesClause\n        | macroClausemacroClause : macroName MACRO ENDmacroName : MODULE_IDENTITY\n        | OBJECT_TYPE\n        | TRAP_TYPE\n        | NOTIFICATION_TYPE\n        | OBJECT_IDENTITY\n        | TEXTUAL_CONVENTION\n        | OBJECT_GROUP\n        | NOTIFICATION_GROUP\n        | MODULE_COMPLIANCE\n        | AGENT_CAPABILITIESchoiceClause : CHOICEfuzzy_lowercase_identifier : LOWERCASE_IDENTIFIER\n        | UPPERCASE_IDENTIFIERvalueDeclaration : fuzzy_lowercase_identifier OBJECT IDENTIFIER COLON_COLON_EQUAL '{' objectIdentifier '}'typeDeclaration : typeName COLON_COLON_EQUAL typeDeclarationRHStypeName : UPPERCASE_IDENTIFIER\n        | typeSMItypeSMI : typeSMIandSPPI\n        | typeSMIonlytypeSMIonly : COUNTER32\n        | GAUGE32\n        | COUNTER64typeDeclarationRHS : Syntax\n        | TEXTUAL_CONVENTION DisplayPart STATUS Status DESCRIPTION Text ReferPart SYNTAX Syntax\n        | choiceClauseconceptualTable : SEQUENCE OF rowrow : UPPERCASE_IDENTIFIERentryType : SEQUENCE '{' sequenceItems '}'sequenceItem : LOWERCASE_IDENTIFIER sequenceSyntaxSyntax : ObjectSyntax\n        | BITS '{' NamedBits '}'sequenceSyntax : BITS\n        | UPPERCASE_IDENTIFIER anySubType\n        | sequenceObjectSyntaxNamedBits : NamedBits ',' NamedBit\n        | NamedBitNamedBit : LOWERCASE_IDENTIFIER '(' NUMBER ')'objectIdentityClause : LOWERCASE_IDENTIFIER OBJECT_IDENTITY STATUS Status DESCRIPTION Text ReferPart COLON_COLON_EQUAL '{' objectIdentifier '}'objectTypeClause : LOWERCASE_IDENTIFIER OBJECT_TYPE SYNTAX Syntax UnitsPart MaxOrPIBAccessPart STATUS Status descriptionClause ReferPart IndexPart MibIndex DefValPart COLON_COLON_EQUAL '{' ObjectName '}'descriptionClause : DESCRIPTION Text\n        | emptyVarPart : VARIABLES '{' VarTypes '}'\n        | emptyVarTypes : VarTypes ',' VarType\n        | VarTypeVarType : ObjectNameDescrPart : DESCRIPTION Text\n        | emptyMaxOrPIBAccessPart : MaxAccessPart\n        | emptyMaxAccessPart : MAX_ACCESS Access\n        | ACCESS AccessmoduleIdentityClause : LOWERCASE_IDENTIFIER MODULE_IDENTITY SubjectCategoriesPart LAST_UPDATED ExtUTCTime ORGANIZATION Text CONTACT_INFO Text DESCRIPTION Text RevisionPart COLON_COLON_EQUAL '{' objectIdentifier '}'SubjectCategoriesPart : SUBJECT_CATEGORIES '{' SubjectCategories '}'\n        | emptySubjectCategories : CategoryIDsCategoryIDs : CategoryIDs ',' CategoryID\n        | CategoryIDCategoryID : LOWERCASE_IDENTIFIER '(' NUMBER ')'\n        | LOWERCASE_IDENTIFIERObjectSyntax : SimpleSyntax\n        | conceptualTable\n        | row\n        | entryType\n        | ApplicationSyntax\n        | typeTag SimpleSyntaxtypeTag : '[' APPLICATION NUMBER ']' IMPLICIT\n        | '[' UNIVERSAL NUMBER ']' IMPLICITsequenceObjectSyntax : sequenceSimpleSyntax\n        | sequenceApplicationSyntaxvalueofObjectSyntax : valueofSimpleSyntaxSimpleSyntax : INTEGER\n        | INTEGER integerSubType\n        | INTEGER enumSpec\n        | INTEGER32\n        | INTEGER32 integerSubType\n        | UPPERCASE_IDENTIFIER enumSpec\n        | UPPERCASE_IDENTIFIER integerSubType\n        | OCTET STRING\n        | OCTET STRING octetStringSubType\n        | UPPERCASE_IDENTIFIER octetStringSubType\n        | OBJECT IDENTIFIER anySubTypevalueofSimpleSyntax : NUMBER\n        | NEGATIVENUMBER\n        | NUMBER64\n        | NEGATIVENUMBER64\n        | HEX_STRING\n        | BIN_STRING\n        | LOWERCASE_IDENTIFIER\n        | QUOTED_STRING\n        | '{' objectIdentifier_defval '}'sequenceSimpleSyntax : INTEGER anySubType\n        | INTEGER32 anySubType\n        | OCTET STRING anySubType\n        | OBJECT IDENTIFIER anySubTypeanySubType : integerSubType\n        | octetStringSubType\n        | enumSpec\n        | emptyintegerSubType : '(' ranges ')'octetStringSubType : '(' SIZE '(' ranges ')' ')'ranges : ranges '|' range\n        | rangerange : value DOT_DOT value\n        | valuevalue : NEGATIVENUMBER\n        | NUMBER\n        | NEGATIVENUMBER64\n        | NUMBER64\n        | HEX_STRING\n        | BIN_STRINGenumSpec : '{' enumItems '}'enumNumber : NUMBER\n        | NEGATIVENUMBERStatus : LOWERCASE_IDENTIFIERDisplayPart : DISPLAY_HINT Text\n        | emptyUnitsPart : UNITS Text\n        | emptyAccess : LOWERCASE_IDENTIFIERIndexPart : AUGMENTS '{' Entry '}'\n        | emptyMibIndex : INDEX '{' IndexTypes '}'\n        | emptyIndexTypes : IndexTypes ',' IndexType\n        | IndexTypeIndexType : IMPLIED Index\n        | IndexEntry : ObjectNameDefValPart : DEFVAL '{' Value '}'\n        | emptyValue : valueofObjectSyntax\n        | '{' BitsValue '}'BitsValue : BitNames\n        | emptyBitNames : BitNames ',' LOWERCASE_IDENTIFIER\n        | LOWERCASE_IDENTIFIERObjectName : objectIdentifierNotificationName : objectIdentifierReferPart : REFERENCE Text\n        | emptyRevisionPart : Revisions\n        | emptyRevisions : Revisions Revision\n        | RevisionRevision : REVISION ExtUTCTime DESCRIPTION TextNotificationObjectsPart : OBJECTS '{' Objects '}'\n        | emptyObjectGroupObjectsPart : OBJECTS '{' Objects '}'Objects : Objects ',' Object\n        | ObjectObject : ObjectNameNotificationsPart : NOTIFICATIONS '{' Notifications '}'Notifications : Notifications ',' Notification\n        | NotificationNotification : NotificationNameText : QUOTED_STRINGExtUTCTime : QUOTED_STRINGobjectIdentifier : subidentifierssubidentifiers : subidentifiers subidentifier\n        | subidentifiersubidentifier : fuzzy_lowercase_identifier\n        | NUMBER\n        | LOWERCASE_IDENTIFIER '(' NUMBER ')'objectIdentifier_defval : subidentifiers_defvalsubidentifiers_defval : subidentifiers_defval subidentifier_defval\n        | subidentifier_defvalsubidentifier_defval : LOWERCASE_IDENTIFIER '(' NUMBER ')'\n        | NUMBERobjectGroupClause : LOWERCASE_IDENTIFIER OBJECT_GROUP ObjectGroupObjectsPart STATUS Status DESCRIPTION Text ReferPart COLON_COLON_EQUAL '{' objectIdentifier '}'notificationGroupClause : LOWERCASE_IDENTIFIER NOTIFICATION_GROUP NotificationsPart STATUS Status DESCRIPTION Text ReferPart COLON_COLON_EQUAL '{' objectIdentifier '}'moduleComplianceClause : LOWERCASE_IDENTIFIER MODULE_COMPLIANCE STATUS Status DESCRIPTION Text ReferPart ComplianceModulePart COLON_COLON_EQUAL '{' objectIdentifier '}'ComplianceModulePart : ComplianceModulesComplianceModules : ComplianceModules ComplianceModule\n        | ComplianceModuleComplianceModule : MODULE ComplianceModuleName MandatoryPart CompliancePartComplianceModuleName : UPPERCASE_IDENTIFIER\n        | emptyMandatoryPart : MANDATORY_GROUPS '{' MandatoryGroups '}'\n        | emptyMandatoryGroups : MandatoryGroups ',' MandatoryGroup\n        | MandatoryGroupMandatoryGroup : objectIdentifierCompliancePart : Compliances\n        | emptyCompliances : Compliances Compliance\n        | ComplianceCompliance : ComplianceGroup\n        | ComplianceObjectComplianceGroup : GROUP objectIdentifier DESCRIPTION TextComplianceObject : OBJECT ObjectName SyntaxPart WriteSyntaxPart AccessPart DESCRIPTION TextSyntaxPart : SYNTAX Syntax\n        | emptyWriteSyntaxPart : WRITE_SYNTAX WriteSyntax\n        | emptyWriteSyntax : SyntaxAccessPart : MIN_ACCESS Access\n        | emptyagentCapabilitiesClause : LOWERCASE_IDENTIFIER AGENT_CAPABILITIES PRODUCT_RELEASE Text STATUS Status DESCRIPTION Text ReferPart ModulePart_Capabilities COLON_COLON_EQUAL '{' objectIdentifier '}'ModulePart_Capabilities : Modules_Capabilities\n        | emptyModules_Capabilities : Modules_Capabilities Module_Capabilities\n        | Module_CapabilitiesModule_Capabilities : SUPPORTS ModuleName_Capabilities INCLUDES '{' CapabilitiesGroups '}' VariationPartCapabilitiesGroups : CapabilitiesGroups ',' CapabilitiesGroup\n        | CapabilitiesGroupCapabilitiesGroup : objectIdentifierModuleName_Capabilities : UPPERCASE_IDENTIFIER objectIdentifier\n        | UPPERCASE_IDENTIFIERVariationPart : Variations\n        | emptyVariations : Variations Variation\n        | VariationVariation : VARIATION ObjectName SyntaxPart WriteSyntaxPart VariationAccessPart CreationPart DefValPart DESCRIPTION TextVariationAccessPart : ACCESS VariationAccess\n        | emptyVariationAccess : LOWERCASE_IDENTIFIERCells : Cells ',' Cell\n        | CellCell : ObjectNameempty :importedKeyword : importedSMIKeyword\n        | BITS\n        | INTEGER32\n        | IPADDRESS\n        | NETWORKADDRESS\n        | MANDATORY_GROUPS\n        | MODULE_COMPLIANCE\n        | MODULE_IDENTITY\n        | OBJECT_GROUP\n        | OBJECT_IDENTITY\n        | OBJECT_TYPE\n        | OPAQUE\n        | TEXTUAL_CONVENTION\n        | TIMETICKS\n        | UNSIGNED32typeSMIandSPPI : IPADDRESS\n        | NETWORKADDRESS\n        | TIMETICKS\n        | OPAQUE\n        | INTEGER32\n        | UNSIGNED32ApplicationSyntax : IPADDRESS anySubType\n        | NETWORKADDRESS anySubType\n        | COUNTER32\n        | COUNTER32 integerSubType\n        | GAUGE32\n        | GAUGE32 integerSubType\n        | UNSIGNED32\n        | UNSIGNED32 integerSubType\n        | TIMETICKS anySubType\n        | OPAQUE\n        | OPAQUE octetStringSubType\n        | COUNTER64\n        | COUNTER64 integerSubTypesequenceApplicationSyntax : IPADDRESS anySubType\n        | NETWORKADDRESS anySubType\n        | COUNTER32 anySubType\n        | GAUGE32 anySubType\n        | UNSIGNED32 anySubType\n        | TIMETICKS anySubType\n        | OPAQUE\n        | COUNTER64 anySubTypeIndex : ObjectName\n        | typeSMIv1typeSMIv1 : INTEGER\n        | OCTET STRING\n        | IPADDRESS\n        | NETWORKADDRESSimportIdentifiers : importIdentifiers ',' importIdentifier\n        | importIdentifier\n        | importIdentifiers ','sequenceItems : sequenceItems ',' sequenceItem\n        | sequenceItem\n        | sequenceItems ','enumItems : enumItems ',' enumItem\n        | enumItem\n        | enumItems enumItem\n        | enumItems ','enumItem : LOWERCASE_IDENTIFIER '(' enumNumber ')'\n        | UPPERCASE_IDENTIFIER '(' enumNumber ')'notificationTypeClause : fuzzy_lowercase_identifier NOTIFICATION_TYPE NotificationObjectsPart STATUS Status DESCRIPTION Text ReferPart COLON_COLON_EQUAL '{' NotificationName '}'trapTypeClause : fuzzy_lowercase_identifier TRAP_TYPE EnterprisePart VarPart DescrPart ReferPart COLON_COLON_EQUAL NUMBEREnterprisePart : ENTERPRISE objectIdentifier\n        | ENTERPRISE '{' objectIdentifier '}'CreationPart : CREATION_REQUIRES '{' Cells '}'\n        | CREATION_REQUIRES '{' '}'\n        | empty"
+    
+_lr_action_items = {'$end':([0,1,2,3,4,7,107,],[-266,0,-1,-2,-4,-3,-5,]),'UPPERCASE_IDENTIFIER':([0,2,4,6,7,9,13,14,15,16,17,18,21,23,25,26,27,28,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,77,79,107,108,109,121,122,123,124,125,126,128,129,131,132,133,134,135,136,137,138,139,140,144,145,146,147,148,149,150,151,155,160,170,171,177,179,180,182,183,184,185,186,188,189,190,192,193,194,195,196,197,198,199,200,201,202,204,212,214,222,224,241,242,246,247,248,249,252,255,259,286,289,292,293,294,298,331,348,355,374,375,376,380,398,399,403,413,418,420,433,434,439,443,444,449,450,452,464,465,466,472,473,477,483,490,491,492,498,506,509,511,516,525,529,533,537,551,562,574,581,583,607,615,],[6,6,-4,-28,-3,18,18,-206,-207,-208,-57,-58,-205,-266,-266,-11,-12,-209,62,-8,-9,83,62,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,83,-16,-5,-31,140,-10,-15,6,83,-60,-68,-70,-75,-56,-106,-107,-108,-109,-110,178,-117,-120,-72,-266,-266,-290,-292,-294,-266,-297,-299,18,140,-45,-17,-111,-118,-119,244,-121,-122,-123,-126,-124,-266,249,-288,-141,-142,-143,-144,-289,-291,-293,-295,-296,-298,-300,18,18,18,18,244,-322,-125,-127,-71,-72,302,18,18,-76,-145,-157,244,-323,-73,18,18,-321,-112,-113,-59,18,-325,-326,-328,428,-146,18,140,18,18,18,18,472,-69,-83,18,18,18,18,-327,18,-217,-215,-216,18,18,140,18,18,18,18,140,-244,18,18,18,-98,18,-84,18,18,]),'{':([5,6,130,138,140,143,144,145,149,155,157,162,166,168,178,189,207,209,302,306,307,310,311,312,313,314,315,317,365,366,406,419,425,430,431,441,454,469,475,493,496,501,512,513,602,],[9,-28,176,182,182,191,182,182,182,212,214,219,222,224,182,182,255,259,182,182,182,182,182,182,182,182,182,182,182,182,420,434,439,443,444,466,477,492,498,511,513,525,537,538,607,]),'DEFINITIONS':([5,6,8,10,20,],[-266,-28,11,-7,-6,]),'LOWERCASE_IDENTIFIER':([6,9,13,14,15,16,17,18,21,23,25,26,27,28,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,77,79,108,121,122,124,125,126,128,129,131,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,155,159,164,170,171,176,177,179,180,182,183,184,185,186,188,189,191,192,193,194,195,196,197,198,199,200,201,202,204,212,213,214,219,221,222,223,224,227,241,242,246,247,248,249,255,259,284,286,287,289,292,293,294,298,299,331,336,337,341,348,355,376,380,384,398,399,403,418,420,434,439,443,444,450,452,464,465,466,472,473,477,483,490,491,492,498,509,511,513,516,525,533,537,538,551,557,562,568,570,571,574,581,583,586,587,596,599,607,615,],[-28,17,17,-206,-207,-208,-57,-58,-205,-266,-266,-11,-12,-209,51,-8,-9,82,51,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,82,-16,-31,-10,-15,82,-60,-68,-70,-75,-56,-106,-107,-108,-109,-110,-117,-120,-72,-266,-266,-290,-292,-294,-266,-297,-299,17,215,215,-45,-17,231,-111,-118,-119,243,-121,-122,-123,-126,-124,-266,252,-288,-141,-142,-143,-144,-289,-291,-293,-295,-296,-298,-300,17,215,17,275,215,17,215,17,215,243,-322,-125,-127,-71,-72,17,17,215,-76,231,-145,-157,243,-323,-73,252,17,386,386,275,17,-321,-59,17,215,-325,-326,-328,-146,17,17,17,17,17,-69,-83,17,17,17,17,-327,17,-217,-215,-216,17,17,17,17,548,17,17,-244,17,569,17,386,17,588,-212,-214,-98,17,-84,593,-211,-213,605,17,17,]),'BITS':([6,32,77,79,109,122,124,160,171,252,433,506,529,],[-28,86,86,-16,130,-15,86,130,-17,301,130,130,130,]),'INTEGER32':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,77,79,108,109,121,122,124,125,126,128,129,131,132,133,134,135,136,137,138,139,140,144,145,146,147,148,149,150,151,160,170,171,177,179,180,183,184,185,186,188,189,192,193,194,195,196,197,198,199,200,201,202,204,246,247,248,249,252,286,289,292,298,374,375,376,403,418,433,450,452,473,483,490,491,506,529,533,574,583,],[-28,-266,-266,-11,-12,71,-8,-9,87,71,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,87,-16,-31,139,-10,-15,87,-60,-68,-70,-75,-56,-106,-107,-108,-109,-110,139,-117,-120,-72,-266,-266,-290,-292,-294,-266,-297,-299,139,-45,-17,-111,-118,-119,-121,-122,-123,-126,-124,-266,-288,-141,-142,-143,-144,-289,-291,-293,-295,-296,-298,-300,-125,-127,-71,-72,307,-76,-145,-157,-73,-112,-113,-59,-328,-146,139,-69,-83,-327,-217,-215,-216,139,139,-244,-98,-84,]),'IPADDRESS':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,77,79,108,109,121,122,124,125,126,128,129,131,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,160,170,171,177,179,180,183,184,185,186,188,189,192,193,194,195,196,197,198,199,200,201,202,204,246,247,248,249,252,286,289,292,298,376,403,418,433,450,452,473,483,490,491,498,506,516,529,533,551,574,583,],[-28,-266,-266,-11,-12,67,-8,-9,88,67,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,88,-16,-31,144,-10,-15,88,-60,-68,-70,-75,-56,-106,-107,-108,-109,-110,-117,-120,-72,-266,-266,-290,-292,-294,-266,-297,-299,144,-45,-17,-111,-118,-119,-121,-122,-123,-126,-124,-266,-288,-141,-142,-143,-144,-289,-291,-293,-295,-296,-298,-300,-125,-127,-71,-72,310,-76,-145,-157,-73,-59,-328,-146,144,-69,-83,-327,-217,-215,-216,522,144,522,144,-244,522,-98,-84,]),'NETWORKADDRESS':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,77,79,108,109,121,122,124,125,126,128,129,131,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,160,170,171,177,179,180,183,184,185,186,188,189,192,193,194,195,196,197,198,199,200,201,202,204,246,247,248,249,252,286,289,292,298,376,403,418,433,450,452,473,483,490,491,498,506,516,529,533,551,574,583,],[-28,-266,-266,-11,-12,68,-8,-9,89,68,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,89,-16,-31,145,-10,-15,89,-60,-68,-70,-75,-56,-106,-107,-108,-109,-110,-117,-120,-72,-266,-266,-290,-292,-294,-266,-297,-299,145,-45,-17,-111,-118,-119,-121,-122,-123,-126,-124,-266,-288,-141,-142,-143,-144,-289,-291,-293,-295,-296,-298,-300,-125,-127,-71,-72,311,-76,-145,-157,-73,-59,-328,-146,145,-69,-83,-327,-217,-215,-216,523,145,523,145,-244,523,-98,-84,]),'MANDATORY_GROUPS':([6,32,77,79,122,124,171,413,427,428,429,],[-28,90,90,-16,-15,90,-17,-266,441,-222,-223,]),'MODULE_COMPLIANCE':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,51,77,79,108,121,122,124,125,126,128,129,131,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,170,171,177,179,180,183,184,185,186,188,189,192,193,194,195,196,197,198,199,200,201,202,204,246,247,248,249,286,289,292,298,376,403,418,450,452,473,483,490,491,533,574,583,],[-28,-266,-266,-11,-12,57,-8,-9,91,57,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,116,91,-16,-31,-10,-15,91,-60,-68,-70,-75,-56,-106,-107,-108,-109,-110,-117,-120,-72,-266,-266,-290,-292,-294,-266,-297,-299,-45,-17,-111,-118,-119,-121,-122,-123,-126,-124,-266,-288,-141,-142,-143,-144,-289,-291,-293,-295,-296,-298,-300,-125,-127,-71,-72,-76,-145,-157,-73,-59,-328,-146,-69,-83,-327,-217,-215,-216,-244,-98,-84,]),'MODULE_IDENTITY':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,51,77,79,108,121,122,124,125,126,128,129,131,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,170,171,177,179,180,183,184,185,186,188,189,192,193,194,195,196,197,198,199,200,201,202,204,246,247,248,249,286,289,292,298,376,403,418,450,452,473,483,490,491,533,574,583,],[-28,-266,-266,-11,-12,56,-8,-9,92,56,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,115,92,-16,-31,-10,-15,92,-60,-68,-70,-75,-56,-106,-107,-108,-109,-110,-117,-120,-72,-266,-266,-290,-292,-294,-266,-297,-299,-45,-17,-111,-118,-119,-121,-122,-123,-126,-124,-266,-288,-141,-142,-143,-144,-289,-291,-293,-295,-296,-298,-300,-125,-127,-71,-72,-76,-145,-157,-73,-59,-328,-146,-69,-83,-327,-217,-215,-216,-244,-98,-84,]),'OBJECT_GROUP':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,51,77,79,108,121,122,124,125,126,128,129,131,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,170,171,177,179,180,183,184,185,186,188,189,192,193,194,195,196,197,198,199,200,201,202,204,246,247,248,249,286,289,292,298,376,403,418,450,452,473,483,490,491,533,574,583,],[-28,-266,-266,-11,-12,58,-8,-9,93,58,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,117,93,-16,-31,-10,-15,93,-60,-68,-70,-75,-56,-106,-107,-108,-109,-110,-117,-120,-72,-266,-266,-290,-292,-294,-266,-297,-299,-45,-17,-111,-118,-119,-121,-122,-123,-126,-124,-266,-288,-141,-142,-143,-144,-289,-291,-293,-295,-296,-298,-300,-125,-127,-71,-72,-76,-145,-157,-73,-59,-328,-146,-69,-83,-327,-217,-215,-216,-244,-98,-84,]),'OBJECT_IDENTITY':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,51,77,79,108,121,122,124,125,126,128,129,131,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,170,171,177,179,180,183,184,185,186,188,189,192,193,194,195,196,197,198,199,200,201,202,204,246,247,248,249,286,289,292,298,376,403,418,450,452,473,483,490,491,533,574,583,],[-28,-266,-266,-11,-12,52,-8,-9,94,52,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,113,94,-16,-31,-10,-15,94,-60,-68,-70,-75,-56,-106,-107,-108,-109,-110,-117,-120,-72,-266,-266,-290,-292,-294,-266,-297,-299,-45,-17,-111,-118,-119,-121,-122,-123,-126,-124,-266,-288,-141,-142,-143,-144,-289,-291,-293,-295,-296,-298,-300,-125,-127,-71,-72,-76,-145,-157,-73,-59,-328,-146,-69,-83,-327,-217,-215,-216,-244,-98,-84,]),'OBJECT_TYPE':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,51,77,79,108,121,122,124,125,126,128,129,131,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,170,171,177,179,180,183,184,185,186,188,189,192,193,194,195,196,197,198,199,200,201,202,204,246,247,248,249,286,289,292,298,376,403,418,450,452,473,483,490,491,533,574,583,],[-28,-266,-266,-11,-12,53,-8,-9,95,53,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,114,95,-16,-31,-10,-15,95,-60,-68,-70,-75,-56,-106,-107,-108,-109,-110,-117,-120,-72,-266,-266,-290,-292,-294,-266,-297,-299,-45,-17,-111,-118,-119,-121,-122,-123,-126,-124,-266,-288,-141,-142,-143,-144,-289,-291,-293,-295,-296,-298,-300,-125,-127,-71,-72,-76,-145,-157,-73,-59,-328,-146,-69,-83,-327,-217,-215,-216,-244,-98,-84,]),'OPAQUE':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,77,79,108,109,121,122,124,125,126,128,129,131,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,160,170,171,177,179,180,183,184,185,186,188,189,192,193,194,195,196,197,198,199,200,201,202,204,246,247,248,249,252,286,289,292,298,376,403,418,433,450,452,473,483,490,491,506,529,533,574,583,],[-28,-266,-266,-11,-12,70,-8,-9,96,70,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,96,-16,-31,150,-10,-15,96,-60,-68,-70,-75,-56,-106,-107,-108,-109,-110,-117,-120,-72,-266,-266,-290,-292,-294,-266,-297,-299,150,-45,-17,-111,-118,-119,-121,-122,-123,-126,-124,-266,-288,-141,-142,-143,-144,-289,-291,-293,-295,-296,-298,-300,-125,-127,-71,-72,316,-76,-145,-157,-73,-59,-328,-146,150,-69,-83,-327,-217,-215,-216,150,150,-244,-98,-84,]),'TEXTUAL_CONVENTION':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,77,79,108,109,121,122,124,125,126,128,129,131,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,170,171,177,179,180,183,184,185,186,188,189,192,193,194,195,196,197,198,199,200,201,202,204,246,247,248,249,286,289,292,298,376,403,418,450,452,473,483,490,491,533,574,583,],[-28,-266,-266,-11,-12,64,-8,-9,97,64,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,97,-16,-31,127,-10,-15,97,-60,-68,-70,-75,-56,-106,-107,-108,-109,-110,-117,-120,-72,-266,-266,-290,-292,-294,-266,-297,-299,-45,-17,-111,-118,-119,-121,-122,-123,-126,-124,-266,-288,-141,-142,-143,-144,-289,-291,-293,-295,-296,-298,-300,-125,-127,-71,-72,-76,-145,-157,-73,-59,-328,-146,-69,-83,-327,-217,-215,-216,-244,-98,-84,]),'TIMETICKS':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,77,79,108,109,121,122,124,125,126,128,129,131,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,160,170,171,177,179,180,183,184,185,186,188,189,192,193,194,195,196,197,198,199,200,201,202,204,246,247,248,249,252,286,289,292,298,376,403,418,433,450,452,473,483,490,491,506,529,533,574,583,],[-28,-266,-266,-11,-12,69,-8,-9,98,69,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,98,-16,-31,149,-10,-15,98,-60,-68,-70,-75,-56,-106,-107,-108,-109,-110,-117,-120,-72,-266,-266,-290,-292,-294,-266,-297,-299,149,-45,-17,-111,-118,-119,-121,-122,-123,-126,-124,-266,-288,-141,-142,-143,-144,-289,-291,-293,-295,-296,-298,-300,-125,-127,-71,-72,315,-76,-145,-157,-73,-59,-328,-146,149,-69,-83,-327,-217,-215,-216,149,149,-244,-98,-84,]),'UNSIGNED32':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,77,79,108,109,121,122,124,125,126,128,129,131,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,160,170,171,177,179,180,183,184,185,186,188,189,192,193,194,195,196,197,198,199,200,201,202,204,246,247,248,249,252,286,289,292,298,376,403,418,433,450,452,473,483,490,491,506,529,533,574,583,],[-28,-266,-266,-11,-12,72,-8,-9,99,72,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,99,-16,-31,148,-10,-15,99,-60,-68,-70,-75,-56,-106,-107,-108,-109,-110,-117,-120,-72,-266,-266,-290,-292,-294,-266,-297,-299,148,-45,-17,-111,-118,-119,-121,-122,-123,-126,-124,-266,-288,-141,-142,-143,-144,-289,-291,-293,-295,-296,-298,-300,-125,-127,-71,-72,314,-76,-145,-157,-73,-59,-328,-146,148,-69,-83,-327,-217,-215,-216,148,148,-244,-98,-84,]),'AGENT_CAPABILITIES':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,51,77,79,108,121,122,124,125,126,128,129,131,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,170,171,177,179,180,183,184,185,186,188,189,192,193,194,195,196,197,198,199,200,201,202,204,246,247,248,249,286,289,292,298,376,403,418,450,452,473,483,490,491,533,574,583,],[-28,-266,-266,-11,-12,60,-8,-9,100,60,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,119,100,-16,-31,-10,-15,100,-60,-68,-70,-75,-56,-106,-107,-108,-109,-110,-117,-120,-72,-266,-266,-290,-292,-294,-266,-297,-299,-45,-17,-111,-118,-119,-121,-122,-123,-126,-124,-266,-288,-141,-142,-143,-144,-289,-291,-293,-295,-296,-298,-300,-125,-127,-71,-72,-76,-145,-157,-73,-59,-328,-146,-69,-83,-327,-217,-215,-216,-244,-98,-84,]),'COUNTER32':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,77,79,108,109,121,122,124,125,126,128,129,131,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,160,170,171,177,179,180,183,184,185,186,188,189,192,193,194,195,196,197,198,199,200,201,202,204,246,247,248,249,252,286,289,292,298,376,403,418,433,450,452,473,483,490,491,506,529,533,574,583,],[-28,-266,-266,-11,-12,73,-8,-9,101,73,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,101,-16,-31,146,-10,-15,101,-60,-68,-70,-75,-56,-106,-107,-108,-109,-110,-117,-120,-72,-266,-266,-290,-292,-294,-266,-297,-299,146,-45,-17,-111,-118,-119,-121,-122,-123,-126,-124,-266,-288,-141,-142,-143,-144,-289,-291,-293,-295,-296,-298,-300,-125,-127,-71,-72,312,-76,-145,-157,-73,-59,-328,-146,146,-69,-83,-327,-217,-215,-216,146,146,-244,-98,-84,]),'COUNTER64':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,77,79,108,109,121,122,124,125,126,128,129,131,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,160,170,171,177,179,180,183,184,185,186,188,189,192,193,194,195,196,197,198,199,200,201,202,204,246,247,248,249,252,286,289,292,298,376,403,418,433,450,452,473,483,490,491,506,529,533,574,583,],[-28,-266,-266,-11,-12,75,-8,-9,102,75,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,102,-16,-31,151,-10,-15,102,-60,-68,-70,-75,-56,-106,-107,-108,-109,-110,-117,-120,-72,-266,-266,-290,-292,-294,-266,-297,-299,151,-45,-17,-111,-118,-119,-121,-122,-123,-126,-124,-266,-288,-141,-142,-143,-144,-289,-291,-293,-295,-296,-298,-300,-125,-127,-71,-72,317,-76,-145,-157,-73,-59,-328,-146,151,-69,-83,-327,-217,-215,-216,151,151,-244,-98,-84,]),'GAUGE32':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,77,79,108,109,121,122,124,125,126,128,129,131,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,160,170,171,177,179,180,183,184,185,186,188,189,192,193,194,195,196,197,198,199,200,201,202,204,246,247,248,249,252,286,289,292,298,376,403,418,433,450,452,473,483,490,491,506,529,533,574,583,],[-28,-266,-266,-11,-12,74,-8,-9,103,74,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,103,-16,-31,147,-10,-15,103,-60,-68,-70,-75,-56,-106,-107,-108,-109,-110,-117,-120,-72,-266,-266,-290,-292,-294,-266,-297,-299,147,-45,-17,-111,-118,-119,-121,-122,-123,-126,-124,-266,-288,-141,-142,-143,-144,-289,-291,-293,-295,-296,-298,-300,-125,-127,-71,-72,313,-76,-145,-157,-73,-59,-328,-146,147,-69,-83,-327,-217,-215,-216,147,147,-244,-98,-84,]),'NOTIFICATION_GROUP':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,51,77,79,108,121,122,124,125,126,128,129,131,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,170,171,177,179,180,183,184,185,186,188,189,192,193,194,195,196,197,198,199,200,201,202,204,246,247,248,249,286,289,292,298,376,403,418,450,452,473,483,490,491,533,574,583,],[-28,-266,-266,-11,-12,59,-8,-9,104,59,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,118,104,-16,-31,-10,-15,104,-60,-68,-70,-75,-56,-106,-107,-108,-109,-110,-117,-120,-72,-266,-266,-290,-292,-294,-266,-297,-299,-45,-17,-111,-118,-119,-121,-122,-123,-126,-124,-266,-288,-141,-142,-143,-144,-289,-291,-293,-295,-296,-298,-300,-125,-127,-71,-72,-76,-145,-157,-73,-59,-328,-146,-69,-83,-327,-217,-215,-216,-244,-98,-84,]),'NOTIFICATION_TYPE':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,50,51,62,77,79,108,121,122,124,125,126,128,129,131,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,170,171,177,179,180,183,184,185,186,188,189,192,193,194,195,196,197,198,199,200,201,202,204,246,247,248,249,286,289,292,298,376,403,418,450,452,473,483,490,491,533,574,583,],[-28,-266,-266,-11,-12,55,-8,-9,105,55,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,112,-57,-58,105,-16,-31,-10,-15,105,-60,-68,-70,-75,-56,-106,-107,-108,-109,-110,-117,-120,-72,-266,-266,-290,-292,-294,-266,-297,-299,-45,-17,-111,-118,-119,-121,-122,-123,-126,-124,-266,-288,-141,-142,-143,-144,-289,-291,-293,-295,-296,-298,-300,-125,-127,-71,-72,-76,-145,-157,-73,-59,-328,-146,-69,-83,-327,-217,-215,-216,-244,-98,-84,]),'TRAP_TYPE':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,50,51,62,77,79,108,121,122,124,125,126,128,129,131,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,170,171,177,179,180,183,184,185,186,188,189,192,193,194,195,196,197,198,199,200,201,202,204,246,247,248,249,286,289,292,298,376,403,418,450,452,473,483,490,491,533,574,583,],[-28,-266,-266,-11,-12,54,-8,-9,106,54,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,111,-57,-58,106,-16,-31,-10,-15,106,-60,-68,-70,-75,-56,-106,-107,-108,-109,-110,-117,-120,-72,-266,-266,-290,-292,-294,-266,-297,-299,-45,-17,-111,-118,-119,-121,-122,-123,-126,-124,-266,-288,-141,-142,-143,-144,-289,-291,-293,-295,-296,-298,-300,-125,-127,-71,-72,-76,-145,-157,-73,-59,-328,-146,-69,-83,-327,-217,-215,-216,-244,-98,-84,]),';':([6,32,76,77,78,79,122,171,],[-28,-266,121,-13,-14,-16,-15,-17,]),'NUMBER':([9,13,14,15,16,17,18,21,22,28,155,181,187,205,206,212,214,222,224,255,259,288,290,291,295,296,297,331,342,348,377,380,420,434,439,443,444,464,465,466,472,477,492,498,509,511,513,516,525,537,538,551,562,568,570,571,581,587,589,596,607,615,],[16,16,-206,-207,-208,-57,-58,-205,24,-209,16,236,236,253,254,16,16,16,16,16,16,352,236,236,357,357,236,16,390,16,403,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,542,16,16,16,571,16,16,571,-212,-214,16,-211,594,-213,16,16,]),'COLON_COLON_EQUAL':([11,13,14,15,16,17,18,21,28,49,62,63,65,66,67,68,69,70,71,72,73,74,75,153,154,208,210,211,215,226,256,258,321,323,324,328,332,378,379,381,383,392,393,405,407,410,411,412,413,414,415,416,421,423,426,427,428,429,432,436,437,440,442,445,446,447,448,453,455,456,458,459,460,461,462,463,470,474,476,478,479,480,481,484,495,497,502,508,524,527,550,555,561,572,577,578,579,580,590,591,613,],[19,-204,-206,-207,-208,-57,-58,-205,-209,109,-61,-62,-63,-64,-282,-283,-284,-285,-286,-287,-65,-66,-67,207,-266,-266,-88,-329,-160,-202,-266,-93,377,-186,-92,-330,-266,-185,-87,-266,406,-266,-266,419,-266,425,-218,-220,-266,430,431,-266,-266,-86,-219,-266,-222,-223,-266,-266,-85,-266,-225,469,-245,-246,-248,-266,-167,-266,-221,-229,-230,-232,-233,-234,-247,-266,-169,501,-187,-188,-190,-231,512,-176,-189,-224,-166,-235,-168,-191,-266,-175,-249,-255,-256,-258,-236,-257,-259,]),'}':([12,13,14,15,16,17,18,21,28,193,194,195,196,229,230,241,242,250,251,260,262,263,264,265,272,273,274,275,278,280,281,282,283,289,292,293,294,299,300,301,302,303,304,305,306,307,310,311,312,313,314,315,316,317,320,325,326,327,351,355,361,362,363,364,365,366,367,368,369,370,371,372,373,382,389,394,397,398,399,401,402,404,409,418,435,451,457,467,468,487,488,489,499,500,510,514,515,517,518,519,520,522,523,532,534,535,536,538,539,540,541,542,543,544,545,546,547,548,549,552,553,554,563,564,565,566,567,568,569,570,571,573,582,584,585,587,593,596,607,609,611,612,616,],[20,-204,-206,-207,-208,-57,-58,-205,-209,-141,-142,-143,-144,286,-81,292,-322,298,-319,328,330,-196,-197,-183,340,-101,-103,-105,345,347,-200,-201,-184,-145,-157,-324,-323,-320,-74,-77,-266,-79,-114,-115,-266,-266,-266,-266,-266,-266,-266,-266,-307,-266,376,379,-90,-91,-80,-321,-318,-78,-137,-138,-266,-266,-301,-302,-303,-304,-305,-306,-308,-195,-102,-199,-82,-325,-326,-139,-140,-89,-104,-146,452,473,483,490,491,508,-227,-228,524,-174,533,550,-171,-173,-309,-310,-311,-313,-314,-226,561,-251,-252,-266,572,-177,-116,-128,-129,-130,-131,-132,-133,-134,-135,-172,-312,574,583,584,585,-179,-180,-210,-182,-212,-214,-170,-250,-178,-136,-211,-181,-213,610,614,-264,-265,-263,]),'VARIABLES':([13,14,15,16,17,18,21,28,154,211,328,],[-204,-206,-207,-208,-57,-58,-205,-209,209,-329,-330,]),'DESCRIPTION':([13,14,15,16,17,18,21,28,129,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,154,177,179,180,183,184,185,186,188,189,192,193,194,195,196,197,198,199,200,201,202,204,208,210,211,215,216,220,226,246,247,248,249,261,265,271,277,279,285,286,289,292,298,328,349,379,386,407,418,424,485,486,497,503,505,507,528,530,531,556,558,559,560,572,576,592,595,597,598,600,601,603,604,605,606,610,614,],[-204,-206,-207,-208,-57,-58,-205,-209,-75,-106,-107,-108,-109,-110,-117,-120,-72,-266,-266,-290,-292,-294,-266,-297,-299,-266,-111,-118,-119,-121,-122,-123,-126,-124,-266,-288,-141,-142,-143,-144,-289,-291,-293,-295,-296,-298,-300,257,-88,-329,-160,266,276,-202,-125,-127,-71,-72,329,-183,-203,344,346,350,-76,-145,-157,-73,-330,395,-87,-165,422,-146,438,504,-266,-176,526,-266,-238,-266,-240,-237,575,-243,-239,-241,-175,-242,-266,-266,-266,-266,-261,-266,-333,-260,-262,608,-332,-331,]),'REFERENCE':([13,14,15,16,17,18,21,28,154,208,210,211,215,226,256,258,324,328,332,343,379,381,392,393,396,407,416,421,423,437,],[-204,-206,-207,-208,-57,-58,-205,-209,-266,-266,-88,-329,-160,-202,322,-93,-92,-330,322,322,-87,322,322,322,322,-266,322,322,-86,-85,]),',':([13,14,15,16,17,18,21,28,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,124,172,193,194,195,196,229,230,241,242,250,251,262,263,264,265,273,274,275,278,280,281,282,283,289,292,293,294,299,300,301,302,303,304,305,306,307,310,311,312,313,314,315,316,317,325,326,327,351,355,361,362,363,364,365,366,367,368,369,370,371,372,373,382,389,394,397,398,399,401,402,404,409,418,487,488,489,514,515,517,518,519,520,522,523,532,534,535,536,552,553,566,569,573,582,593,609,611,612,616,],[-204,-206,-207,-208,-57,-58,-205,-209,124,-316,-18,-19,-20,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-277,-278,-279,-280,-281,-21,-22,-23,-24,-25,-26,-27,-317,-315,-141,-142,-143,-144,287,-81,293,-322,299,-319,331,-196,-197,-183,341,-103,-105,331,348,-200,-201,-184,-145,-157,-324,-323,-320,-74,-77,-266,-79,-114,-115,-266,-266,-266,-266,-266,-266,-266,-266,-307,-266,380,-90,-91,-80,-321,-318,-78,-137,-138,-266,-266,-301,-302,-303,-304,-305,-306,-308,-195,-102,-199,-82,-325,-326,-139,-140,-89,-104,-146,509,-227,-228,551,-171,-173,-309,-310,-311,-313,-314,-226,562,-251,-252,-172,-312,586,-182,-170,-250,-181,615,-264,-265,-263,]),'SYNTAX':([13,14,15,16,17,18,21,28,114,226,265,323,378,396,417,486,592,],[-204,-206,-207,-208,-57,-58,-205,-209,160,-202,-183,-186,-185,-266,433,506,506,]),'WRITE_SYNTAX':([13,14,15,16,17,18,21,28,129,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,177,179,180,183,184,185,186,188,189,192,193,194,195,196,197,198,199,200,201,202,204,246,247,248,249,265,286,289,292,298,418,486,505,507,531,592,595,],[-204,-206,-207,-208,-57,-58,-205,-209,-75,-106,-107,-108,-109,-110,-117,-120,-72,-266,-266,-290,-292,-294,-266,-297,-299,-111,-118,-119,-121,-122,-123,-126,-124,-266,-288,-141,-142,-143,-144,-289,-291,-293,-295,-296,-298,-300,-125,-127,-71,-72,-183,-76,-145,-157,-73,-146,-266,529,-238,-237,-266,529,]),'MIN_ACCESS':([13,14,15,16,17,18,21,28,129,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,177,179,180,183,184,185,186,188,189,192,193,194,195,196,197,198,199,200,201,202,204,246,247,248,249,265,286,289,292,298,418,486,505,507,528,530,531,559,560,],[-204,-206,-207,-208,-57,-58,-205,-209,-75,-106,-107,-108,-109,-110,-117,-120,-72,-266,-266,-290,-292,-294,-266,-297,-299,-111,-118,-119,-121,-122,-123,-126,-124,-266,-288,-141,-142,-143,-144,-289,-291,-293,-295,-296,-298,-300,-125,-127,-71,-72,-183,-76,-145,-157,-73,-146,-266,-266,-238,557,-240,-237,-239,-241,]),'INCLUDES':([13,14,15,16,17,18,21,28,471,472,494,],[-204,-206,-207,-208,-57,-58,-205,-209,493,-254,-253,]),'ACCESS':([13,14,15,16,17,18,21,28,129,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,177,179,180,183,184,185,186,188,189,192,193,194,195,196,197,198,199,200,201,202,204,217,226,246,247,248,249,265,267,269,286,289,292,298,338,418,507,530,531,559,560,592,595,597,],[-204,-206,-207,-208,-57,-58,-205,-209,-75,-106,-107,-108,-109,-110,-117,-120,-72,-266,-266,-290,-292,-294,-266,-297,-299,-111,-118,-119,-121,-122,-123,-126,-124,-266,-288,-141,-142,-143,-144,-289,-291,-293,-295,-296,-298,-300,-266,-202,-125,-127,-71,-72,-183,337,-164,-76,-145,-157,-73,-163,-146,-238,-240,-237,-239,-241,-266,-266,599,]),'CREATION_REQUIRES':([13,14,15,16,17,18,21,28,129,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,177,179,180,183,184,185,186,188,189,192,193,194,195,196,197,198,199,200,201,202,204,246,247,248,249,265,286,289,292,298,418,507,530,531,559,560,592,595,597,598,600,604,605,],[-204,-206,-207,-208,-57,-58,-205,-209,-75,-106,-107,-108,-109,-110,-117,-120,-72,-266,-266,-290,-292,-294,-266,-297,-299,-111,-118,-119,-121,-122,-123,-126,-124,-266,-288,-141,-142,-143,-144,-289,-291,-293,-295,-296,-298,-300,-125,-127,-71,-72,-183,-76,-145,-157,-73,-146,-238,-240,-237,-239,-241,-266,-266,-266,602,-261,-260,-262,]),'DEFVAL':([13,14,15,16,17,18,21,28,129,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,177,179,180,183,184,185,186,188,189,192,193,194,195,196,197,198,199,200,201,202,204,215,226,246,247,248,249,265,286,289,292,298,323,378,407,418,421,423,436,437,453,455,474,476,507,524,530,531,550,559,560,592,595,597,598,600,601,603,604,605,610,614,],[-204,-206,-207,-208,-57,-58,-205,-209,-75,-106,-107,-108,-109,-110,-117,-120,-72,-266,-266,-290,-292,-294,-266,-297,-299,-111,-118,-119,-121,-122,-123,-126,-124,-266,-288,-141,-142,-143,-144,-289,-291,-293,-295,-296,-298,-300,-160,-202,-125,-127,-71,-72,-183,-76,-145,-157,-73,-186,-185,-266,-146,-266,-86,-266,-85,-266,-167,496,-169,-238,-166,-240,-237,-168,-239,-241,-266,-266,-266,-266,-261,496,-333,-260,-262,-332,-331,]),'(':([17,138,139,140,144,145,146,147,148,149,150,151,178,188,189,231,243,244,245,275,302,306,307,310,311,312,313,314,315,317,365,366,569,588,],[22,181,181,187,187,187,181,181,181,187,203,181,187,203,187,288,295,296,297,342,187,187,187,187,187,187,187,187,187,187,187,187,589,589,]),'BEGIN':([19,],[23,]),'EXPORTS':([23,],[26,]),'IMPORTS':([23,25,26,27,],[-266,32,-11,-12,]),'END':([23,25,26,27,29,30,31,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,108,120,121,125,126,128,129,131,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,170,177,179,180,183,184,185,186,188,189,192,193,194,195,196,197,198,199,200,201,202,204,246,247,248,249,286,289,292,298,376,403,418,450,452,473,483,490,491,533,574,583,],[-266,-266,-11,-12,-266,-8,-9,107,-29,-30,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-31,170,-10,-60,-68,-70,-75,-56,-106,-107,-108,-109,-110,-117,-120,-72,-266,-266,-290,-292,-294,-266,-297,-299,-45,-111,-118,-119,-121,-122,-123,-126,-124,-266,-288,-141,-142,-143,-144,-289,-291,-293,-295,-296,-298,-300,-125,-127,-71,-72,-76,-145,-157,-73,-59,-328,-146,-69,-83,-327,-217,-215,-216,-244,-98,-84,]),')':([24,232,233,234,235,236,237,238,239,240,352,353,354,356,357,358,359,360,390,400,594,],[28,289,-148,-150,-151,-152,-153,-154,-155,-156,397,-147,-149,398,-158,-159,399,400,409,418,596,]),'OBJECT':([50,51,62,109,137,160,226,252,374,375,413,427,428,429,433,440,442,459,461,462,463,484,506,508,527,529,590,],[110,-57,-58,142,142,142,-202,309,-112,-113,-266,-266,-222,-223,142,465,-225,465,-232,-233,-234,-231,142,-224,-235,142,-236,]),'MACRO':([52,53,54,55,56,57,58,59,60,61,64,],[-50,-47,-48,-49,-46,-54,-52,-53,-55,120,-51,]),'FROM':([80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,124,172,],[123,-316,-18,-19,-20,-267,-268,-269,-270,-271,-272,-273,-274,-275,-276,-277,-278,-279,-280,-281,-21,-22,-23,-24,-25,-26,-27,-317,-315,]),'CHOICE':([109,],[131,]),'INTEGER':([109,137,160,252,374,375,433,498,506,516,529,551,],[138,138,138,306,-112,-113,138,520,138,520,138,520,]),'OCTET':([109,137,160,252,374,375,433,498,506,516,529,551,],[141,141,141,308,-112,-113,141,521,141,521,141,521,]),'SEQUENCE':([109,160,433,506,529,],[143,143,143,143,143,]),'[':([109,160,433,506,529,],[152,152,152,152,152,]),'IDENTIFIER':([110,142,309,],[153,189,366,]),'ENTERPRISE':([111,],[155,]),'OBJECTS':([112,117,],[157,166,]),'STATUS':([112,113,116,127,129,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,156,158,165,167,173,175,177,179,180,183,184,185,186,188,189,192,193,194,195,196,197,198,199,200,201,202,204,217,225,226,228,246,247,248,249,267,269,286,289,292,298,330,333,334,335,338,345,347,385,386,387,418,],[-266,159,164,-266,-75,-106,-107,-108,-109,-110,-117,-120,-72,-266,-266,-290,-292,-294,-266,-297,-299,213,-193,221,223,227,-162,-111,-118,-119,-121,-122,-123,-126,-124,-266,-288,-141,-142,-143,-144,-289,-291,-293,-295,-296,-298,-300,-266,284,-202,-161,-125,-127,-71,-72,-266,-164,-76,-145,-157,-73,-192,384,-94,-95,-163,-194,-198,-96,-165,-97,-146,]),'SUBJECT_CATEGORIES':([115,],[162,]),'LAST_UPDATED':([115,161,163,340,],[-266,218,-100,-99,]),'NOTIFICATIONS':([118,],[168,]),'PRODUCT_RELEASE':([119,],[169,]),'DISPLAY_HINT':([127,],[174,]),'UNITS':([129,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,177,179,180,183,184,185,186,188,189,192,193,194,195,196,197,198,199,200,201,202,204,217,246,247,248,249,286,289,292,298,418,],[-75,-106,-107,-108,-109,-110,-117,-120,-72,-266,-266,-290,-292,-294,-266,-297,-299,-111,-118,-119,-121,-122,-123,-126,-124,-266,-288,-141,-142,-143,-144,-289,-291,-293,-295,-296,-298,-300,268,-125,-127,-71,-72,-76,-145,-157,-73,-146,]),'MAX_ACCESS':([129,132,133,134,135,136,138,139,140,144,145,146,147,148,149,150,151,177,179,180,183,184,185,186,188,189,192,193,194,195,196,197,198,199,200,201,202,204,217,226,246,247,248,249,267,269,286,289,292,298,338,418,],[-75,-106,-107,-108,-109,-110,-117,-120,-72,-266,-266,-290,-292,-294,-266,-297,-299,-111,-118,-119,-121,-122,-123,-126,-124,-266,-288,-141,-142,-143,-144,-289,-291,-293,-295,-296,-298,-300,-266,-202,-125,-127,-71,-72,336,-164,-76,-145,-157,-73,-163,-146,]),'STRING':([141,308,521,],[188,365,553,]),'OF':([143,],[190,]),'APPLICATION':([152,],[205,]),'UNIVERSAL':([152,],[206,]),'QUOTED_STRING':([169,174,218,257,266,268,276,322,329,339,344,346,350,395,408,422,438,482,504,513,526,575,608,],[226,226,271,226,226,226,226,226,226,226,226,226,226,226,226,226,226,271,226,549,226,226,226,]),'NEGATIVENUMBER':([181,187,290,291,295,296,297,513,],[235,235,235,235,358,358,235,543,]),'NEGATIVENUMBER64':([181,187,290,291,297,513,],[237,237,237,237,237,545,]),'NUMBER64':([181,187,290,291,297,513,],[238,238,238,238,238,544,]),'HEX_STRING':([181,187,290,291,297,513,],[239,239,239,239,239,546,]),'BIN_STRING':([181,187,290,291,297,513,],[240,240,240,240,240,547,]),'SIZE':([187,203,],[245,245,]),'AUGMENTS':([215,226,323,378,407,421,423,436,437,],[-160,-202,-186,-185,-266,-266,-86,454,-85,]),'INDEX':([215,226,323,378,407,421,423,436,437,453,455,524,],[-160,-202,-186,-185,-266,-266,-86,-266,-85,475,-167,-166,]),'MODULE':([226,323,343,378,391,411,412,413,426,427,428,429,440,442,458,459,460,461,462,463,484,508,527,590,],[-202,-186,-266,-185,413,413,-220,-266,-219,-266,-222,-223,-266,-225,-221,-229,-230,-232,-233,-234,-231,-224,-235,-236,]),'SUPPORTS':([226,323,378,416,432,446,448,470,561,577,578,579,580,591,613,],[-202,-186,-185,-266,449,449,-248,-247,-266,-249,-255,-256,-258,-257,-259,]),'CONTACT_INFO':([226,388,],[-202,408,]),'REVISION':([226,456,479,481,502,555,],[-202,482,482,-190,-189,-191,]),'GROUP':([226,413,427,428,429,440,442,459,461,462,463,484,508,527,590,],[-202,-266,-266,-222,-223,464,-225,464,-232,-233,-234,-231,-224,-235,-236,]),'VARIATION':([226,561,578,580,591,613,],[-202,581,581,-258,-257,-259,]),'|':([232,233,234,235,236,237,238,239,240,353,354,360,],[290,-148,-150,-151,-152,-153,-154,-155,-156,-147,-149,290,]),'DOT_DOT':([234,235,236,237,238,239,240,],[291,-151,-152,-153,-154,-155,-156,]),']':([253,254,],[318,319,]),'ORGANIZATION':([270,271,],[339,-203,]),'IMPLICIT':([318,319,],[374,375,]),'IMPLIED':([498,551,],[516,516,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'mibFile':([0,],[1,]),'modules':([0,],[2,]),'empty':([0,5,23,25,29,32,112,115,127,144,145,149,154,189,208,217,256,267,302,306,307,310,311,312,313,314,315,317,332,343,365,366,381,392,393,396,407,413,416,421,427,432,436,440,453,456,474,486,505,528,538,561,592,595,597,598,601,],[3,10,27,31,35,78,158,163,175,196,196,196,210,196,258,269,323,335,196,196,196,196,196,196,196,196,196,196,323,323,196,196,323,323,323,323,423,429,323,323,442,447,455,460,476,480,497,507,530,558,567,579,507,530,600,603,497,]),'module':([0,2,],[4,7,]),'moduleName':([0,2,123,],[5,5,171,]),'moduleOid':([5,],[8,]),'objectIdentifier':([9,155,212,214,222,224,255,259,331,348,380,420,434,439,443,444,464,465,466,472,477,492,498,509,511,516,525,537,551,562,581,607,615,],[12,211,260,265,265,283,320,265,265,283,265,435,283,457,467,468,485,265,489,494,265,510,265,489,536,265,554,265,265,536,265,265,265,]),'subidentifiers':([9,155,212,214,222,224,255,259,331,348,380,420,434,439,443,444,464,465,466,472,477,492,498,509,511,516,525,537,551,562,581,607,615,],[13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,]),'subidentifier':([9,13,155,212,214,222,224,255,259,331,348,380,420,434,439,443,444,464,465,466,472,477,492,498,509,511,516,525,537,551,562,581,607,615,],[14,21,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,]),'fuzzy_lowercase_identifier':([9,13,29,34,155,212,214,222,224,255,259,331,348,380,420,434,439,443,444,464,465,466,472,477,492,498,509,511,516,525,537,551,562,581,607,615,],[15,15,50,50,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,]),'exportsClause':([23,],[25,]),'linkagePart':([25,],[29,]),'linkageClause':([25,],[30,]),'declarationPart':([29,],[33,]),'declarations':([29,],[34,]),'declaration':([29,34,],[36,108,]),'typeDeclaration':([29,34,],[37,37,]),'valueDeclaration':([29,34,],[38,38,]),'objectIdentityClause':([29,34,],[39,39,]),'objectTypeClause':([29,34,],[40,40,]),'trapTypeClause':([29,34,],[41,41,]),'notificationTypeClause':([29,34,],[42,42,]),'moduleIdentityClause':([29,34,],[43,43,]),'moduleComplianceClause':([29,34,],[44,44,]),'objectGroupClause':([29,34,],[45,45,]),'notificationGroupClause':([29,34,],[46,46,]),'agentCapabilitiesClause':([29,34,],[47,47,]),'macroClause':([29,34,],[48,48,]),'typeName':([29,34,],[49,49,]),'macroName':([29,34,],[61,61,]),'typeSMI':([29,34,],[63,63,]),'typeSMIandSPPI':([29,34,],[65,65,]),'typeSMIonly':([29,34,],[66,66,]),'importPart':([32,],[76,]),'imports':([32,],[77,]),'import':([32,77,],[79,122,]),'importIdentifiers':([32,77,],[80,80,]),'importIdentifier':([32,77,124,],[81,81,172,]),'importedKeyword':([32,77,124,],[84,84,84,]),'importedSMIKeyword':([32,77,124,],[85,85,85,]),'typeDeclarationRHS':([109,],[125,]),'Syntax':([109,160,433,506,529,],[126,217,450,531,560,]),'choiceClause':([109,],[128,]),'ObjectSyntax':([109,160,433,506,529,],[129,129,129,129,129,]),'SimpleSyntax':([109,137,160,433,506,529,],[132,177,132,132,132,132,]),'conceptualTable':([109,160,433,506,529,],[133,133,133,133,133,]),'row':([109,160,190,433,506,529,],[134,134,248,134,134,134,]),'entryType':([109,160,433,506,529,],[135,135,135,135,135,]),'ApplicationSyntax':([109,160,433,506,529,],[136,136,136,136,136,]),'typeTag':([109,160,433,506,529,],[137,137,137,137,137,]),'EnterprisePart':([111,],[154,]),'NotificationObjectsPart':([112,],[156,]),'SubjectCategoriesPart':([115,],[161,]),'ObjectGroupObjectsPart':([117,],[165,]),'NotificationsPart':([118,],[167,]),'DisplayPart':([127,],[173,]),'integerSubType':([138,139,140,144,145,146,147,148,149,151,178,189,302,306,307,310,311,312,313,314,315,317,365,366,],[179,183,185,193,193,198,199,200,193,204,185,193,193,193,193,193,193,193,193,193,193,193,193,193,]),'enumSpec':([138,140,144,145,149,178,189,302,306,307,310,311,312,313,314,315,317,365,366,],[180,184,195,195,195,184,195,195,195,195,195,195,195,195,195,195,195,195,195,]),'octetStringSubType':([140,144,145,149,150,178,188,189,302,306,307,310,311,312,313,314,315,317,365,366,],[186,194,194,194,202,186,246,194,194,194,194,194,194,194,194,194,194,194,194,194,]),'anySubType':([144,145,149,189,302,306,307,310,311,312,313,314,315,317,365,366,],[192,197,201,247,362,363,364,367,368,369,370,371,372,373,401,402,]),'VarPart':([154,],[208,]),'Status':([159,164,213,221,223,227,284,384,],[216,220,261,277,279,285,349,407,]),'Text':([169,174,257,266,268,276,322,329,339,344,346,350,395,408,422,438,504,526,575,608,],[225,228,324,332,338,343,378,381,388,392,393,396,416,424,437,456,527,555,590,613,]),'NamedBits':([176,],[229,]),'NamedBit':([176,287,],[230,351,]),'ranges':([181,187,297,],[232,232,360,]),'range':([181,187,290,297,],[233,233,353,233,]),'value':([181,187,290,291,297,],[234,234,234,354,234,]),'enumItems':([182,],[241,]),'enumItem':([182,241,293,],[242,294,355,]),'sequenceItems':([191,],[250,]),'sequenceItem':([191,299,],[251,361,]),'DescrPart':([208,],[256,]),'Objects':([214,222,],[262,278,]),'Object':([214,222,331,],[263,263,382,]),'ObjectName':([214,222,259,331,380,465,477,498,516,537,551,581,607,615,],[264,264,327,264,327,486,500,518,518,563,518,592,612,612,]),'UnitsPart':([217,],[267,]),'ExtUTCTime':([218,482,],[270,503,]),'SubjectCategories':([219,],[272,]),'CategoryIDs':([219,],[273,]),'CategoryID':([219,341,],[274,389,]),'Notifications':([224,],[280,]),'Notification':([224,348,],[281,394,]),'NotificationName':([224,348,434,],[282,282,451,]),'sequenceSyntax':([252,],[300,]),'sequenceObjectSyntax':([252,],[303,]),'sequenceSimpleSyntax':([252,],[304,]),'sequenceApplicationSyntax':([252,],[305,]),'ReferPart':([256,332,343,381,392,393,396,416,421,],[321,383,391,405,414,415,417,432,436,]),'VarTypes':([259,],[325,]),'VarType':([259,380,],[326,404,]),'MaxOrPIBAccessPart':([267,],[333,]),'MaxAccessPart':([267,],[334,]),'enumNumber':([295,296,],[356,359,]),'Access':([336,337,557,],[385,387,576,]),'ComplianceModulePart':([391,],[410,]),'ComplianceModules':([391,],[411,]),'ComplianceModule':([391,411,],[412,426,]),'descriptionClause':([407,],[421,]),'ComplianceModuleName':([413,],[427,]),'MandatoryPart':([427,],[440,]),'ModulePart_Capabilities':([432,],[445,]),'Modules_Capabilities':([432,],[446,]),'Module_Capabilities':([432,446,],[448,470,]),'IndexPart':([436,],[453,]),'CompliancePart':([440,],[458,]),'Compliances':([440,],[459,]),'Compliance':([440,459,],[461,484,]),'ComplianceGroup':([440,459,],[462,462,]),'ComplianceObject':([440,459,],[463,463,]),'ModuleName_Capabilities':([449,],[471,]),'MibIndex':([453,],[474,]),'RevisionPart':([456,],[478,]),'Revisions':([456,],[479,]),'Revision':([456,479,],[481,502,]),'MandatoryGroups':([466,],[487,]),'MandatoryGroup':([466,509,],[488,532,]),'DefValPart':([474,601,],[495,606,]),'Entry':([477,],[499,]),'SyntaxPart':([486,592,],[505,595,]),'IndexTypes':([498,],[514,]),'IndexType':([498,551,],[515,573,]),'Index':([498,516,551,],[517,552,517,]),'typeSMIv1':([498,516,551,],[519,519,519,]),'WriteSyntaxPart':([505,595,],[528,597,]),'CapabilitiesGroups':([511,],[534,]),'CapabilitiesGroup':([511,562,],[535,582,]),'Value':([513,],[539,]),'valueofObjectSyntax':([513,],[540,]),'valueofSimpleSyntax':([513,],[541,]),'AccessPart':([528,],[556,]),'WriteSyntax':([529,],[559,]),'BitsValue':([538,],[564,]),'objectIdentifier_defval':([538,],[565,]),'BitNames':([538,],[566,]),'subidentifiers_defval':([538,],[568,]),'subidentifier_defval':([538,568,],[570,587,]),'VariationPart':([561,],[577,]),'Variations':([561,],[578,]),'Variation':([561,578,],[580,591,]),'VariationAccessPart':([597,],[598,]),'CreationPart':([598,],[601,]),'VariationAccess':([599,],[604,]),'Cells':([607,],[609,]),'Cell':([607,615,],[611,616,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> mibFile","S'",1,None,None,None),
+  ('mibFile -> modules','mibFile',1,'p_mibFile','smi.py',179),
+  ('mibFile -> empty','mibFile',1,'p_mibFile','smi.py',180),
+  ('modules -> modules module','modules',2,'p_modules','smi.py',184),
+  ('modules -> module','modules',1,'p_modules','smi.py',185),
+  ('module -> moduleName moduleOid DEFINITIONS COLON_COLON_EQUAL BEGIN exportsClause linkagePart declarationPart END','module',9,'p_module','smi.py',193),
+  ('moduleOid -> { objectIdentifier }','moduleOid',3,'p_moduleOid','smi.py',202),
+  ('moduleOid -> empty','moduleOid',1,'p_moduleOid','smi.py',203),
+  ('linkagePart -> linkageClause','linkagePart',1,'p_linkagePart','smi.py',209),
+  ('linkagePart -> empty','linkagePart',1,'p_linkagePart','smi.py',210),
+  ('linkageClause -> IMPORTS importPart ;','linkageClause',3,'p_linkageClause','smi.py',215),
+  ('exportsClause -> EXPORTS','exportsClause',1,'p_exportsClause','smi.py',219),
+  ('exportsClause -> empty','exportsClause',1,'p_exportsClause','smi.py',220),
+  ('importPart -> imports','importPart',1,'p_importPart','smi.py',223),
+  ('importPart -> empty','importPart',1,'p_importPart','smi.py',224),
+  ('imports -> imports import','imports',2,'p_imports','smi.py',238),
+  ('imports -> import','imports',1,'p_imports','smi.py',239),
+  ('import -> importIdentifiers FROM moduleName','import',3,'p_import','smi.py',247),
+  ('importIdentifier -> LOWERCASE_IDENTIFIER','importIdentifier',1,'p_importIdentifier','smi.py',263),
+  ('importIdentifier -> UPPERCASE_IDENTIFIER','importIdentifier',1,'p_importIdentifier','smi.py',264),
+  ('importIdentifier -> importedKeyword','importIdentifier',1,'p_importIdentifier','smi.py',265),
+  ('importedSMIKeyword -> AGENT_CAPABILITIES','importedSMIKeyword',1,'p_importedSMIKeyword','smi.py',286),
+  ('importedSMIKeyword -> COUNTER32','importedSMIKeyword',1,'p_importedSMIKeyword','smi.py',287),
+  ('importedSMIKeyword -> COUNTER64','importedSMIKeyword',1,'p_importedSMIKeyword','smi.py',288),
+  ('importedSMIKeyword -> GAUGE32','importedSMIKeyword',1,'p_importedSMIKeyword','smi.py',289),
+  ('importedSMIKeyword -> NOTIFICATION_GROUP','importedSMIKeyword',1,'p_importedSMIKeyword','smi.py',290),
+  ('importedSMIKeyword -> NOTIFICATION_TYPE','importedSMIKeyword',1,'p_importedSMIKeyword','smi.py',291),
+  ('importedSMIKeyword -> TRAP_TYPE','importedSMIKeyword',1,'p_importedSMIKeyword','smi.py',292),
+  ('moduleName -> UPPERCASE_IDENTIFIER','moduleName',1,'p_moduleName','smi.py',296),
+  ('declarationPart -> declarations','declarationPart',1,'p_declarationPart','smi.py',300),
+  ('declarationPart -> empty','declarationPart',1,'p_declarationPart','smi.py',301),
+  ('declarations -> declarations declaration','declarations',2,'p_declarations','smi.py',306),
+  ('declarations -> declaration','declarations',1,'p_declarations','smi.py',307),
+  ('declaration -> typeDeclaration','declaration',1,'p_declaration','smi.py',315),
+  ('declaration -> valueDeclaration','declaration',1,'p_declaration','smi.py',316),
+  ('declaration -> objectIdentityClause','declaration',1,'p_declaration','smi.py',317),
+  ('declaration -> objectTypeClause','declaration',1,'p_declaration','smi.py',318),
+  ('declaration -> trapTypeClause','declaration',1,'p_declaration','smi.py',319),
+  ('declaration -> notificationTypeClause','declaration',1,'p_declaration','smi.py',320),
+  ('declaration -> moduleIdentityClause','declaration',1,'p_declaration','smi.py',321),
+  ('declaration -> moduleComplianceClause','declaration',1,'p_declaration','smi.py',322),
+  ('declaration -> objectGroupClause','declaration',1,'p_declaration','smi.py',323),
+  ('declaration -> notificationGroupClause','declaration',1,'p_declaration','smi.py',324),
+  ('declaration -> agentCapabilitiesClause','declaration',1,'p_declaration','smi.py',325),
+  ('declaration -> macroClause','declaration',1,'p_declaration','smi.py',326),
+  ('macroClause -> macroName MACRO END','macroClause',3,'p_macroClause','smi.py',331),
+  ('macroName -> MODULE_IDENTITY','macroName',1,'p_macroName','smi.py',334),
+  ('macroName -> OBJECT_TYPE','macroName',1,'p_macroName','smi.py',335),
+  ('macroName -> TRAP_TYPE','macroName',1,'p_macroName','smi.py',336),
+  ('macroName -> NOTIFICATION_TYPE','macroName',1,'p_macroName','smi.py',337),
+  ('macroName -> OBJECT_IDENTITY','macroName',1,'p_macroName','smi.py',338),
+  ('macroName -> TEXTUAL_CONVENTION','macroName',1,'p_macroName','smi.py',339),
+  ('macroName -> OBJECT_GROUP','macroName',1,'p_macroName','smi.py',340),
+  ('macroName -> NOTIFICATION_GROUP','macroName',1,'p_macroName','smi.py',341),
+  ('macroName -> MODULE_COMPLIANCE','macroName',1,'p_macroName','smi.py',342),
+  ('macroName -> AGENT_CAPABILITIES','macroName',1,'p_macroName','smi.py',343),
+  ('choiceClause -> CHOICE','choiceClause',1,'p_choiceClause','smi.py',346),
+  ('fuzzy_lowercase_identifier -> LOWERCASE_IDENTIFIER','fuzzy_lowercase_identifier',1,'p_fuzzy_lowercase_identifier','smi.py',350),
+  ('fuzzy_lowercase_identifier -> UPPERCASE_IDENTIFIER','fuzzy_lowercase_identifier',1,'p_fuzzy_lowercase_identifier','smi.py',351),
+  ('valueDeclaration -> fuzzy_lowercase_identifier OBJECT IDENTIFIER COLON_COLON_EQUAL { objectIdentifier }','valueDeclaration',7,'p_valueDeclaration','smi.py',355),
+  ('typeDeclaration -> typeName COLON_COLON_EQUAL typeDeclarationRHS','typeDeclaration',3,'p_typeDeclaration','smi.py',359),
+  ('typeName -> UPPERCASE_IDENTIFIER','typeName',1,'p_typeName','smi.py',363),
+  ('typeName -> typeSMI','typeName',1,'p_typeName','smi.py',364),
+  ('typeSMI -> typeSMIandSPPI','typeSMI',1,'p_typeSMI','smi.py',368),
+  ('typeSMI -> typeSMIonly','typeSMI',1,'p_typeSMI','smi.py',369),
+  ('typeSMIonly -> COUNTER32','typeSMIonly',1,'p_typeSMIonly','smi.py',381),
+  ('typeSMIonly -> GAUGE32','typeSMIonly',1,'p_typeSMIonly','smi.py',382),
+  ('typeSMIonly -> COUNTER64','typeSMIonly',1,'p_typeSMIonly','smi.py',383),
+  ('typeDeclarationRHS -> Syntax','typeDeclarationRHS',1,'p_typeDeclarationRHS','smi.py',387),
+  ('typeDeclarationRHS -> TEXTUAL_CONVENTION DisplayPart STATUS Status DESCRIPTION Text ReferPart SYNTAX Syntax','typeDeclarationRHS',9,'p_typeDeclarationRHS','smi.py',388),
+  ('typeDeclarationRHS -> choiceClause','typeDeclarationRHS',1,'p_typeDeclarationRHS','smi.py',389),
+  ('conceptualTable -> SEQUENCE OF row','conceptualTable',3,'p_conceptualTable','smi.py',405),
+  ('row -> UPPERCASE_IDENTIFIER','row',1,'p_row','smi.py',409),
+  ('entryType -> SEQUENCE { sequenceItems }','entryType',4,'p_entryType','smi.py',414),
+  ('sequenceItem -> LOWERCASE_IDENTIFIER sequenceSyntax','sequenceItem',2,'p_sequenceItem','smi.py',428),
+  ('Syntax -> ObjectSyntax','Syntax',1,'p_Syntax','smi.py',432),
+  ('Syntax -> BITS { NamedBits }','Syntax',4,'p_Syntax','smi.py',433),
+  ('sequenceSyntax -> BITS','sequenceSyntax',1,'p_sequenceSyntax','smi.py',443),
+  ('sequenceSyntax -> UPPERCASE_IDENTIFIER anySubType','sequenceSyntax',2,'p_sequenceSyntax','smi.py',444),
+  ('sequenceSyntax -> sequenceObjectSyntax','sequenceSyntax',1,'p_sequenceSyntax','smi.py',445),
+  ('NamedBits -> NamedBits , NamedBit','NamedBits',3,'p_NamedBits','smi.py',449),
+  ('NamedBits -> NamedBit','NamedBits',1,'p_NamedBits','smi.py',450),
+  ('NamedBit -> LOWERCASE_IDENTIFIER ( NUMBER )','NamedBit',4,'p_NamedBit','smi.py',458),
+  ('objectIdentityClause -> LOWERCASE_IDENTIFIER OBJECT_IDENTITY STATUS Status DESCRIPTION Text ReferPart COLON_COLON_EQUAL { objectIdentifier }','objectIdentityClause',11,'p_objectIdentityClause','smi.py',462),
+  ('objectTypeClause -> LOWERCASE_IDENTIFIER OBJECT_TYPE SYNTAX Syntax UnitsPart MaxOrPIBAccessPart STATUS Status descriptionClause ReferPart IndexPart MibIndex DefValPart COLON_COLON_EQUAL { ObjectName }','objectTypeClause',17,'p_objectTypeClause','smi.py',474),
+  ('descriptionClause -> DESCRIPTION Text','descriptionClause',2,'p_descriptionClause','smi.py',492),
+  ('descriptionClause -> empty','descriptionClause',1,'p_descriptionClause','smi.py',493),
+  ('VarPart -> VARIABLES { VarTypes }','VarPart',4,'p_VarPart','smi.py',512),
+  ('VarPart -> empty','VarPart',1,'p_VarPart','smi.py',513),
+  ('VarTypes -> VarTypes , VarType','VarTypes',3,'p_VarTypes','smi.py',517),
+  ('VarTypes -> VarType','VarTypes',1,'p_VarTypes','smi.py',518),
+  ('VarType -> ObjectName','VarType',1,'p_VarType','smi.py',526),
+  ('DescrPart -> DESCRIPTION Text','DescrPart',2,'p_DescrPart','smi.py',530),
+  ('DescrPart -> empty','DescrPart',1,'p_DescrPart','smi.py',531),
+  ('MaxOrPIBAccessPart -> MaxAccessPart','MaxOrPIBAccessPart',1,'p_MaxOrPIBAccessPart','smi.py',536),
+  ('MaxOrPIBAccessPart -> empty','MaxOrPIBAccessPart',1,'p_MaxOrPIBAccessPart','smi.py',537),
+  ('MaxAccessPart -> MAX_ACCESS Access','MaxAccessPart',2,'p_MaxAccessPart','smi.py',542),
+  ('MaxAccessPart -> ACCESS Access','MaxAccessPart',2,'p_MaxAccessPart','smi.py',543),
+  ('moduleIdentityClause -> LOWERCASE_IDENTIFIER MODULE_IDENTITY SubjectCategoriesPart LAST_UPDATED ExtUTCTime ORGANIZATION Text CONTACT_INFO Text DESCRIPTION Text RevisionPart COLON_COLON_EQUAL { objectIdentifier }','moduleIdentityClause',16,'p_moduleIdentityClause','smi.py',560),
+  ('SubjectCategoriesPart -> SUBJECT_CATEGORIES { SubjectCategories }','SubjectCategoriesPart',4,'p_SubjectCategoriesPart','smi.py',577),
+  ('SubjectCategoriesPart -> empty','SubjectCategoriesPart',1,'p_SubjectCategoriesPart','smi.py',578),
+  ('SubjectCategories -> CategoryIDs','SubjectCategories',1,'p_SubjectCategories','smi.py',583),
+  ('CategoryIDs -> CategoryIDs , CategoryID','CategoryIDs',3,'p_CategoryIDs','smi.py',587),
+  ('CategoryIDs -> CategoryID','CategoryIDs',1,'p_CategoryIDs','smi.py',588),
+  ('CategoryID -> LOWERCASE_IDENTIFIER ( NUMBER )','CategoryID',4,'p_CategoryID','smi.py',596),
+  ('CategoryID -> LOWERCASE_IDENTIFIER','CategoryID',1,'p_CategoryID','smi.py',597),
+  ('ObjectSyntax -> SimpleSyntax','ObjectSyntax',1,'p_ObjectSyntax','smi.py',607),
+  ('ObjectSyntax -> conceptualTable','ObjectSyntax',1,'p_ObjectSyntax','smi.py',608),
+  ('ObjectSyntax -> row','ObjectSyntax',1,'p_ObjectSyntax','smi.py',609),
+  ('ObjectSyntax -> entryType','ObjectSyntax',1,'p_ObjectSyntax','smi.py',610),
+  ('ObjectSyntax -> ApplicationSyntax','ObjectSyntax',1,'p_ObjectSyntax','smi.py',611),
+  ('ObjectSyntax -> typeTag SimpleSyntax','ObjectSyntax',2,'p_ObjectSyntax','smi.py',612),
+  ('typeTag -> [ APPLICATION NUMBER ] IMPLICIT','typeTag',5,'p_typeTag','smi.py',620),
+  ('typeTag -> [ UNIVERSAL NUMBER ] IMPLICIT','typeTag',5,'p_typeTag','smi.py',621),
+  ('sequenceObjectSyntax -> sequenceSimpleSyntax','sequenceObjectSyntax',1,'p_sequenceObjectSyntax','smi.py',624),
+  ('sequenceObjectSyntax -> sequenceApplicationSyntax','sequenceObjectSyntax',1,'p_sequenceObjectSyntax','smi.py',625),
+  ('valueofObjectSyntax -> valueofSimpleSyntax','valueofObjectSyntax',1,'p_valueofObjectSyntax','smi.py',630),
+  ('SimpleSyntax -> INTEGER','SimpleSyntax',1,'p_SimpleSyntax','smi.py',634),
+  ('SimpleSyntax -> INTEGER integerSubType','SimpleSyntax',2,'p_SimpleSyntax','smi.py',635),
+  ('SimpleSyntax -> INTEGER enumSpec','SimpleSyntax',2,'p_SimpleSyntax','smi.py',636),
+  ('SimpleSyntax -> INTEGER32','SimpleSyntax',1,'p_SimpleSyntax','smi.py',637),
+  ('SimpleSyntax -> INTEGER32 integerSubType','SimpleSyntax',2,'p_SimpleSyntax','smi.py',638),
+  ('SimpleSyntax -> UPPERCASE_IDENTIFIER enumSpec','SimpleSyntax',2,'p_SimpleSyntax','smi.py',639),
+  ('SimpleSyntax -> UPPERCASE_IDENTIFIER integerSubType','SimpleSyntax',2,'p_SimpleSyntax','smi.py',640),
+  ('SimpleSyntax -> OCTET STRING','SimpleSyntax',2,'p_SimpleSyntax','smi.py',641),
+  ('SimpleSyntax -> OCTET STRING octetStringSubType','SimpleSyntax',3,'p_SimpleSyntax','smi.py',642),
+  ('SimpleSyntax -> UPPERCASE_IDENTIFIER octetStringSubType','SimpleSyntax',2,'p_SimpleSyntax','smi.py',643),
+  ('SimpleSyntax -> OBJECT IDENTIFIER anySubType','SimpleSyntax',3,'p_SimpleSyntax','smi.py',644),
+  ('valueofSimpleSyntax -> NUMBER','valueofSimpleSyntax',1,'p_valueofSimpleSyntax','smi.py',659),
+  ('valueofSimpleSyntax -> NEGATIVENUMBER','valueofSimpleSyntax',1,'p_valueofSimpleSyntax','smi.py',660),
+  ('valueofSimpleSyntax -> NUMBER64','valueofSimpleSyntax',1,'p_valueofSimpleSyntax','smi.py',661),
+  ('valueofSimpleSyntax -> NEGATIVENUMBER64','valueofSimpleSyntax',1,'p_valueofSimpleSyntax','smi.py',662),
+  ('valueofSimpleSyntax -> HEX_STRING','valueofSimpleSyntax',1,'p_valueofSimpleSyntax','smi.py',663),
+  ('valueofSimpleSyntax -> BIN_STRING','valueofSimpleSyntax',1,'p_valueofSimpleSyntax','smi.py',664),
+  ('valueofSimpleSyntax -> LOWERCASE_IDENTIFIER','valueofSimpleSyntax',1,'p_valueofSimpleSyntax','smi.py',665),
+  ('valueofSimpleSyntax -> QUOTED_STRING','valueofSimpleSyntax',1,'p_valueofSimpleSyntax','smi.py',666),
+  ('valueofSimpleSyntax -> { objectIdentifier_defval }','valueofSimpleSyntax',3,'p_valueofSimpleSyntax','smi.py',667),
+  ('sequenceSimpleSyntax -> INTEGER anySubType','sequenceSimpleSyntax',2,'p_sequenceSimpleSyntax','smi.py',680),
+  ('sequenceSimpleSyntax -> INTEGER32 anySubType','sequenceSimpleSyntax',2,'p_sequenceSimpleSyntax','smi.py',681),
+  ('sequenceSimpleSyntax -> OCTET STRING anySubType','sequenceSimpleSyntax',3,'p_sequenceSimpleSyntax','smi.py',682),
+  ('sequenceSimpleSyntax -> OBJECT IDENTIFIER anySubType','sequenceSimpleSyntax',3,'p_sequenceSimpleSyntax','smi.py',683),
+  ('anySubType -> integerSubType','anySubType',1,'p_anySubType','smi.py',725),
+  ('anySubType -> octetStringSubType','anySubType',1,'p_anySubType','smi.py',726),
+  ('anySubType -> enumSpec','anySubType',1,'p_anySubType','smi.py',727),
+  ('anySubType -> empty','anySubType',1,'p_anySubType','smi.py',728),
+  ('integerSubType -> ( ranges )','integerSubType',3,'p_integerSubType','smi.py',733),
+  ('octetStringSubType -> ( SIZE ( ranges ) )','octetStringSubType',6,'p_octetStringSubType','smi.py',737),
+  ('ranges -> ranges | range','ranges',3,'p_ranges','smi.py',741),
+  ('ranges -> range','ranges',1,'p_ranges','smi.py',742),
+  ('range -> value DOT_DOT value','range',3,'p_range','smi.py',750),
+  ('range -> value','range',1,'p_range','smi.py',751),
+  ('value -> NEGATIVENUMBER','value',1,'p_value','smi.py',759),
+  ('value -> NUMBER','value',1,'p_value','smi.py',760),
+  ('value -> NEGATIVENUMBER64','value',1,'p_value','smi.py',761),
+  ('value -> NUMBER64','value',1,'p_value','smi.py',762),
+  ('value -> HEX_STRING','value',1,'p_value','smi.py',763),
+  ('value -> BIN_STRING','value',1,'p_value','smi.py',764),
+  ('enumSpec -> { enumItems }','enumSpec',3,'p_enumSpec','smi.py',768),
+  ('enumNumber -> NUMBER','enumNumber',1,'p_enumNumber','smi.py',785),
+  ('enumNumber -> NEGATIVENUMBER','enumNumber',1,'p_enumNumber','smi.py',786),
+  ('Status -> LOWERCASE_IDENTIFIER','Status',1,'p_Status','smi.py',791),
+  ('DisplayPart -> DISPLAY_HINT Text','DisplayPart',2,'p_DisplayPart','smi.py',795),
+  ('DisplayPart -> empty','DisplayPart',1,'p_DisplayPart','smi.py',796),
+  ('UnitsPart -> UNITS Text','UnitsPart',2,'p_UnitsPart','smi.py',801),
+  ('UnitsPart -> empty','UnitsPart',1,'p_UnitsPart','smi.py',802),
+  ('Access -> LOWERCASE_IDENTIFIER','Access',1,'p_Access','smi.py',807),
+  ('IndexPart -> AUGMENTS { Entry }','IndexPart',4,'p_IndexPart','smi.py',811),
+  ('IndexPart -> empty','IndexPart',1,'p_IndexPart','smi.py',812),
+  ('MibIndex -> INDEX { IndexTypes }','MibIndex',4,'p_MibIndex','smi.py',817),
+  ('MibIndex -> empty','MibIndex',1,'p_MibIndex','smi.py',818),
+  ('IndexTypes -> IndexTypes , IndexType','IndexTypes',3,'p_IndexTypes','smi.py',823),
+  ('IndexTypes -> IndexType','IndexTypes',1,'p_IndexTypes','smi.py',824),
+  ('IndexType -> IMPLIED Index','IndexType',2,'p_IndexType','smi.py',832),
+  ('IndexType -> Index','IndexType',1,'p_IndexType','smi.py',833),
+  ('Entry -> ObjectName','Entry',1,'p_Entry','smi.py',847),
+  ('DefValPart -> DEFVAL { Value }','DefValPart',4,'p_DefValPart','smi.py',851),
+  ('DefValPart -> empty','DefValPart',1,'p_DefValPart','smi.py',852),
+  ('Value -> valueofObjectSyntax','Value',1,'p_Value','smi.py',857),
+  ('Value -> { BitsValue }','Value',3,'p_Value','smi.py',858),
+  ('BitsValue -> BitNames','BitsValue',1,'p_BitsValue','smi.py',866),
+  ('BitsValue -> empty','BitsValue',1,'p_BitsValue','smi.py',867),
+  ('BitNames -> BitNames , LOWERCASE_IDENTIFIER','BitNames',3,'p_BitNames','smi.py',871),
+  ('BitNames -> LOWERCASE_IDENTIFIER','BitNames',1,'p_BitNames','smi.py',872),
+  ('ObjectName -> objectIdentifier','ObjectName',1,'p_ObjectName','smi.py',880),
+  ('NotificationName -> objectIdentifier','NotificationName',1,'p_NotificationName','smi.py',884),
+  ('ReferPart -> REFERENCE Text','ReferPart',2,'p_ReferPart','smi.py',888),
+  ('ReferPart -> empty','ReferPart',1,'p_ReferPart','smi.py',889),
+  ('RevisionPart -> Revisions','RevisionPart',1,'p_RevisionPart','smi.py',894),
+  ('RevisionPart -> empty','RevisionPart',1,'p_RevisionPart','smi.py',895),
+  ('Revisions -> Revisions Revision','Revisions',2,'p_Revisions','smi.py',900),
+  ('Revisions -> Revision','Revisions',1,'p_Revisions','smi.py',901),
+  ('Revision -> REVISION ExtUTCTime DESCRIPTION Text','Revision',4,'p_Revision','smi.py',909),
+  ('NotificationObjectsPart -> OBJECTS { Objects }','NotificationObjectsPart',4,'p_NotificationObjectsPart','smi.py',913),
+  ('NotificationObjectsPart -> empty','NotificationObjectsPart',1,'p_NotificationObjectsPart','smi.py',914),
+  ('ObjectGroupObjectsPart -> OBJECTS { Objects }','ObjectGroupObjectsPart',4,'p_ObjectGroupObjectsPart','smi.py',918),
+  ('Objects -> Objects , Object','Objects',3,'p_Objects','smi.py',922),
+  ('Objects -> Object','Objects',1,'p_Objects','smi.py',923),
+  ('Object -> ObjectName','Object',1,'p_Object','smi.py',931),
+  ('NotificationsPart -> NOTIFICATIONS { Notifications }','NotificationsPart',4,'p_NotificationsPart','smi.py',935),
+  ('Notifications -> Notifications , Notification','Notifications',3,'p_Notifications','smi.py',939),
+  ('Notifications -> Notification','Notifications',1,'p_Notifications','smi.py',940),
+  ('Notification -> NotificationName','Notification',1,'p_Notification','smi.py',948),
+  ('Text -> QUOTED_STRING','Text',1,'p_Text','smi.py',952),
+  ('ExtUTCTime -> QUOTED_STRING','ExtUTCTime',1,'p_ExtUTCTime','smi.py',956),
+  ('objectIdentifier -> subidentifiers','objectIdentifier',1,'p_objectIdentifier','smi.py',960),
+  ('subidentifiers -> subidentifiers subidentifier','subidentifiers',2,'p_subidentifiers','smi.py',964),
+  ('subidentifiers -> subidentifier','subidentifiers',1,'p_subidentifiers','smi.py',965),
+  ('subidentifier -> fuzzy_lowercase_identifier','subidentifier',1,'p_subidentifier','smi.py',973),
+  ('subidentifier -> NUMBER','subidentifier',1,'p_subidentifier','smi.py',974),
+  ('subidentifier -> LOWERCASE_IDENTIFIER ( NUMBER )','subidentifier',4,'p_subidentifier','smi.py',975),
+  ('objectIdentifier_defval -> subidentifiers_defval','objectIdentifier_defval',1,'p_objectIdentifier_defval','smi.py',985),
+  ('subidentifiers_defval -> subidentifiers_defval subidentifier_defval','subidentifiers_defval',2,'p_subidentifiers_defval','smi.py',989),
+  ('subidentifiers_defval -> subidentifier_defval','subidentifiers_defval',1,'p_subidentifiers_defval','smi.py',990),
+  ('subidentifier_defval -> LOWERCASE_IDENTIFIER ( NUMBER )','subidentifier_defval',4,'p_subidentifier_defval','smi.py',998),
+  ('subidentifier_defval -> NUMBER','subidentifier_defval',1,'p_subidentifier_defval','smi.py',999),
+  ('objectGroupClause -> LOWERCASE_IDENTIFIER OBJECT_GROUP ObjectGroupObjectsPart STATUS Status DESCRIPTION Text ReferPart COLON_COLON_EQUAL { objectIdentifier }','objectGroupClause',12,'p_objectGroupClause','smi.py',1007),
+  ('notificationGroupClause -> LOWERCASE_IDENTIFIER NOTIFICATION_GROUP NotificationsPart STATUS Status DESCRIPTION Text ReferPart COLON_COLON_EQUAL { objectIdentifier }','notificationGroupClause',12,'p_notificationGroupClause','smi.py',1019),
+  ('moduleComplianceClause -> LOWERCASE_IDENTIFIER MODULE_COMPLIANCE STATUS Status DESCRIPTION Text ReferPart ComplianceModulePart COLON_COLON_EQUAL { objectIdentifier }','moduleComplianceClause',12,'p_moduleComplianceClause','smi.py',1031),
+  ('ComplianceModulePart -> ComplianceModules','ComplianceModulePart',1,'p_ComplianceModulePart','smi.py',1044),
+  ('ComplianceModules -> ComplianceModules ComplianceModule','ComplianceModules',2,'p_ComplianceModules','smi.py',1048),
+  ('ComplianceModules -> ComplianceModule','ComplianceModules',1,'p_ComplianceModules','smi.py',1049),
+  ('ComplianceModule -> MODULE ComplianceModuleName MandatoryPart CompliancePart','ComplianceModule',4,'p_ComplianceModule','smi.py',1057),
+  ('ComplianceModuleName -> UPPERCASE_IDENTIFIER','ComplianceModuleName',1,'p_ComplianceModuleName','smi.py',1063),
+  ('ComplianceModuleName -> empty','ComplianceModuleName',1,'p_ComplianceModuleName','smi.py',1064),
+  ('MandatoryPart -> MANDATORY_GROUPS { MandatoryGroups }','MandatoryPart',4,'p_MandatoryPart','smi.py',1069),
+  ('MandatoryPart -> empty','MandatoryPart',1,'p_MandatoryPart','smi.py',1070),
+  ('MandatoryGroups -> MandatoryGroups , MandatoryGroup','MandatoryGroups',3,'p_MandatoryGroups','smi.py',1075),
+  ('MandatoryGroups -> MandatoryGroup','MandatoryGroups',1,'p_MandatoryGroups','smi.py',1076),
+  ('MandatoryGroup -> objectIdentifier','MandatoryGroup',1,'p_MandatoryGroup','smi.py',1084),
+  ('CompliancePart -> Compliances','CompliancePart',1,'p_CompliancePart','smi.py',1088),
+  ('CompliancePart -> empty','CompliancePart',1,'p_CompliancePart','smi.py',1089),
+  ('Compliances -> Compliances Compliance','Compliances',2,'p_Compliances','smi.py',1094),
+  ('Compliances -> Compliance','Compliances',1,'p_Compliances','smi.py',1095),
+  ('Compliance -> ComplianceGroup','Compliance',1,'p_Compliance','smi.py',1103),
+  ('Compliance -> ComplianceObject','Compliance',1,'p_Compliance','smi.py',1104),
+  ('ComplianceGroup -> GROUP objectIdentifier DESCRIPTION Text','ComplianceGroup',4,'p_ComplianceGroup','smi.py',1109),
+  ('ComplianceObject -> OBJECT ObjectName SyntaxPart WriteSyntaxPart AccessPart DESCRIPTION Text','ComplianceObject',7,'p_ComplianceObject','smi.py',1115),
+  ('SyntaxPart -> SYNTAX Syntax','SyntaxPart',2,'p_SyntaxPart','smi.py',1124),
+  ('SyntaxPart -> empty','SyntaxPart',1,'p_SyntaxPart','smi.py',1125),
+  ('WriteSyntaxPart -> WRITE_SYNTAX WriteSyntax','WriteSyntaxPart',2,'p_WriteSyntaxPart','smi.py',1130),
+  ('WriteSyntaxPart -> empty','WriteSyntaxPart',1,'p_WriteSyntaxPart','smi.py',1131),
+  ('WriteSyntax -> Syntax','WriteSyntax',1,'p_WriteSyntax','smi.py',1136),
+  ('AccessPart -> MIN_ACCESS Access','AccessPart',2,'p_AccessPart','smi.py',1140),
+  ('AccessPart -> empty','AccessPart',1,'p_AccessPart','smi.py',1141),
+  ('agentCapabilitiesClause -> LOWERCASE_IDENTIFIER AGENT_CAPABILITIES PRODUCT_RELEASE Text STATUS Status DESCRIPTION Text ReferPart ModulePart_Capabilities COLON_COLON_EQUAL { objectIdentifier }','agentCapabilitiesClause',14,'p_agentCapabilitiesClause','smi.py',1146),
+  ('ModulePart_Capabilities -> Modules_Capabilities','ModulePart_Capabilities',1,'p_ModulePart_Capabilities','smi.py',1160),
+  ('ModulePart_Capabilities -> empty','ModulePart_Capabilities',1,'p_ModulePart_Capabilities','smi.py',1161),
+  ('Modules_Capabilities -> Modules_Capabilities Module_Capabilities','Modules_Capabilities',2,'p_Modules_Capabilities','smi.py',1166),
+  ('Modules_Capabilities -> Module_Capabilities','Modules_Capabilities',1,'p_Modules_Capabilities','smi.py',1167),
+  ('Module_Capabilities -> SUPPORTS ModuleName_Capabilities INCLUDES { CapabilitiesGroups } VariationPart','Module_Capabilities',7,'p_Module_Capabilities','smi.py',1175),
+  ('CapabilitiesGroups -> CapabilitiesGroups , CapabilitiesGroup','CapabilitiesGroups',3,'p_CapabilitiesGroups','smi.py',1181),
+  ('CapabilitiesGroups -> CapabilitiesGroup','CapabilitiesGroups',1,'p_CapabilitiesGroups','smi.py',1182),
+  ('CapabilitiesGroup -> objectIdentifier','CapabilitiesGroup',1,'p_CapabilitiesGroup','smi.py',1190),
+  ('ModuleName_Capabilities -> UPPERCASE_IDENTIFIER objectIdentifier','ModuleName_Capabilities',2,'p_ModuleName_Capabilities','smi.py',1194),
+  ('ModuleName_Capabilities -> UPPERCASE_IDENTIFIER','ModuleName_Capabilities',1,'p_ModuleName_Capabilities','smi.py',1195),
+  ('VariationPart -> Variations','VariationPart',1,'p_VariationPart','smi.py',1203),
+  ('VariationPart -> empty','VariationPart',1,'p_VariationPart','smi.py',1204),
+  ('Variations -> Variations Variation','Variations',2,'p_Variations','smi.py',1209),
+  ('Variations -> Variation','Variations',1,'p_Variations','smi.py',1210),
+  ('Variation -> VARIATION ObjectName SyntaxPart WriteSyntaxPart VariationAccessPart CreationPart DefValPart DESCRIPTION Text','Variation',9,'p_Variation','smi.py',1218),
+  ('VariationAccessPart -> ACCESS VariationAccess','VariationAccessPart',2,'p_VariationAccessPart','smi.py',1229),
+  ('VariationAccessPart -> empty','VariationAccessPart',1,'p_VariationAccessPart','smi.py',1230),
+  ('VariationAccess -> LOWERCASE_IDENTIFIER','VariationAccess',1,'p_VariationAccess','smi.py',1235),
+  ('Cells -> Cells , Cell','Cells',3,'p_Cells','smi.py',1245),
+  ('Cells -> Cell','Cells',1,'p_Cells','smi.py',1246),
+  ('Cell -> ObjectName','Cell',1,'p_Cell','smi.py',1254),
+  ('empty -> <empty>','empty',0,'p_empty','smi.py',1258),
+  ('importedKeyword -> importedSMIKeyword','importedKeyword',1,'p_importedKeyword','smi.py',1287),
+  ('importedKeyword -> BITS','importedKeyword',1,'p_importedKeyword','smi.py',1288),
+  ('importedKeyword -> INTEGER32','importedKeyword',1,'p_importedKeyword','smi.py',1289),
+  ('importedKeyword -> IPADDRESS','importedKeyword',1,'p_importedKeyword','smi.py',1290),
+  ('importedKeyword -> NETWORKADDRESS','importedKeyword',1,'p_importedKeyword','smi.py',1291),
+  ('importedKeyword -> MANDATORY_GROUPS','importedKeyword',1,'p_importedKeyword','smi.py',1292),
+  ('importedKeyword -> MODULE_COMPLIANCE','importedKeyword',1,'p_importedKeyword','smi.py',1293),
+  ('importedKeyword -> MODULE_IDENTITY','importedKeyword',1,'p_importedKeyword','smi.py',1294),
+  ('importedKeyword -> OBJECT_GROUP','importedKeyword',1,'p_importedKeyword','smi.py',1295),
+  ('importedKeyword -> OBJECT_IDENTITY','importedKeyword',1,'p_importedKeyword','smi.py',1296),
+  ('importedKeyword -> OBJECT_TYPE','importedKeyword',1,'p_importedKeyword','smi.py',1297),
+  ('importedKeyword -> OPAQUE','importedKeyword',1,'p_importedKeyword','smi.py',1298),
+  ('importedKeyword -> TEXTUAL_CONVENTION','importedKeyword',1,'p_importedKeyword','smi.py',1299),
+  ('importedKeyword -> TIMETICKS','importedKeyword',1,'p_importedKeyword','smi.py',1300),
+  ('importedKeyword -> UNSIGNED32','importedKeyword',1,'p_importedKeyword','smi.py',1301),
+  ('typeSMIandSPPI -> IPADDRESS','typeSMIandSPPI',1,'p_typeSMIandSPPI','smi.py',1307),
+  ('typeSMIandSPPI -> NETWORKADDRESS','typeSMIandSPPI',1,'p_typeSMIandSPPI','smi.py',1308),
+  ('typeSMIandSPPI -> TIMETICKS','typeSMIandSPPI',1,'p_typeSMIandSPPI','smi.py',1309),
+  ('typeSMIandSPPI -> OPAQUE','typeSMIandSPPI',1,'p_typeSMIandSPPI','smi.py',1310),
+  ('typeSMIandSPPI -> INTEGER32','typeSMIandSPPI',1,'p_typeSMIandSPPI','smi.py',1311),
+  ('typeSMIandSPPI -> UNSIGNED32','typeSMIandSPPI',1,'p_typeSMIandSPPI','smi.py',1312),
+  ('ApplicationSyntax -> IPADDRESS anySubType','ApplicationSyntax',2,'p_ApplicationSyntax','smi.py',1318),
+  ('ApplicationSyntax -> NETWORKADDRESS anySubType','ApplicationSyntax',2,'p_ApplicationSyntax','smi.py',1319),
+  ('ApplicationSyntax -> COUNTER32','ApplicationSyntax',1,'p_ApplicationSyntax','smi.py',1320),
+  ('ApplicationSyntax -> COUNTER32 integerSubType','ApplicationSyntax',2,'p_ApplicationSyntax','smi.py',1321),
+  ('ApplicationSyntax -> GAUGE32','ApplicationSyntax',1,'p_ApplicationSyntax','smi.py',1322),
+  ('ApplicationSyntax -> GAUGE32 integerSubType','ApplicationSyntax',2,'p_ApplicationSyntax','smi.py',1323),
+  ('ApplicationSyntax -> UNSIGNED32','ApplicationSyntax',1,'p_ApplicationSyntax','smi.py',1324),
+  ('ApplicationSyntax -> UNSIGNED32 integerSubType','ApplicationSyntax',2,'p_ApplicationSyntax','smi.py',1325),
+  ('ApplicationSyntax -> TIMETICKS anySubType','ApplicationSyntax',2,'p_ApplicationSyntax','smi.py',1326),
+  ('ApplicationSyntax -> OPAQUE','ApplicationSyntax',1,'p_ApplicationSyntax','smi.py',1327),
+  ('ApplicationSyntax -> OPAQUE octetStringSubType','ApplicationSyntax',2,'p_ApplicationSyntax','smi.py',1328),
+  ('ApplicationSyntax -> COUNTER64','ApplicationSyntax',1,'p_ApplicationSyntax','smi.py',1329),
+  ('ApplicationSyntax -> COUNTER64 integerSubType','ApplicationSyntax',2,'p_ApplicationSyntax','smi.py',1330),
+  ('sequenceApplicationSyntax -> IPADDRESS anySubType','sequenceApplicationSyntax',2,'p_sequenceApplicationSyntax','smi.py',1340),
+  ('sequenceApplicationSyntax -> NETWORKADDRESS anySubType','sequenceApplicationSyntax',2,'p_sequenceApplicationSyntax','smi.py',1341),
+  ('sequenceApplicationSyntax -> COUNTER32 anySubType','sequenceApplicationSyntax',2,'p_sequenceApplicationSyntax','smi.py',1342),
+  ('sequenceApplicationSyntax -> GAUGE32 anySubType','sequenceApplicationSyntax',2,'p_sequenceApplicationSyntax','smi.py',1343),
+  ('sequenceApplicationSyntax -> UNSIGNED32 anySubType','sequenceApplicationSyntax',2,'p_sequenceApplicationSyntax','smi.py',1344),
+  ('sequenceApplicationSyntax -> TIMETICKS anySubType','sequenceApplicationSyntax',2,'p_sequenceApplicationSyntax','smi.py',1345),
+  ('sequenceApplicationSyntax -> OPAQUE','sequenceApplicationSyntax',1,'p_sequenceApplicationSyntax','smi.py',1346),
+  ('sequenceApplicationSyntax -> COUNTER64 anySubType','sequenceApplicationSyntax',2,'p_sequenceApplicationSyntax','smi.py',1347),
+  ('Index -> ObjectName','Index',1,'p_Index','smi.py',1360),
+  ('Index -> typeSMIv1','Index',1,'p_Index','smi.py',1361),
+  ('typeSMIv1 -> INTEGER','typeSMIv1',1,'p_typeSMIv1','smi.py',1370),
+  ('typeSMIv1 -> OCTET STRING','typeSMIv1',2,'p_typeSMIv1','smi.py',1371),
+  ('typeSMIv1 -> IPADDRESS','typeSMIv1',1,'p_typeSMIv1','smi.py',1372),
+  ('typeSMIv1 -> NETWORKADDRESS','typeSMIv1',1,'p_typeSMIv1','smi.py',1373),
+  ('importIdentifiers -> importIdentifiers , importIdentifier','importIdentifiers',3,'p_importIdentifiers','smi.py',1389),
+  ('importIdentifiers -> importIdentifier','importIdentifiers',1,'p_importIdentifiers','smi.py',1390),
+  ('importIdentifiers -> importIdentifiers ,','importIdentifiers',2,'p_importIdentifiers','smi.py',1391),
+  ('sequenceItems -> sequenceItems , sequenceItem','sequenceItems',3,'p_sequenceItems','smi.py',1406),
+  ('sequenceItems -> sequenceItem','sequenceItems',1,'p_sequenceItems','smi.py',1407),
+  ('sequenceItems -> sequenceItems ,','sequenceItems',2,'p_sequenceItems','smi.py',1408),
+  ('enumItems -> enumItems , enumItem','enumItems',3,'p_enumItems','smi.py',1424),
+  ('enumItems -> enumItem','enumItems',1,'p_enumItems','smi.py',1425),
+  ('enumItems -> enumItems enumItem','enumItems',2,'p_enumItems','smi.py',1426),
+  ('enumItems -> enumItems ,','enumItems',2,'p_enumItems','smi.py',1427),
+  ('enumItem -> LOWERCASE_IDENTIFIER ( enumNumber )','enumItem',4,'p_enumItem','smi.py',1445),
+  ('enumItem -> UPPERCASE_IDENTIFIER ( enumNumber )','enumItem',4,'p_enumItem','smi.py',1446),
+  ('notificationTypeClause -> fuzzy_lowercase_identifier NOTIFICATION_TYPE NotificationObjectsPart STATUS Status DESCRIPTION Text ReferPart COLON_COLON_EQUAL { NotificationName }','notificationTypeClause',12,'p_notificationTypeClause','smi.py',1455),
+  ('trapTypeClause -> fuzzy_lowercase_identifier TRAP_TYPE EnterprisePart VarPart DescrPart ReferPart COLON_COLON_EQUAL NUMBER','trapTypeClause',8,'p_trapTypeClause','smi.py',1473),
+  ('EnterprisePart -> ENTERPRISE objectIdentifier','EnterprisePart',2,'p_EnterprisePart','smi.py',1488),
+  ('EnterprisePart -> ENTERPRISE { objectIdentifier }','EnterprisePart',4,'p_EnterprisePart','smi.py',1489),
+  ('CreationPart -> CREATION_REQUIRES { Cells }','CreationPart',4,'p_CreationPart','smi.py',1502),
+  ('CreationPart -> CREATION_REQUIRES { }','CreationPart',3,'p_CreationPart','smi.py',1503),
+  ('CreationPart -> empty','CreationPart',1,'p_CreationPart','smi.py',1504),
+]
@@ -0,0 +1,346 @@
+
+# parsetab_bda7ec23a17f1b42.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = "mibFileACCESS AGENT_CAPABILITIES APPLICATION AUGMENTS BEGIN BIN_STRING BITS CHOICE COLON_COLON_EQUAL CONTACT_INFO COUNTER32 COUNTER64 CREATION_REQUIRES DEFINITIONS DEFVAL DESCRIPTION DISPLAY_HINT DOT_DOT END ENTERPRISE EXPORTS EXTENDS FROM GAUGE32 GROUP HEX_STRING IDENTIFIER IMPLICIT IMPLIED IMPORTS INCLUDES INDEX INSTALL_ERRORS INTEGER INTEGER32 IPADDRESS LAST_UPDATED LOWERCASE_IDENTIFIER MACRO MANDATORY_GROUPS MAX_ACCESS MIN_ACCESS MODULE MODULE_COMPLIANCE MODULE_IDENTITY NEGATIVENUMBER NEGATIVENUMBER64 NOTIFICATIONS NOTIFICATION_GROUP NOTIFICATION_TYPE NUMBER NUMBER64 OBJECT OBJECTS OBJECT_GROUP OBJECT_IDENTITY OBJECT_TYPE OCTET OF OPAQUE ORGANIZATION PIB_ACCESS PIB_DEFINITIONS PIB_INDEX PIB_MIN_ACCESS PIB_REFERENCES PIB_TAG POLICY_ACCESS PRODUCT_RELEASE QUOTED_STRING REFERENCE REVISION SEQUENCE SIZE STATUS STRING SUBJECT_CATEGORIES SUPPORTS SYNTAX TEXTUAL_CONVENTION TIMETICKS TRAP_TYPE UNIQUENESS UNITS UNIVERSAL UNSIGNED32 UPPERCASE_IDENTIFIER VALUE VARIABLES VARIATION WRITE_SYNTAXmibFile : modules\n        | emptymodules : modules module\n        | modulemodule : moduleName moduleOid DEFINITIONS COLON_COLON_EQUAL BEGIN exportsClause linkagePart declarationPart ENDmoduleOid : '{' objectIdentifier '}'\n        | emptylinkagePart : linkageClause\n        | emptylinkageClause : IMPORTS importPart ';'exportsClause : EXPORTS\n        | emptyimportPart : imports\n        | emptyimports : imports import\n        | importimport : importIdentifiers FROM moduleNameimportIdentifiers : importIdentifiers ',' importIdentifier\n        | importIdentifierimportIdentifier : LOWERCASE_IDENTIFIER\n        | UPPERCASE_IDENTIFIER\n        | importedKeywordimportedKeyword : importedSMIKeyword\n        | BITS\n        | INTEGER32\n        | IPADDRESS\n        | MANDATORY_GROUPS\n        | MODULE_COMPLIANCE\n        | MODULE_IDENTITY\n        | OBJECT_GROUP\n        | OBJECT_IDENTITY\n        | OBJECT_TYPE\n        | OPAQUE\n        | TEXTUAL_CONVENTION\n        | TIMETICKS\n        | UNSIGNED32importedSMIKeyword : AGENT_CAPABILITIES\n        | COUNTER32\n        | COUNTER64\n        | GAUGE32\n        | NOTIFICATION_GROUP\n        | NOTIFICATION_TYPE\n        | TRAP_TYPEmoduleName : UPPERCASE_IDENTIFIERdeclarationPart : declarations\n        | emptydeclarations : declarations declaration\n        | declarationdeclaration : typeDeclaration\n        | valueDeclaration\n        | objectIdentityClause\n        | objectTypeClause\n        | trapTypeClause\n        | notificationTypeClause\n        | moduleIdentityClause\n        | moduleComplianceClause\n        | objectGroupClause\n        | notificationGroupClause\n        | agentCapabilitiesClause\n        | macroClausemacroClause : macroName MACRO ENDmacroName : MODULE_IDENTITY\n        | OBJECT_TYPE\n        | TRAP_TYPE\n        | NOTIFICATION_TYPE\n        | OBJECT_IDENTITY\n        | TEXTUAL_CONVENTION\n        | OBJECT_GROUP\n        | NOTIFICATION_GROUP\n        | MODULE_COMPLIANCE\n        | AGENT_CAPABILITIESchoiceClause : CHOICEfuzzy_lowercase_identifier : LOWERCASE_IDENTIFIER\n        | UPPERCASE_IDENTIFIERvalueDeclaration : fuzzy_lowercase_identifier OBJECT IDENTIFIER COLON_COLON_EQUAL '{' objectIdentifier '}'typeDeclaration : typeName COLON_COLON_EQUAL typeDeclarationRHStypeName : UPPERCASE_IDENTIFIER\n        | typeSMItypeSMI : typeSMIandSPPI\n        | typeSMIonlytypeSMIandSPPI : IPADDRESS\n        | TIMETICKS\n        | OPAQUE\n        | INTEGER32\n        | UNSIGNED32typeSMIonly : COUNTER32\n        | GAUGE32\n        | COUNTER64typeDeclarationRHS : Syntax\n        | TEXTUAL_CONVENTION DisplayPart STATUS Status DESCRIPTION Text ReferPart SYNTAX Syntax\n        | choiceClauseconceptualTable : SEQUENCE OF rowrow : UPPERCASE_IDENTIFIERentryType : SEQUENCE '{' sequenceItems '}'sequenceItems : sequenceItems ',' sequenceItem\n        | sequenceItemsequenceItem : LOWERCASE_IDENTIFIER sequenceSyntaxSyntax : ObjectSyntax\n        | BITS '{' NamedBits '}'sequenceSyntax : BITS\n        | UPPERCASE_IDENTIFIER anySubType\n        | sequenceObjectSyntaxNamedBits : NamedBits ',' NamedBit\n        | NamedBitNamedBit : LOWERCASE_IDENTIFIER '(' NUMBER ')'objectIdentityClause : LOWERCASE_IDENTIFIER OBJECT_IDENTITY STATUS Status DESCRIPTION Text ReferPart COLON_COLON_EQUAL '{' objectIdentifier '}'objectTypeClause : LOWERCASE_IDENTIFIER OBJECT_TYPE SYNTAX Syntax UnitsPart MaxOrPIBAccessPart STATUS Status descriptionClause ReferPart IndexPart MibIndex DefValPart COLON_COLON_EQUAL '{' ObjectName '}'descriptionClause : DESCRIPTION Text\n        | emptytrapTypeClause : fuzzy_lowercase_identifier TRAP_TYPE ENTERPRISE objectIdentifier VarPart DescrPart ReferPart COLON_COLON_EQUAL NUMBERVarPart : VARIABLES '{' VarTypes '}'\n        | emptyVarTypes : VarTypes ',' VarType\n        | VarTypeVarType : ObjectNameDescrPart : DESCRIPTION Text\n        | emptyMaxOrPIBAccessPart : MaxAccessPart\n        | emptyMaxAccessPart : MAX_ACCESS Access\n        | ACCESS AccessnotificationTypeClause : LOWERCASE_IDENTIFIER NOTIFICATION_TYPE NotificationObjectsPart STATUS Status DESCRIPTION Text ReferPart COLON_COLON_EQUAL '{' NotificationName '}'moduleIdentityClause : LOWERCASE_IDENTIFIER MODULE_IDENTITY SubjectCategoriesPart LAST_UPDATED ExtUTCTime ORGANIZATION Text CONTACT_INFO Text DESCRIPTION Text RevisionPart COLON_COLON_EQUAL '{' objectIdentifier '}'SubjectCategoriesPart : SUBJECT_CATEGORIES '{' SubjectCategories '}'\n        | emptySubjectCategories : CategoryIDsCategoryIDs : CategoryIDs ',' CategoryID\n        | CategoryIDCategoryID : LOWERCASE_IDENTIFIER '(' NUMBER ')'\n        | LOWERCASE_IDENTIFIERObjectSyntax : SimpleSyntax\n        | conceptualTable\n        | row\n        | entryType\n        | ApplicationSyntax\n        | typeTag SimpleSyntaxtypeTag : '[' APPLICATION NUMBER ']' IMPLICIT\n        | '[' UNIVERSAL NUMBER ']' IMPLICITsequenceObjectSyntax : sequenceSimpleSyntax\n        | sequenceApplicationSyntaxvalueofObjectSyntax : valueofSimpleSyntaxSimpleSyntax : INTEGER\n        | INTEGER integerSubType\n        | INTEGER enumSpec\n        | INTEGER32\n        | INTEGER32 integerSubType\n        | UPPERCASE_IDENTIFIER enumSpec\n        | UPPERCASE_IDENTIFIER integerSubType\n        | OCTET STRING\n        | OCTET STRING octetStringSubType\n        | UPPERCASE_IDENTIFIER octetStringSubType\n        | OBJECT IDENTIFIER anySubTypevalueofSimpleSyntax : NUMBER\n        | NEGATIVENUMBER\n        | NUMBER64\n        | NEGATIVENUMBER64\n        | HEX_STRING\n        | BIN_STRING\n        | LOWERCASE_IDENTIFIER\n        | QUOTED_STRING\n        | '{' objectIdentifier_defval '}'sequenceSimpleSyntax : INTEGER anySubType\n        | INTEGER32 anySubType\n        | OCTET STRING anySubType\n        | OBJECT IDENTIFIER anySubTypeApplicationSyntax : IPADDRESS anySubType\n        | COUNTER32\n        | COUNTER32 integerSubType\n        | GAUGE32\n        | GAUGE32 integerSubType\n        | UNSIGNED32\n        | UNSIGNED32 integerSubType\n        | TIMETICKS anySubType\n        | OPAQUE\n        | OPAQUE octetStringSubType\n        | COUNTER64\n        | COUNTER64 integerSubTypesequenceApplicationSyntax : IPADDRESS anySubType\n        | COUNTER32 anySubType\n        | GAUGE32 anySubType\n        | UNSIGNED32 anySubType\n        | TIMETICKS anySubType\n        | OPAQUE\n        | COUNTER64 anySubTypeanySubType : integerSubType\n        | octetStringSubType\n        | enumSpec\n        | emptyintegerSubType : '(' ranges ')'octetStringSubType : '(' SIZE '(' ranges ')' ')'ranges : ranges '|' range\n        | rangerange : value DOT_DOT value\n        | valuevalue : NEGATIVENUMBER\n        | NUMBER\n        | NEGATIVENUMBER64\n        | NUMBER64\n        | HEX_STRING\n        | BIN_STRINGenumSpec : '{' enumItems '}'enumItems : enumItems ',' enumItem\n        | enumItemenumItem : LOWERCASE_IDENTIFIER '(' enumNumber ')'enumNumber : NUMBER\n        | NEGATIVENUMBERStatus : LOWERCASE_IDENTIFIERDisplayPart : DISPLAY_HINT Text\n        | emptyUnitsPart : UNITS Text\n        | emptyAccess : LOWERCASE_IDENTIFIERIndexPart : AUGMENTS '{' Entry '}'\n        | emptyMibIndex : INDEX '{' IndexTypes '}'\n        | emptyIndexTypes : IndexTypes ',' IndexType\n        | IndexTypeIndexType : IMPLIED Index\n        | IndexIndex : ObjectNameEntry : ObjectNameDefValPart : DEFVAL '{' Value '}'\n        | emptyValue : valueofObjectSyntax\n        | '{' BitsValue '}'BitsValue : BitNames\n        | emptyBitNames : BitNames ',' LOWERCASE_IDENTIFIER\n        | LOWERCASE_IDENTIFIERObjectName : objectIdentifierNotificationName : objectIdentifierReferPart : REFERENCE Text\n        | emptyRevisionPart : Revisions\n        | emptyRevisions : Revisions Revision\n        | RevisionRevision : REVISION ExtUTCTime DESCRIPTION TextNotificationObjectsPart : OBJECTS '{' Objects '}'\n        | emptyObjectGroupObjectsPart : OBJECTS '{' Objects '}'Objects : Objects ',' Object\n        | ObjectObject : ObjectNameNotificationsPart : NOTIFICATIONS '{' Notifications '}'Notifications : Notifications ',' Notification\n        | NotificationNotification : NotificationNameText : QUOTED_STRINGExtUTCTime : QUOTED_STRINGobjectIdentifier : subidentifierssubidentifiers : subidentifiers subidentifier\n        | subidentifiersubidentifier : fuzzy_lowercase_identifier\n        | NUMBER\n        | LOWERCASE_IDENTIFIER '(' NUMBER ')'objectIdentifier_defval : subidentifiers_defvalsubidentifiers_defval : subidentifiers_defval subidentifier_defval\n        | subidentifier_defvalsubidentifier_defval : LOWERCASE_IDENTIFIER '(' NUMBER ')'\n        | NUMBERobjectGroupClause : LOWERCASE_IDENTIFIER OBJECT_GROUP ObjectGroupObjectsPart STATUS Status DESCRIPTION Text ReferPart COLON_COLON_EQUAL '{' objectIdentifier '}'notificationGroupClause : LOWERCASE_IDENTIFIER NOTIFICATION_GROUP NotificationsPart STATUS Status DESCRIPTION Text ReferPart COLON_COLON_EQUAL '{' objectIdentifier '}'moduleComplianceClause : LOWERCASE_IDENTIFIER MODULE_COMPLIANCE STATUS Status DESCRIPTION Text ReferPart ComplianceModulePart COLON_COLON_EQUAL '{' objectIdentifier '}'ComplianceModulePart : ComplianceModulesComplianceModules : ComplianceModules ComplianceModule\n        | ComplianceModuleComplianceModule : MODULE ComplianceModuleName MandatoryPart CompliancePartComplianceModuleName : UPPERCASE_IDENTIFIER\n        | emptyMandatoryPart : MANDATORY_GROUPS '{' MandatoryGroups '}'\n        | emptyMandatoryGroups : MandatoryGroups ',' MandatoryGroup\n        | MandatoryGroupMandatoryGroup : objectIdentifierCompliancePart : Compliances\n        | emptyCompliances : Compliances Compliance\n        | ComplianceCompliance : ComplianceGroup\n        | ComplianceObjectComplianceGroup : GROUP objectIdentifier DESCRIPTION TextComplianceObject : OBJECT ObjectName SyntaxPart WriteSyntaxPart AccessPart DESCRIPTION TextSyntaxPart : SYNTAX Syntax\n        | emptyWriteSyntaxPart : WRITE_SYNTAX WriteSyntax\n        | emptyWriteSyntax : SyntaxAccessPart : MIN_ACCESS Access\n        | emptyagentCapabilitiesClause : LOWERCASE_IDENTIFIER AGENT_CAPABILITIES PRODUCT_RELEASE Text STATUS Status DESCRIPTION Text ReferPart ModulePart_Capabilities COLON_COLON_EQUAL '{' objectIdentifier '}'ModulePart_Capabilities : Modules_Capabilities\n        | emptyModules_Capabilities : Modules_Capabilities Module_Capabilities\n        | Module_CapabilitiesModule_Capabilities : SUPPORTS ModuleName_Capabilities INCLUDES '{' CapabilitiesGroups '}' VariationPartCapabilitiesGroups : CapabilitiesGroups ',' CapabilitiesGroup\n        | CapabilitiesGroupCapabilitiesGroup : objectIdentifierModuleName_Capabilities : UPPERCASE_IDENTIFIER objectIdentifier\n        | UPPERCASE_IDENTIFIERVariationPart : Variations\n        | emptyVariations : Variations Variation\n        | VariationVariation : VARIATION ObjectName SyntaxPart WriteSyntaxPart VariationAccessPart CreationPart DefValPart DESCRIPTION TextVariationAccessPart : ACCESS VariationAccess\n        | emptyVariationAccess : LOWERCASE_IDENTIFIERCreationPart : CREATION_REQUIRES '{' Cells '}'\n        | emptyCells : Cells ',' Cell\n        | CellCell : ObjectNameempty :"
+    
+_lr_action_items = {'$end':([0,1,2,3,4,7,105,],[-316,0,-1,-2,-4,-3,-5,]),'UPPERCASE_IDENTIFIER':([0,2,4,6,7,9,13,14,15,16,17,18,21,23,25,26,27,28,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,76,78,105,106,107,119,120,121,122,123,124,126,127,129,130,131,132,133,134,135,136,137,138,142,143,144,145,146,147,148,151,153,166,167,173,175,176,179,180,181,182,184,185,186,188,189,190,191,192,193,194,195,196,197,199,208,213,215,236,237,238,239,242,245,274,277,280,284,309,319,329,353,354,355,387,396,401,402,404,418,422,424,428,429,434,435,436,449,450,451,457,461,462,468,475,476,477,483,491,494,496,501,505,509,513,517,531,541,553,560,562,586,593,],[6,6,-4,-44,-3,18,18,-254,-255,-256,-73,-74,-253,-316,-316,-11,-12,-257,62,-8,-9,82,62,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,82,-16,-5,-47,138,-10,-15,6,82,-76,-89,-91,-98,-72,-131,-132,-133,-134,-135,174,-142,-145,-93,-316,-167,-169,-171,-316,-174,-176,18,138,-61,-17,-136,-143,-144,-146,-147,-148,-151,-149,-316,239,-166,-185,-186,-187,-188,-168,-170,-172,-173,-175,-177,18,18,18,-150,-152,-92,-93,288,18,-99,-189,-201,-94,18,18,18,-137,-138,-75,18,413,-190,-110,18,138,18,18,18,18,457,-90,-106,18,18,18,18,18,-122,-265,-263,-264,18,18,138,18,18,18,18,138,-292,18,18,18,-123,18,-107,18,18,]),'{':([5,6,128,136,138,141,142,146,155,158,162,164,174,185,202,247,288,292,293,296,297,298,299,300,302,345,346,388,408,410,415,416,426,438,454,459,478,481,486,497,498,581,],[9,-44,172,178,178,187,178,178,208,210,213,215,178,178,245,309,178,178,178,178,178,178,178,178,178,178,178,404,422,424,428,429,451,461,477,483,496,498,505,517,518,586,]),'DEFINITIONS':([5,6,8,10,20,],[-316,-44,11,-7,-6,]),'LOWERCASE_IDENTIFIER':([6,9,13,14,15,16,17,18,21,23,25,26,27,28,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,76,78,106,119,120,122,123,124,126,127,129,130,131,132,133,134,136,137,138,142,143,144,145,146,147,148,151,152,160,166,167,172,173,175,176,178,179,180,181,182,184,185,187,188,189,190,191,192,193,194,195,196,197,199,207,208,210,212,213,214,215,218,236,237,238,239,245,272,274,275,277,280,281,284,285,309,314,315,319,322,329,355,364,387,401,402,404,422,424,428,429,435,436,449,450,451,457,461,462,468,475,476,477,483,494,496,498,501,505,513,517,518,531,536,541,547,549,550,553,560,562,565,566,575,578,586,593,],[-44,17,17,-254,-255,-256,-73,-74,-253,-316,-316,-11,-12,-257,51,-8,-9,81,51,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,81,-16,-47,-10,-15,81,-76,-89,-91,-98,-72,-131,-132,-133,-134,-135,-142,-145,-93,-316,-167,-169,-171,-316,-174,-176,17,204,204,-61,-17,222,-136,-143,-144,234,-146,-147,-148,-151,-149,-316,242,-166,-185,-186,-187,-188,-168,-170,-172,-173,-175,-177,204,17,263,204,17,204,17,204,-150,-152,-92,-93,17,204,-99,222,-189,-201,234,-94,242,17,366,366,17,263,17,-75,204,17,-190,-110,17,17,17,17,17,-90,-106,17,17,17,17,17,-122,-265,-263,-264,17,17,17,17,528,17,17,-292,17,548,17,366,17,567,-260,-262,-123,17,-107,572,-259,-261,584,17,17,]),'BITS':([6,32,76,78,107,120,122,153,167,242,418,491,509,],[-44,85,85,-16,128,-15,85,128,-17,287,128,128,128,]),'INTEGER32':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,76,78,106,107,119,120,122,123,124,126,127,129,130,131,132,133,134,135,136,137,138,142,143,144,145,146,147,148,153,166,167,173,175,176,179,180,181,182,184,185,188,189,190,191,192,193,194,195,196,197,199,236,237,238,239,242,274,277,280,284,353,354,355,401,402,418,435,436,462,468,475,476,491,509,513,553,562,],[-44,-316,-316,-11,-12,70,-8,-9,86,70,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,86,-16,-47,137,-10,-15,86,-76,-89,-91,-98,-72,-131,-132,-133,-134,-135,137,-142,-145,-93,-316,-167,-169,-171,-316,-174,-176,137,-61,-17,-136,-143,-144,-146,-147,-148,-151,-149,-316,-166,-185,-186,-187,-188,-168,-170,-172,-173,-175,-177,-150,-152,-92,-93,293,-99,-189,-201,-94,-137,-138,-75,-190,-110,137,-90,-106,-122,-265,-263,-264,137,137,-292,-123,-107,]),'IPADDRESS':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,76,78,106,107,119,120,122,123,124,126,127,129,130,131,132,133,134,136,137,138,142,143,144,145,146,147,148,153,166,167,173,175,176,179,180,181,182,184,185,188,189,190,191,192,193,194,195,196,197,199,236,237,238,239,242,274,277,280,284,355,401,402,418,435,436,462,468,475,476,491,509,513,553,562,],[-44,-316,-316,-11,-12,67,-8,-9,87,67,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,87,-16,-47,142,-10,-15,87,-76,-89,-91,-98,-72,-131,-132,-133,-134,-135,-142,-145,-93,-316,-167,-169,-171,-316,-174,-176,142,-61,-17,-136,-143,-144,-146,-147,-148,-151,-149,-316,-166,-185,-186,-187,-188,-168,-170,-172,-173,-175,-177,-150,-152,-92,-93,296,-99,-189,-201,-94,-75,-190,-110,142,-90,-106,-122,-265,-263,-264,142,142,-292,-123,-107,]),'MANDATORY_GROUPS':([6,32,76,78,120,122,167,396,412,413,414,],[-44,88,88,-16,-15,88,-17,-316,426,-270,-271,]),'MODULE_COMPLIANCE':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,51,76,78,106,119,120,122,123,124,126,127,129,130,131,132,133,134,136,137,138,142,143,144,145,146,147,148,166,167,173,175,176,179,180,181,182,184,185,188,189,190,191,192,193,194,195,196,197,199,236,237,238,239,274,277,280,284,355,401,402,435,436,462,468,475,476,513,553,562,],[-44,-316,-316,-11,-12,57,-8,-9,89,57,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,114,89,-16,-47,-10,-15,89,-76,-89,-91,-98,-72,-131,-132,-133,-134,-135,-142,-145,-93,-316,-167,-169,-171,-316,-174,-176,-61,-17,-136,-143,-144,-146,-147,-148,-151,-149,-316,-166,-185,-186,-187,-188,-168,-170,-172,-173,-175,-177,-150,-152,-92,-93,-99,-189,-201,-94,-75,-190,-110,-90,-106,-122,-265,-263,-264,-292,-123,-107,]),'MODULE_IDENTITY':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,51,76,78,106,119,120,122,123,124,126,127,129,130,131,132,133,134,136,137,138,142,143,144,145,146,147,148,166,167,173,175,176,179,180,181,182,184,185,188,189,190,191,192,193,194,195,196,197,199,236,237,238,239,274,277,280,284,355,401,402,435,436,462,468,475,476,513,553,562,],[-44,-316,-316,-11,-12,56,-8,-9,90,56,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,113,90,-16,-47,-10,-15,90,-76,-89,-91,-98,-72,-131,-132,-133,-134,-135,-142,-145,-93,-316,-167,-169,-171,-316,-174,-176,-61,-17,-136,-143,-144,-146,-147,-148,-151,-149,-316,-166,-185,-186,-187,-188,-168,-170,-172,-173,-175,-177,-150,-152,-92,-93,-99,-189,-201,-94,-75,-190,-110,-90,-106,-122,-265,-263,-264,-292,-123,-107,]),'OBJECT_GROUP':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,51,76,78,106,119,120,122,123,124,126,127,129,130,131,132,133,134,136,137,138,142,143,144,145,146,147,148,166,167,173,175,176,179,180,181,182,184,185,188,189,190,191,192,193,194,195,196,197,199,236,237,238,239,274,277,280,284,355,401,402,435,436,462,468,475,476,513,553,562,],[-44,-316,-316,-11,-12,58,-8,-9,91,58,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,115,91,-16,-47,-10,-15,91,-76,-89,-91,-98,-72,-131,-132,-133,-134,-135,-142,-145,-93,-316,-167,-169,-171,-316,-174,-176,-61,-17,-136,-143,-144,-146,-147,-148,-151,-149,-316,-166,-185,-186,-187,-188,-168,-170,-172,-173,-175,-177,-150,-152,-92,-93,-99,-189,-201,-94,-75,-190,-110,-90,-106,-122,-265,-263,-264,-292,-123,-107,]),'OBJECT_IDENTITY':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,51,76,78,106,119,120,122,123,124,126,127,129,130,131,132,133,134,136,137,138,142,143,144,145,146,147,148,166,167,173,175,176,179,180,181,182,184,185,188,189,190,191,192,193,194,195,196,197,199,236,237,238,239,274,277,280,284,355,401,402,435,436,462,468,475,476,513,553,562,],[-44,-316,-316,-11,-12,52,-8,-9,92,52,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,110,92,-16,-47,-10,-15,92,-76,-89,-91,-98,-72,-131,-132,-133,-134,-135,-142,-145,-93,-316,-167,-169,-171,-316,-174,-176,-61,-17,-136,-143,-144,-146,-147,-148,-151,-149,-316,-166,-185,-186,-187,-188,-168,-170,-172,-173,-175,-177,-150,-152,-92,-93,-99,-189,-201,-94,-75,-190,-110,-90,-106,-122,-265,-263,-264,-292,-123,-107,]),'OBJECT_TYPE':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,51,76,78,106,119,120,122,123,124,126,127,129,130,131,132,133,134,136,137,138,142,143,144,145,146,147,148,166,167,173,175,176,179,180,181,182,184,185,188,189,190,191,192,193,194,195,196,197,199,236,237,238,239,274,277,280,284,355,401,402,435,436,462,468,475,476,513,553,562,],[-44,-316,-316,-11,-12,53,-8,-9,93,53,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,111,93,-16,-47,-10,-15,93,-76,-89,-91,-98,-72,-131,-132,-133,-134,-135,-142,-145,-93,-316,-167,-169,-171,-316,-174,-176,-61,-17,-136,-143,-144,-146,-147,-148,-151,-149,-316,-166,-185,-186,-187,-188,-168,-170,-172,-173,-175,-177,-150,-152,-92,-93,-99,-189,-201,-94,-75,-190,-110,-90,-106,-122,-265,-263,-264,-292,-123,-107,]),'OPAQUE':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,76,78,106,107,119,120,122,123,124,126,127,129,130,131,132,133,134,136,137,138,142,143,144,145,146,147,148,153,166,167,173,175,176,179,180,181,182,184,185,188,189,190,191,192,193,194,195,196,197,199,236,237,238,239,242,274,277,280,284,355,401,402,418,435,436,462,468,475,476,491,509,513,553,562,],[-44,-316,-316,-11,-12,69,-8,-9,94,69,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,94,-16,-47,147,-10,-15,94,-76,-89,-91,-98,-72,-131,-132,-133,-134,-135,-142,-145,-93,-316,-167,-169,-171,-316,-174,-176,147,-61,-17,-136,-143,-144,-146,-147,-148,-151,-149,-316,-166,-185,-186,-187,-188,-168,-170,-172,-173,-175,-177,-150,-152,-92,-93,301,-99,-189,-201,-94,-75,-190,-110,147,-90,-106,-122,-265,-263,-264,147,147,-292,-123,-107,]),'TEXTUAL_CONVENTION':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,76,78,106,107,119,120,122,123,124,126,127,129,130,131,132,133,134,136,137,138,142,143,144,145,146,147,148,166,167,173,175,176,179,180,181,182,184,185,188,189,190,191,192,193,194,195,196,197,199,236,237,238,239,274,277,280,284,355,401,402,435,436,462,468,475,476,513,553,562,],[-44,-316,-316,-11,-12,64,-8,-9,95,64,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,95,-16,-47,125,-10,-15,95,-76,-89,-91,-98,-72,-131,-132,-133,-134,-135,-142,-145,-93,-316,-167,-169,-171,-316,-174,-176,-61,-17,-136,-143,-144,-146,-147,-148,-151,-149,-316,-166,-185,-186,-187,-188,-168,-170,-172,-173,-175,-177,-150,-152,-92,-93,-99,-189,-201,-94,-75,-190,-110,-90,-106,-122,-265,-263,-264,-292,-123,-107,]),'TIMETICKS':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,76,78,106,107,119,120,122,123,124,126,127,129,130,131,132,133,134,136,137,138,142,143,144,145,146,147,148,153,166,167,173,175,176,179,180,181,182,184,185,188,189,190,191,192,193,194,195,196,197,199,236,237,238,239,242,274,277,280,284,355,401,402,418,435,436,462,468,475,476,491,509,513,553,562,],[-44,-316,-316,-11,-12,68,-8,-9,96,68,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,96,-16,-47,146,-10,-15,96,-76,-89,-91,-98,-72,-131,-132,-133,-134,-135,-142,-145,-93,-316,-167,-169,-171,-316,-174,-176,146,-61,-17,-136,-143,-144,-146,-147,-148,-151,-149,-316,-166,-185,-186,-187,-188,-168,-170,-172,-173,-175,-177,-150,-152,-92,-93,300,-99,-189,-201,-94,-75,-190,-110,146,-90,-106,-122,-265,-263,-264,146,146,-292,-123,-107,]),'UNSIGNED32':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,76,78,106,107,119,120,122,123,124,126,127,129,130,131,132,133,134,136,137,138,142,143,144,145,146,147,148,153,166,167,173,175,176,179,180,181,182,184,185,188,189,190,191,192,193,194,195,196,197,199,236,237,238,239,242,274,277,280,284,355,401,402,418,435,436,462,468,475,476,491,509,513,553,562,],[-44,-316,-316,-11,-12,71,-8,-9,97,71,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,97,-16,-47,145,-10,-15,97,-76,-89,-91,-98,-72,-131,-132,-133,-134,-135,-142,-145,-93,-316,-167,-169,-171,-316,-174,-176,145,-61,-17,-136,-143,-144,-146,-147,-148,-151,-149,-316,-166,-185,-186,-187,-188,-168,-170,-172,-173,-175,-177,-150,-152,-92,-93,299,-99,-189,-201,-94,-75,-190,-110,145,-90,-106,-122,-265,-263,-264,145,145,-292,-123,-107,]),'AGENT_CAPABILITIES':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,51,76,78,106,119,120,122,123,124,126,127,129,130,131,132,133,134,136,137,138,142,143,144,145,146,147,148,166,167,173,175,176,179,180,181,182,184,185,188,189,190,191,192,193,194,195,196,197,199,236,237,238,239,274,277,280,284,355,401,402,435,436,462,468,475,476,513,553,562,],[-44,-316,-316,-11,-12,60,-8,-9,98,60,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,117,98,-16,-47,-10,-15,98,-76,-89,-91,-98,-72,-131,-132,-133,-134,-135,-142,-145,-93,-316,-167,-169,-171,-316,-174,-176,-61,-17,-136,-143,-144,-146,-147,-148,-151,-149,-316,-166,-185,-186,-187,-188,-168,-170,-172,-173,-175,-177,-150,-152,-92,-93,-99,-189,-201,-94,-75,-190,-110,-90,-106,-122,-265,-263,-264,-292,-123,-107,]),'COUNTER32':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,76,78,106,107,119,120,122,123,124,126,127,129,130,131,132,133,134,136,137,138,142,143,144,145,146,147,148,153,166,167,173,175,176,179,180,181,182,184,185,188,189,190,191,192,193,194,195,196,197,199,236,237,238,239,242,274,277,280,284,355,401,402,418,435,436,462,468,475,476,491,509,513,553,562,],[-44,-316,-316,-11,-12,72,-8,-9,99,72,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,99,-16,-47,143,-10,-15,99,-76,-89,-91,-98,-72,-131,-132,-133,-134,-135,-142,-145,-93,-316,-167,-169,-171,-316,-174,-176,143,-61,-17,-136,-143,-144,-146,-147,-148,-151,-149,-316,-166,-185,-186,-187,-188,-168,-170,-172,-173,-175,-177,-150,-152,-92,-93,297,-99,-189,-201,-94,-75,-190,-110,143,-90,-106,-122,-265,-263,-264,143,143,-292,-123,-107,]),'COUNTER64':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,76,78,106,107,119,120,122,123,124,126,127,129,130,131,132,133,134,136,137,138,142,143,144,145,146,147,148,153,166,167,173,175,176,179,180,181,182,184,185,188,189,190,191,192,193,194,195,196,197,199,236,237,238,239,242,274,277,280,284,355,401,402,418,435,436,462,468,475,476,491,509,513,553,562,],[-44,-316,-316,-11,-12,74,-8,-9,100,74,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,100,-16,-47,148,-10,-15,100,-76,-89,-91,-98,-72,-131,-132,-133,-134,-135,-142,-145,-93,-316,-167,-169,-171,-316,-174,-176,148,-61,-17,-136,-143,-144,-146,-147,-148,-151,-149,-316,-166,-185,-186,-187,-188,-168,-170,-172,-173,-175,-177,-150,-152,-92,-93,302,-99,-189,-201,-94,-75,-190,-110,148,-90,-106,-122,-265,-263,-264,148,148,-292,-123,-107,]),'GAUGE32':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,76,78,106,107,119,120,122,123,124,126,127,129,130,131,132,133,134,136,137,138,142,143,144,145,146,147,148,153,166,167,173,175,176,179,180,181,182,184,185,188,189,190,191,192,193,194,195,196,197,199,236,237,238,239,242,274,277,280,284,355,401,402,418,435,436,462,468,475,476,491,509,513,553,562,],[-44,-316,-316,-11,-12,73,-8,-9,101,73,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,101,-16,-47,144,-10,-15,101,-76,-89,-91,-98,-72,-131,-132,-133,-134,-135,-142,-145,-93,-316,-167,-169,-171,-316,-174,-176,144,-61,-17,-136,-143,-144,-146,-147,-148,-151,-149,-316,-166,-185,-186,-187,-188,-168,-170,-172,-173,-175,-177,-150,-152,-92,-93,298,-99,-189,-201,-94,-75,-190,-110,144,-90,-106,-122,-265,-263,-264,144,144,-292,-123,-107,]),'NOTIFICATION_GROUP':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,51,76,78,106,119,120,122,123,124,126,127,129,130,131,132,133,134,136,137,138,142,143,144,145,146,147,148,166,167,173,175,176,179,180,181,182,184,185,188,189,190,191,192,193,194,195,196,197,199,236,237,238,239,274,277,280,284,355,401,402,435,436,462,468,475,476,513,553,562,],[-44,-316,-316,-11,-12,59,-8,-9,102,59,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,116,102,-16,-47,-10,-15,102,-76,-89,-91,-98,-72,-131,-132,-133,-134,-135,-142,-145,-93,-316,-167,-169,-171,-316,-174,-176,-61,-17,-136,-143,-144,-146,-147,-148,-151,-149,-316,-166,-185,-186,-187,-188,-168,-170,-172,-173,-175,-177,-150,-152,-92,-93,-99,-189,-201,-94,-75,-190,-110,-90,-106,-122,-265,-263,-264,-292,-123,-107,]),'NOTIFICATION_TYPE':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,51,76,78,106,119,120,122,123,124,126,127,129,130,131,132,133,134,136,137,138,142,143,144,145,146,147,148,166,167,173,175,176,179,180,181,182,184,185,188,189,190,191,192,193,194,195,196,197,199,236,237,238,239,274,277,280,284,355,401,402,435,436,462,468,475,476,513,553,562,],[-44,-316,-316,-11,-12,55,-8,-9,103,55,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,112,103,-16,-47,-10,-15,103,-76,-89,-91,-98,-72,-131,-132,-133,-134,-135,-142,-145,-93,-316,-167,-169,-171,-316,-174,-176,-61,-17,-136,-143,-144,-146,-147,-148,-151,-149,-316,-166,-185,-186,-187,-188,-168,-170,-172,-173,-175,-177,-150,-152,-92,-93,-99,-189,-201,-94,-75,-190,-110,-90,-106,-122,-265,-263,-264,-292,-123,-107,]),'TRAP_TYPE':([6,23,25,26,27,29,30,31,32,34,36,37,38,39,40,41,42,43,44,45,46,47,48,50,51,62,76,78,106,119,120,122,123,124,126,127,129,130,131,132,133,134,136,137,138,142,143,144,145,146,147,148,166,167,173,175,176,179,180,181,182,184,185,188,189,190,191,192,193,194,195,196,197,199,236,237,238,239,274,277,280,284,355,401,402,435,436,462,468,475,476,513,553,562,],[-44,-316,-316,-11,-12,54,-8,-9,104,54,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,109,-73,-74,104,-16,-47,-10,-15,104,-76,-89,-91,-98,-72,-131,-132,-133,-134,-135,-142,-145,-93,-316,-167,-169,-171,-316,-174,-176,-61,-17,-136,-143,-144,-146,-147,-148,-151,-149,-316,-166,-185,-186,-187,-188,-168,-170,-172,-173,-175,-177,-150,-152,-92,-93,-99,-189,-201,-94,-75,-190,-110,-90,-106,-122,-265,-263,-264,-292,-123,-107,]),';':([6,32,75,76,77,78,120,167,],[-44,-316,119,-13,-14,-16,-15,-17,]),'NUMBER':([9,13,14,15,16,17,18,21,22,28,151,177,183,200,201,208,213,215,245,276,278,279,282,283,309,319,323,329,384,387,404,422,424,428,429,449,450,451,457,461,477,483,494,496,498,501,505,517,518,531,541,547,549,550,560,566,568,575,586,593,],[16,16,-254,-255,-256,-73,-74,-253,24,-257,16,227,227,243,244,16,16,16,16,333,227,227,338,227,16,16,372,16,402,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,522,16,16,16,550,16,16,550,-260,-262,16,-259,573,-261,16,16,]),'COLON_COLON_EQUAL':([11,13,14,15,16,17,18,21,28,49,62,63,65,66,67,68,69,70,71,72,73,74,150,203,204,217,246,248,306,308,310,356,358,359,363,368,374,375,385,386,389,390,393,394,395,396,397,398,399,405,407,411,412,413,414,417,420,421,425,427,430,431,432,433,437,439,441,443,444,445,446,447,448,455,458,460,463,464,465,466,469,480,482,487,493,504,507,530,534,540,551,556,557,558,559,569,570,591,],[19,-252,-254,-255,-256,-73,-74,-253,-257,107,-77,-78,-79,-80,-81,-82,-83,-84,-85,-86,-87,-88,202,-316,-207,-250,-316,-112,-316,-117,-316,384,-234,-116,388,-316,-316,-316,-233,-111,-316,408,410,-266,-268,-316,415,416,-316,-316,-109,-267,-316,-270,-271,-316,-316,-108,-316,-273,454,-293,-294,-296,-316,-214,-316,-269,-277,-278,-280,-281,-282,-295,-316,-216,486,-235,-236,-238,-279,497,-224,-237,-272,-213,-283,-215,-239,-316,-223,-297,-303,-304,-306,-284,-305,-307,]),'}':([12,13,14,15,16,17,18,21,28,189,190,191,192,220,221,232,233,240,241,254,255,256,257,260,261,262,263,266,268,269,270,271,277,280,286,287,288,289,290,291,292,293,296,297,298,299,300,301,302,305,332,336,341,342,343,344,345,346,347,348,349,350,351,352,360,361,362,369,371,376,379,380,382,383,392,401,403,419,440,442,452,453,472,473,474,484,485,495,499,500,502,503,512,514,515,516,518,519,520,521,522,523,524,525,526,527,528,529,532,533,542,543,544,545,546,547,548,549,550,552,561,563,564,566,572,575,588,589,590,594,],[20,-252,-254,-255,-256,-73,-74,-253,-257,-185,-186,-187,-188,274,-104,280,-203,284,-96,318,-244,-245,-231,321,-126,-128,-130,326,328,-248,-249,-232,-189,-201,-97,-100,-316,-102,-139,-140,-316,-316,-316,-316,-316,-316,-316,-183,-316,355,-103,-202,-95,-101,-162,-163,-316,-316,-178,-179,-180,-181,-182,-184,386,-114,-115,-243,-127,-247,-105,-204,-164,-165,-129,-190,-113,436,462,468,475,476,493,-275,-276,504,-222,513,530,-218,-220,-221,-274,540,-299,-300,-316,551,-225,-141,-153,-154,-155,-156,-157,-158,-159,-160,-219,553,562,563,564,-227,-228,-258,-230,-260,-262,-217,-298,-226,-161,-259,-229,-261,592,-314,-315,-313,]),'VARIABLES':([13,14,15,16,17,18,21,28,203,],[-252,-254,-255,-256,-73,-74,-253,-257,247,]),'DESCRIPTION':([13,14,15,16,17,18,21,28,127,130,131,132,133,134,136,137,138,142,143,144,145,146,147,148,173,175,176,179,180,181,182,184,185,188,189,190,191,192,193,194,195,196,197,199,203,204,205,211,217,236,237,238,239,246,248,253,257,259,265,267,273,274,277,280,284,330,366,386,389,401,409,470,471,482,488,490,492,508,510,511,535,537,538,539,551,555,571,574,576,577,579,580,582,583,584,585,592,],[-252,-254,-255,-256,-73,-74,-253,-257,-98,-131,-132,-133,-134,-135,-142,-145,-93,-316,-167,-169,-171,-316,-174,-176,-136,-143,-144,-146,-147,-148,-151,-149,-316,-166,-185,-186,-187,-188,-168,-170,-172,-173,-175,-177,-316,-207,249,264,-250,-150,-152,-92,-93,307,-112,317,-231,-251,325,327,331,-99,-189,-201,-94,377,-212,-111,406,-190,423,489,-316,-224,506,-316,-286,-316,-288,-285,554,-291,-287,-289,-223,-290,-316,-316,-316,-316,-309,-316,-312,-308,-310,587,-311,]),'REFERENCE':([13,14,15,16,17,18,21,28,203,204,217,246,248,306,308,310,324,359,368,374,375,378,386,389,399,405,407,421,],[-252,-254,-255,-256,-73,-74,-253,-257,-316,-207,-250,-316,-112,357,-117,357,357,-116,357,357,357,357,-111,-316,357,357,-109,-108,]),',':([13,14,15,16,17,18,21,28,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,168,189,190,191,192,220,221,232,233,240,241,254,255,256,257,261,262,263,266,268,269,270,271,277,280,286,287,288,289,290,291,292,293,296,297,298,299,300,301,302,332,336,341,342,343,344,345,346,347,348,349,350,351,352,360,361,362,369,371,376,379,380,382,383,392,401,403,472,473,474,499,500,502,503,512,514,515,516,532,545,548,552,561,572,588,589,590,594,],[-252,-254,-255,-256,-73,-74,-253,-257,122,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-18,-185,-186,-187,-188,275,-104,281,-203,285,-96,319,-244,-245,-231,322,-128,-130,319,329,-248,-249,-232,-189,-201,-97,-100,-316,-102,-139,-140,-316,-316,-316,-316,-316,-316,-316,-183,-316,-103,-202,-95,-101,-162,-163,-316,-316,-178,-179,-180,-181,-182,-184,387,-114,-115,-243,-127,-247,-105,-204,-164,-165,-129,-190,-113,494,-275,-276,531,-218,-220,-221,-274,541,-299,-300,-219,565,-230,-217,-298,-229,593,-314,-315,-313,]),'SYNTAX':([13,14,15,16,17,18,21,28,111,217,257,358,378,385,400,471,571,],[-252,-254,-255,-256,-73,-74,-253,-257,153,-250,-231,-234,-316,-233,418,491,491,]),'WRITE_SYNTAX':([13,14,15,16,17,18,21,28,127,130,131,132,133,134,136,137,138,142,143,144,145,146,147,148,173,175,176,179,180,181,182,184,185,188,189,190,191,192,193,194,195,196,197,199,236,237,238,239,257,274,277,280,284,401,471,490,492,511,571,574,],[-252,-254,-255,-256,-73,-74,-253,-257,-98,-131,-132,-133,-134,-135,-142,-145,-93,-316,-167,-169,-171,-316,-174,-176,-136,-143,-144,-146,-147,-148,-151,-149,-316,-166,-185,-186,-187,-188,-168,-170,-172,-173,-175,-177,-150,-152,-92,-93,-231,-99,-189,-201,-94,-190,-316,509,-286,-285,-316,509,]),'MIN_ACCESS':([13,14,15,16,17,18,21,28,127,130,131,132,133,134,136,137,138,142,143,144,145,146,147,148,173,175,176,179,180,181,182,184,185,188,189,190,191,192,193,194,195,196,197,199,236,237,238,239,257,274,277,280,284,401,471,490,492,508,510,511,538,539,],[-252,-254,-255,-256,-73,-74,-253,-257,-98,-131,-132,-133,-134,-135,-142,-145,-93,-316,-167,-169,-171,-316,-174,-176,-136,-143,-144,-146,-147,-148,-151,-149,-316,-166,-185,-186,-187,-188,-168,-170,-172,-173,-175,-177,-150,-152,-92,-93,-231,-99,-189,-201,-94,-190,-316,-316,-286,536,-288,-285,-287,-289,]),'INCLUDES':([13,14,15,16,17,18,21,28,456,457,479,],[-252,-254,-255,-256,-73,-74,-253,-257,478,-302,-301,]),'ACCESS':([13,14,15,16,17,18,21,28,127,130,131,132,133,134,136,137,138,142,143,144,145,146,147,148,173,175,176,179,180,181,182,184,185,188,189,190,191,192,193,194,195,196,197,199,206,217,236,237,238,239,250,252,257,274,277,280,284,316,401,492,510,511,538,539,571,574,576,],[-252,-254,-255,-256,-73,-74,-253,-257,-98,-131,-132,-133,-134,-135,-142,-145,-93,-316,-167,-169,-171,-316,-174,-176,-136,-143,-144,-146,-147,-148,-151,-149,-316,-166,-185,-186,-187,-188,-168,-170,-172,-173,-175,-177,-316,-250,-150,-152,-92,-93,315,-211,-231,-99,-189,-201,-94,-210,-190,-286,-288,-285,-287,-289,-316,-316,578,]),'CREATION_REQUIRES':([13,14,15,16,17,18,21,28,127,130,131,132,133,134,136,137,138,142,143,144,145,146,147,148,173,175,176,179,180,181,182,184,185,188,189,190,191,192,193,194,195,196,197,199,236,237,238,239,257,274,277,280,284,401,492,510,511,538,539,571,574,576,577,579,583,584,],[-252,-254,-255,-256,-73,-74,-253,-257,-98,-131,-132,-133,-134,-135,-142,-145,-93,-316,-167,-169,-171,-316,-174,-176,-136,-143,-144,-146,-147,-148,-151,-149,-316,-166,-185,-186,-187,-188,-168,-170,-172,-173,-175,-177,-150,-152,-92,-93,-231,-99,-189,-201,-94,-190,-286,-288,-285,-287,-289,-316,-316,-316,581,-309,-308,-310,]),'DEFVAL':([13,14,15,16,17,18,21,28,127,130,131,132,133,134,136,137,138,142,143,144,145,146,147,148,173,175,176,179,180,181,182,184,185,188,189,190,191,192,193,194,195,196,197,199,204,217,236,237,238,239,257,274,277,280,284,358,385,389,401,405,407,420,421,437,439,458,460,492,504,510,511,530,538,539,571,574,576,577,579,580,582,583,584,592,],[-252,-254,-255,-256,-73,-74,-253,-257,-98,-131,-132,-133,-134,-135,-142,-145,-93,-316,-167,-169,-171,-316,-174,-176,-136,-143,-144,-146,-147,-148,-151,-149,-316,-166,-185,-186,-187,-188,-168,-170,-172,-173,-175,-177,-207,-250,-150,-152,-92,-93,-231,-99,-189,-201,-94,-234,-233,-316,-190,-316,-109,-316,-108,-316,-214,481,-216,-286,-213,-288,-285,-215,-287,-289,-316,-316,-316,-316,-309,481,-312,-308,-310,-311,]),'(':([17,136,137,138,142,143,144,145,146,147,148,174,184,185,222,234,235,263,288,292,293,296,297,298,299,300,302,345,346,548,567,],[22,177,177,183,183,177,177,177,183,198,177,183,198,183,276,282,283,323,183,183,183,183,183,183,183,183,183,183,183,568,568,]),'BEGIN':([19,],[23,]),'EXPORTS':([23,],[26,]),'IMPORTS':([23,25,26,27,],[-316,32,-11,-12,]),'END':([23,25,26,27,29,30,31,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,106,118,119,123,124,126,127,129,130,131,132,133,134,136,137,138,142,143,144,145,146,147,148,166,173,175,176,179,180,181,182,184,185,188,189,190,191,192,193,194,195,196,197,199,236,237,238,239,274,277,280,284,355,401,402,435,436,462,468,475,476,513,553,562,],[-316,-316,-11,-12,-316,-8,-9,105,-45,-46,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-47,166,-10,-76,-89,-91,-98,-72,-131,-132,-133,-134,-135,-142,-145,-93,-316,-167,-169,-171,-316,-174,-176,-61,-136,-143,-144,-146,-147,-148,-151,-149,-316,-166,-185,-186,-187,-188,-168,-170,-172,-173,-175,-177,-150,-152,-92,-93,-99,-189,-201,-94,-75,-190,-110,-90,-106,-122,-265,-263,-264,-292,-123,-107,]),')':([24,223,224,225,226,227,228,229,230,231,333,334,335,337,338,339,340,372,381,573,],[28,277,-192,-194,-195,-196,-197,-198,-199,-200,379,-191,-193,380,-205,-206,381,392,401,575,]),'OBJECT':([50,51,62,107,135,153,217,242,353,354,396,412,413,414,418,425,427,444,446,447,448,469,491,493,507,509,569,],[108,-73,-74,140,140,140,-250,295,-137,-138,-316,-316,-270,-271,140,450,-273,450,-280,-281,-282,-279,140,-272,-283,140,-284,]),'MACRO':([52,53,54,55,56,57,58,59,60,61,64,],[-66,-63,-64,-65,-62,-70,-68,-69,-71,118,-67,]),'FROM':([79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,168,],[121,-19,-20,-21,-22,-23,-24,-25,-26,-27,-28,-29,-30,-31,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-18,]),'CHOICE':([107,],[129,]),'INTEGER':([107,135,153,242,353,354,418,491,509,],[136,136,136,292,-137,-138,136,136,136,]),'OCTET':([107,135,153,242,353,354,418,491,509,],[139,139,139,294,-137,-138,139,139,139,]),'SEQUENCE':([107,153,418,491,509,],[141,141,141,141,141,]),'[':([107,153,418,491,509,],[149,149,149,149,149,]),'IDENTIFIER':([108,140,295,],[150,185,346,]),'ENTERPRISE':([109,],[151,]),'STATUS':([110,112,114,125,127,130,131,132,133,134,136,137,138,142,143,144,145,146,147,148,154,156,161,163,169,171,173,175,176,179,180,181,182,184,185,188,189,190,191,192,193,194,195,196,197,199,206,216,217,219,236,237,238,239,250,252,274,277,280,284,311,312,313,316,318,326,328,365,366,367,401,],[152,-316,160,-316,-98,-131,-132,-133,-134,-135,-142,-145,-93,-316,-167,-169,-171,-316,-174,-176,207,-241,212,214,218,-209,-136,-143,-144,-146,-147,-148,-151,-149,-316,-166,-185,-186,-187,-188,-168,-170,-172,-173,-175,-177,-316,272,-250,-208,-150,-152,-92,-93,-316,-211,-99,-189,-201,-94,364,-118,-119,-210,-240,-242,-246,-120,-212,-121,-190,]),'OBJECTS':([112,115,],[155,162,]),'SUBJECT_CATEGORIES':([113,],[158,]),'LAST_UPDATED':([113,157,159,321,],[-316,209,-125,-124,]),'NOTIFICATIONS':([116,],[164,]),'PRODUCT_RELEASE':([117,],[165,]),'DISPLAY_HINT':([125,],[170,]),'UNITS':([127,130,131,132,133,134,136,137,138,142,143,144,145,146,147,148,173,175,176,179,180,181,182,184,185,188,189,190,191,192,193,194,195,196,197,199,206,236,237,238,239,274,277,280,284,401,],[-98,-131,-132,-133,-134,-135,-142,-145,-93,-316,-167,-169,-171,-316,-174,-176,-136,-143,-144,-146,-147,-148,-151,-149,-316,-166,-185,-186,-187,-188,-168,-170,-172,-173,-175,-177,251,-150,-152,-92,-93,-99,-189,-201,-94,-190,]),'MAX_ACCESS':([127,130,131,132,133,134,136,137,138,142,143,144,145,146,147,148,173,175,176,179,180,181,182,184,185,188,189,190,191,192,193,194,195,196,197,199,206,217,236,237,238,239,250,252,274,277,280,284,316,401,],[-98,-131,-132,-133,-134,-135,-142,-145,-93,-316,-167,-169,-171,-316,-174,-176,-136,-143,-144,-146,-147,-148,-151,-149,-316,-166,-185,-186,-187,-188,-168,-170,-172,-173,-175,-177,-316,-250,-150,-152,-92,-93,314,-211,-99,-189,-201,-94,-210,-190,]),'STRING':([139,294,],[184,345,]),'OF':([141,],[186,]),'APPLICATION':([149,],[200,]),'UNIVERSAL':([149,],[201,]),'QUOTED_STRING':([165,170,209,249,251,264,307,317,320,325,327,331,357,377,391,406,423,467,489,498,506,554,587,],[217,217,259,217,217,217,217,217,217,217,217,217,217,217,217,217,217,259,217,529,217,217,217,]),'NEGATIVENUMBER':([177,183,278,279,282,283,498,],[226,226,226,226,339,226,523,]),'NEGATIVENUMBER64':([177,183,278,279,283,498,],[228,228,228,228,228,525,]),'NUMBER64':([177,183,278,279,283,498,],[229,229,229,229,229,524,]),'HEX_STRING':([177,183,278,279,283,498,],[230,230,230,230,230,526,]),'BIN_STRING':([177,183,278,279,283,498,],[231,231,231,231,231,527,]),'SIZE':([183,198,],[235,235,]),'AUGMENTS':([204,217,358,385,389,405,407,420,421,],[-207,-250,-234,-233,-316,-316,-109,438,-108,]),'INDEX':([204,217,358,385,389,405,407,420,421,437,439,504,],[-207,-250,-234,-233,-316,-316,-109,-316,-108,459,-214,-213,]),'MODULE':([217,324,358,373,385,394,395,396,411,412,413,414,425,427,443,444,445,446,447,448,469,493,507,569,],[-250,-316,-234,396,-233,396,-268,-316,-267,-316,-270,-271,-316,-273,-269,-277,-278,-280,-281,-282,-279,-272,-283,-284,]),'CONTACT_INFO':([217,370,],[-250,391,]),'SUPPORTS':([217,358,385,399,417,431,433,455,540,556,557,558,559,570,591,],[-250,-234,-233,-316,434,434,-296,-295,-316,-297,-303,-304,-306,-305,-307,]),'REVISION':([217,441,464,466,487,534,],[-250,467,467,-238,-237,-239,]),'GROUP':([217,396,412,413,414,425,427,444,446,447,448,469,493,507,569,],[-250,-316,-316,-270,-271,449,-273,449,-280,-281,-282,-279,-272,-283,-284,]),'VARIATION':([217,540,557,559,570,591,],[-250,560,560,-306,-305,-307,]),'|':([223,224,225,226,227,228,229,230,231,334,335,340,],[278,-192,-194,-195,-196,-197,-198,-199,-200,-191,-193,278,]),'DOT_DOT':([225,226,227,228,229,230,231,],[279,-195,-196,-197,-198,-199,-200,]),']':([243,244,],[303,304,]),'ORGANIZATION':([258,259,],[320,-251,]),'IMPLICIT':([303,304,],[353,354,]),'IMPLIED':([483,531,],[501,501,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'mibFile':([0,],[1,]),'modules':([0,],[2,]),'empty':([0,5,23,25,29,32,112,113,125,142,146,185,203,206,246,250,288,292,293,296,297,298,299,300,302,306,310,324,345,346,368,374,375,378,389,396,399,405,412,417,420,425,437,441,458,471,490,508,518,540,571,574,576,577,580,],[3,10,27,31,35,77,156,159,171,192,192,192,248,252,308,313,192,192,192,192,192,192,192,192,192,358,358,358,192,192,358,358,358,358,407,414,358,358,427,432,439,445,460,465,482,492,510,537,546,558,492,510,579,582,482,]),'module':([0,2,],[4,7,]),'moduleName':([0,2,121,],[5,5,167,]),'moduleOid':([5,],[8,]),'objectIdentifier':([9,151,208,213,215,245,309,319,329,387,404,422,424,428,429,449,450,451,457,461,477,483,494,496,501,505,517,531,541,560,586,593,],[12,203,257,257,271,305,257,257,271,257,419,271,442,452,453,470,257,474,479,257,495,257,474,516,257,533,257,257,516,257,257,257,]),'subidentifiers':([9,151,208,213,215,245,309,319,329,387,404,422,424,428,429,449,450,451,457,461,477,483,494,496,501,505,517,531,541,560,586,593,],[13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,]),'subidentifier':([9,13,151,208,213,215,245,309,319,329,387,404,422,424,428,429,449,450,451,457,461,477,483,494,496,501,505,517,531,541,560,586,593,],[14,21,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,]),'fuzzy_lowercase_identifier':([9,13,29,34,151,208,213,215,245,309,319,329,387,404,422,424,428,429,449,450,451,457,461,477,483,494,496,501,505,517,531,541,560,586,593,],[15,15,50,50,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,]),'exportsClause':([23,],[25,]),'linkagePart':([25,],[29,]),'linkageClause':([25,],[30,]),'declarationPart':([29,],[33,]),'declarations':([29,],[34,]),'declaration':([29,34,],[36,106,]),'typeDeclaration':([29,34,],[37,37,]),'valueDeclaration':([29,34,],[38,38,]),'objectIdentityClause':([29,34,],[39,39,]),'objectTypeClause':([29,34,],[40,40,]),'trapTypeClause':([29,34,],[41,41,]),'notificationTypeClause':([29,34,],[42,42,]),'moduleIdentityClause':([29,34,],[43,43,]),'moduleComplianceClause':([29,34,],[44,44,]),'objectGroupClause':([29,34,],[45,45,]),'notificationGroupClause':([29,34,],[46,46,]),'agentCapabilitiesClause':([29,34,],[47,47,]),'macroClause':([29,34,],[48,48,]),'typeName':([29,34,],[49,49,]),'macroName':([29,34,],[61,61,]),'typeSMI':([29,34,],[63,63,]),'typeSMIandSPPI':([29,34,],[65,65,]),'typeSMIonly':([29,34,],[66,66,]),'importPart':([32,],[75,]),'imports':([32,],[76,]),'import':([32,76,],[78,120,]),'importIdentifiers':([32,76,],[79,79,]),'importIdentifier':([32,76,122,],[80,80,168,]),'importedKeyword':([32,76,122,],[83,83,83,]),'importedSMIKeyword':([32,76,122,],[84,84,84,]),'typeDeclarationRHS':([107,],[123,]),'Syntax':([107,153,418,491,509,],[124,206,435,511,539,]),'choiceClause':([107,],[126,]),'ObjectSyntax':([107,153,418,491,509,],[127,127,127,127,127,]),'SimpleSyntax':([107,135,153,418,491,509,],[130,173,130,130,130,130,]),'conceptualTable':([107,153,418,491,509,],[131,131,131,131,131,]),'row':([107,153,186,418,491,509,],[132,132,238,132,132,132,]),'entryType':([107,153,418,491,509,],[133,133,133,133,133,]),'ApplicationSyntax':([107,153,418,491,509,],[134,134,134,134,134,]),'typeTag':([107,153,418,491,509,],[135,135,135,135,135,]),'NotificationObjectsPart':([112,],[154,]),'SubjectCategoriesPart':([113,],[157,]),'ObjectGroupObjectsPart':([115,],[161,]),'NotificationsPart':([116,],[163,]),'DisplayPart':([125,],[169,]),'integerSubType':([136,137,138,142,143,144,145,146,148,174,185,288,292,293,296,297,298,299,300,302,345,346,],[175,179,181,189,193,194,195,189,199,181,189,189,189,189,189,189,189,189,189,189,189,189,]),'enumSpec':([136,138,142,146,174,185,288,292,293,296,297,298,299,300,302,345,346,],[176,180,191,191,180,191,191,191,191,191,191,191,191,191,191,191,191,]),'octetStringSubType':([138,142,146,147,174,184,185,288,292,293,296,297,298,299,300,302,345,346,],[182,190,190,197,182,236,190,190,190,190,190,190,190,190,190,190,190,190,]),'anySubType':([142,146,185,288,292,293,296,297,298,299,300,302,345,346,],[188,196,237,342,343,344,347,348,349,350,351,352,382,383,]),'Status':([152,160,207,212,214,218,272,364,],[205,211,253,265,267,273,330,389,]),'Text':([165,170,249,251,264,307,317,320,325,327,331,357,377,391,406,423,489,506,554,587,],[216,219,310,316,324,359,368,370,374,375,378,385,399,409,421,441,507,534,569,591,]),'NamedBits':([172,],[220,]),'NamedBit':([172,275,],[221,332,]),'ranges':([177,183,283,],[223,223,340,]),'range':([177,183,278,283,],[224,224,334,224,]),'value':([177,183,278,279,283,],[225,225,225,335,225,]),'enumItems':([178,],[232,]),'enumItem':([178,281,],[233,336,]),'sequenceItems':([187,],[240,]),'sequenceItem':([187,285,],[241,341,]),'VarPart':([203,],[246,]),'UnitsPart':([206,],[250,]),'Objects':([208,213,],[254,266,]),'Object':([208,213,319,],[255,255,369,]),'ObjectName':([208,213,309,319,387,450,461,483,501,517,531,560,586,593,],[256,256,362,256,362,471,485,503,503,542,503,571,590,590,]),'ExtUTCTime':([209,467,],[258,488,]),'SubjectCategories':([210,],[260,]),'CategoryIDs':([210,],[261,]),'CategoryID':([210,322,],[262,371,]),'Notifications':([215,],[268,]),'Notification':([215,329,],[269,376,]),'NotificationName':([215,329,422,],[270,270,440,]),'sequenceSyntax':([242,],[286,]),'sequenceObjectSyntax':([242,],[289,]),'sequenceSimpleSyntax':([242,],[290,]),'sequenceApplicationSyntax':([242,],[291,]),'DescrPart':([246,],[306,]),'MaxOrPIBAccessPart':([250,],[311,]),'MaxAccessPart':([250,],[312,]),'enumNumber':([282,],[337,]),'ReferPart':([306,310,324,368,374,375,378,399,405,],[356,363,373,390,397,398,400,417,420,]),'VarTypes':([309,],[360,]),'VarType':([309,387,],[361,403,]),'Access':([314,315,536,],[365,367,555,]),'ComplianceModulePart':([373,],[393,]),'ComplianceModules':([373,],[394,]),'ComplianceModule':([373,394,],[395,411,]),'descriptionClause':([389,],[405,]),'ComplianceModuleName':([396,],[412,]),'MandatoryPart':([412,],[425,]),'ModulePart_Capabilities':([417,],[430,]),'Modules_Capabilities':([417,],[431,]),'Module_Capabilities':([417,431,],[433,455,]),'IndexPart':([420,],[437,]),'CompliancePart':([425,],[443,]),'Compliances':([425,],[444,]),'Compliance':([425,444,],[446,469,]),'ComplianceGroup':([425,444,],[447,447,]),'ComplianceObject':([425,444,],[448,448,]),'ModuleName_Capabilities':([434,],[456,]),'MibIndex':([437,],[458,]),'RevisionPart':([441,],[463,]),'Revisions':([441,],[464,]),'Revision':([441,464,],[466,487,]),'MandatoryGroups':([451,],[472,]),'MandatoryGroup':([451,494,],[473,512,]),'DefValPart':([458,580,],[480,585,]),'Entry':([461,],[484,]),'SyntaxPart':([471,571,],[490,574,]),'IndexTypes':([483,],[499,]),'IndexType':([483,531,],[500,552,]),'Index':([483,501,531,],[502,532,502,]),'WriteSyntaxPart':([490,574,],[508,576,]),'CapabilitiesGroups':([496,],[514,]),'CapabilitiesGroup':([496,541,],[515,561,]),'Value':([498,],[519,]),'valueofObjectSyntax':([498,],[520,]),'valueofSimpleSyntax':([498,],[521,]),'AccessPart':([508,],[535,]),'WriteSyntax':([509,],[538,]),'BitsValue':([518,],[543,]),'objectIdentifier_defval':([518,],[544,]),'BitNames':([518,],[545,]),'subidentifiers_defval':([518,],[547,]),'subidentifier_defval':([518,547,],[549,566,]),'VariationPart':([540,],[556,]),'Variations':([540,],[557,]),'Variation':([540,557,],[559,570,]),'VariationAccessPart':([576,],[577,]),'CreationPart':([577,],[580,]),'VariationAccess':([578,],[583,]),'Cells':([586,],[588,]),'Cell':([586,593,],[589,594,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> mibFile","S'",1,None,None,None),
+  ('mibFile -> modules','mibFile',1,'p_mibFile','smi.py',179),
+  ('mibFile -> empty','mibFile',1,'p_mibFile','smi.py',180),
+  ('modules -> modules module','modules',2,'p_modules','smi.py',184),
+  ('modules -> module','modules',1,'p_modules','smi.py',185),
+  ('module -> moduleName moduleOid DEFINITIONS COLON_COLON_EQUAL BEGIN exportsClause linkagePart declarationPart END','module',9,'p_module','smi.py',193),
+  ('moduleOid -> { objectIdentifier }','moduleOid',3,'p_moduleOid','smi.py',202),
+  ('moduleOid -> empty','moduleOid',1,'p_moduleOid','smi.py',203),
+  ('linkagePart -> linkageClause','linkagePart',1,'p_linkagePart','smi.py',209),
+  ('linkagePart -> empty','linkagePart',1,'p_linkagePart','smi.py',210),
+  ('linkageClause -> IMPORTS importPart ;','linkageClause',3,'p_linkageClause','smi.py',215),
+  ('exportsClause -> EXPORTS','exportsClause',1,'p_exportsClause','smi.py',219),
+  ('exportsClause -> empty','exportsClause',1,'p_exportsClause','smi.py',220),
+  ('importPart -> imports','importPart',1,'p_importPart','smi.py',223),
+  ('importPart -> empty','importPart',1,'p_importPart','smi.py',224),
+  ('imports -> imports import','imports',2,'p_imports','smi.py',238),
+  ('imports -> import','imports',1,'p_imports','smi.py',239),
+  ('import -> importIdentifiers FROM moduleName','import',3,'p_import','smi.py',247),
+  ('importIdentifiers -> importIdentifiers , importIdentifier','importIdentifiers',3,'p_importIdentifiers','smi.py',253),
+  ('importIdentifiers -> importIdentifier','importIdentifiers',1,'p_importIdentifiers','smi.py',254),
+  ('importIdentifier -> LOWERCASE_IDENTIFIER','importIdentifier',1,'p_importIdentifier','smi.py',263),
+  ('importIdentifier -> UPPERCASE_IDENTIFIER','importIdentifier',1,'p_importIdentifier','smi.py',264),
+  ('importIdentifier -> importedKeyword','importIdentifier',1,'p_importIdentifier','smi.py',265),
+  ('importedKeyword -> importedSMIKeyword','importedKeyword',1,'p_importedKeyword','smi.py',269),
+  ('importedKeyword -> BITS','importedKeyword',1,'p_importedKeyword','smi.py',270),
+  ('importedKeyword -> INTEGER32','importedKeyword',1,'p_importedKeyword','smi.py',271),
+  ('importedKeyword -> IPADDRESS','importedKeyword',1,'p_importedKeyword','smi.py',272),
+  ('importedKeyword -> MANDATORY_GROUPS','importedKeyword',1,'p_importedKeyword','smi.py',273),
+  ('importedKeyword -> MODULE_COMPLIANCE','importedKeyword',1,'p_importedKeyword','smi.py',274),
+  ('importedKeyword -> MODULE_IDENTITY','importedKeyword',1,'p_importedKeyword','smi.py',275),
+  ('importedKeyword -> OBJECT_GROUP','importedKeyword',1,'p_importedKeyword','smi.py',276),
+  ('importedKeyword -> OBJECT_IDENTITY','importedKeyword',1,'p_importedKeyword','smi.py',277),
+  ('importedKeyword -> OBJECT_TYPE','importedKeyword',1,'p_importedKeyword','smi.py',278),
+  ('importedKeyword -> OPAQUE','importedKeyword',1,'p_importedKeyword','smi.py',279),
+  ('importedKeyword -> TEXTUAL_CONVENTION','importedKeyword',1,'p_importedKeyword','smi.py',280),
+  ('importedKeyword -> TIMETICKS','importedKeyword',1,'p_importedKeyword','smi.py',281),
+  ('importedKeyword -> UNSIGNED32','importedKeyword',1,'p_importedKeyword','smi.py',282),
+  ('importedSMIKeyword -> AGENT_CAPABILITIES','importedSMIKeyword',1,'p_importedSMIKeyword','smi.py',286),
+  ('importedSMIKeyword -> COUNTER32','importedSMIKeyword',1,'p_importedSMIKeyword','smi.py',287),
+  ('importedSMIKeyword -> COUNTER64','importedSMIKeyword',1,'p_importedSMIKeyword','smi.py',288),
+  ('importedSMIKeyword -> GAUGE32','importedSMIKeyword',1,'p_importedSMIKeyword','smi.py',289),
+  ('importedSMIKeyword -> NOTIFICATION_GROUP','importedSMIKeyword',1,'p_importedSMIKeyword','smi.py',290),
+  ('importedSMIKeyword -> NOTIFICATION_TYPE','importedSMIKeyword',1,'p_importedSMIKeyword','smi.py',291),
+  ('importedSMIKeyword -> TRAP_TYPE','importedSMIKeyword',1,'p_importedSMIKeyword','smi.py',292),
+  ('moduleName -> UPPERCASE_IDENTIFIER','moduleName',1,'p_moduleName','smi.py',296),
+  ('declarationPart -> declarations','declarationPart',1,'p_declarationPart','smi.py',300),
+  ('declarationPart -> empty','declarationPart',1,'p_declarationPart','smi.py',301),
+  ('declarations -> declarations declaration','declarations',2,'p_declarations','smi.py',306),
+  ('declarations -> declaration','declarations',1,'p_declarations','smi.py',307),
+  ('declaration -> typeDeclaration','declaration',1,'p_declaration','smi.py',315),
+  ('declaration -> valueDeclaration','declaration',1,'p_declaration','smi.py',316),
+  ('declaration -> objectIdentityClause','declaration',1,'p_declaration','smi.py',317),
+  ('declaration -> objectTypeClause','declaration',1,'p_declaration','smi.py',318),
+  ('declaration -> trapTypeClause','declaration',1,'p_declaration','smi.py',319),
+  ('declaration -> notificationTypeClause','declaration',1,'p_declaration','smi.py',320),
+  ('declaration -> moduleIdentityClause','declaration',1,'p_declaration','smi.py',321),
+  ('declaration -> moduleComplianceClause','declaration',1,'p_declaration','smi.py',322),
+  ('declaration -> objectGroupClause','declaration',1,'p_declaration','smi.py',323),
+  ('declaration -> notificationGroupClause','declaration',1,'p_declaration','smi.py',324),
+  ('declaration -> agentCapabilitiesClause','declaration',1,'p_declaration','smi.py',325),
+  ('declaration -> macroClause','declaration',1,'p_declaration','smi.py',326),
+  ('macroClause -> macroName MACRO END','macroClause',3,'p_macroClause','smi.py',331),
+  ('macroName -> MODULE_IDENTITY','macroName',1,'p_macroName','smi.py',334),
+  ('macroName -> OBJECT_TYPE','macroName',1,'p_macroName','smi.py',335),
+  ('macroName -> TRAP_TYPE','macroName',1,'p_macroName','smi.py',336),
+  ('macroName -> NOTIFICATION_TYPE','macroName',1,'p_macroName','smi.py',337),
+  ('macroName -> OBJECT_IDENTITY','macroName',1,'p_macroName','smi.py',338),
+  ('macroName -> TEXTUAL_CONVENTION','macroName',1,'p_macroName','smi.py',339),
+  ('macroName -> OBJECT_GROUP','macroName',1,'p_macroName','smi.py',340),
+  ('macroName -> NOTIFICATION_GROUP','macroName',1,'p_macroName','smi.py',341),
+  ('macroName -> MODULE_COMPLIANCE','macroName',1,'p_macroName','smi.py',342),
+  ('macroName -> AGENT_CAPABILITIES','macroName',1,'p_macroName','smi.py',343),
+  ('choiceClause -> CHOICE','choiceClause',1,'p_choiceClause','smi.py',346),
+  ('fuzzy_lowercase_identifier -> LOWERCASE_IDENTIFIER','fuzzy_lowercase_identifier',1,'p_fuzzy_lowercase_identifier','smi.py',350),
+  ('fuzzy_lowercase_identifier -> UPPERCASE_IDENTIFIER','fuzzy_lowercase_identifier',1,'p_fuzzy_lowercase_identifier','smi.py',351),
+  ('valueDeclaration -> fuzzy_lowercase_identifier OBJECT IDENTIFIER COLON_COLON_EQUAL { objectIdentifier }','valueDeclaration',7,'p_valueDeclaration','smi.py',355),
+  ('typeDeclaration -> typeName COLON_COLON_EQUAL typeDeclarationRHS','typeDeclaration',3,'p_typeDeclaration','smi.py',359),
+  ('typeName -> UPPERCASE_IDENTIFIER','typeName',1,'p_typeName','smi.py',363),
+  ('typeName -> typeSMI','typeName',1,'p_typeName','smi.py',364),
+  ('typeSMI -> typeSMIandSPPI','typeSMI',1,'p_typeSMI','smi.py',368),
+  ('typeSMI -> typeSMIonly','typeSMI',1,'p_typeSMI','smi.py',369),
+  ('typeSMIandSPPI -> IPADDRESS','typeSMIandSPPI',1,'p_typeSMIandSPPI','smi.py',373),
+  ('typeSMIandSPPI -> TIMETICKS','typeSMIandSPPI',1,'p_typeSMIandSPPI','smi.py',374),
+  ('typeSMIandSPPI -> OPAQUE','typeSMIandSPPI',1,'p_typeSMIandSPPI','smi.py',375),
+  ('typeSMIandSPPI -> INTEGER32','typeSMIandSPPI',1,'p_typeSMIandSPPI','smi.py',376),
+  ('typeSMIandSPPI -> UNSIGNED32','typeSMIandSPPI',1,'p_typeSMIandSPPI','smi.py',377),
+  ('typeSMIonly -> COUNTER32','typeSMIonly',1,'p_typeSMIonly','smi.py',381),
+  ('typeSMIonly -> GAUGE32','typeSMIonly',1,'p_typeSMIonly','smi.py',382),
+  ('typeSMIonly -> COUNTER64','typeSMIonly',1,'p_typeSMIonly','smi.py',383),
+  ('typeDeclarationRHS -> Syntax','typeDeclarationRHS',1,'p_typeDeclarationRHS','smi.py',387),
+  ('typeDeclarationRHS -> TEXTUAL_CONVENTION DisplayPart STATUS Status DESCRIPTION Text ReferPart SYNTAX Syntax','typeDeclarationRHS',9,'p_typeDeclarationRHS','smi.py',388),
+  ('typeDeclarationRHS -> choiceClause','typeDeclarationRHS',1,'p_typeDeclarationRHS','smi.py',389),
+  ('conceptualTable -> SEQUENCE OF row','conceptualTable',3,'p_conceptualTable','smi.py',405),
+  ('row -> UPPERCASE_IDENTIFIER','row',1,'p_row','smi.py',409),
+  ('entryType -> SEQUENCE { sequenceItems }','entryType',4,'p_entryType','smi.py',414),
+  ('sequenceItems -> sequenceItems , sequenceItem','sequenceItems',3,'p_sequenceItems','smi.py',418),
+  ('sequenceItems -> sequenceItem','sequenceItems',1,'p_sequenceItems','smi.py',419),
+  ('sequenceItem -> LOWERCASE_IDENTIFIER sequenceSyntax','sequenceItem',2,'p_sequenceItem','smi.py',428),
+  ('Syntax -> ObjectSyntax','Syntax',1,'p_Syntax','smi.py',432),
+  ('Syntax -> BITS { NamedBits }','Syntax',4,'p_Syntax','smi.py',433),
+  ('sequenceSyntax -> BITS','sequenceSyntax',1,'p_sequenceSyntax','smi.py',443),
+  ('sequenceSyntax -> UPPERCASE_IDENTIFIER anySubType','sequenceSyntax',2,'p_sequenceSyntax','smi.py',444),
+  ('sequenceSyntax -> sequenceObjectSyntax','sequenceSyntax',1,'p_sequenceSyntax','smi.py',445),
+  ('NamedBits -> NamedBits , NamedBit','NamedBits',3,'p_NamedBits','smi.py',449),
+  ('NamedBits -> NamedBit','NamedBits',1,'p_NamedBits','smi.py',450),
+  ('NamedBit -> LOWERCASE_IDENTIFIER ( NUMBER )','NamedBit',4,'p_NamedBit','smi.py',458),
+  ('objectIdentityClause -> LOWERCASE_IDENTIFIER OBJECT_IDENTITY STATUS Status DESCRIPTION Text ReferPart COLON_COLON_EQUAL { objectIdentifier }','objectIdentityClause',11,'p_objectIdentityClause','smi.py',462),
+  ('objectTypeClause -> LOWERCASE_IDENTIFIER OBJECT_TYPE SYNTAX Syntax UnitsPart MaxOrPIBAccessPart STATUS Status descriptionClause ReferPart IndexPart MibIndex DefValPart COLON_COLON_EQUAL { ObjectName }','objectTypeClause',17,'p_objectTypeClause','smi.py',474),
+  ('descriptionClause -> DESCRIPTION Text','descriptionClause',2,'p_descriptionClause','smi.py',492),
+  ('descriptionClause -> empty','descriptionClause',1,'p_descriptionClause','smi.py',493),
+  ('trapTypeClause -> fuzzy_lowercase_identifier TRAP_TYPE ENTERPRISE objectIdentifier VarPart DescrPart ReferPart COLON_COLON_EQUAL NUMBER','trapTypeClause',9,'p_trapTypeClause','smi.py',498),
+  ('VarPart -> VARIABLES { VarTypes }','VarPart',4,'p_VarPart','smi.py',512),
+  ('VarPart -> empty','VarPart',1,'p_VarPart','smi.py',513),
+  ('VarTypes -> VarTypes , VarType','VarTypes',3,'p_VarTypes','smi.py',517),
+  ('VarTypes -> VarType','VarTypes',1,'p_VarTypes','smi.py',518),
+  ('VarType -> ObjectName','VarType',1,'p_VarType','smi.py',526),
+  ('DescrPart -> DESCRIPTION Text','DescrPart',2,'p_DescrPart','smi.py',530),
+  ('DescrPart -> empty','DescrPart',1,'p_DescrPart','smi.py',531),
+  ('MaxOrPIBAccessPart -> MaxAccessPart','MaxOrPIBAccessPart',1,'p_MaxOrPIBAccessPart','smi.py',536),
+  ('MaxOrPIBAccessPart -> empty','MaxOrPIBAccessPart',1,'p_MaxOrPIBAccessPart','smi.py',537),
+  ('MaxAccessPart -> MAX_ACCESS Access','MaxAccessPart',2,'p_MaxAccessPart','smi.py',542),
+  ('MaxAccessPart -> ACCESS Access','MaxAccessPart',2,'p_MaxAccessPart','smi.py',543),
+  ('notificationTypeClause -> LOWERCASE_IDENTIFIER NOTIFICATION_TYPE NotificationObjectsPart STATUS Status DESCRIPTION Text ReferPart COLON_COLON_EQUAL { NotificationName }','notificationTypeClause',12,'p_notificationTypeClause','smi.py',547),
+  ('moduleIdentityClause -> LOWERCASE_IDENTIFIER MODULE_IDENTITY SubjectCategoriesPart LAST_UPDATED ExtUTCTime ORGANIZATION Text CONTACT_INFO Text DESCRIPTION Text RevisionPart COLON_COLON_EQUAL { objectIdentifier }','moduleIdentityClause',16,'p_moduleIdentityClause','smi.py',560),
+  ('SubjectCategoriesPart -> SUBJECT_CATEGORIES { SubjectCategories }','SubjectCategoriesPart',4,'p_SubjectCategoriesPart','smi.py',577),
+  ('SubjectCategoriesPart -> empty','SubjectCategoriesPart',1,'p_SubjectCategoriesPart','smi.py',578),
+  ('SubjectCategories -> CategoryIDs','SubjectCategories',1,'p_SubjectCategories','smi.py',583),
+  ('CategoryIDs -> CategoryIDs , CategoryID','CategoryIDs',3,'p_CategoryIDs','smi.py',587),
+  ('CategoryIDs -> CategoryID','CategoryIDs',1,'p_CategoryIDs','smi.py',588),
+  ('CategoryID -> LOWERCASE_IDENTIFIER ( NUMBER )','CategoryID',4,'p_CategoryID','smi.py',596),
+  ('CategoryID -> LOWERCASE_IDENTIFIER','CategoryID',1,'p_CategoryID','smi.py',597),
+  ('ObjectSyntax -> SimpleSyntax','ObjectSyntax',1,'p_ObjectSyntax','smi.py',607),
+  ('ObjectSyntax -> conceptualTable','ObjectSyntax',1,'p_ObjectSyntax','smi.py',608),
+  ('ObjectSyntax -> row','ObjectSyntax',1,'p_ObjectSyntax','smi.py',609),
+  ('ObjectSyntax -> entryType','ObjectSyntax',1,'p_ObjectSyntax','smi.py',610),
+  ('ObjectSyntax -> ApplicationSyntax','ObjectSyntax',1,'p_ObjectSyntax','smi.py',611),
+  ('ObjectSyntax -> typeTag SimpleSyntax','ObjectSyntax',2,'p_ObjectSyntax','smi.py',612),
+  ('typeTag -> [ APPLICATION NUMBER ] IMPLICIT','typeTag',5,'p_typeTag','smi.py',620),
+  ('typeTag -> [ UNIVERSAL NUMBER ] IMPLICIT','typeTag',5,'p_typeTag','smi.py',621),
+  ('sequenceObjectSyntax -> sequenceSimpleSyntax','sequenceObjectSyntax',1,'p_sequenceObjectSyntax','smi.py',624),
+  ('sequenceObjectSyntax -> sequenceApplicationSyntax','sequenceObjectSyntax',1,'p_sequenceObjectSyntax','smi.py',625),
+  ('valueofObjectSyntax -> valueofSimpleSyntax','valueofObjectSyntax',1,'p_valueofObjectSyntax','smi.py',630),
+  ('SimpleSyntax -> INTEGER','SimpleSyntax',1,'p_SimpleSyntax','smi.py',634),
+  ('SimpleSyntax -> INTEGER integerSubType','SimpleSyntax',2,'p_SimpleSyntax','smi.py',635),
+  ('SimpleSyntax -> INTEGER enumSpec','SimpleSyntax',2,'p_SimpleSyntax','smi.py',636),
+  ('SimpleSyntax -> INTEGER32','SimpleSyntax',1,'p_SimpleSyntax','smi.py',637),
+  ('SimpleSyntax -> INTEGER32 integerSubType','SimpleSyntax',2,'p_SimpleSyntax','smi.py',638),
+  ('SimpleSyntax -> UPPERCASE_IDENTIFIER enumSpec','SimpleSyntax',2,'p_SimpleSyntax','smi.py',639),
+  ('SimpleSyntax -> UPPERCASE_IDENTIFIER integerSubType','SimpleSyntax',2,'p_SimpleSyntax','smi.py',640),
+  ('SimpleSyntax -> OCTET STRING','SimpleSyntax',2,'p_SimpleSyntax','smi.py',641),
+  ('SimpleSyntax -> OCTET STRING octetStringSubType','SimpleSyntax',3,'p_SimpleSyntax','smi.py',642),
+  ('SimpleSyntax -> UPPERCASE_IDENTIFIER octetStringSubType','SimpleSyntax',2,'p_SimpleSyntax','smi.py',643),
+  ('SimpleSyntax -> OBJECT IDENTIFIER anySubType','SimpleSyntax',3,'p_SimpleSyntax','smi.py',644),
+  ('valueofSimpleSyntax -> NUMBER','valueofSimpleSyntax',1,'p_valueofSimpleSyntax','smi.py',659),
+  ('valueofSimpleSyntax -> NEGATIVENUMBER','valueofSimpleSyntax',1,'p_valueofSimpleSyntax','smi.py',660),
+  ('valueofSimpleSyntax -> NUMBER64','valueofSimpleSyntax',1,'p_valueofSimpleSyntax','smi.py',661),
+  ('valueofSimpleSyntax -> NEGATIVENUMBER64','valueofSimpleSyntax',1,'p_valueofSimpleSyntax','smi.py',662),
+  ('valueofSimpleSyntax -> HEX_STRING','valueofSimpleSyntax',1,'p_valueofSimpleSyntax','smi.py',663),
+  ('valueofSimpleSyntax -> BIN_STRING','valueofSimpleSyntax',1,'p_valueofSimpleSyntax','smi.py',664),
+  ('valueofSimpleSyntax -> LOWERCASE_IDENTIFIER','valueofSimpleSyntax',1,'p_valueofSimpleSyntax','smi.py',665),
+  ('valueofSimpleSyntax -> QUOTED_STRING','valueofSimpleSyntax',1,'p_valueofSimpleSyntax','smi.py',666),
+  ('valueofSimpleSyntax -> { objectIdentifier_defval }','valueofSimpleSyntax',3,'p_valueofSimpleSyntax','smi.py',667),
+  ('sequenceSimpleSyntax -> INTEGER anySubType','sequenceSimpleSyntax',2,'p_sequenceSimpleSyntax','smi.py',680),
+  ('sequenceSimpleSyntax -> INTEGER32 anySubType','sequenceSimpleSyntax',2,'p_sequenceSimpleSyntax','smi.py',681),
+  ('sequenceSimpleSyntax -> OCTET STRING anySubType','sequenceSimpleSyntax',3,'p_sequenceSimpleSyntax','smi.py',682),
+  ('sequenceSimpleSyntax -> OBJECT IDENTIFIER anySubType','sequenceSimpleSyntax',3,'p_sequenceSimpleSyntax','smi.py',683),
+  ('ApplicationSyntax -> IPADDRESS anySubType','ApplicationSyntax',2,'p_ApplicationSyntax','smi.py',691),
+  ('ApplicationSyntax -> COUNTER32','ApplicationSyntax',1,'p_ApplicationSyntax','smi.py',692),
+  ('ApplicationSyntax -> COUNTER32 integerSubType','ApplicationSyntax',2,'p_ApplicationSyntax','smi.py',693),
+  ('ApplicationSyntax -> GAUGE32','ApplicationSyntax',1,'p_ApplicationSyntax','smi.py',694),
+  ('ApplicationSyntax -> GAUGE32 integerSubType','ApplicationSyntax',2,'p_ApplicationSyntax','smi.py',695),
+  ('ApplicationSyntax -> UNSIGNED32','ApplicationSyntax',1,'p_ApplicationSyntax','smi.py',696),
+  ('ApplicationSyntax -> UNSIGNED32 integerSubType','ApplicationSyntax',2,'p_ApplicationSyntax','smi.py',697),
+  ('ApplicationSyntax -> TIMETICKS anySubType','ApplicationSyntax',2,'p_ApplicationSyntax','smi.py',698),
+  ('ApplicationSyntax -> OPAQUE','ApplicationSyntax',1,'p_ApplicationSyntax','smi.py',699),
+  ('ApplicationSyntax -> OPAQUE octetStringSubType','ApplicationSyntax',2,'p_ApplicationSyntax','smi.py',700),
+  ('ApplicationSyntax -> COUNTER64','ApplicationSyntax',1,'p_ApplicationSyntax','smi.py',701),
+  ('ApplicationSyntax -> COUNTER64 integerSubType','ApplicationSyntax',2,'p_ApplicationSyntax','smi.py',702),
+  ('sequenceApplicationSyntax -> IPADDRESS anySubType','sequenceApplicationSyntax',2,'p_sequenceApplicationSyntax','smi.py',711),
+  ('sequenceApplicationSyntax -> COUNTER32 anySubType','sequenceApplicationSyntax',2,'p_sequenceApplicationSyntax','smi.py',712),
+  ('sequenceApplicationSyntax -> GAUGE32 anySubType','sequenceApplicationSyntax',2,'p_sequenceApplicationSyntax','smi.py',713),
+  ('sequenceApplicationSyntax -> UNSIGNED32 anySubType','sequenceApplicationSyntax',2,'p_sequenceApplicationSyntax','smi.py',714),
+  ('sequenceApplicationSyntax -> TIMETICKS anySubType','sequenceApplicationSyntax',2,'p_sequenceApplicationSyntax','smi.py',715),
+  ('sequenceApplicationSyntax -> OPAQUE','sequenceApplicationSyntax',1,'p_sequenceApplicationSyntax','smi.py',716),
+  ('sequenceApplicationSyntax -> COUNTER64 anySubType','sequenceApplicationSyntax',2,'p_sequenceApplicationSyntax','smi.py',717),
+  ('anySubType -> integerSubType','anySubType',1,'p_anySubType','smi.py',725),
+  ('anySubType -> octetStringSubType','anySubType',1,'p_anySubType','smi.py',726),
+  ('anySubType -> enumSpec','anySubType',1,'p_anySubType','smi.py',727),
+  ('anySubType -> empty','anySubType',1,'p_anySubType','smi.py',728),
+  ('integerSubType -> ( ranges )','integerSubType',3,'p_integerSubType','smi.py',733),
+  ('octetStringSubType -> ( SIZE ( ranges ) )','octetStringSubType',6,'p_octetStringSubType','smi.py',737),
+  ('ranges -> ranges | range','ranges',3,'p_ranges','smi.py',741),
+  ('ranges -> range','ranges',1,'p_ranges','smi.py',742),
+  ('range -> value DOT_DOT value','range',3,'p_range','smi.py',750),
+  ('range -> value','range',1,'p_range','smi.py',751),
+  ('value -> NEGATIVENUMBER','value',1,'p_value','smi.py',759),
+  ('value -> NUMBER','value',1,'p_value','smi.py',760),
+  ('value -> NEGATIVENUMBER64','value',1,'p_value','smi.py',761),
+  ('value -> NUMBER64','value',1,'p_value','smi.py',762),
+  ('value -> HEX_STRING','value',1,'p_value','smi.py',763),
+  ('value -> BIN_STRING','value',1,'p_value','smi.py',764),
+  ('enumSpec -> { enumItems }','enumSpec',3,'p_enumSpec','smi.py',768),
+  ('enumItems -> enumItems , enumItem','enumItems',3,'p_enumItems','smi.py',772),
+  ('enumItems -> enumItem','enumItems',1,'p_enumItems','smi.py',773),
+  ('enumItem -> LOWERCASE_IDENTIFIER ( enumNumber )','enumItem',4,'p_enumItem','smi.py',781),
+  ('enumNumber -> NUMBER','enumNumber',1,'p_enumNumber','smi.py',785),
+  ('enumNumber -> NEGATIVENUMBER','enumNumber',1,'p_enumNumber','smi.py',786),
+  ('Status -> LOWERCASE_IDENTIFIER','Status',1,'p_Status','smi.py',791),
+  ('DisplayPart -> DISPLAY_HINT Text','DisplayPart',2,'p_DisplayPart','smi.py',795),
+  ('DisplayPart -> empty','DisplayPart',1,'p_DisplayPart','smi.py',796),
+  ('UnitsPart -> UNITS Text','UnitsPart',2,'p_UnitsPart','smi.py',801),
+  ('UnitsPart -> empty','UnitsPart',1,'p_UnitsPart','smi.py',802),
+  ('Access -> LOWERCASE_IDENTIFIER','Access',1,'p_Access','smi.py',807),
+  ('IndexPart -> AUGMENTS { Entry }','IndexPart',4,'p_IndexPart','smi.py',811),
+  ('IndexPart -> empty','IndexPart',1,'p_IndexPart','smi.py',812),
+  ('MibIndex -> INDEX { IndexTypes }','MibIndex',4,'p_MibIndex','smi.py',817),
+  ('MibIndex -> empty','MibIndex',1,'p_MibIndex','smi.py',818),
+  ('IndexTypes -> IndexTypes , IndexType','IndexTypes',3,'p_IndexTypes','smi.py',823),
+  ('IndexTypes -> IndexType','IndexTypes',1,'p_IndexTypes','smi.py',824),
+  ('IndexType -> IMPLIED Index','IndexType',2,'p_IndexType','smi.py',832),
+  ('IndexType -> Index','IndexType',1,'p_IndexType','smi.py',833),
+  ('Index -> ObjectName','Index',1,'p_Index','smi.py',841),
+  ('Entry -> ObjectName','Entry',1,'p_Entry','smi.py',847),
+  ('DefValPart -> DEFVAL { Value }','DefValPart',4,'p_DefValPart','smi.py',851),
+  ('DefValPart -> empty','DefValPart',1,'p_DefValPart','smi.py',852),
+  ('Value -> valueofObjectSyntax','Value',1,'p_Value','smi.py',857),
+  ('Value -> { BitsValue }','Value',3,'p_Value','smi.py',858),
+  ('BitsValue -> BitNames','BitsValue',1,'p_BitsValue','smi.py',866),
+  ('BitsValue -> empty','BitsValue',1,'p_BitsValue','smi.py',867),
+  ('BitNames -> BitNames , LOWERCASE_IDENTIFIER','BitNames',3,'p_BitNames','smi.py',871),
+  ('BitNames -> LOWERCASE_IDENTIFIER','BitNames',1,'p_BitNames','smi.py',872),
+  ('ObjectName -> objectIdentifier','ObjectName',1,'p_ObjectName','smi.py',880),
+  ('NotificationName -> objectIdentifier','NotificationName',1,'p_NotificationName','smi.py',884),
+  ('ReferPart -> REFERENCE Text','ReferPart',2,'p_ReferPart','smi.py',888),
+  ('ReferPart -> empty','ReferPart',1,'p_ReferPart','smi.py',889),
+  ('RevisionPart -> Revisions','RevisionPart',1,'p_RevisionPart','smi.py',894),
+  ('RevisionPart -> empty','RevisionPart',1,'p_RevisionPart','smi.py',895),
+  ('Revisions -> Revisions Revision','Revisions',2,'p_Revisions','smi.py',900),
+  ('Revisions -> Revision','Revisions',1,'p_Revisions','smi.py',901),
+  ('Revision -> REVISION ExtUTCTime DESCRIPTION Text','Revision',4,'p_Revision','smi.py',909),
+  ('NotificationObjectsPart -> OBJECTS { Objects }','NotificationObjectsPart',4,'p_NotificationObjectsPart','smi.py',913),
+  ('NotificationObjectsPart -> empty','NotificationObjectsPart',1,'p_NotificationObjectsPart','smi.py',914),
+  ('ObjectGroupObjectsPart -> OBJECTS { Objects }','ObjectGroupObjectsPart',4,'p_ObjectGroupObjectsPart','smi.py',918),
+  ('Objects -> Objects , Object','Objects',3,'p_Objects','smi.py',922),
+  ('Objects -> Object','Objects',1,'p_Objects','smi.py',923),
+  ('Object -> ObjectName','Object',1,'p_Object','smi.py',931),
+  ('NotificationsPart -> NOTIFICATIONS { Notifications }','NotificationsPart',4,'p_NotificationsPart','smi.py',935),
+  ('Notifications -> Notifications , Notification','Notifications',3,'p_Notifications','smi.py',939),
+  ('Notifications -> Notification','Notifications',1,'p_Notifications','smi.py',940),
+  ('Notification -> NotificationName','Notification',1,'p_Notification','smi.py',948),
+  ('Text -> QUOTED_STRING','Text',1,'p_Text','smi.py',952),
+  ('ExtUTCTime -> QUOTED_STRING','ExtUTCTime',1,'p_ExtUTCTime','smi.py',956),
+  ('objectIdentifier -> subidentifiers','objectIdentifier',1,'p_objectIdentifier','smi.py',960),
+  ('subidentifiers -> subidentifiers subidentifier','subidentifiers',2,'p_subidentifiers','smi.py',964),
+  ('subidentifiers -> subidentifier','subidentifiers',1,'p_subidentifiers','smi.py',965),
+  ('subidentifier -> fuzzy_lowercase_identifier','subidentifier',1,'p_subidentifier','smi.py',973),
+  ('subidentifier -> NUMBER','subidentifier',1,'p_subidentifier','smi.py',974),
+  ('subidentifier -> LOWERCASE_IDENTIFIER ( NUMBER )','subidentifier',4,'p_subidentifier','smi.py',975),
+  ('objectIdentifier_defval -> subidentifiers_defval','objectIdentifier_defval',1,'p_objectIdentifier_defval','smi.py',985),
+  ('subidentifiers_defval -> subidentifiers_defval subidentifier_defval','subidentifiers_defval',2,'p_subidentifiers_defval','smi.py',989),
+  ('subidentifiers_defval -> subidentifier_defval','subidentifiers_defval',1,'p_subidentifiers_defval','smi.py',990),
+  ('subidentifier_defval -> LOWERCASE_IDENTIFIER ( NUMBER )','subidentifier_defval',4,'p_subidentifier_defval','smi.py',998),
+  ('subidentifier_defval -> NUMBER','subidentifier_defval',1,'p_subidentifier_defval','smi.py',999),
+  ('objectGroupClause -> LOWERCASE_IDENTIFIER OBJECT_GROUP ObjectGroupObjectsPart STATUS Status DESCRIPTION Text ReferPart COLON_COLON_EQUAL { objectIdentifier }','objectGroupClause',12,'p_objectGroupClause','smi.py',1007),
+  ('notificationGroupClause -> LOWERCASE_IDENTIFIER NOTIFICATION_GROUP NotificationsPart STATUS Status DESCRIPTION Text ReferPart COLON_COLON_EQUAL { objectIdentifier }','notificationGroupClause',12,'p_notificationGroupClause','smi.py',1019),
+  ('moduleComplianceClause -> LOWERCASE_IDENTIFIER MODULE_COMPLIANCE STATUS Status DESCRIPTION Text ReferPart ComplianceModulePart COLON_COLON_EQUAL { objectIdentifier }','moduleComplianceClause',12,'p_moduleComplianceClause','smi.py',1031),
+  ('ComplianceModulePart -> ComplianceModules','ComplianceModulePart',1,'p_ComplianceModulePart','smi.py',1044),
+  ('ComplianceModules -> ComplianceModules ComplianceModule','ComplianceModules',2,'p_ComplianceModules','smi.py',1048),
+  ('ComplianceModules -> ComplianceModule','ComplianceModules',1,'p_ComplianceModules','smi.py',1049),
+  ('ComplianceModule -> MODULE ComplianceModuleName MandatoryPart CompliancePart','ComplianceModule',4,'p_ComplianceModule','smi.py',1057),
+  ('ComplianceModuleName -> UPPERCASE_IDENTIFIER','ComplianceModuleName',1,'p_ComplianceModuleName','smi.py',1063),
+  ('ComplianceModuleName -> empty','ComplianceModuleName',1,'p_ComplianceModuleName','smi.py',1064),
+  ('MandatoryPart -> MANDATORY_GROUPS { MandatoryGroups }','MandatoryPart',4,'p_MandatoryPart','smi.py',1069),
+  ('MandatoryPart -> empty','MandatoryPart',1,'p_MandatoryPart','smi.py',1070),
+  ('MandatoryGroups -> MandatoryGroups , MandatoryGroup','MandatoryGroups',3,'p_MandatoryGroups','smi.py',1075),
+  ('MandatoryGroups -> MandatoryGroup','MandatoryGroups',1,'p_MandatoryGroups','smi.py',1076),
+  ('MandatoryGroup -> objectIdentifier','MandatoryGroup',1,'p_MandatoryGroup','smi.py',1084),
+  ('CompliancePart -> Compliances','CompliancePart',1,'p_CompliancePart','smi.py',1088),
+  ('CompliancePart -> empty','CompliancePart',1,'p_CompliancePart','smi.py',1089),
+  ('Compliances -> Compliances Compliance','Compliances',2,'p_Compliances','smi.py',1094),
+  ('Compliances -> Compliance','Compliances',1,'p_Compliances','smi.py',1095),
+  ('Compliance -> ComplianceGroup','Compliance',1,'p_Compliance','smi.py',1103),
+  ('Compliance -> ComplianceObject','Compliance',1,'p_Compliance','smi.py',1104),
+  ('ComplianceGroup -> GROUP objectIdentifier DESCRIPTION Text','ComplianceGroup',4,'p_ComplianceGroup','smi.py',1109),
+  ('ComplianceObject -> OBJECT ObjectName SyntaxPart WriteSyntaxPart AccessPart DESCRIPTION Text','ComplianceObject',7,'p_ComplianceObject','smi.py',1115),
+  ('SyntaxPart -> SYNTAX Syntax','SyntaxPart',2,'p_SyntaxPart','smi.py',1124),
+  ('SyntaxPart -> empty','SyntaxPart',1,'p_SyntaxPart','smi.py',1125),
+  ('WriteSyntaxPart -> WRITE_SYNTAX WriteSyntax','WriteSyntaxPart',2,'p_WriteSyntaxPart','smi.py',1130),
+  ('WriteSyntaxPart -> empty','WriteSyntaxPart',1,'p_WriteSyntaxPart','smi.py',1131),
+  ('WriteSyntax -> Syntax','WriteSyntax',1,'p_WriteSyntax','smi.py',1136),
+  ('AccessPart -> MIN_ACCESS Access','AccessPart',2,'p_AccessPart','smi.py',1140),
+  ('AccessPart -> empty','AccessPart',1,'p_AccessPart','smi.py',1141),
+  ('agentCapabilitiesClause -> LOWERCASE_IDENTIFIER AGENT_CAPABILITIES PRODUCT_RELEASE Text STATUS Status DESCRIPTION Text ReferPart ModulePart_Capabilities COLON_COLON_EQUAL { objectIdentifier }','agentCapabilitiesClause',14,'p_agentCapabilitiesClause','smi.py',1146),
+  ('ModulePart_Capabilities -> Modules_Capabilities','ModulePart_Capabilities',1,'p_ModulePart_Capabilities','smi.py',1160),
+  ('ModulePart_Capabilities -> empty','ModulePart_Capabilities',1,'p_ModulePart_Capabilities','smi.py',1161),
+  ('Modules_Capabilities -> Modules_Capabilities Module_Capabilities','Modules_Capabilities',2,'p_Modules_Capabilities','smi.py',1166),
+  ('Modules_Capabilities -> Module_Capabilities','Modules_Capabilities',1,'p_Modules_Capabilities','smi.py',1167),
+  ('Module_Capabilities -> SUPPORTS ModuleName_Capabilities INCLUDES { CapabilitiesGroups } VariationPart','Module_Capabilities',7,'p_Module_Capabilities','smi.py',1175),
+  ('CapabilitiesGroups -> CapabilitiesGroups , CapabilitiesGroup','CapabilitiesGroups',3,'p_CapabilitiesGroups','smi.py',1181),
+  ('CapabilitiesGroups -> CapabilitiesGroup','CapabilitiesGroups',1,'p_CapabilitiesGroups','smi.py',1182),
+  ('CapabilitiesGroup -> objectIdentifier','CapabilitiesGroup',1,'p_CapabilitiesGroup','smi.py',1190),
+  ('ModuleName_Capabilities -> UPPERCASE_IDENTIFIER objectIdentifier','ModuleName_Capabilities',2,'p_ModuleName_Capabilities','smi.py',1194),
+  ('ModuleName_Capabilities -> UPPERCASE_IDENTIFIER','ModuleName_Capabilities',1,'p_ModuleName_Capabilities','smi.py',1195),
+  ('VariationPart -> Variations','VariationPart',1,'p_VariationPart','smi.py',1203),
+  ('VariationPart -> empty','VariationPart',1,'p_VariationPart','smi.py',1204),
+  ('Variations -> Variations Variation','Variations',2,'p_Variations','smi.py',1209),
+  ('Variations -> Variation','Variations',1,'p_Variations','smi.py',1210),
+  ('Variation -> VARIATION ObjectName SyntaxPart WriteSyntaxPart VariationAccessPart CreationPart DefValPart DESCRIPTION Text','Variation',9,'p_Variation','smi.py',1218),
+  ('VariationAccessPart -> ACCESS VariationAccess','VariationAccessPart',2,'p_VariationAccessPart','smi.py',1229),
+  ('VariationAccessPart -> empty','VariationAccessPart',1,'p_VariationAccessPart','smi.py',1230),
+  ('VariationAccess -> LOWERCASE_IDENTIFIER','VariationAccess',1,'p_VariationAccess','smi.py',1235),
+  ('CreationPart -> CREATION_REQUIRES { Cells }','CreationPart',4,'p_CreationPart','smi.py',1239),
+  ('CreationPart -> empty','CreationPart',1,'p_CreationPart','smi.py',1240),
+  ('Cells -> Cells , Cell','Cells',3,'p_Cells','smi.py',1245),
+  ('Cells -> Cell','Cells',1,'p_Cells','smi.py',1246),
+  ('Cell -> ObjectName','Cell',1,'p_Cell','smi.py',1254),
+  ('empty -> <empty>','empty',0,'p_empty','smi.py',1258),
+]
@@ -5,6 +5,7 @@
 # License: https://www.pysnmp.com/pysmi/license.html
 #
 from pysmi.reader.callback import CallbackReader
+from pysmi.reader.corpus import CorpusReader
 from pysmi.reader.httpclient import HttpReader
 from pysmi.reader.localfile import FileReader
 from pysmi.reader.url import get_readers_from_urls
@@ -4,6 +4,7 @@
 # Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
 # License: https://www.pysnmp.com/pysmi/license.html
 #
+import asyncio
 import os
 
 
@@ -20,6 +21,10 @@ class AbstractReader:
         return self
 
     def get_mib_variants(self, mibname, **options):
+        # exact (alias, file name) pairs known to serve the MIB
+        if options.get("variants"):
+            return options["variants"]
+
         filenames = []
 
         if self.originalMatching:
@@ -44,3 +49,18 @@ class AbstractReader:
 
     def get_data(self, filename, **options):
         raise NotImplementedError()
+
+    def get_file_names(self):
+        """Return names of all files this reader serves, if it can tell."""
+        raise NotImplementedError()
+
+    def get_file_data(self, filename):
+        """Return *MibInfo* and contents of the file by its exact name."""
+        raise NotImplementedError()
+
+    async def get_data_async(self, filename, **options):
+        """Asynchronous version of *get_data*.
+
+        Unless overridden, calls *get_data* in a separate thread.
+        """
+        return await asyncio.to_thread(self.get_data, filename, **options)
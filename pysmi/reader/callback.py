@@ -4,6 +4,7 @@
 # Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
 # License: https://www.pysnmp.com/pysmi/license.html
 #
+import inspect
 import time
 
 from pysmi import debug, error
@@ -22,7 +23,8 @@ class CallbackReader(AbstractReader):
         """Create an instance of *CallbackReader* bound to specific URL.
 
         Args:
-            cbFun (callable): user callable accepting *MIB name* and *cbCtx* objects
+            cbFun (callable): user callable accepting *MIB name* and *cbCtx* objects,
+                may be a coroutine function if used with *MibCompiler.compile_async*
 
         Keyword Args:
             cbCtx (object): user object that can be used to communicate state information
@@ -40,7 +42,25 @@ class CallbackReader(AbstractReader):
             f"calling user callback {self._cbFun} for MIB {mibname}"
         )
 
-        res = self._cbFun(mibname, self._cbCtx)
+        if inspect.iscoroutinefunction(self._cbFun):
+            raise error.PySmiReaderError(
+                f"user callback {self._cbFun} is a coroutine function, asynchronous compilation required",
+                reader=self,
+            )
+
+        return self._make_result(mibname, self._cbFun(mibname, self._cbCtx))
+
+    async def get_data_async(self, mibname, **options):
+        if not inspect.iscoroutinefunction(self._cbFun):
+            return await AbstractReader.get_data_async(self, mibname, **options)
+
+        debug.logger & debug.FLAG_READER and debug.logger(
+            f"awaiting user callback {self._cbFun} for MIB {mibname}"
+        )
+
+        return self._make_result(mibname, await self._cbFun(mibname, self._cbCtx))
+
+    def _make_result(self, mibname, res):
         if res:
             return (
                 MibInfo(
@@ -0,0 +1,148 @@
+#
+# This file is part of pysmi software.
+#
+# Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
+# License: https://www.pysnmp.com/pysmi/license.html
+#
+import re
+import sys
+
+from pysmi import debug
+from pysmi import error
+from pysmi.graph import DependencyGraph
+from pysmi.reader.base import AbstractReader
+
+# ASN.1 comments run till the end of line or till the next "--"
+COMMENT_RE = re.compile(r"--.*?(--|$)", re.MULTILINE)
+
+MODULE_RE = re.compile(r"(?<![\w-])([A-Za-z][\w-]*)\s+DEFINITIONS\s*::=\s*BEGIN\b")
+
+IMPORTS_RE = re.compile(r"\bIMPORTS\b(.*?);", re.DOTALL)
+
+FROM_RE = re.compile(r"\bFROM\s+([A-Za-z][\w-]*)")
+
+
+def scan_mib_text(fileData):
+    """Pick MIB module names and IMPORT'ed MIB names out of ASN.1 text.
+
+    This is a quick text scan, with no actual parsing, so a broken MIB
+    may yield something still.
+
+    Returns:
+        list of *(mibname, imported)* tuples, one per MIB module defined
+        in the text, where *imported* is a list of IMPORT'ed MIB names
+    """
+    fileData = COMMENT_RE.sub("", fileData)
+
+    modules = list(MODULE_RE.finditer(fileData))
+
+    mibs = []
+
+    for index, match in enumerate(modules):
+        if index + 1 < len(modules):
+            end = modules[index + 1].start()
+
+        else:
+            end = len(fileData)
+
+        imports = IMPORTS_RE.search(fileData, match.end(), end)
+
+        mibs.append(
+            (match.group(1), imports and FROM_RE.findall(imports.group(1)) or [])
+        )
+
+    return mibs
+
+
+class CorpusReader(AbstractReader):
+    """Serve ASN.1 MIBs by name out of all the files of another reader.
+
+    *CorpusReader* class instance lists every file of the underlying
+    reader once, picking MIB module names and IMPORT'ed MIB names out
+    of the files with a quick text scan, with no actual parsing. The
+    MIBs are then served right from the files defining them, without
+    trying various file names.
+
+    The underlying reader must support *get_file_names* and
+    *get_file_data* methods, which is the case for *FileReader* and
+    *ZipReader*.
+    """
+
+    def __init__(self, reader):
+        """Create an instance of *CorpusReader* on top of another reader.
+
+        Args:
+            reader: *FileReader* or *ZipReader* object
+        """
+        self._reader = reader
+        self._files = None
+        self._graph = None
+
+    def __str__(self):
+        """Return string representation of the instance."""
+        return f"{self.__class__.__name__}{{{self._reader}}}"
+
+    def _scan(self):
+        if self._files is not None:
+            return
+
+        self._files = {}
+        self._graph = DependencyGraph()
+
+        for filename in self._reader.get_file_names():
+            try:
+                fileInfo, fileData = self._reader.get_file_data(filename)
+
+            except error.PySmiError:
+                debug.logger & debug.FLAG_READER and debug.logger(
+                    f"skipping file {filename}: {sys.exc_info()[1]}"
+                )
+                continue
+
+            for mibname, imported in scan_mib_text(fileData):
+                if mibname in self._files:
+                    debug.logger & debug.FLAG_READER and debug.logger(
+                        f"MIB {mibname} of {filename} already found in {self._files[mibname]}"
+                    )
+                    continue
+
+                self._files[mibname] = filename
+
+                self._graph.add_module(mibname, imported)
+
+        debug.logger & debug.FLAG_READER and debug.logger(
+            f"{len(self._files)} MIBs found in {self._reader}"
+        )
+
+    def get_mib_names(self, external=False):
+        """Return names of all MIB modules found, IMPORT'ed ones first.
+
+        MIB modules are ordered by their likely dependencies, so that MIBs
+        go after the MIBs they IMPORT whenever possible.
+
+        Keyword Args:
+            external (bool): also return names of the MIBs IMPORT'ed, but
+                not found by this reader
+        """
+        self._scan()
+
+        return [
+            mibname
+            for wave in self._graph.waves()
+            for mibname in sorted(wave)
+            if external or mibname in self._files
+        ]
+
+    def get_data(self, mibname, **options):
+        self._scan()
+
+        if mibname not in self._files:
+            raise error.PySmiReaderFileNotFoundError(
+                f"source MIB {mibname} not found", reader=self
+            )
+
+        fileInfo, fileData = self._reader.get_file_data(self._files[mibname])
+
+        fileInfo.name = mibname
+
+        return fileInfo, fileData
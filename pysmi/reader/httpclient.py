@@ -58,6 +58,10 @@ class HttpReader(AbstractReader):
 
         debug.logger & debug.FLAG_READER and debug.logger(f"looking for MIB {mibname}")
 
+        # MIB could not be looked up at some URL for other reasons than
+        # not being there
+        unavailable = False
+
         for mibalias, mibfile in self.get_mib_variants(mibname, **options):
             if self.MIB_MAGIC in self._url:
                 url = self._url.replace(self.MIB_MAGIC, mibfile)
@@ -75,6 +79,7 @@ class HttpReader(AbstractReader):
                 debug.logger & debug.FLAG_READER and debug.logger(
                     f"failed to fetch MIB from {url}: {sys.exc_info()[1]}"
                 )
+                unavailable = True
                 continue
 
             debug.logger & debug.FLAG_READER and debug.logger(
@@ -104,6 +109,14 @@ class HttpReader(AbstractReader):
                     path=url, file=mibfile, name=mibalias, mtime=mtime
                 ), response.content.decode("utf-8")
 
+            if response.status_code not in (404, 410):
+                unavailable = True
+
+        if unavailable:
+            raise error.PySmiReaderUnavailableError(
+                f"source MIB {mibname} not available", reader=self
+            )
+
         raise error.PySmiReaderFileNotFoundError(
             f"source MIB {mibname} not found", reader=self
         )
@@ -153,3 +153,52 @@ class FileReader(AbstractReader):
         raise error.PySmiReaderFileNotFoundError(
             f"source MIB {mibname} not found", reader=self
         )
+
+    def get_file_names(self):
+        filenames = []
+
+        for path in self.get_subdirs(self._path, self._recursive, self._ignoreErrors):
+            try:
+                names = os.listdir(path)
+
+            except OSError:
+                if not self._ignoreErrors:
+                    raise error.PySmiError(
+                        f"directory {path} access error: {sys.exc_info()[1]}"
+                    )
+
+                continue
+
+            for name in sorted(names):
+                f = os.path.join(decode(path), decode(name))
+
+                if name != self.indexFile and os.path.isfile(f):
+                    filenames.append(os.path.relpath(f, self._path))
+
+        return filenames
+
+    def get_file_data(self, filename):
+        f = os.path.join(self._path, decode(filename))
+
+        debug.logger & debug.FLAG_READER and debug.logger(f"reading file {f}")
+
+        try:
+            mtime = os.stat(f)[8]
+
+            with open(f, mode="rb") as fp:
+                mibData = fp.read(self.maxMibSize)
+
+        except OSError:
+            raise error.PySmiReaderFileNotFoundError(
+                f"file {f} access error: {sys.exc_info()[1]}", reader=self
+            )
+
+        if len(mibData) == self.maxMibSize:
+            raise error.PySmiReaderError(f"MIB {f} too large", reader=self)
+
+        return MibInfo(
+            path=f"file://{f}",
+            file=os.path.basename(filename),
+            name=os.path.basename(filename),
+            mtime=mtime,
+        ), decode(mibData)
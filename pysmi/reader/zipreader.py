@@ -206,3 +206,40 @@ class ZipReader(AbstractReader):
         raise error.PySmiReaderFileNotFoundError(
             f"source MIB {mibname} not found", reader=self
         )
+
+    def get_file_names(self):
+        if self._pendingError:
+            raise self._pendingError
+
+        return sorted(self._members)
+
+    def get_file_data(self, filename):
+        if self._pendingError:
+            raise self._pendingError
+
+        try:
+            refs = self._members[filename]
+
+        except KeyError:
+            raise error.PySmiReaderFileNotFoundError(
+                f"file {filename} not found", reader=self
+            )
+
+        mibData, mtime = self._read_zip_file(refs)
+
+        if not mibData:
+            raise error.PySmiReaderFileNotFoundError(
+                f"file {filename} is empty or unreadable", reader=self
+            )
+
+        if len(mibData) == self.maxMibSize:
+            raise error.PySmiReaderError(
+                f"MIB {self._name}/{filename} too large", reader=self
+            )
+
+        return MibInfo(
+            path=f"zip://{self._name}/{filename}",
+            file=filename,
+            name=filename,
+            mtime=mtime,
+        ), decode(mibData)
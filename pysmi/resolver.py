@@ -0,0 +1,155 @@
+#
+# This file is part of pysmi software.
+#
+# Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
+# License: https://www.pysnmp.com/pysmi/license.html
+#
+import time
+
+from pysmi import debug
+from pysmi import error
+
+
+class MibResolver:
+    """Remembers what file of what MIB source serves each MIB name.
+
+    MIB sources try a handful of file names and extensions for each MIB
+    name. *MibResolver* records the file that has served the MIB, so
+    that next time the source is asked for that very file only. The
+    MIB names a source has found no file for are recorded as well, and
+    the source is not asked for them again for *missTtl* seconds, unless
+    *missTtl* is zero. MIBs a source could not look up, for network
+    errors and such, are not recorded.
+
+    Records are kept in a *FileCache* or a *MemoryCache* object. Records
+    turning out to be stale are dropped and MIB names are looked up
+    by the source the usual way.
+    """
+
+    #: default time to remember MIBs not found, in seconds
+    missTtl = 3600
+
+    def __init__(self, cache, missTtl=None):
+        """Creates an instance of *MibResolver* class.
+
+        Args:
+            cache: *FileCache* or *MemoryCache* object to keep records in
+
+        Keyword Args:
+            missTtl: time to remember MIBs not found, in seconds
+        """
+        self._cache = cache
+
+        if missTtl is not None:
+            self.missTtl = missTtl
+
+    def __str__(self):
+        """Return a string representation of the instance."""
+        return f"{self.__class__.__name__}{{{self._cache}}}"
+
+    def _get_key(self, source, mibname):
+        return self._cache.make_key("resolution", str(source), mibname)
+
+    def _lookup(self, source, mibname):
+        key = self._get_key(source, mibname)
+
+        record = self._cache.get_data(key)
+
+        if record is None:
+            return key, None
+
+        if record[0] == "miss":
+            if time.time() - record[1] < self.missTtl:
+                debug.logger & debug.FLAG_READER and debug.logger(
+                    f"MIB {mibname} known to be missing at {source}"
+                )
+                raise error.PySmiReaderFileNotFoundError(
+                    f"source MIB {mibname} not found", reader=source
+                )
+
+            return key, None
+
+        debug.logger & debug.FLAG_READER and debug.logger(
+            f"MIB {mibname} known to be served by {source} from {record[2]}"
+        )
+
+        return key, [(record[1], record[2])]
+
+    def _record(self, key, fileInfo):
+        if fileInfo.file:
+            self._cache.put_data(key, ("hit", fileInfo.name, fileInfo.file))
+
+    def _record_miss(self, key):
+        # nothing to remember a miss for
+        if self.missTtl > 0:
+            self._cache.put_data(key, ("miss", time.time()))
+
+    def get_data(self, source, mibname, **options):
+        """Fetch MIB from the source, going straight to the recorded file.
+
+        Returns:
+            *(MibInfo, text)* tuple as *get_data* of the source does
+        """
+        key, variants = self._lookup(source, mibname)
+
+        if variants is not None:
+            try:
+                return source.get_data(mibname, variants=variants, **options)
+
+            except error.PySmiReaderUnavailableError:
+                raise
+
+            except error.PySmiReaderFileNotFoundError:
+                debug.logger & debug.FLAG_READER and debug.logger(
+                    f"stale record of MIB {mibname} at {source}"
+                )
+
+        try:
+            fileInfo, fileData = source.get_data(mibname, **options)
+
+        except error.PySmiReaderUnavailableError:
+            raise
+
+        except error.PySmiReaderFileNotFoundError:
+            self._record_miss(key)
+            raise
+
+        self._record(key, fileInfo)
+
+        return fileInfo, fileData
+
+    async def get_data_async(self, source, mibname, **options):
+        """Asynchronous version of *get_data*."""
+        key, variants = self._lookup(source, mibname)
+
+        if variants is not None:
+            try:
+                return await source.get_data_async(
+                    mibname, variants=variants, **options
+                )
+
+            except error.PySmiReaderUnavailableError:
+                raise
+
+            except error.PySmiReaderFileNotFoundError:
+                debug.logger & debug.FLAG_READER and debug.logger(
+                    f"stale record of MIB {mibname} at {source}"
+                )
+
+        try:
+            fileInfo, fileData = await source.get_data_async(mibname, **options)
+
+        except error.PySmiReaderUnavailableError:
+            raise
+
+        except error.PySmiReaderFileNotFoundError:
+            self._record_miss(key)
+            raise
+
+        self._record(key, fileInfo)
+
+        return fileInfo, fileData
+
+    def purge(self):
+        """Forget everything recorded."""
+        self._cache.purge()
@@ -14,16 +14,21 @@ from pathlib import Path
 
 from pysmi import config, debug, error
 from pysmi.borrower import AnyFileBorrower, PyFileBorrower
+from pysmi.cache import FileCache
 from pysmi.codegen import JsonCodeGen, NullCodeGen, PySnmpCodeGen
 from pysmi.compiler import MibCompiler
+from pysmi.journal import BuildJournal
+from pysmi.manifest import BuildManifest
 from pysmi.parser import SmiV1CompatParser
 from pysmi.reader import get_readers_from_urls
+from pysmi.resolver import MibResolver
 from pysmi.searcher import (
     AnyFileSearcher,
     PyFileSearcher,
     PyPackageSearcher,
     StubSearcher,
 )
+from pysmi.server import MibCompilerClient, MibCompilerServer
 from pysmi.writer import CallbackWriter, FileWriter, PyFileWriter
 
 
@@ -46,8 +51,13 @@ def start():
     dstTemplate = None
     dstDirectory = None
     cacheDirectory = ""
+    purgeCacheFlag = False
+    lookupCacheFlag = True
+    lookupMissTtl = 0
     nodepsFlag = False
     rebuildFlag = False
+    incrementalFlag = False
+    resumeFlag = False
     dryrunFlag = False
     genMibTextsFlag = False
     keepTextsLayout = False
@@ -55,7 +65,20 @@ def start():
     pyOptimizationLevel = 0
     ignoreErrorsFlag = False
     buildIndexFlag = False
+    mergeIndexFiles = []
     writeMibsFlag = True
+    jobs = 1
+    threadsFlag = False
+    shard = None
+    memoryBudget = None
+    showStatsFlag = False
+    reproducibleFlag = False
+    skipUnchangedFlag = False
+    isolateFlag = False
+    mibTimeout = None
+    mibMemoryLimit = None
+    serveAddress = None
+    connectAddress = None
 
     helpMessage = f"""\
     Usage: {sys.argv[0]} [--help]
@@ -71,23 +94,42 @@ def start():
         [--destination-template=<PATH>]
         [--destination-directory=<DIRECTORY>]
         [--cache-directory=<DIRECTORY>]
+        [--purge-cache]
+        [--no-lookup-cache]
+        [--lookup-miss-ttl=<SECONDS>]
         [--disable-fuzzy-source]
         [--no-dependencies]
         [--no-python-compile]
         [--python-optimization-level]
         [--ignore-errors]
         [--build-index]
+        [--merge-index=<FILE>]
         [--rebuild]
+        [--incremental]
+        [--resume]
         [--dry-run]
         [--no-mib-writes]
         [--generate-mib-texts]
         [--keep-texts-layout]
+        [--jobs=<NUMBER>]
+        [--threads]
+        [--shard=<NUMBER>/<COUNT>]
+        [--memory-budget=<MBYTES>]
+        [--show-stats]
+        [--reproducible]
+        [--skip-unchanged]
+        [--isolate]
+        [--mib-timeout=<SECONDS>]
+        [--mib-memory-limit=<MBYTES>]
+        [--serve=<SOCKET>]
+        [--connect=<SOCKET>]
         <MIB-NAME> [MIB-NAME [...]]]
     Where:
         URI      - file, zip, http, https schemes are supported.
                 Use @mib@ placeholder token in URI to refer directly to
                 the required MIB module when source does not support
                 directory listing (e.g. HTTP).
+        SOCKET   - UNIX socket path
         FORMAT   - pysnmp, json, null
         TEMPLATE - path to a Jinja2 template extending the base one (see
                 documentation for details)"""
@@ -110,17 +152,35 @@ def start():
                 "destination-template=",
                 "destination-directory=",
                 "cache-directory=",
+                "purge-cache",
+                "no-lookup-cache",
+                "lookup-miss-ttl=",
                 "no-dependencies",
                 "no-python-compile",
                 "python-optimization-level=",
                 "ignore-errors",
                 "build-index",
+                "merge-index=",
                 "rebuild",
+                "incremental",
+                "resume",
                 "dry-run",
                 "no-mib-writes",
                 "generate-mib-texts",
                 "disable-fuzzy-source",
                 "keep-texts-layout",
+                "jobs=",
+                "threads",
+                "shard=",
+                "memory-budget=",
+                "show-stats",
+                "reproducible",
+                "skip-unchanged",
+                "isolate",
+                "mib-timeout=",
+                "mib-memory-limit=",
+                "serve=",
+                "connect=",
             ],
         )
 
@@ -191,6 +251,22 @@ def start():
         if opt[0] == "--cache-directory":
             cacheDirectory = opt[1]
 
+        if opt[0] == "--purge-cache":
+            purgeCacheFlag = True
+
+        if opt[0] == "--no-lookup-cache":
+            lookupCacheFlag = False
+
+        if opt[0] == "--lookup-miss-ttl":
+            try:
+                lookupMissTtl = float(opt[1])
+
+            except ValueError:
+                sys.stderr.write(
+                    f"ERROR: lookup miss TTL must be a number{os.linesep}{helpMessage}{os.linesep}"
+                )
+                sys.exit(EX_USAGE)
+
         if opt[0] == "--no-dependencies":
             nodepsFlag = True
 
@@ -213,9 +289,18 @@ def start():
         if opt[0] == "--build-index":
             buildIndexFlag = True
 
+        if opt[0] == "--merge-index":
+            mergeIndexFiles.append(opt[1])
+
         if opt[0] == "--rebuild":
             rebuildFlag = True
 
+        if opt[0] == "--incremental":
+            incrementalFlag = True
+
+        if opt[0] == "--resume":
+            resumeFlag = True
+
         if opt[0] == "--dry-run":
             dryrunFlag = True
 
@@ -231,7 +316,107 @@ def start():
         if opt[0] == "--keep-texts-layout":
             keepTextsLayout = True
 
-    if not mibSources:
+        if opt[0] == "--threads":
+            threadsFlag = True
+
+        if opt[0] == "--jobs":
+            try:
+                jobs = int(opt[1])
+
+            except ValueError:
+                sys.stderr.write(
+                    f"ERROR: number of jobs must be an integer{os.linesep}{helpMessage}{os.linesep}"
+                )
+                sys.exit(EX_USAGE)
+
+        if opt[0] == "--shard":
+            try:
+                shardNumber, shardCount = (int(x) for x in opt[1].split("/"))
+
+            except ValueError:
+                sys.stderr.write(
+                    f"ERROR: shard must be given as <NUMBER>/<COUNT>{os.linesep}{helpMessage}{os.linesep}"
+                )
+                sys.exit(EX_USAGE)
+
+            if not 1 <= shardNumber <= shardCount:
+                sys.stderr.write(
+                    f"ERROR: shard number must be from 1 to {shardCount}{os.linesep}{helpMessage}{os.linesep}"
+                )
+                sys.exit(EX_USAGE)
+
+            shard = shardNumber - 1, shardCount
+
+        if opt[0] == "--memory-budget":
+            try:
+                memoryBudget = int(opt[1]) * 1024 * 1024
+
+            except ValueError:
+                sys.stderr.write(
+                    f"ERROR: memory budget must be an integer{os.linesep}{helpMessage}{os.linesep}"
+                )
+                sys.exit(EX_USAGE)
+
+        if opt[0] == "--isolate":
+            isolateFlag = True
+
+        if opt[0] == "--mib-timeout":
+            try:
+                mibTimeout = float(opt[1])
+
+            except ValueError:
+                sys.stderr.write(
+                    f"ERROR: MIB timeout must be a number{os.linesep}{helpMessage}{os.linesep}"
+                )
+                sys.exit(EX_USAGE)
+
+        if opt[0] == "--mib-memory-limit":
+            try:
+                mibMemoryLimit = int(opt[1]) * 1024 * 1024
+
+            except ValueError:
+                sys.stderr.write(
+                    f"ERROR: MIB memory limit must be an integer{os.linesep}{helpMessage}{os.linesep}"
+                )
+                sys.exit(EX_USAGE)
+
+        if opt[0] == "--skip-unchanged":
+            skipUnchangedFlag = True
+
+        if opt[0] == "--reproducible":
+            reproducibleFlag = True
+
+        if opt[0] == "--show-stats":
+            showStatsFlag = True
+
+        if opt[0] == "--serve":
+            serveAddress = opt[1]
+
+        if opt[0] == "--connect":
+            connectAddress = opt[1]
+
+    if purgeCacheFlag:
+        if not cacheDirectory:
+            sys.stderr.write(
+                f"ERROR: cache directory not specified{os.linesep}{helpMessage}{os.linesep}"
+            )
+            sys.exit(EX_USAGE)
+
+        try:
+            for cacheName in ("ast", "symtables", "names"):
+                FileCache(os.path.join(cacheDirectory, cacheName)).purge()
+
+        except error.PySmiError:
+            sys.stderr.write(f"ERROR: {sys.exc_info()[1]}{os.linesep}")
+            sys.exit(EX_SOFTWARE)
+
+        if verboseFlag:
+            sys.stderr.write(f"Cache at {cacheDirectory} purged{os.linesep}")
+
+        if not inputMibs:
+            sys.exit(EX_OK)
+
+    if not mibSources and not connectAddress:
         mibSources = [
             "file:///usr/share/snmp/mibs",
             "https://mibs.pysnmp.com/asn1/@mib@",
@@ -251,12 +436,133 @@ def start():
 
         inputMibs = [os.path.basename(os.path.splitext(x)[0]) for x in inputMibs]
 
-    if not inputMibs:
+    if shard and mergeIndexFiles:
+        sys.stderr.write(
+            f"ERROR: partial indexes are merged apart from the shards{os.linesep}{helpMessage}{os.linesep}"
+        )
+        sys.exit(EX_USAGE)
+
+    if not inputMibs and not serveAddress and not mergeIndexFiles:
         sys.stderr.write(
             f"ERROR: MIB module names not specified{os.linesep}{helpMessage}{os.linesep}"
         )
         sys.exit(EX_USAGE)
 
+    def report(processed):
+        sorted_files = sorted(processed)
+        compiled = [x for x in sorted_files if processed[x] == "compiled"]
+        borrowed = [x for x in sorted_files if processed[x] == "borrowed"]
+        untouched = [x for x in sorted_files if processed[x] == "untouched"]
+        missing = [x for x in sorted_files if processed[x] == "missing"]
+        unprocessed = [x for x in sorted_files if processed[x] == "unprocessed"]
+        failed = [x for x in sorted_files if processed[x] == "failed"]
+        if verboseFlag:
+            sys.stdout.write(
+                "{}reated/updated MIBs: {}{}".format(
+                    dryrunFlag and "Would be c" or "C",
+                    ", ".join(
+                        [
+                            f"{x} ({processed[x].alias})"
+                            if x != processed[x].alias
+                            else f"{x}"
+                            for x in compiled
+                        ]
+                    ),
+                    os.linesep,
+                )
+            )
+
+            sys.stdout.write(
+                "Pre-compiled MIBs {}borrowed: {}{}".format(
+                    dryrunFlag and "would be " or "",
+                    ", ".join([f"{x} ({processed[x].path})" for x in borrowed]),
+                    os.linesep,
+                )
+            )
+
+            sys.stdout.write(
+                "Up to date MIBs: {}{}".format(
+                    ", ".join([f"{x}" for x in untouched]),
+                    os.linesep,
+                )
+            )
+            sys.stderr.write(
+                "Missing source MIBs: {}{}".format(
+                    f"{os.linesep} ".join([f"{x}" for x in missing]),
+                    os.linesep,
+                )
+            )
+
+            sys.stderr.write(
+                "Ignored MIBs: {}{}".format(
+                    ", ".join([f"{x}" for x in unprocessed]),
+                    os.linesep,
+                )
+            )
+
+            sys.stderr.write(
+                "Failed MIBs: {}{}".format(
+                    f"{os.linesep} ".join(
+                        [f"{x} ({processed[x].error})" for x in failed]
+                    ),
+                    os.linesep,
+                )
+            )
+
+        exitCode = EX_OK
+
+        if len(missing) > 0:
+            exitCode = EX_MIB_MISSING
+
+        if len(failed) > 0:
+            exitCode = EX_MIB_FAILED
+
+        sys.exit(exitCode)
+
+    compileOptions = dict(
+        noDeps=nodepsFlag,
+        rebuild=rebuildFlag,
+        dryRun=dryrunFlag,
+        dstTemplate=dstTemplate,
+        genTexts=genMibTextsFlag,
+        writeMibs=writeMibsFlag,
+        ignoreErrors=ignoreErrorsFlag,
+        jobs=jobs,
+        threads=threadsFlag,
+        memoryBudget=memoryBudget,
+        reproducible=reproducibleFlag,
+        resume=resumeFlag,
+        isolate=isolateFlag,
+        mibTimeout=mibTimeout,
+        mibMemoryLimit=mibMemoryLimit,
+        shard=shard,
+    )
+
+    if connectAddress:
+        if verboseFlag:
+            sys.stderr.write(
+                f"""\
+Compile server socket: {connectAddress}
+Additional source MIB repositories: {', '.join(mibSources)}
+MIBs to compile: {', '.join(inputMibs)}
+"""
+            )
+
+        try:
+            processed = MibCompilerClient(connectAddress).compile(
+                *inputMibs,
+                sources=mibSources,
+                buildIndex=buildIndexFlag,
+                keepTextsLayout=keepTextsLayout,
+                **compileOptions,
+            )
+
+        except error.PySmiError:
+            sys.stderr.write(f"ERROR: {sys.exc_info()[1]}{os.linesep}")
+            sys.exit(EX_SOFTWARE)
+
+        report(processed)
+
     if not dstFormat:
         dstFormat = "pysnmp"
 
@@ -305,7 +611,9 @@ def start():
         codeGenerator = PySnmpCodeGen()
 
         fileWriter = PyFileWriter(dstDirectory).set_options(
-            pyCompile=pyCompileFlag, pyOptimizationLevel=pyOptimizationLevel
+            pyCompile=pyCompileFlag,
+            pyOptimizationLevel=pyOptimizationLevel,
+            skipUnchanged=skipUnchangedFlag,
         )
 
     elif dstFormat == "json":
@@ -341,7 +649,9 @@ def start():
 
         codeGenerator = JsonCodeGen()
 
-        fileWriter = FileWriter(dstDirectory).set_options(suffix=".json")
+        fileWriter = FileWriter(dstDirectory).set_options(
+            suffix=".json", skipUnchanged=skipUnchangedFlag
+        )
 
     elif dstFormat == "null":
         if not mibStubs:
@@ -391,24 +701,63 @@ MIBs to compile: {', '.join(inputMibs)}
 Destination format: {dstFormat}
 Custom destination template: {dstTemplate}
 Parser grammar cache directory: {cacheDirectory or "not used"}
+Parsed MIBs cache directory: {cacheDirectory and os.path.join(cacheDirectory, "ast") or "not used"}
+Symbol tables cache directory: {cacheDirectory and os.path.join(cacheDirectory, "symtables") or "not used"}
+MIB files lookup cache directory: {cacheDirectory and lookupCacheFlag and f"{os.path.join(cacheDirectory, 'names')} ({lookupMissTtl and f'missing MIBs remembered for {lookupMissTtl:g} seconds' or 'missing MIBs not remembered'})" or "not used"}
 Also compile all relevant MIBs: {"no" if nodepsFlag else "yes"}
 Rebuild MIBs regardless of age: {"yes" if rebuildFlag else "no"}
+Rebuild MIBs by content signatures: {"yes" if incrementalFlag else "no"}
+Resume from the journal: {"yes" if resumeFlag else "no"}
 Dry run mode: {"yes" if dryrunFlag else "no"}
 Create/update MIBs: {"yes" if writeMibsFlag else "no"}
 Byte-compile Python modules: {"yes" if dstFormat == "pysnmp" and pyCompileFlag else "no"} (optimization level {"yes" if dstFormat == "pysnmp" and pyOptimizationLevel else "no"})
 Ignore compilation errors: {"yes" if ignoreErrorsFlag else "no"}
 Generate OID->MIB index: {"yes" if buildIndexFlag else "no"}
+Merge OID->MIB indexes: {', '.join(mergeIndexFiles) or "no"}
 Generate texts in MIBs: {"yes" if genMibTextsFlag else "no"}
 Keep original texts layout: {"yes" if keepTextsLayout else "no"}
+Reproducible output: {"yes" if reproducibleFlag else "no"}
+Leave unchanged MIBs alone: {"yes" if skipUnchangedFlag else "no"}
 Try various file names while searching for MIB module: {"yes" if doFuzzyMatchingFlag else "no"}
+Parallel jobs: {jobs} ({"threads" if threadsFlag else "processes"})
+Shard of MIBs to compile: {shard and f"{shard[0] + 1} of {shard[1]}" or "all"}
+Memory budget for symbol tables: {memoryBudget and f"{memoryBudget // 1024 // 1024} MB" or "unlimited"}
+Process each MIB in isolation: {"yes" if isolateFlag or mibTimeout or mibMemoryLimit else "no"} (time limit {mibTimeout and f"{mibTimeout:g} seconds" or "none"}, memory limit {mibMemoryLimit and f"{mibMemoryLimit // 1024 // 1024} MB" or "none"})
+Serve compile requests at: {serveAddress or "no"}
 """
         )
 
     # Initialize compiler infrastructure
 
-    mibCompiler = MibCompiler(
-        SmiV1CompatParser(tempdir=cacheDirectory), codeGenerator, fileWriter
-    )
+    mibParser = SmiV1CompatParser(tempdir=cacheDirectory)
+
+    if cacheDirectory:
+        mibParser.set_options(cache=FileCache(os.path.join(cacheDirectory, "ast")))
+
+    mibCompiler = MibCompiler(mibParser, codeGenerator, fileWriter)
+
+    if cacheDirectory:
+        mibCompiler.set_options(
+            symbolTableCache=FileCache(os.path.join(cacheDirectory, "symtables"))
+        )
+
+    if cacheDirectory and lookupCacheFlag:
+        mibCompiler.set_options(
+            resolver=MibResolver(
+                FileCache(os.path.join(cacheDirectory, "names")),
+                missTtl=lookupMissTtl,
+            )
+        )
+
+    if incrementalFlag:
+        mibCompiler.set_options(
+            manifest=BuildManifest(os.path.join(dstDirectory, ".pysmi-manifest.json"))
+        )
+
+    if resumeFlag:
+        mibCompiler.set_options(
+            journal=BuildJournal(os.path.join(dstDirectory, ".pysmi-journal"))
+        )
 
     try:
         mibCompiler.add_sources(
@@ -421,19 +770,35 @@ Try various file names while searching for MIB module: {"yes" if doFuzzyMatching
 
         mibCompiler.add_borrowers(*borrowers)
 
-        processed = mibCompiler.compile(
-            *inputMibs,
-            **dict(
-                noDeps=nodepsFlag,
-                rebuild=rebuildFlag,
-                dryRun=dryrunFlag,
-                dstTemplate=dstTemplate,
-                genTexts=genMibTextsFlag,
+        if serveAddress:
+            server = MibCompilerServer(
+                serveAddress, mibCompiler, fuzzyMatching=doFuzzyMatchingFlag
+            )
+
+            if verboseFlag:
+                sys.stderr.write(
+                    f"Serving compile requests at {serveAddress}{os.linesep}"
+                )
+
+            try:
+                server.serve_forever()
+
+            except KeyboardInterrupt:
+                pass
+
+            finally:
+                server.server_close()
+
+            sys.exit(EX_OK)
+
+        processed = {}
+
+        if inputMibs:
+            processed = mibCompiler.compile(
+                *inputMibs,
                 textFilter=keepTextsLayout and (lambda symbol, text: text) or None,
-                writeMibs=writeMibsFlag,
-                ignoreErrors=ignoreErrorsFlag,
-            ),
-        )
+                **compileOptions,
+            )
 
         safe = {}
         sorted_files = sorted(processed)
@@ -442,78 +807,44 @@ Try various file names while searching for MIB module: {"yes" if doFuzzyMatching
                 safe[x] = processed[x]
 
         if buildIndexFlag:
-            mibCompiler.build_index(safe, dryRun=dryrunFlag, ignoreErrors=True)
+            mibCompiler.build_index(
+                safe,
+                dryRun=dryrunFlag,
+                ignoreErrors=True,
+                reproducible=reproducibleFlag,
+                shard=shard,
+            )
 
-    except error.PySmiError:
-        sys.stderr.write(f"ERROR: {sys.exc_info()[1]}{os.linesep}")
-        sys.exit(EX_SOFTWARE)
+        if mergeIndexFiles:
+            indexes = []
 
-    else:
-        compiled = [x for x in sorted_files if processed[x] == "compiled"]
-        borrowed = [x for x in sorted_files if processed[x] == "borrowed"]
-        untouched = [x for x in sorted_files if processed[x] == "untouched"]
-        missing = [x for x in sorted_files if processed[x] == "missing"]
-        unprocessed = [x for x in sorted_files if processed[x] == "unprocessed"]
-        failed = [x for x in sorted_files if processed[x] == "failed"]
-        if verboseFlag:
-            sys.stdout.write(
-                "{}reated/updated MIBs: {}{}".format(
-                    dryrunFlag and "Would be c" or "C",
-                    ", ".join(
-                        [
-                            f"{x} ({processed[x].alias})"
-                            if x != processed[x].alias
-                            else f"{x}"
-                            for x in compiled
-                        ]
-                    ),
-                    os.linesep,
-                )
-            )
+            for mergeIndexFile in mergeIndexFiles:
+                try:
+                    with open(mergeIndexFile) as f:
+                        indexes.append(f.read())
 
-            sys.stdout.write(
-                "Pre-compiled MIBs {}borrowed: {}{}".format(
-                    dryrunFlag and "would be " or "",
-                    ", ".join([f"{x} ({processed[x].path})" for x in borrowed]),
-                    os.linesep,
-                )
-            )
+                except OSError:
+                    raise error.PySmiError(
+                        f"failure reading index {mergeIndexFile}: {sys.exc_info()[1]}"
+                    )
 
-            sys.stdout.write(
-                "Up to date MIBs: {}{}".format(
-                    ", ".join([f"{x}" for x in untouched]),
-                    os.linesep,
-                )
-            )
-            sys.stderr.write(
-                "Missing source MIBs: {}{}".format(
-                    f"{os.linesep} ".join([f"{x}" for x in missing]),
-                    os.linesep,
-                )
+            mibCompiler.merge_index(
+                indexes, dryRun=dryrunFlag, reproducible=reproducibleFlag
             )
 
+    except error.PySmiError:
+        sys.stderr.write(f"ERROR: {sys.exc_info()[1]}{os.linesep}")
+        sys.exit(EX_SOFTWARE)
+
+    else:
+        if verboseFlag and mibCompiler.peakMemory:
             sys.stderr.write(
-                "Ignored MIBs: {}{}".format(
-                    ", ".join([f"{x}" for x in unprocessed]),
-                    os.linesep,
-                )
+                f"Peak memory usage: {mibCompiler.peakMemory // 1024 // 1024} MB{os.linesep}"
             )
 
+        if showStatsFlag:
             sys.stderr.write(
-                "Failed MIBs: {}{}".format(
-                    f"{os.linesep} ".join(
-                        [f"{x} ({processed[x].error})" for x in failed]
-                    ),
-                    os.linesep,
-                )
+                f"Compilation statistics:{os.linesep}{mibCompiler.stats}{os.linesep}"
             )
 
-        exitCode = EX_OK
-
-        if len(missing) > 0:
-            exitCode = EX_MIB_MISSING
-
-        if len(failed) > 0:
-            exitCode = EX_MIB_FAILED
-
-        sys.exit(exitCode)
+        report(processed)
@@ -4,6 +4,7 @@
 # Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
 # License: https://www.pysnmp.com/pysmi/license.html
 #
+import asyncio
 
 
 class AbstractSearcher:
@@ -14,3 +15,12 @@ class AbstractSearcher:
 
     def file_exists(self, mibname, mtime, rebuild=False):
         raise NotImplementedError()
+
+    async def file_exists_async(self, mibname, mtime, rebuild=False):
+        """Asynchronous version of *file_exists*.
+
+        Unless overridden, calls *file_exists* in a separate thread.
+        """
+        return await asyncio.to_thread(
+            self.file_exists, mibname, mtime, rebuild=rebuild
+        )
@@ -0,0 +1,324 @@
+#
+# This file is part of pysmi software.
+#
+# Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
+# License: https://www.pysnmp.com/pysmi/license.html
+#
+import copy
+import json
+import os
+import socket
+import socketserver
+import sys
+
+from pysmi import debug
+from pysmi import error
+from pysmi.cache import MemoryCache
+from pysmi.compiler import MibStatus
+from pysmi.reader import get_readers_from_urls
+from pysmi.stats import PhaseStats
+
+# compile options that may come with a request
+REQUEST_OPTIONS = (
+    "noDeps",
+    "rebuild",
+    "dryRun",
+    "dstTemplate",
+    "genTexts",
+    "writeMibs",
+    "ignoreErrors",
+    "jobs",
+    "threads",
+    "memoryBudget",
+    "reproducible",
+    "resume",
+    "isolate",
+    "mibTimeout",
+    "mibMemoryLimit",
+    "shard",
+)
+
+
+def _get_status_attributes(status):
+    attributes = {}
+
+    for attr, value in status.__dict__.items():
+        if isinstance(value, Exception):
+            value = str(value)
+
+        elif attr == "stats":
+            value = {k: v.__dict__ for k, v in value.items()}
+
+        attributes[attr] = value
+
+    return attributes
+
+
+def _check_request(request):
+    for key in ("mibs", "sources"):
+        value = request.get(key) or []
+
+        if not isinstance(value, list) or not all(isinstance(x, str) for x in value):
+            raise error.PySmiError(
+                f"malformed request: {key} must be a list of strings"
+            )
+
+    if not isinstance(request.get("options") or {}, dict):
+        raise error.PySmiError("malformed request: options must be a JSON object")
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline())
+
+            if not isinstance(request, dict):
+                raise ValueError("compile request must be a JSON object")
+
+        except ValueError:
+            responses = [dict(error=f"malformed request: {sys.exc_info()[1]}")]
+
+        else:
+            responses = self.server.serve_request(request)
+
+        for response in responses:
+            self.wfile.write(json.dumps(response, default=str).encode() + b"\n")
+            self.wfile.flush()
+
+
+class MibCompilerServer(socketserver.UnixStreamServer):
+    """Serves compile requests on a local UNIX socket.
+
+    The server keeps given *MibCompiler* along with its parser and code
+    generator from one request to another. Symbol tables of the MIBs
+    ever read are kept in memory, unless *MibCompiler* is configured
+    with a cache of its own, so the base MIBs get parsed only once.
+
+    A request is a JSON object on a single line carrying *mibs* to
+    compile and, optionally, MIB *sources* URLs to search before the
+    sources *MibCompiler* is configured with, *options* to compile with
+    and the *buildIndex* flag. As soon as each MIB is processed, the server
+    responds with a JSON object on a line of its own, carrying MIB
+    *mibname*, *status* and status *attributes*. Either *done* or
+    *error* object concludes the response.
+
+    Requests are served one at a time.
+    """
+
+    allow_reuse_address = True
+
+    def __init__(self, path, mibCompiler, **readerOptions):
+        """Creates an instance of *MibCompilerServer* class.
+
+        Args:
+            path: UNIX socket path to listen at
+            mibCompiler: configured *MibCompiler* object
+
+        Keyword Args:
+            readerOptions: options for the readers of requested MIB sources
+        """
+        self._path = path
+        self._mibCompiler = mibCompiler
+        self._readerOptions = readerOptions
+
+        if mibCompiler.symbolTableCache is None:
+            mibCompiler.set_options(symbolTableCache=MemoryCache())
+
+        # socket left over by a server gone
+        if os.path.exists(path):
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                try:
+                    sock.connect(path)
+
+                except OSError:
+                    os.unlink(path)
+
+                else:
+                    raise error.PySmiError(f"server already listening at {path}")
+
+        try:
+            socketserver.UnixStreamServer.__init__(self, path, _RequestHandler)
+
+        except OSError:
+            raise error.PySmiError(f"failure listening at {path}: {sys.exc_info()[1]}")
+
+        debug.logger & debug.FLAG_COMPILER and debug.logger(f"{self} started")
+
+    def __str__(self):
+        """Return a string representation of the instance."""
+        return f'{self.__class__.__name__}{{"{self._path}"}}'
+
+    def server_close(self):
+        socketserver.UnixStreamServer.server_close(self)
+
+        if os.path.exists(self._path):
+            os.unlink(self._path)
+
+    def serve_request(self, request):
+        """Compile MIBs as requested, yielding responses one by one."""
+        try:
+            _check_request(request)
+
+        except error.PySmiError:
+            yield dict(error=str(sys.exc_info()[1]))
+            return
+
+        mibnames = request.get("mibs") or []
+
+        options = {
+            k: v
+            for k, v in (request.get("options") or {}).items()
+            if k in REQUEST_OPTIONS
+        }
+
+        if (request.get("options") or {}).get("keepTextsLayout"):
+            options["textFilter"] = lambda symbol, text: text
+
+        debug.logger & debug.FLAG_COMPILER and debug.logger(
+            f"{self} compiling {', '.join(mibnames)}"
+        )
+
+        mibCompiler = self._mibCompiler
+
+        try:
+            if request.get("sources"):
+                # requested sources go first, for this request only
+                mibCompiler = copy.copy(mibCompiler)
+                mibCompiler._sources = []
+                mibCompiler.add_sources(
+                    *get_readers_from_urls(*request["sources"], **self._readerOptions),
+                    *self._mibCompiler._sources,
+                )
+
+            processed = {}
+
+            for mibname, status, mibData in mibCompiler.compile_iter(
+                *mibnames, **options
+            ):
+                processed[mibname] = status
+
+                yield dict(
+                    mibname=mibname,
+                    status=str(status),
+                    attributes=_get_status_attributes(status),
+                )
+
+            if request.get("buildIndex"):
+                mibCompiler.build_index(
+                    {k: v for k, v in processed.items() if v != "failed"},
+                    dryRun=options.get("dryRun"),
+                    ignoreErrors=True,
+                    reproducible=options.get("reproducible"),
+                    shard=options.get("shard"),
+                )
+
+        except error.PySmiError:
+            yield dict(error=str(sys.exc_info()[1]))
+            return
+
+        # bad option values and such are reported rather than
+        # leaving the client with a connection closed midway
+        except Exception:
+            debug.logger & debug.FLAG_COMPILER and debug.logger(
+                f"{self} failed to serve request: {sys.exc_info()[1]!r}"
+            )
+            yield dict(
+                error=f"request failure: {sys.exc_info()[0].__name__}: {sys.exc_info()[1]}"
+            )
+            return
+
+        yield dict(done=True)
+
+
+class MibCompilerClient:
+    """Submits compile requests to *MibCompilerServer*.
+
+    Compiling MIBs through the server yields the same *MibStatus*
+    objects *MibCompiler* does, except that *error* attributes carry
+    *PySmiError* objects with just the error message and MIB revisions
+    are strings.
+    """
+
+    def __init__(self, path):
+        """Creates an instance of *MibCompilerClient* class.
+
+        Args:
+            path: UNIX socket path *MibCompilerServer* listens at
+        """
+        self._path = path
+
+    def __str__(self):
+        """Return a string representation of the instance."""
+        return f'{self.__class__.__name__}{{"{self._path}"}}'
+
+    def compile_iter(self, *mibnames, sources=(), buildIndex=False, **options):
+        """Compile MIBs at the server, yielding results as they come.
+
+        Args:
+            mibnames: list of ASN.1 MIBs names
+            sources: MIB source URLs to search first
+            buildIndex: build OID->MIB index once MIBs are compiled
+            options: options *MibCompiler.compile* accepts
+
+        Returns:
+            iterator over *(mibname, MibStatus)* tuples
+        """
+        request = dict(
+            mibs=list(mibnames),
+            sources=list(sources),
+            options=options,
+            buildIndex=buildIndex,
+        )
+
+        try:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.connect(self._path)
+
+        except OSError:
+            raise error.PySmiError(
+                f"failure connecting to {self._path}: {sys.exc_info()[1]}"
+            )
+
+        with sock, sock.makefile("rwb") as f:
+            try:
+                f.write(json.dumps(request).encode() + b"\n")
+                f.flush()
+
+                for line in f:
+                    response = json.loads(line)
+
+                    if "error" in response:
+                        raise error.PySmiError(response["error"])
+
+                    if response.get("done"):
+                        return
+
+                    attributes = response.get("attributes", {})
+
+                    if "error" in attributes:
+                        attributes["error"] = error.PySmiError(attributes["error"])
+
+                    if "stats" in attributes:
+                        attributes["stats"] = {
+                            k: PhaseStats(**v) for k, v in attributes["stats"].items()
+                        }
+
+                    yield response["mibname"], MibStatus(
+                        response["status"]
+                    ).set_options(**attributes)
+
+            except (OSError, ValueError):
+                raise error.PySmiError(
+                    f"failure talking to {self._path}: {sys.exc_info()[1]}"
+                )
+
+        raise error.PySmiError(f"incomplete response from {self._path}")
+
+    def compile(self, *mibnames, **options):
+        """Compile MIBs at the server.
+
+        Returns:
+            A dictionary of MIB module names processed (keys) and *MibStatus*
+            class instances (values)
+        """
+        return dict(self.compile_iter(*mibnames, **options))
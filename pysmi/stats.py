@@ -0,0 +1,227 @@
+#
+# This file is part of pysmi software.
+#
+# Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
+# License: https://www.pysnmp.com/pysmi/license.html
+#
+import collections
+import contextlib
+import threading
+import time
+
+
+class PhaseStats:
+    """Time spent in a phase of MIB compilation."""
+
+    #: wall clock time, in seconds
+    wallTime = 0.0
+
+    #: CPU time of the process the phase ran in, in seconds
+    cpuTime = 0.0
+
+    #: number of times the phase ran
+    calls = 0
+
+    def __init__(self, **kwargs):
+        for k in kwargs:
+            setattr(self, k, kwargs[k])
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(wallTime={self.wallTime:.6f}, cpuTime={self.cpuTime:.6f}, calls={self.calls})"
+
+    def add(self, wallTime, cpuTime, calls=1):
+        self.wallTime += wallTime
+        self.cpuTime += cpuTime
+        self.calls += calls
+
+
+class PhaseEvent:
+    """A phase of MIB compilation as reported to observers."""
+
+    #: MIB module name, if the phase is run on behalf of one
+    mibname = None
+
+    #: size of the data the phase has taken or produced, if known
+    size = None
+
+    #: wall clock time of the phase, in seconds, once finished
+    wallTime = 0.0
+
+    #: CPU time of the phase, in seconds, once finished
+    cpuTime = 0.0
+
+    #: exception the phase has failed with, if any
+    error = None
+
+    def __init__(self, phase, mibname=None):
+        #: phase name
+        self.phase = phase
+        self.mibname = mibname
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(phase={self.phase!r}, mibname={self.mibname!r}, size={self.size}, wallTime={self.wallTime:.6f})"
+
+
+# stands for the events nobody is interested in, never read
+_unobservedEvent = PhaseEvent(None)
+
+
+class CompileStats:
+    """Time spent in each phase of MIB compilation and related counters.
+
+    The phases are:
+
+    * *read* - fetching ASN.1 MIB texts through the *sources*
+    * *parse* - lexing and parsing ASN.1 MIB texts
+    * *symtable* - building MIB symbol tables
+    * *search* - looking up transformed MIBs through the *searchers*
+    * *codegen* - MIB transformation by the code generator
+    * *render* - template rendering, which is a part of *codegen*
+    * *write* - storing transformed MIBs, byte-compilation included
+    * *borrow* - fetching pre-transformed MIBs through the *borrowers*
+
+    Phases run in worker processes are timed there, so CPU time of all
+    the phases may add up to more than the wall clock time of the run.
+
+    Counters are *sourceProbes*, *searcherProbes*, *searcherHits*,
+    *borrowAttempts*, *borrowHits* and *symbolTableCacheHits*.
+
+    Each phase is reported to *observers*, if any, as a *PhaseEvent*.
+    With *events* set to a list, finished phases are collected there, so
+    that they can be reported by the process the statistics end up in.
+
+    Statistics may be updated by many threads at once.
+    """
+
+    #: list collecting *PhaseEvent* of finished phases or *None*
+    events = None
+
+    def __init__(self, observers=()):
+        #: objects with *phase_started* and *phase_finished* methods
+        self.observers = observers
+
+        #: phase name to *PhaseStats* map
+        self.phases = collections.defaultdict(PhaseStats)
+
+        #: MIB name to the map of phase name to *PhaseStats*
+        self.mibs = collections.defaultdict(lambda: collections.defaultdict(PhaseStats))
+
+        #: counter name to counter value map
+        self.counters = collections.Counter()
+
+        self._lock = threading.RLock()
+
+    def __str__(self):
+        """Return a human-readable summary of the statistics."""
+        lines = [
+            f"{phase}: {x.wallTime:.3f}s wall, {x.cpuTime:.3f}s CPU, {x.calls} calls"
+            for phase, x in self.phases.items()
+        ]
+
+        lines.extend(f"{k}: {v}" for k, v in sorted(self.counters.items()))
+
+        return "\n".join(lines)
+
+    def __getstate__(self):
+        # default factories are lambdas, these can't be pickled, nor locks
+        with self._lock:
+            return dict(
+                phases=dict(self.phases),
+                mibs={k: dict(v) for k, v in self.mibs.items()},
+                counters=self.counters.copy(),
+                events=self.events,
+            )
+
+    def __setstate__(self, state):
+        self.__init__()
+        self.phases.update(state["phases"])
+        self.events = state["events"]
+
+        for mibname, phases in state["mibs"].items():
+            self.mibs[mibname].update(phases)
+
+        self.counters.update(state["counters"])
+
+    @contextlib.contextmanager
+    def timer(self, phase, mibname=None):
+        """Time the phase, optionally on behalf of a MIB module.
+
+        Yields *PhaseEvent* the caller may set *size* of.
+        """
+        observed = self.observers or self.events is not None
+
+        if observed:
+            event = PhaseEvent(phase, mibname)
+
+            for observer in self.observers:
+                observer.phase_started(event)
+
+        else:
+            event = _unobservedEvent
+
+        wallTime = time.perf_counter()
+        cpuTime = time.process_time()
+
+        try:
+            yield event
+
+        except BaseException as exc:
+            event.error = exc
+            raise
+
+        finally:
+            wallTime = time.perf_counter() - wallTime
+            cpuTime = time.process_time() - cpuTime
+
+            self.add(phase, wallTime, cpuTime, mibname)
+
+            if observed:
+                event.wallTime = wallTime
+                event.cpuTime = cpuTime
+
+                self._finish(event)
+
+    def _finish(self, event):
+        for observer in self.observers:
+            observer.phase_finished(event)
+
+        if self.events is not None:
+            with self._lock:
+                self.events.append(event)
+
+    def add(self, phase, wallTime, cpuTime, mibname=None, calls=1):
+        """Account time spent in the phase."""
+        with self._lock:
+            self.phases[phase].add(wallTime, cpuTime, calls)
+
+            if mibname is not None:
+                self.mibs[mibname][phase].add(wallTime, cpuTime, calls)
+
+    def count(self, counter, value=1):
+        """Increment the counter."""
+        with self._lock:
+            self.counters[counter] += value
+
+    def update(self, other):
+        """Add up statistics collected elsewhere, e.g. in a worker process."""
+        with self._lock:
+            for phase, x in other.phases.items():
+                self.add(phase, x.wallTime, x.cpuTime, calls=x.calls)
+
+            for mibname, phases in other.mibs.items():
+                for phase, x in phases.items():
+                    self.mibs[mibname][phase].add(x.wallTime, x.cpuTime, x.calls)
+
+            self.counters.update(other.counters)
+
+        # phases run elsewhere are reported once they are over
+        for event in other.events or ():
+            for observer in self.observers:
+                observer.phase_started(event)
+
+            self._finish(event)
+
+    def get_mib_stats(self, mibname):
+        """Return phase name to *PhaseStats* map of the MIB module."""
+        with self._lock:
+            return dict(self.mibs.get(mibname, {}))
@@ -0,0 +1,180 @@
+#
+# This file is part of pysmi software.
+#
+# Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
+# License: https://www.pysnmp.com/pysmi/license.html
+#
+import collections.abc
+import os
+import pickle
+import sys
+import tempfile
+
+from pysmi import debug
+from pysmi import error
+
+
+class SymbolTableMap(collections.abc.MutableMapping):
+    """Maps MIB module names to symbol tables within a memory budget.
+
+    Symbol tables are kept in memory until their pickled size adds up
+    to more than *maxSize* bytes. Then least recently used tables are
+    spilled to files, to be brought back to memory once looked up again.
+    Unlike caches, the map never loses its contents.
+
+    Spilled tables go to a temporary directory, unless *path* is given,
+    which is removed once the map is closed.
+    """
+
+    def __init__(self, maxSize, path=None):
+        """Creates an instance of *SymbolTableMap* class.
+
+        Args:
+            maxSize: size limit of symbol tables kept in memory, in bytes
+
+        Keyword Args:
+            path: directory to spill symbol tables to
+        """
+        self.maxSize = maxSize
+        self._path = path
+        self._tempdir = None
+
+        # dictionary order tells how recently tables were used
+        self._tables = {}
+        self._sizes = {}
+        self._size = 0
+
+        self._spilled = set()
+
+        #: largest size of symbol tables ever kept in memory, in bytes
+        self.peakSize = 0
+
+    def __str__(self):
+        """Return a string representation of the instance."""
+        return f"{self.__class__.__name__}{{{len(self._tables)} in memory, {len(self._spilled)} spilled}}"
+
+    def _get_filename(self, mibname):
+        if self._path is None:
+            self._tempdir = tempfile.TemporaryDirectory(prefix="pysmi-")
+            self._path = self._tempdir.name
+
+        # MIB names are safe to use as file names
+        return os.path.join(self._path, mibname + ".pickle")
+
+    def _spill(self):
+        while self._size > self.maxSize and len(self._tables) > 1:
+            mibname = next(iter(self._tables))
+
+            filename = self._get_filename(mibname)
+
+            try:
+                with open(filename, "wb") as f:
+                    pickle.dump(
+                        self._tables[mibname], f, protocol=pickle.HIGHEST_PROTOCOL
+                    )
+
+            except Exception:
+                raise error.PySmiError(
+                    f"failure spilling symbol table of {mibname} to {filename}: {sys.exc_info()[1]}"
+                )
+
+            del self._tables[mibname]
+
+            self._size -= self._sizes[mibname]
+            self._spilled.add(mibname)
+
+            debug.logger & debug.FLAG_COMPILER and debug.logger(
+                f"symbol table of {mibname} spilled to {filename}"
+            )
+
+    def __getitem__(self, mibname):
+        if mibname in self._tables:
+            symbolTable = self._tables.pop(mibname)
+
+        elif mibname in self._spilled:
+            filename = self._get_filename(mibname)
+
+            try:
+                with open(filename, "rb") as f:
+                    symbolTable = pickle.load(f)
+
+            except Exception:
+                raise error.PySmiError(
+                    f"failure reading symbol table of {mibname} from {filename}: {sys.exc_info()[1]}"
+                )
+
+            self._spilled.remove(mibname)
+            self._size += self._sizes[mibname]
+
+            debug.logger & debug.FLAG_COMPILER and debug.logger(
+                f"symbol table of {mibname} read back from {filename}"
+            )
+
+        else:
+            raise KeyError(mibname)
+
+        self._tables[mibname] = symbolTable
+
+        self._spill()
+
+        return symbolTable
+
+    def __setitem__(self, mibname, symbolTable):
+        self.discard(mibname)
+
+        self._sizes[mibname] = len(
+            pickle.dumps(symbolTable, protocol=pickle.HIGHEST_PROTOCOL)
+        )
+
+        self._tables[mibname] = symbolTable
+        self._size += self._sizes[mibname]
+
+        self.peakSize = max(self.peakSize, self._size)
+
+        self._spill()
+
+    def __delitem__(self, mibname):
+        if mibname not in self:
+            raise KeyError(mibname)
+
+        self.discard(mibname)
+
+    def discard(self, mibname):
+        """Remove symbol table of MIB module if there is one."""
+        if mibname in self._tables:
+            del self._tables[mibname]
+            self._size -= self._sizes[mibname]
+
+        elif mibname in self._spilled:
+            self._spilled.remove(mibname)
+
+            try:
+                os.unlink(self._get_filename(mibname))
+
+            except OSError:
+                pass
+
+        self._sizes.pop(mibname, None)
+
+    def __contains__(self, mibname):
+        return mibname in self._tables or mibname in self._spilled
+
+    def __iter__(self):
+        yield from tuple(self._sizes)
+
+    def __len__(self):
+        return len(self._sizes)
+
+    def copy(self):
+        """Return a dictionary of all symbol tables, spilled ones included."""
+        return {mibname: self[mibname] for mibname in self}
+
+    def close(self):
+        """Drop all symbol tables along with the files they were spilled to."""
+        for mibname in tuple(self._sizes):
+            self.discard(mibname)
+
+        if self._tempdir is not None:
+            self._tempdir.cleanup()
+            self._tempdir = None
+            self._path = None
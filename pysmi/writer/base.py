@@ -4,9 +4,16 @@
 # Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
 # License: https://www.pysnmp.com/pysmi/license.html
 #
+import asyncio
+import hashlib
+import os
 
 
 class AbstractWriter:
+    #: whether independent instances of this writer, each in its own
+    #: process, may store different MIBs at the same time
+    concurrentWrites = False
+
     def set_options(self, **kwargs):
         for k in kwargs:
             setattr(self, k, kwargs[k])
@@ -15,5 +22,53 @@ class AbstractWriter:
     def put_data(self, mibname, data, comments=(), dryRun=False):
         raise NotImplementedError()
 
+    async def put_data_async(self, mibname, data, comments=(), dryRun=False):
+        """Asynchronous version of *put_data*.
+
+        Unless overridden, calls *put_data* in a separate thread.
+        """
+        return await asyncio.to_thread(
+            self.put_data, mibname, data, comments=comments, dryRun=dryRun
+        )
+
     def get_data(self, filename):
         raise NotImplementedError()
+
+    def get_digest(self, mibname):
+        """Return SHA-256 digest of the transformed MIB stored before.
+
+        Args:
+            mibname: MIB module name
+
+        Returns:
+            hex digest of the stored bytes, as *get_output_digest* makes
+            it, or *None* if no such MIB is stored
+
+        Raises:
+            NotImplementedError: if the writer can't read stored MIBs back
+        """
+        raise NotImplementedError()
+
+    @staticmethod
+    def _get_file_digest(filename):
+        try:
+            with open(filename, "rb") as f:
+                return hashlib.sha256(f.read()).hexdigest()
+
+        except OSError:
+            return None
+
+    @staticmethod
+    def _is_unchanged(filename, data):
+        """Tell if the file already holds exactly the *data* bytes."""
+        try:
+            if os.stat(filename).st_size != len(data):
+                return False
+
+            with open(filename, "rb") as f:
+                digest = hashlib.sha256(f.read()).digest()
+
+        except OSError:
+            return False
+
+        return digest == hashlib.sha256(data).digest()
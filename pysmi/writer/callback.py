@@ -4,6 +4,7 @@
 # Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
 # License: https://www.pysnmp.com/pysmi/license.html
 #
+import inspect
 import sys
 
 from pysmi import debug, error
@@ -22,7 +23,8 @@ class CallbackWriter(AbstractWriter):
         """Creates an instance of *CallbackWriter* class.
 
         Args:
-            cbFun (callable): user-supplied callable
+            cbFun (callable): user-supplied callable, may be a coroutine
+                function if used with *MibCompiler.compile_async*
         Keyword Args:
             cbCtx: user-supplied object passed intact to user callback
         """
@@ -38,6 +40,12 @@ class CallbackWriter(AbstractWriter):
             debug.logger & debug.FLAG_WRITER and debug.logger("dry run mode")
             return
 
+        if inspect.iscoroutinefunction(self._cbFun):
+            raise error.PySmiWriterError(
+                f"user callback {self._cbFun} is a coroutine function, asynchronous compilation required",
+                writer=self,
+            )
+
         try:
             self._cbFun(mibname, data, self._cbCtx)
 
@@ -51,5 +59,28 @@ class CallbackWriter(AbstractWriter):
             f"user callback for {mibname} succeeded"
         )
 
+    async def put_data_async(self, mibname, data, comments=(), dryRun=False):
+        if not inspect.iscoroutinefunction(self._cbFun):
+            return await AbstractWriter.put_data_async(
+                self, mibname, data, comments=comments, dryRun=dryRun
+            )
+
+        if dryRun:
+            debug.logger & debug.FLAG_WRITER and debug.logger("dry run mode")
+            return
+
+        try:
+            await self._cbFun(mibname, data, self._cbCtx)
+
+        except Exception:
+            raise error.PySmiWriterError(
+                f"user callback {self._cbFun} failure writing {mibname}: {sys.exc_info()[1]}",
+                writer=self,
+            )
+
+        debug.logger & debug.FLAG_WRITER and debug.logger(
+            f"user callback for {mibname} succeeded"
+        )
+
     def get_data(self, filename):
         return ""
@@ -23,6 +23,11 @@ class FileWriter(AbstractWriter):
 
     suffix = ""
 
+    #: leave files already holding the same data alone
+    skipUnchanged = False
+
+    concurrentWrites = True
+
     def __init__(self, path):
         """Creates an instance of *FileReader* class.
 
@@ -51,6 +56,11 @@ class FileWriter(AbstractWriter):
                 f.close()
             return ""
 
+    def get_digest(self, mibname):
+        return self._get_file_digest(
+            os.path.join(self._path, decode(mibname)) + self.suffix
+        )
+
     def put_data(self, mibname, data, comments=(), dryRun=False):
         if dryRun:
             debug.logger & debug.FLAG_WRITER and debug.logger("dry run mode")
@@ -58,7 +68,7 @@ class FileWriter(AbstractWriter):
 
         if not os.path.exists(self._path):
             try:
-                os.makedirs(self._path)
+                os.makedirs(self._path, exist_ok=True)
 
             except OSError:
                 raise error.PySmiWriterError(
@@ -71,11 +81,19 @@ class FileWriter(AbstractWriter):
 
         filename = os.path.join(self._path, decode(mibname)) + self.suffix
 
+        data = encode(data)
+
+        if self.skipUnchanged and self._is_unchanged(filename, data):
+            debug.logger & debug.FLAG_WRITER and debug.logger(
+                f"{mibname} unchanged in {filename}"
+            )
+            return
+
         tfile = None
 
         try:
             fd, tfile = tempfile.mkstemp(dir=self._path)
-            os.write(fd, encode(data))
+            os.write(fd, data)
             os.close(fd)
             os.rename(tfile, filename)
 
@@ -5,6 +5,7 @@
 # License: https://www.pysnmp.com/pysmi/license.html
 #
 import importlib.machinery
+import importlib.util
 import os
 import py_compile
 import sys
@@ -28,6 +29,11 @@ class PyFileWriter(AbstractWriter):
     pyCompile = True
     pyOptimizationLevel = -1
 
+    #: leave Python modules already holding the same code alone
+    skipUnchanged = False
+
+    concurrentWrites = True
+
     def __init__(self, path):
         """Creates an instance of *PyFileWriter* class.
 
@@ -47,7 +53,7 @@ class PyFileWriter(AbstractWriter):
 
         if not os.path.exists(self._path):
             try:
-                os.makedirs(self._path)
+                os.makedirs(self._path, exist_ok=True)
 
             except OSError:
                 raise error.PySmiWriterError(
@@ -61,24 +67,36 @@ class PyFileWriter(AbstractWriter):
         pyfile = os.path.join(self._path, decode(mibname))
         pyfile += SOURCE_SUFFIXES[0]
 
-        tfile = None
+        data = encode(data)
 
-        try:
-            fd, tfile = tempfile.mkstemp(dir=self._path)
-            os.write(fd, encode(data))
-            os.close(fd)
-            os.rename(tfile, pyfile)
+        if self.skipUnchanged and self._is_unchanged(pyfile, data):
+            debug.logger & debug.FLAG_WRITER and debug.logger(
+                f"{mibname} unchanged in {pyfile}"
+            )
 
-        except (OSError, UnicodeEncodeError):
-            exc = sys.exc_info()
-            if tfile and os.access(tfile, os.F_OK):
-                os.unlink(tfile)
+            # byte-compiled module may still be missing
+            if not self.pyCompile or os.path.exists(self._get_pyc_file(pyfile)):
+                return
 
-            raise error.PySmiWriterError(
-                f"failure writing file {pyfile}: {exc[1]}", file=pyfile, writer=self
-            )
+        else:
+            tfile = None
+
+            try:
+                fd, tfile = tempfile.mkstemp(dir=self._path)
+                os.write(fd, data)
+                os.close(fd)
+                os.rename(tfile, pyfile)
+
+            except (OSError, UnicodeEncodeError):
+                exc = sys.exc_info()
+                if tfile and os.access(tfile, os.F_OK):
+                    os.unlink(tfile)
 
-        debug.logger & debug.FLAG_WRITER and debug.logger(f"created file {pyfile}")
+                raise error.PySmiWriterError(
+                    f"failure writing file {pyfile}: {exc[1]}", file=pyfile, writer=self
+                )
+
+            debug.logger & debug.FLAG_WRITER and debug.logger(f"created file {pyfile}")
 
         if self.pyCompile:
             try:
@@ -101,5 +119,18 @@ class PyFileWriter(AbstractWriter):
 
         debug.logger & debug.FLAG_WRITER and debug.logger(f"{mibname} stored")
 
+    def _get_pyc_file(self, pyfile):
+        optimization = self.pyOptimizationLevel
+
+        if optimization < 0:
+            optimization = sys.flags.optimize
+
+        return importlib.util.cache_from_source(pyfile, optimization=optimization or "")
+
     def get_data(self, filename):
         return ""
+
+    def get_digest(self, mibname):
+        return self._get_file_digest(
+            os.path.join(self._path, decode(mibname)) + SOURCE_SUFFIXES[0]
+        )
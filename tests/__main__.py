@@ -13,6 +13,20 @@ except ImportError:
 suite = unittest.TestLoader().loadTestsFromNames(
     [
         "test_zipreader",
+        "test_compiler",
+        "test_graph",
+        "test_cache",
+        "test_manifest",
+        "test_server",
+        "test_symtablemap",
+        "test_stats",
+        "test_writer",
+        "test_resolver",
+        "test_journal",
+        "test_threading",
+        "test_lexer",
+        "test_tables",
+        "test_parser",
         "test_agentcapabilities_smiv2_pysnmp",
         "test_imports_smiv2_pysnmp",
         "test_modulecompliance_smiv2_pysnmp",
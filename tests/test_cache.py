@@ -0,0 +1,193 @@
+#
+# This file is part of pysmi software.
+#
+# Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
+# License: https://www.pysnmp.com/pysmi/license.html
+#
+import os
+import pickle
+import sys
+import tempfile
+import threading
+
+try:
+    import unittest2 as unittest
+
+except ImportError:
+    import unittest
+
+from pysmi.cache import FileCache, MemoryCache
+from pysmi.parser.dialect import smi_v1_relaxed, smi_v2
+from pysmi.parser.smi import parserFactory
+
+
+class FileCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.cache = FileCache(self.tempdir.name)
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def testPutGetData(self):
+        key = self.cache.make_key("TEST-MIB")
+
+        self.cache.put_data(key, [("TEST-MIB", None, {}, [])])
+
+        self.assertEqual(self.cache.get_data(key), [("TEST-MIB", None, {}, [])])
+
+    def testMissingData(self):
+        self.assertIsNone(self.cache.get_data(self.cache.make_key("TEST-MIB")))
+
+    def testBrokenData(self):
+        key = self.cache.make_key("TEST-MIB")
+
+        with open(os.path.join(self.tempdir.name, key + FileCache.suffix), "w") as f:
+            f.write("garbage")
+
+        self.assertIsNone(self.cache.get_data(key))
+
+    def testMakeKey(self):
+        self.assertEqual(
+            self.cache.make_key("a", ("b",)), self.cache.make_key("a", ("b",))
+        )
+        self.assertNotEqual(self.cache.make_key("ab"), self.cache.make_key("a", "b"))
+
+    def testEviction(self):
+        cache = FileCache(self.tempdir.name, maxSize=4096)
+
+        keys = [cache.make_key(x) for x in range(10)]
+
+        for key in keys:
+            cache.put_data(key, "x" * 1000)
+
+        self.assertLessEqual(
+            sum(
+                os.path.getsize(os.path.join(self.tempdir.name, x))
+                for x in os.listdir(self.tempdir.name)
+            ),
+            4096,
+        )
+        self.assertEqual(cache.get_data(keys[-1]), "x" * 1000)
+
+    def testPurge(self):
+        key = self.cache.make_key("TEST-MIB")
+
+        self.cache.put_data(key, "data")
+        self.cache.purge()
+
+        self.assertIsNone(self.cache.get_data(key))
+        self.assertEqual(os.listdir(self.tempdir.name), [])
+
+
+class ParserCacheTestCase(unittest.TestCase):
+    mib = """
+TEST-MIB DEFINITIONS ::= BEGIN
+
+testRoot OBJECT IDENTIFIER ::= { 1 3 6 1 4 1 9999 }
+
+END
+"""
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.cache = FileCache(self.tempdir.name)
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def testCachedParse(self):
+        parser = parserFactory(**smi_v2)().set_options(cache=self.cache)
+
+        mibTrees = parser.parse(self.mib)
+
+        self.assertEqual(len(os.listdir(self.tempdir.name)), 1)
+
+        self.assertEqual(parser.parse(self.mib), mibTrees)
+        self.assertEqual(parserFactory(**smi_v2)().parse(self.mib), mibTrees)
+
+    def testCacheKeyedByGrammar(self):
+        parserFactory(**smi_v2)().set_options(cache=self.cache).parse(self.mib)
+        parserFactory(**smi_v1_relaxed)().set_options(cache=self.cache).parse(self.mib)
+
+        self.assertEqual(len(os.listdir(self.tempdir.name)), 2)
+
+    def testCacheKeyedByParserClass(self):
+        parserClass = parserFactory(**smi_v2)
+
+        class CustomParser(parserClass):
+            def p_mibFile(self, p):
+                """mibFile : modules
+                | empty"""
+                p[0] = ("mibFile", p[1] and p[1][:0])
+
+        mibTrees = parserClass().set_options(cache=self.cache).parse(self.mib)
+
+        self.assertTrue(mibTrees)
+
+        parser = CustomParser().set_options(cache=self.cache)
+
+        self.assertEqual(parser.parse(self.mib), [])
+        self.assertEqual(len(os.listdir(self.tempdir.name)), 2)
+
+
+class MemoryCacheTestCase(unittest.TestCase):
+    def testGetPutData(self):
+        cache = MemoryCache()
+
+        self.assertIsNone(cache.get_data("key"))
+
+        data = {"a": [1, 2]}
+
+        cache.put_data("key", data)
+
+        self.assertEqual(cache.get_data("key"), data)
+        self.assertIsNot(cache.get_data("key"), data)
+
+    def testEviction(self):
+        cache = MemoryCache(maxSize=100)
+
+        cache.put_data("a", "x" * 60)
+        cache.put_data("b", "y" * 60)
+
+        self.assertIsNone(cache.get_data("a"))
+        self.assertEqual(cache.get_data("b"), "y" * 60)
+
+    def testThreads(self):
+        cache = MemoryCache(maxSize=1000)
+
+        errors = []
+
+        def run(index):
+            try:
+                for n in range(2000):
+                    cache.put_data(f"{index}-{n}", "x" * 100)
+                    cache.get_data(f"{index}-{n - 1}")
+
+            except Exception as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=run, args=(x,)) for x in range(4)]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(cache._size, sum(len(x) for x in cache._objects.values()))
+        self.assertLessEqual(cache._size, cache.maxSize)
+
+    def testPickle(self):
+        cache = MemoryCache()
+
+        cache.put_data("key", "data")
+
+        self.assertEqual(pickle.loads(pickle.dumps(cache)).get_data("key"), "data")
+
+
+suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+
+if __name__ == "__main__":
+    unittest.TextTestRunner(verbosity=2).run(suite)
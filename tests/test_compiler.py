@@ -0,0 +1,1421 @@
+#
+# This file is part of pysmi software.
+#
+# Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
+# License: https://www.pysnmp.com/pysmi/license.html
+#
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import unittest2 as unittest
+
+except ImportError:
+    import unittest
+
+from pysmi import error
+from pysmi.cache import FileCache, MemoryCache
+from pysmi.codegen import JsonCodeGen
+from pysmi.compiler import MibCompiler
+from pysmi.journal import BuildJournal, get_output_digest
+from pysmi.manifest import BuildManifest
+from pysmi.observer import AbstractObserver
+from pysmi.parser.dialect import smi_v1_relaxed
+from pysmi.parser.smi import parserFactory
+from pysmi.reader import CallbackReader, CorpusReader, FileReader, ZipReader
+from pysmi.resolver import MibResolver
+from pysmi.searcher import AnyFileSearcher, StubSearcher
+from pysmi.writer import CallbackWriter, FileWriter
+
+
+MIBS = {
+    "SNMPv2-SMI": """
+SNMPv2-SMI DEFINITIONS ::= BEGIN
+END
+""",
+    "SNMPv2-TC": """
+SNMPv2-TC DEFINITIONS ::= BEGIN
+END
+""",
+    "SNMPv2-CONF": """
+SNMPv2-CONF DEFINITIONS ::= BEGIN
+END
+""",
+    "TEST-MIB": """
+TEST-MIB DEFINITIONS ::= BEGIN
+IMPORTS
+  MODULE-IDENTITY, OBJECT-TYPE, Integer32
+    FROM SNMPv2-SMI
+  otherRoot
+    FROM OTHER-MIB
+  thirdRoot
+    FROM THIRD-MIB;
+
+testModule MODULE-IDENTITY
+    LAST-UPDATED "201601010000Z"
+    ORGANIZATION "test"
+    CONTACT-INFO "test"
+    DESCRIPTION "test"
+    ::= { otherRoot 1 }
+
+testObject OBJECT-TYPE
+    SYNTAX Integer32
+    MAX-ACCESS read-only
+    STATUS current
+    DESCRIPTION "test"
+    ::= { thirdRoot 1 }
+
+END
+""",
+    "OTHER-MIB": """
+OTHER-MIB DEFINITIONS ::= BEGIN
+IMPORTS
+  thirdRoot
+    FROM THIRD-MIB;
+
+otherRoot OBJECT IDENTIFIER ::= { thirdRoot 2 }
+
+END
+""",
+    "THIRD-MIB": """
+THIRD-MIB DEFINITIONS ::= BEGIN
+
+thirdRoot OBJECT IDENTIFIER ::= { 1 3 6 1 4 1 9999 }
+
+END
+""",
+    "BROKEN-MIB": """
+BROKEN-MIB DEFINITIONS ::= BEGIN
+IMPORTS
+  thirdRoot
+    FROM THIRD-MIB;
+
+brokenRoot OBJECT IDENTIFIER ::=
+END
+""",
+}
+
+
+class JobsTestCase(unittest.TestCase):
+    def compile(self, *mibnames, **options):
+        written = {}
+
+        mibCompiler = MibCompiler(
+            parserFactory(**smi_v1_relaxed)(),
+            JsonCodeGen(),
+            CallbackWriter(lambda m, d, c: written.__setitem__(m, d)),
+        )
+
+        mibCompiler.add_sources(CallbackReader(lambda m, c: MIBS.get(m)))
+        mibCompiler.add_searchers(StubSearcher(*JsonCodeGen.baseMibs))
+
+        processed = mibCompiler.compile(*mibnames, **options)
+
+        return {k: str(v) for k, v in processed.items()}, written
+
+    def testParallelParsingMatchesSerial(self):
+        serial = self.compile("TEST-MIB", genTexts=True)
+        parallel = self.compile("TEST-MIB", genTexts=True, jobs=2)
+
+        self.assertEqual(serial[0], parallel[0])
+        self.assertEqual(sorted(serial[1]), sorted(parallel[1]))
+
+    def testParallelParsingCompiles(self):
+        processed, written = self.compile("TEST-MIB", jobs=3)
+
+        self.assertEqual(processed["TEST-MIB"], "compiled")
+        self.assertEqual(processed["OTHER-MIB"], "compiled")
+        self.assertEqual(processed["THIRD-MIB"], "compiled")
+        self.assertEqual(processed["SNMPv2-SMI"], "untouched")
+        self.assertIn("TEST-MIB", written)
+
+    def testParallelParsingFailure(self):
+        serial = self.compile("TEST-MIB", "BROKEN-MIB", "MISSING-MIB")
+        parallel = self.compile("TEST-MIB", "BROKEN-MIB", "MISSING-MIB", jobs=2)
+
+        self.assertEqual(serial[0], parallel[0])
+        self.assertEqual(parallel[0]["BROKEN-MIB"], "failed")
+        self.assertEqual(parallel[0]["MISSING-MIB"], "missing")
+        self.assertEqual(parallel[0]["TEST-MIB"], "unprocessed")
+
+    def testParallelWritesMatchSerial(self):
+        contents = []
+
+        for jobs in (1, 2):
+            with tempfile.TemporaryDirectory() as path:
+                mibCompiler = MibCompiler(
+                    parserFactory(**smi_v1_relaxed)(),
+                    JsonCodeGen(),
+                    FileWriter(path).set_options(suffix=".json"),
+                )
+
+                mibCompiler.add_sources(CallbackReader(lambda m, c: MIBS.get(m)))
+                mibCompiler.add_searchers(StubSearcher(*JsonCodeGen.baseMibs))
+
+                processed = mibCompiler.compile("TEST-MIB", jobs=jobs)
+
+                self.assertEqual(processed["TEST-MIB"], "compiled")
+
+                written = {}
+
+                for filename in os.listdir(path):
+                    with open(os.path.join(path, filename)) as f:
+                        written[filename] = json.load(f)
+
+                    # generation time differs from run to run
+                    del written[filename]["meta"]["comments"]
+
+                contents.append(written)
+
+        self.assertEqual(
+            sorted(contents[0]), ["OTHER-MIB.json", "TEST-MIB.json", "THIRD-MIB.json"]
+        )
+        self.assertEqual(contents[0], contents[1])
+
+
+class ThreadsTestCase(unittest.TestCase):
+    def setUp(self):
+        self.written = {}
+
+        self.mibCompiler = MibCompiler(
+            parserFactory(**smi_v1_relaxed)(),
+            JsonCodeGen(),
+            CallbackWriter(lambda m, d, c: self.written.__setitem__(m, d)),
+        )
+
+        self.mibCompiler.add_sources(CallbackReader(lambda m, c: MIBS.get(m)))
+        self.mibCompiler.add_searchers(StubSearcher(*JsonCodeGen.baseMibs))
+
+    def testThreadsMatchSerial(self):
+        serial = self.mibCompiler.compile("TEST-MIB", genTexts=True, reproducible=True)
+        written = dict(self.written)
+
+        self.written.clear()
+
+        threaded = self.mibCompiler.compile(
+            "TEST-MIB", genTexts=True, reproducible=True, jobs=3, threads=True
+        )
+
+        self.assertEqual(threaded, serial)
+        self.assertEqual(self.written, written)
+
+    def testThreadsFailure(self):
+        processed = self.mibCompiler.compile(
+            "TEST-MIB", "BROKEN-MIB", "MISSING-MIB", jobs=2, threads=True
+        )
+
+        self.assertEqual(processed["BROKEN-MIB"], "failed")
+        self.assertEqual(processed["MISSING-MIB"], "missing")
+        self.assertEqual(processed["TEST-MIB"], "unprocessed")
+
+    def testConcurrentCompilations(self):
+        results = {}
+
+        def compile(mibname):
+            results[mibname] = self.mibCompiler.compile(
+                mibname, reproducible=True, writeMibs=False
+            )
+
+        threads = [
+            threading.Thread(target=compile, args=(x,))
+            for x in ("TEST-MIB", "OTHER-MIB", "THIRD-MIB", "BROKEN-MIB")
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        for mibname in ("TEST-MIB", "OTHER-MIB", "THIRD-MIB"):
+            self.assertEqual(results[mibname][mibname], "compiled")
+
+        self.assertEqual(results["BROKEN-MIB"]["BROKEN-MIB"], "failed")
+
+
+class WavefrontTestCase(unittest.TestCase):
+    def setUp(self):
+        self.events = []
+
+        self.mibCompiler = MibCompiler(
+            parserFactory(**smi_v1_relaxed)(),
+            JsonCodeGen(),
+            CallbackWriter(lambda m, d, c: self.events.append(("write", m))),
+        )
+
+        self.mibCompiler.add_sources(CallbackReader(self.read))
+        self.mibCompiler.add_searchers(StubSearcher(*JsonCodeGen.baseMibs))
+
+    def read(self, mibname, cbCtx):
+        self.events.append(("read", mibname))
+
+        return MIBS.get(mibname)
+
+    def testDependencyGraph(self):
+        self.mibCompiler.compile("TEST-MIB")
+
+        graph = self.mibCompiler.graph
+
+        self.assertEqual(
+            set(graph.imports("TEST-MIB")),
+            {"SNMPv2-SMI", "SNMPv2-TC", "SNMPv2-CONF", "OTHER-MIB", "THIRD-MIB"},
+        )
+        self.assertEqual(graph.importers("OTHER-MIB"), ("TEST-MIB",))
+        self.assertIn("THIRD-MIB", graph.closure("TEST-MIB"))
+
+    def testReadyMibStoredBeforeReadingOthers(self):
+        processed = self.mibCompiler.compile("THIRD-MIB", "TEST-MIB", ignoreErrors=True)
+
+        self.assertEqual(processed["TEST-MIB"], "compiled")
+        self.assertLess(
+            self.events.index(("write", "THIRD-MIB")),
+            self.events.index(("read", "OTHER-MIB")),
+        )
+        self.assertEqual(self.events[-1], ("write", "TEST-MIB"))
+
+    def testNothingStoredOnFailure(self):
+        processed = self.mibCompiler.compile("TEST-MIB", "BROKEN-MIB")
+
+        self.assertEqual(processed["TEST-MIB"], "unprocessed")
+        self.assertNotIn("write", [x[0] for x in self.events])
+
+
+class SymbolTableCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.parsed = []
+
+        parsed = self.parsed
+
+        class Parser(parserFactory(**smi_v1_relaxed)):
+            def parse(self, data, **kwargs):
+                mibTrees = super().parse(data, **kwargs)
+                parsed.extend(x[0] for x in mibTrees)
+                return mibTrees
+
+        self.parserClass = Parser
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def compile(self, *mibnames, **options):
+        written = {}
+
+        mibCompiler = MibCompiler(
+            self.parserClass(),
+            JsonCodeGen(),
+            CallbackWriter(lambda m, d, c: written.__setitem__(m, d)),
+        ).set_options(symbolTableCache=FileCache(self.tempdir.name))
+
+        mibCompiler.add_sources(CallbackReader(lambda m, c: MIBS.get(m)))
+        mibCompiler.add_searchers(StubSearcher(*JsonCodeGen.baseMibs))
+
+        processed = mibCompiler.compile(*mibnames, **options)
+
+        return {k: str(v) for k, v in processed.items()}, written
+
+    def testImportedMibsNotParsed(self):
+        processed, written = self.compile("TEST-MIB")
+
+        self.assertIn("THIRD-MIB", self.parsed)
+
+        del self.parsed[:]
+
+        cachedProcessed, cachedWritten = self.compile("TEST-MIB", noDeps=True)
+
+        self.assertEqual(self.parsed, ["TEST-MIB"])
+        self.assertEqual(cachedProcessed["TEST-MIB"], "compiled")
+        self.assertEqual(cachedProcessed["THIRD-MIB"], "untouched")
+        self.assertEqual(
+            json.loads(cachedWritten["TEST-MIB"])["testObject"],
+            json.loads(written["TEST-MIB"])["testObject"],
+        )
+
+    def testCachedSymbolTables(self):
+        processed, written = self.compile("TEST-MIB")
+
+        for jobs in (1, 2):
+            cachedProcessed, cachedWritten = self.compile("TEST-MIB", jobs=jobs)
+
+            self.assertEqual(processed, cachedProcessed)
+
+            for mibname in written:
+                mib = json.loads(written[mibname])
+                cachedMib = json.loads(cachedWritten[mibname])
+
+                # generation time differs from run to run
+                del mib["meta"], cachedMib["meta"]
+
+                self.assertEqual(mib, cachedMib)
+
+
+class IncrementalCompileTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.mibs = dict(MIBS)
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def compile(self, *mibnames, **options):
+        mibCompiler = MibCompiler(
+            parserFactory(**smi_v1_relaxed)(),
+            JsonCodeGen(),
+            FileWriter(self.tempdir.name).set_options(suffix=".json"),
+        ).set_options(
+            manifest=BuildManifest(os.path.join(self.tempdir.name, "manifest.json"))
+        )
+
+        mibCompiler.add_sources(CallbackReader(lambda m, c: self.mibs.get(m)))
+        mibCompiler.add_searchers(
+            AnyFileSearcher(self.tempdir.name).set_options(exts=[".json"]),
+            StubSearcher(*JsonCodeGen.baseMibs),
+        )
+
+        processed = mibCompiler.compile(*mibnames, **options)
+
+        return {
+            k: str(v) for k, v in processed.items() if k not in JsonCodeGen.baseMibs
+        }
+
+    def testUnchangedMibsUntouched(self):
+        processed = self.compile("TEST-MIB")
+
+        self.assertEqual(set(processed.values()), {"compiled"})
+
+        # MIB texts read through callbacks always look brand new
+        processed = self.compile("TEST-MIB")
+
+        self.assertEqual(set(processed.values()), {"untouched"})
+
+    def testChangedMibRebuilt(self):
+        self.compile("TEST-MIB")
+
+        self.mibs["TEST-MIB"] = self.mibs["TEST-MIB"].replace(
+            'ORGANIZATION "test"', 'ORGANIZATION "changed"'
+        )
+
+        processed = self.compile("TEST-MIB")
+
+        self.assertEqual(processed["TEST-MIB"], "compiled")
+        self.assertEqual(processed["OTHER-MIB"], "untouched")
+        self.assertEqual(processed["THIRD-MIB"], "untouched")
+
+    def testImportedMibChangeRebuildsImporters(self):
+        self.compile("TEST-MIB")
+
+        self.mibs["THIRD-MIB"] = self.mibs["THIRD-MIB"].replace("9999", "8888")
+
+        processed = self.compile("TEST-MIB")
+
+        self.assertEqual(set(processed.values()), {"compiled"})
+
+        with open(os.path.join(self.tempdir.name, "TEST-MIB.json")) as f:
+            self.assertEqual(json.load(f)["testObject"]["oid"], "1.3.6.1.4.1.8888.1")
+
+    def testMissingOutputRebuilt(self):
+        self.compile("TEST-MIB")
+
+        os.unlink(os.path.join(self.tempdir.name, "OTHER-MIB.json"))
+
+        processed = self.compile("TEST-MIB")
+
+        self.assertEqual(processed["OTHER-MIB"], "compiled")
+        self.assertEqual(processed["TEST-MIB"], "untouched")
+
+    def testDryRunNotRecorded(self):
+        self.compile("TEST-MIB", dryRun=True)
+
+        self.assertFalse(
+            os.path.exists(os.path.join(self.tempdir.name, "manifest.json"))
+        )
+
+
+class CompileIterTestCase(unittest.TestCase):
+    def setUp(self):
+        self.events = []
+        self.written = {}
+
+        self.mibCompiler = MibCompiler(
+            parserFactory(**smi_v1_relaxed)(),
+            JsonCodeGen(),
+            CallbackWriter(lambda m, d, c: self.written.__setitem__(m, d)),
+        )
+
+        self.mibCompiler.add_sources(CallbackReader(self.read))
+        self.mibCompiler.add_searchers(StubSearcher(*JsonCodeGen.baseMibs))
+
+    def read(self, mibname, cbCtx):
+        self.events.append(("read", mibname))
+
+        return MIBS.get(mibname)
+
+    def testMatchesCompile(self):
+        for options in ({}, dict(ignoreErrors=True), dict(jobs=2)):
+            for mibnames in (("TEST-MIB",), ("TEST-MIB", "BROKEN-MIB", "MISSING-MIB")):
+                processed = self.mibCompiler.compile(*mibnames, **options)
+
+                results = list(self.mibCompiler.compile_iter(*mibnames, **options))
+
+                self.assertEqual(len(results), len({x[0] for x in results}))
+                self.assertEqual(
+                    {x[0]: str(x[1]) for x in results},
+                    {k: str(v) for k, v in processed.items()},
+                )
+
+    def testCompiledMibData(self):
+        for mibname, status, mibData in self.mibCompiler.compile_iter("TEST-MIB"):
+            if status == "compiled":
+                self.assertEqual(mibData, self.written[mibname])
+
+            else:
+                self.assertIsNone(mibData)
+
+    def testResultsStreamed(self):
+        for mibname, status, mibData in self.mibCompiler.compile_iter(
+            "THIRD-MIB", "TEST-MIB", ignoreErrors=True
+        ):
+            self.events.append(("result", mibname))
+
+        self.assertLess(
+            self.events.index(("result", "THIRD-MIB")),
+            self.events.index(("read", "OTHER-MIB")),
+        )
+
+    def testFailure(self):
+        results = {
+            mibname: status
+            for mibname, status, mibData in self.mibCompiler.compile_iter(
+                "TEST-MIB", "BROKEN-MIB"
+            )
+        }
+
+        self.assertEqual(results["BROKEN-MIB"], "failed")
+        self.assertEqual(results["TEST-MIB"], "unprocessed")
+        self.assertFalse(self.written)
+
+
+class CompileAsyncTestCase(unittest.TestCase):
+    def setUp(self):
+        self.written = {}
+        self.reading = 0
+        self.maxReading = 0
+
+    def get_compiler(self, read, write):
+        mibCompiler = MibCompiler(
+            parserFactory(**smi_v1_relaxed)(), JsonCodeGen(), CallbackWriter(write)
+        )
+
+        mibCompiler.add_sources(CallbackReader(read))
+        mibCompiler.add_searchers(StubSearcher(*JsonCodeGen.baseMibs))
+
+        return mibCompiler
+
+    async def read(self, mibname, cbCtx):
+        self.reading += 1
+        self.maxReading = max(self.maxReading, self.reading)
+
+        await asyncio.sleep(0.01)
+
+        self.reading -= 1
+
+        return MIBS.get(mibname)
+
+    async def write(self, mibname, data, cbCtx):
+        await asyncio.sleep(0)
+
+        self.written[mibname] = data
+
+    def testMatchesCompile(self):
+        mibCompiler = self.get_compiler(
+            lambda m, c: MIBS.get(m), lambda m, d, c: self.written.__setitem__(m, d)
+        )
+
+        for mibnames in (("TEST-MIB",), ("TEST-MIB", "BROKEN-MIB", "MISSING-MIB")):
+            processed = mibCompiler.compile(*mibnames)
+
+            asyncProcessed = asyncio.run(mibCompiler.compile_async(*mibnames))
+
+            self.assertEqual(
+                {k: str(v) for k, v in processed.items()},
+                {k: str(v) for k, v in asyncProcessed.items()},
+            )
+
+    def testAsyncComponents(self):
+        mibCompiler = self.get_compiler(self.read, self.write)
+
+        processed = asyncio.run(mibCompiler.compile_async("TEST-MIB"))
+
+        self.assertEqual(processed["TEST-MIB"], "compiled")
+        self.assertEqual(sorted(self.written), ["OTHER-MIB", "TEST-MIB", "THIRD-MIB"])
+
+        # MIBs IMPORT'ed by TEST-MIB are read concurrently
+        self.assertGreater(self.maxReading, 1)
+
+    def testEventLoopNotBlocked(self):
+        ticks = []
+
+        async def tick():
+            while True:
+                ticks.append(None)
+                await asyncio.sleep(0)
+
+        async def main():
+            ticker = asyncio.ensure_future(tick())
+
+            try:
+                return await self.get_compiler(self.read, self.write).compile_async(
+                    "TEST-MIB"
+                )
+
+            finally:
+                ticker.cancel()
+
+        processed = asyncio.run(main())
+
+        self.assertEqual(processed["TEST-MIB"], "compiled")
+        self.assertGreater(len(ticks), 1)
+
+    def testMoreCallsThanExecutorWorkers(self):
+        # synchronous callbacks run in the default executor
+        mibCompiler = self.get_compiler(
+            lambda m, c: MIBS.get(m), lambda m, d, c: self.written.__setitem__(m, d)
+        )
+
+        async def main():
+            asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(2))
+
+            return await asyncio.wait_for(
+                asyncio.gather(
+                    *[mibCompiler.compile_async("TEST-MIB") for _ in range(6)]
+                ),
+                timeout=60,
+            )
+
+        for processed in asyncio.run(main()):
+            self.assertEqual(processed["TEST-MIB"], "compiled")
+
+    def testCancel(self):
+        threads = set(threading.enumerate())
+
+        async def read(mibname, cbCtx):
+            if mibname == "TEST-MIB":
+                return MIBS[mibname]
+
+            reading.set()
+
+            # IMPORT'ed MIBs never come
+            await asyncio.Event().wait()
+
+        async def main():
+            task = asyncio.ensure_future(
+                self.get_compiler(read, self.write).compile_async("TEST-MIB")
+            )
+
+            await reading.wait()
+
+            task.cancel()
+
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+            # the compilation stops while the event loop is still running,
+            # default executor threads are not waited for
+            engineThreads = [
+                x
+                for x in set(threading.enumerate()) - threads
+                if not x.name.startswith("asyncio")
+            ]
+
+            self.assertTrue(engineThreads)
+
+            for thread in engineThreads:
+                await asyncio.to_thread(thread.join, 10)
+
+                self.assertFalse(thread.is_alive())
+
+        reading = asyncio.Event()
+
+        asyncio.run(main())
+
+        self.assertEqual(self.written, {})
+
+    def testAsyncReaderNeedsAsyncCompile(self):
+        mibCompiler = self.get_compiler(self.read, self.write)
+
+        processed = mibCompiler.compile("TEST-MIB")
+
+        self.assertEqual(processed["TEST-MIB"], "failed")
+
+
+class CompileAllTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.written = {}
+        self.parsed = []
+
+        parsed = self.parsed
+
+        class Parser(parserFactory(**smi_v1_relaxed)):
+            def parse(self, data, **kwargs):
+                mibTrees = super().parse(data, **kwargs)
+                parsed.extend(x[0] for x in mibTrees)
+                return mibTrees
+
+        self.mibCompiler = MibCompiler(
+            Parser(),
+            JsonCodeGen(),
+            CallbackWriter(lambda m, d, c: self.written.__setitem__(m, d)),
+        )
+
+        self.mibCompiler.add_searchers(StubSearcher(*JsonCodeGen.baseMibs))
+
+        self.path = os.path.join(self.tempdir.name, "mibs")
+
+        os.mkdir(self.path)
+
+        for mibname, text in MIBS.items():
+            # file names need not match MIB names
+            with open(os.path.join(self.path, mibname.lower() + ".my"), "w") as f:
+                f.write(text)
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def testMibNamesInDependencyOrder(self):
+        mibnames = CorpusReader(FileReader(self.path)).get_mib_names()
+
+        self.assertEqual(sorted(mibnames), sorted(MIBS))
+        self.assertLess(mibnames.index("THIRD-MIB"), mibnames.index("OTHER-MIB"))
+        self.assertLess(mibnames.index("OTHER-MIB"), mibnames.index("TEST-MIB"))
+
+    def testCompileAll(self):
+        progress = []
+
+        processed = self.mibCompiler.compile_all(
+            FileReader(self.path), progress=lambda *args: progress.append(args)
+        )
+
+        self.assertEqual(processed["TEST-MIB"], "compiled")
+        self.assertEqual(processed["OTHER-MIB"], "compiled")
+        self.assertEqual(processed["THIRD-MIB"], "compiled")
+        self.assertEqual(processed["BROKEN-MIB"], "failed")
+        self.assertEqual(processed["SNMPv2-SMI"], "untouched")
+        self.assertEqual(processed["TEST-MIB"].file, "test-mib.my")
+
+        # each file is parsed once, successfully or not
+        self.assertEqual(sorted(self.parsed), sorted(set(self.parsed)))
+        self.assertNotIn("BROKEN-MIB", self.parsed)
+
+        self.assertEqual(sorted(self.written), ["OTHER-MIB", "TEST-MIB", "THIRD-MIB"])
+
+        self.assertEqual(len(progress), len(processed))
+        self.assertEqual([x[2] for x in progress], list(range(1, len(progress) + 1)))
+        self.assertEqual({x[0] for x in progress}, set(processed))
+
+        # the corpus does not stay among the sources
+        self.assertEqual(self.mibCompiler.compile("TEST-MIB")["TEST-MIB"], "missing")
+
+    def testSourcesUntouched(self):
+        sources = []
+
+        self.mibCompiler.compile_all(
+            FileReader(self.path),
+            progress=lambda *args: sources.append(list(self.mibCompiler._sources)),
+        )
+
+        # concurrent compilations do not see the corpus
+        self.assertTrue(sources)
+        self.assertTrue(all(x == [] for x in sources))
+
+    def testCompileAllFromZip(self):
+        filename = os.path.join(self.tempdir.name, "mibs.zip")
+
+        with zipfile.ZipFile(filename, "w") as archive:
+            for mibname, text in MIBS.items():
+                archive.writestr(os.path.join("mibs", mibname), text)
+
+        processed = self.mibCompiler.compile_all(ZipReader(filename))
+
+        self.assertEqual(processed["TEST-MIB"], "compiled")
+        self.assertEqual(processed["BROKEN-MIB"], "failed")
+
+
+class MemoryBudgetTestCase(unittest.TestCase):
+    def setUp(self):
+        self.written = {}
+        self.parsed = []
+
+        parsed = self.parsed
+
+        class Parser(parserFactory(**smi_v1_relaxed)):
+            def parse(self, data, **kwargs):
+                mibTrees = super().parse(data, **kwargs)
+                parsed.extend(x[0] for x in mibTrees)
+                return mibTrees
+
+        self.mibCompiler = MibCompiler(
+            Parser(),
+            JsonCodeGen(),
+            CallbackWriter(lambda m, d, c: self.written.__setitem__(m, d)),
+        )
+
+        self.mibCompiler.add_sources(CallbackReader(lambda m, c: MIBS.get(m)))
+        self.mibCompiler.add_searchers(StubSearcher(*JsonCodeGen.baseMibs))
+
+    def testMatchesUnlimited(self):
+        processed = self.mibCompiler.compile("TEST-MIB", genTexts=True)
+        written = dict(self.written)
+
+        self.written.clear()
+
+        # every symbol table but the last one used gets spilled
+        self.assertEqual(
+            self.mibCompiler.compile("TEST-MIB", genTexts=True, memoryBudget=1),
+            processed,
+        )
+        self.assertEqual(sorted(self.written), sorted(written))
+
+        for mibname in written:
+            self.assertEqual(
+                json.loads(self.written[mibname])["meta"]["module"],
+                json.loads(written[mibname])["meta"]["module"],
+            )
+
+    def testWaitingMibsParsedAgain(self):
+        processed = self.mibCompiler.compile("TEST-MIB", memoryBudget=1)
+
+        self.assertEqual(processed["TEST-MIB"], "compiled")
+
+        # TEST-MIB waits for the MIBs it IMPORTs without its parse tree
+        self.assertEqual(self.parsed.count("TEST-MIB"), 2)
+        self.assertEqual(self.parsed.count("THIRD-MIB"), 1)
+
+    def testBuiltMibsStoredRightAway(self):
+        processed = self.mibCompiler.compile("TEST-MIB", "BROKEN-MIB", memoryBudget=1)
+
+        self.assertEqual(processed["BROKEN-MIB"], "failed")
+        self.assertEqual(processed["THIRD-MIB"], "compiled")
+        self.assertIn("THIRD-MIB", self.written)
+
+    def testWavesGetSymbolTablesNeeded(self):
+        mibs = dict(
+            MIBS,
+            **{
+                "WAITING-MIB": """
+WAITING-MIB DEFINITIONS ::= BEGIN
+IMPORTS
+  slowRoot
+    FROM SLOW-MIB;
+
+waitingRoot OBJECT IDENTIFIER ::= { slowRoot 1 }
+
+END
+""",
+                "SLOW-MIB": """
+SLOW-MIB DEFINITIONS ::= BEGIN
+
+slowRoot OBJECT IDENTIFIER ::= { 1 3 6 1 4 1 9998 }
+
+END
+""",
+            },
+        )
+
+        symbolTables = {}
+        generating = threading.Event()
+
+        class CodeGen(JsonCodeGen):
+            def gen_code(self, ast, symbolTable, **kwargs):
+                symbolTables[ast[0]] = set(symbolTable)
+                generating.set()
+                return super().gen_code(ast, symbolTable, **kwargs)
+
+        def read(mibname, cbCtx):
+            if mibname == "SLOW-MIB":
+                # WAITING-MIB gets ready once the other MIBs are being generated
+                generating.wait(10)
+
+            return mibs.get(mibname)
+
+        mibCompiler = MibCompiler(
+            parserFactory(**smi_v1_relaxed)(),
+            CodeGen(),
+            CallbackWriter(lambda m, d, c: self.written.__setitem__(m, d)),
+        )
+
+        mibCompiler.add_sources(CallbackReader(read))
+        mibCompiler.add_searchers(StubSearcher(*JsonCodeGen.baseMibs))
+
+        processed = mibCompiler.compile(
+            "TEST-MIB", "WAITING-MIB", memoryBudget=1, jobs=2, threads=True
+        )
+
+        self.assertEqual(processed["TEST-MIB"], "compiled")
+        self.assertEqual(processed["WAITING-MIB"], "compiled")
+
+        # symbol table of WAITING-MIB, likely spilled by then, is not
+        # read back for the MIBs it has nothing to do with
+        for mibname in ("TEST-MIB", "OTHER-MIB", "THIRD-MIB"):
+            self.assertNotIn("WAITING-MIB", symbolTables[mibname])
+
+        self.assertTrue(
+            {"TEST-MIB", "OTHER-MIB", "THIRD-MIB"}.issubset(symbolTables["TEST-MIB"])
+        )
+        self.assertIn("SLOW-MIB", symbolTables["WAITING-MIB"])
+
+    def testPeakMemoryReported(self):
+        self.mibCompiler.compile("TEST-MIB", memoryBudget=1024 * 1024)
+
+        if sys.platform != "win32":
+            self.assertGreater(self.mibCompiler.peakMemory, 0)
+
+
+class CompileStatsTestCase(unittest.TestCase):
+    def compile(self, *mibnames, **options):
+        mibCompiler = MibCompiler(
+            parserFactory(**smi_v1_relaxed)(),
+            JsonCodeGen(),
+            CallbackWriter(lambda m, d, c: None),
+        )
+
+        mibCompiler.add_sources(CallbackReader(lambda m, c: MIBS.get(m)))
+        mibCompiler.add_searchers(StubSearcher(*JsonCodeGen.baseMibs))
+
+        return mibCompiler, mibCompiler.compile(*mibnames, **options)
+
+    def testPhases(self):
+        for options in ({}, dict(jobs=2)):
+            mibCompiler, processed = self.compile("TEST-MIB", **options)
+
+            for phase in ("read", "parse", "symtable", "codegen", "render", "write"):
+                self.assertIn(phase, mibCompiler.stats.phases)
+
+            self.assertEqual(mibCompiler.stats.phases["codegen"].calls, 3)
+            self.assertEqual(mibCompiler.stats.phases["write"].calls, 3)
+
+    def testCounters(self):
+        mibCompiler, processed = self.compile("TEST-MIB", "MISSING-MIB")
+
+        counters = mibCompiler.stats.counters
+
+        # base MIBs are found by the stub searcher
+        self.assertEqual(counters["searcherHits"], 3)
+        self.assertEqual(counters["searcherProbes"], 6)
+        self.assertEqual(counters["sourceProbes"], 7)
+        self.assertEqual(counters["borrowAttempts"], 0)
+
+    def testMibStats(self):
+        mibCompiler, processed = self.compile("TEST-MIB")
+
+        self.assertEqual(processed["TEST-MIB"].alias, "TEST-MIB")
+        self.assertEqual(processed["TEST-MIB"].stats["codegen"].calls, 1)
+        self.assertIn("search", processed["SNMPv2-SMI"].stats)
+        self.assertNotIn("codegen", processed["SNMPv2-SMI"].stats)
+
+
+class ObserverTestCase(unittest.TestCase):
+    def compile(self, *mibnames, **options):
+        events = []
+
+        class Observer(AbstractObserver):
+            def phase_finished(self, event):
+                events.append(event)
+
+        mibCompiler = MibCompiler(
+            parserFactory(**smi_v1_relaxed)(),
+            JsonCodeGen(),
+            CallbackWriter(lambda m, d, c: None),
+        )
+
+        mibCompiler.add_sources(CallbackReader(lambda m, c: MIBS.get(m)))
+        mibCompiler.add_searchers(StubSearcher(*JsonCodeGen.baseMibs))
+        mibCompiler.add_observers(Observer())
+
+        mibCompiler.compile(*mibnames, **options)
+
+        return events
+
+    def testEvents(self):
+        for options in ({}, dict(jobs=2), dict(isolate=True)):
+            events = self.compile("TEST-MIB", **options)
+
+            phases = {(x.phase, x.mibname): x for x in events}
+
+            self.assertEqual(
+                phases["read", "TEST-MIB"].size, len(MIBS["TEST-MIB"]), options
+            )
+            self.assertEqual(phases["parse", "TEST-MIB"].size, len(MIBS["TEST-MIB"]))
+            self.assertIn(("symtable", "TEST-MIB"), phases)
+            self.assertIn(("search", "SNMPv2-SMI"), phases)
+            self.assertGreater(phases["render", "TEST-MIB"].size, 0)
+            self.assertEqual(
+                phases["codegen", "TEST-MIB"].size, phases["write", "TEST-MIB"].size
+            )
+
+    def testFailedPhase(self):
+        events = self.compile("BROKEN-MIB")
+
+        self.assertTrue(any(x.phase == "parse" and x.error is not None for x in events))
+
+
+class ReproducibleTestCase(unittest.TestCase):
+    def compile(self, *mibnames, **options):
+        written = {}
+
+        mibCompiler = MibCompiler(
+            parserFactory(**smi_v1_relaxed)(),
+            JsonCodeGen(),
+            CallbackWriter(lambda m, d, c: written.__setitem__(m, d)),
+        )
+
+        mibCompiler.add_sources(CallbackReader(lambda m, c: MIBS.get(m)))
+        mibCompiler.add_searchers(StubSearcher(*JsonCodeGen.baseMibs))
+
+        mibCompiler.compile(*mibnames, **options)
+
+        mibCompiler.build_index({}, **options)
+
+        return written
+
+    def testVolatileCommentsDropped(self):
+        written = self.compile("TEST-MIB", reproducible=True)
+
+        comments = json.loads(written["TEST-MIB"])["meta"]["comments"]
+
+        self.assertEqual(len(comments), 2)
+        self.assertTrue(comments[1].startswith("Produced by pysmi-"))
+        self.assertNotIn(" at ", comments[1])
+
+        self.assertNotIn("On host", written["index"])
+
+    def testSourceDateEpoch(self):
+        os.environ["SOURCE_DATE_EPOCH"] = "0"
+
+        try:
+            written = self.compile("TEST-MIB", reproducible=True)
+
+        finally:
+            del os.environ["SOURCE_DATE_EPOCH"]
+
+        comments = json.loads(written["TEST-MIB"])["meta"]["comments"]
+
+        self.assertTrue(comments[1].endswith(" at Thu Jan  1 00:00:00 1970"))
+
+    def testSameOutput(self):
+        written = self.compile("TEST-MIB", genTexts=True, reproducible=True)
+
+        self.assertEqual(
+            self.compile("TEST-MIB", genTexts=True, reproducible=True, jobs=2),
+            written,
+        )
+
+    def testSameOutputWhateverHashSeed(self):
+        script = f"""
+import sys
+sys.path.insert(0, {os.path.dirname(__file__)!r})
+from test_compiler import ReproducibleTestCase
+written = ReproducibleTestCase().compile("TEST-MIB", genTexts=True, reproducible=True)
+sys.stdout.write(repr(sorted(written.items())))
+"""
+        outputs = set()
+
+        for seed in ("1", "2"):
+            outputs.add(
+                subprocess.check_output(
+                    [sys.executable, "-c", script],
+                    env=dict(os.environ, PYTHONHASHSEED=seed),
+                )
+            )
+
+        self.assertEqual(len(outputs), 1)
+
+
+class MibResolverTestCase(unittest.TestCase):
+    def setUp(self):
+        self.reads = []
+
+        self.mibCompiler = MibCompiler(
+            parserFactory(**smi_v1_relaxed)(),
+            JsonCodeGen(),
+            CallbackWriter(lambda m, d, c: None),
+        )
+
+        self.mibCompiler.add_sources(CallbackReader(self.read))
+        self.mibCompiler.add_searchers(StubSearcher(*JsonCodeGen.baseMibs))
+        self.mibCompiler.set_options(resolver=MibResolver(MemoryCache()))
+
+    def read(self, mibname, cbCtx):
+        self.reads.append(mibname)
+
+        return MIBS.get(mibname)
+
+    def testMissingMibNotLookedUpAgain(self):
+        for _ in range(2):
+            processed = self.mibCompiler.compile("TEST-MIB", "MISSING-MIB")
+
+            self.assertEqual(processed["MISSING-MIB"], "missing")
+
+        self.assertEqual(self.reads.count("MISSING-MIB"), 1)
+        self.assertEqual(self.reads.count("TEST-MIB"), 2)
+
+
+class BuildJournalTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.written = {}
+        self.mibs = dict(MIBS)
+        self.failOn = None
+
+        self.mibCompiler = MibCompiler(
+            parserFactory(**smi_v1_relaxed)(),
+            JsonCodeGen(),
+            CallbackWriter(self.write),
+        )
+
+        self.mibCompiler.add_sources(CallbackReader(lambda m, c: self.mibs.get(m)))
+        self.mibCompiler.add_searchers(StubSearcher(*JsonCodeGen.baseMibs))
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def write(self, mibname, mibData, cbCtx):
+        if mibname == self.failOn:
+            raise KeyboardInterrupt()
+
+        self.written[mibname] = mibData
+
+    def compile(self, *mibnames, **options):
+        self.written.clear()
+
+        self.mibCompiler.set_options(
+            journal=BuildJournal(os.path.join(self.tempdir.name, "journal"))
+        )
+
+        return self.mibCompiler.compile(*mibnames, **options)
+
+    def interrupt(self, *mibnames, **options):
+        self.failOn = "TEST-MIB"
+
+        self.assertRaises(KeyboardInterrupt, self.compile, *mibnames, **options)
+        self.assertIn("THIRD-MIB", self.written)
+
+        self.failOn = None
+
+    def testResumeInterrupted(self):
+        self.interrupt("TEST-MIB")
+
+        processed = self.compile("TEST-MIB", resume=True)
+
+        self.assertEqual(processed["TEST-MIB"], "compiled")
+        self.assertEqual(processed["THIRD-MIB"], "untouched")
+        self.assertEqual(sorted(self.written), ["TEST-MIB"])
+
+    def testClearedOnSuccess(self):
+        self.compile("TEST-MIB")
+
+        self.assertFalse(os.path.exists(os.path.join(self.tempdir.name, "journal")))
+
+        processed = self.compile("TEST-MIB", resume=True)
+
+        self.assertEqual(processed["TEST-MIB"], "compiled")
+        self.assertEqual(processed["THIRD-MIB"], "compiled")
+
+    def testKeptOnFailure(self):
+        self.compile("TEST-MIB", "BROKEN-MIB", ignoreErrors=True)
+
+        processed = self.compile(
+            "TEST-MIB", "BROKEN-MIB", ignoreErrors=True, resume=True
+        )
+
+        self.assertEqual(processed["TEST-MIB"], "untouched")
+        self.assertEqual(processed["BROKEN-MIB"], "failed")
+        self.assertEqual(self.written, {})
+
+    def testRebuildTakesPrecedence(self):
+        self.interrupt("TEST-MIB")
+
+        processed = self.compile("TEST-MIB", resume=True, rebuild=True)
+
+        self.assertEqual(processed["THIRD-MIB"], "compiled")
+        self.assertEqual(sorted(self.written), ["OTHER-MIB", "TEST-MIB", "THIRD-MIB"])
+
+    def testChangedInputsRebuilt(self):
+        self.interrupt("TEST-MIB")
+
+        self.mibs["THIRD-MIB"] = self.mibs["THIRD-MIB"].replace("9999", "9998")
+
+        processed = self.compile("TEST-MIB", resume=True)
+
+        self.assertEqual(processed["THIRD-MIB"], "compiled")
+        self.assertEqual(processed["OTHER-MIB"], "compiled")
+        self.assertEqual(processed["TEST-MIB"], "compiled")
+
+    def interrupt_to_files(self):
+        path = os.path.join(self.tempdir.name, "mibs")
+
+        test = self
+
+        class Writer(FileWriter):
+            def put_data(self, mibname, data, comments=(), dryRun=False):
+                test.write(mibname, data, None)
+                super().put_data(mibname, data, comments, dryRun)
+
+        self.mibCompiler._writer = Writer(path).set_options(suffix=".json")
+
+        self.interrupt("TEST-MIB")
+
+        return path
+
+    def testDeletedOutputRebuilt(self):
+        path = self.interrupt_to_files()
+
+        os.remove(os.path.join(path, "THIRD-MIB.json"))
+
+        processed = self.compile("TEST-MIB", resume=True)
+
+        self.assertEqual(processed["THIRD-MIB"], "compiled")
+        self.assertEqual(processed["OTHER-MIB"], "untouched")
+
+    def testChangedOutputRebuilt(self):
+        path = self.interrupt_to_files()
+
+        with open(os.path.join(path, "OTHER-MIB.json"), "a") as f:
+            f.write(" ")
+
+        processed = self.compile("TEST-MIB", resume=True)
+
+        self.assertEqual(processed["THIRD-MIB"], "untouched")
+        self.assertEqual(processed["OTHER-MIB"], "compiled")
+
+    def testRecords(self):
+        self.compile("TEST-MIB", "BROKEN-MIB", ignoreErrors=True)
+
+        record = BuildJournal(os.path.join(self.tempdir.name, "journal")).get_record(
+            "TEST-MIB"
+        )
+
+        self.assertEqual(record["status"], "compiled")
+        self.assertEqual(record["digest"], get_output_digest(self.written["TEST-MIB"]))
+        self.assertIsNotNone(record["source"])
+        self.assertIsNotNone(record["signature"])
+
+    def testNotResumedByDefault(self):
+        self.interrupt("TEST-MIB")
+
+        self.assertEqual(self.compile("TEST-MIB")["THIRD-MIB"], "compiled")
+
+
+class ShardTestCase(unittest.TestCase):
+    def setUp(self):
+        self.mibs = dict(
+            MIBS,
+            **{
+                "FOURTH-MIB": """
+FOURTH-MIB DEFINITIONS ::= BEGIN
+IMPORTS
+  OBJECT-TYPE, Integer32
+    FROM SNMPv2-SMI;
+
+fourthRoot OBJECT IDENTIFIER ::= { 1 3 6 1 4 1 8888 }
+
+fourthObject OBJECT-TYPE
+    SYNTAX Integer32
+    MAX-ACCESS read-only
+    STATUS current
+    DESCRIPTION "test"
+    ::= { fourthRoot 1 }
+
+END
+"""
+            },
+        )
+
+    def get_compiler(self, written):
+        mibCompiler = MibCompiler(
+            parserFactory(**smi_v1_relaxed)(),
+            JsonCodeGen(),
+            CallbackWriter(lambda m, d, c: written.__setitem__(m, d)),
+        )
+
+        mibCompiler.add_sources(CallbackReader(lambda m, c: self.mibs.get(m)))
+        mibCompiler.add_searchers(StubSearcher(*JsonCodeGen.baseMibs))
+
+        return mibCompiler
+
+    def compile(self, *mibnames, **options):
+        written = {}
+
+        mibCompiler = self.get_compiler(written)
+
+        processed = mibCompiler.compile(*mibnames, reproducible=True, **options)
+
+        mibCompiler.build_index(
+            {k: v for k, v in processed.items() if v != "failed"},
+            reproducible=True,
+            shard=options.get("shard"),
+        )
+
+        return processed, written
+
+    def testShardsBuildEachMibOnce(self):
+        processed, written = self.compile("TEST-MIB", "FOURTH-MIB")
+
+        shardWritten = {}
+
+        for index in range(2):
+            shardProcessed, shardMibs = self.compile(
+                "TEST-MIB", "FOURTH-MIB", shard=(index, 2)
+            )
+
+            shardMibs.pop(f"index-{index + 1}-of-2")
+
+            self.assertTrue(shardMibs)
+            self.assertFalse(set(shardMibs).intersection(shardWritten))
+            self.assertEqual(
+                {x for x in shardProcessed if shardProcessed[x] == "compiled"},
+                set(shardMibs),
+            )
+
+            shardWritten.update(shardMibs)
+
+        written.pop("index")
+
+        self.assertEqual(shardWritten, written)
+
+    def testDependenciesStayTogether(self):
+        mibCompiler = self.get_compiler({})
+
+        shards = [
+            mibCompiler.get_shard(["TEST-MIB", "FOURTH-MIB"], index, 2)
+            for index in range(2)
+        ]
+
+        self.assertIn(["FOURTH-MIB"], shards)
+        self.assertIn(
+            ["TEST-MIB", "OTHER-MIB", "SNMPv2-SMI", "THIRD-MIB"],
+            shards,
+        )
+
+    def testNoDeps(self):
+        mibCompiler = self.get_compiler({})
+
+        shards = [
+            mibCompiler.get_shard(["TEST-MIB", "FOURTH-MIB"], index, 2, noDeps=True)
+            for index in range(2)
+        ]
+
+        self.assertEqual(sorted(shards), [["FOURTH-MIB"], ["TEST-MIB"]])
+
+    def testMissingMib(self):
+        mibCompiler = self.get_compiler({})
+
+        self.assertEqual(mibCompiler.get_shard(["MISSING-MIB"], 0, 1), ["MISSING-MIB"])
+
+    def testBadShard(self):
+        mibCompiler = self.get_compiler({})
+
+        self.assertRaises(error.PySmiError, mibCompiler.get_shard, ["TEST-MIB"], 2, 2)
+
+    def testMergedIndexMatchesFullIndex(self):
+        processed, written = self.compile("TEST-MIB", "FOURTH-MIB")
+
+        indexes = [
+            self.compile("TEST-MIB", "FOURTH-MIB", shard=(index, 2))[1][
+                f"index-{index + 1}-of-2"
+            ]
+            for index in range(2)
+        ]
+
+        merged = {}
+
+        self.get_compiler(merged).merge_index(indexes, reproducible=True)
+
+        self.assertEqual(json.loads(merged["index"]), json.loads(written["index"]))
+        self.assertIn("1.3.6.1.4.1.8888", json.loads(merged["index"])["oids"])
+
+
+class IsolationTestCase(unittest.TestCase):
+    def setUp(self):
+        self.written = {}
+
+        class Parser(parserFactory(**smi_v1_relaxed)):
+            def parse(self, data, **kwargs):
+                if "HANGING-MIB" in data:
+                    time.sleep(60)
+
+                elif "CRASHING-MIB" in data:
+                    os._exit(1)
+
+                elif "GREEDY-MIB" in data:
+                    bytearray(1024 * 1024 * 1024)
+
+                return super().parse(data, **kwargs)
+
+        self.mibCompiler = MibCompiler(
+            Parser(),
+            JsonCodeGen(),
+            CallbackWriter(lambda m, d, c: self.written.__setitem__(m, d)),
+        )
+
+        mibs = dict(
+            MIBS,
+            **{
+                x: MIBS["OTHER-MIB"].replace("OTHER-MIB", x).replace("otherRoot", "x")
+                for x in ("HANGING-MIB", "CRASHING-MIB", "GREEDY-MIB")
+            },
+        )
+
+        self.mibCompiler.add_sources(CallbackReader(lambda m, c: mibs.get(m)))
+        self.mibCompiler.add_searchers(StubSearcher(*JsonCodeGen.baseMibs))
+
+    def testMatchesUnisolated(self):
+        processed = self.mibCompiler.compile("TEST-MIB", reproducible=True)
+        written = dict(self.written)
+
+        self.written.clear()
+
+        self.assertEqual(
+            self.mibCompiler.compile("TEST-MIB", isolate=True, reproducible=True),
+            processed,
+        )
+        self.assertEqual(self.written, written)
+
+    def testTimeout(self):
+        processed = self.mibCompiler.compile("TEST-MIB", "HANGING-MIB", mibTimeout=1)
+
+        self.assertEqual(processed["HANGING-MIB"], "failed")
+        self.assertIsInstance(processed["HANGING-MIB"].error, error.PySmiTimeoutError)
+        self.assertEqual(processed["TEST-MIB"], "compiled")
+        self.assertIn("TEST-MIB", self.written)
+
+    def testCrash(self):
+        processed = self.mibCompiler.compile("TEST-MIB", "CRASHING-MIB", isolate=True)
+
+        self.assertEqual(processed["CRASHING-MIB"], "failed")
+        self.assertIsInstance(processed["CRASHING-MIB"].error, error.PySmiWorkerError)
+        self.assertEqual(processed["TEST-MIB"], "compiled")
+
+    @unittest.skipIf(sys.platform != "linux", "memory limit is best supported on Linux")
+    def testMemoryLimit(self):
+        processed = self.mibCompiler.compile(
+            "TEST-MIB", "GREEDY-MIB", mibMemoryLimit=256 * 1024 * 1024
+        )
+
+        self.assertEqual(processed["GREEDY-MIB"], "failed")
+        self.assertIn("MemoryError", str(processed["GREEDY-MIB"].error))
+        self.assertEqual(processed["TEST-MIB"], "compiled")
+
+
+suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+
+if __name__ == "__main__":
+    unittest.TextTestRunner(verbosity=2).run(suite)
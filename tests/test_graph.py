@@ -0,0 +1,88 @@
+#
+# This file is part of pysmi software.
+#
+# Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
+# License: https://www.pysnmp.com/pysmi/license.html
+#
+import sys
+
+try:
+    import unittest2 as unittest
+
+except ImportError:
+    import unittest
+
+from pysmi.graph import DependencyGraph
+
+
+class DependencyGraphTestCase(unittest.TestCase):
+    def setUp(self):
+        self.graph = DependencyGraph()
+        self.graph.add_module("A-MIB", ["B-MIB", "C-MIB"])
+        self.graph.add_module("B-MIB", ["C-MIB", "D-MIB"])
+        self.graph.add_module("D-MIB", ["B-MIB"])
+        self.graph.add_module("C-MIB")
+
+    def testNodes(self):
+        self.assertEqual(sorted(self.graph), ["A-MIB", "B-MIB", "C-MIB", "D-MIB"])
+        self.assertIn("D-MIB", self.graph)
+        self.assertNotIn("E-MIB", self.graph)
+
+    def testImports(self):
+        self.assertEqual(self.graph.imports("A-MIB"), ("B-MIB", "C-MIB"))
+        self.assertEqual(self.graph.imports("C-MIB"), ())
+
+    def testImporters(self):
+        self.assertEqual(self.graph.importers("C-MIB"), ("A-MIB", "B-MIB"))
+
+    def testClosure(self):
+        self.assertEqual(self.graph.closure("A-MIB"), {"B-MIB", "C-MIB", "D-MIB"})
+        self.assertEqual(self.graph.closure("C-MIB"), set())
+
+    def testDependents(self):
+        self.assertEqual(self.graph.dependents("C-MIB"), {"A-MIB", "B-MIB", "D-MIB"})
+
+    def testCycles(self):
+        self.assertEqual(self.graph.cycles(), [{"B-MIB", "D-MIB"}])
+
+    def testSelfImportCycle(self):
+        self.graph.add_module("E-MIB", ["E-MIB"])
+
+        self.assertIn({"E-MIB"}, self.graph.cycles())
+
+    def testWaves(self):
+        self.assertEqual(
+            [sorted(x) for x in self.graph.waves()],
+            [["C-MIB"], ["B-MIB", "D-MIB"], ["A-MIB"]],
+        )
+
+    def testPartition(self):
+        self.graph.add_module("E-MIB", ["F-MIB"])
+        self.graph.add_module("F-MIB")
+
+        groups = self.graph.partition(["A-MIB", "E-MIB"], 2)
+
+        self.assertEqual(
+            sorted(sorted(x) for x in groups),
+            [["A-MIB", "B-MIB", "C-MIB", "D-MIB"], ["E-MIB", "F-MIB"]],
+        )
+        self.assertEqual(groups, self.graph.partition(["E-MIB", "A-MIB"], 2))
+
+    def testPartitionBalanced(self):
+        groups = self.graph.partition(["B-MIB", "C-MIB", "D-MIB"], 3)
+
+        self.assertEqual(len(groups), 3)
+        self.assertEqual(set().union(*groups), {"B-MIB", "C-MIB", "D-MIB"})
+        self.assertEqual(sum(len(x) for x in groups), 3)
+
+    def testMissingImport(self):
+        self.graph.add_module("E-MIB", ["MISSING-MIB"])
+
+        self.assertIn("MISSING-MIB", self.graph)
+        self.assertEqual(self.graph.waves()[0], ["C-MIB", "MISSING-MIB"])
+
+
+suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+
+if __name__ == "__main__":
+    unittest.TextTestRunner(verbosity=2).run(suite)
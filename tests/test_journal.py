@@ -0,0 +1,96 @@
+#
+# This file is part of pysmi software.
+#
+# Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
+# License: https://www.pysnmp.com/pysmi/license.html
+#
+import os
+import sys
+import tempfile
+
+try:
+    import unittest2 as unittest
+
+except ImportError:
+    import unittest
+
+from pysmi.journal import BuildJournal, get_output_digest
+
+
+class BuildJournalTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tempdir.name, "journal")
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def testAddAndLoad(self):
+        journal = BuildJournal(self.path)
+
+        self.assertIsNone(journal.get_record("TEST-MIB"))
+
+        journal.add_record("TEST-MIB", "abc", "def", "compiled", "123")
+
+        self.assertEqual(
+            BuildJournal(self.path).get_record("TEST-MIB"),
+            dict(
+                mib="TEST-MIB",
+                source="abc",
+                signature="def",
+                status="compiled",
+                digest="123",
+            ),
+        )
+
+    def testLatestRecordWins(self):
+        journal = BuildJournal(self.path)
+
+        journal.add_record("TEST-MIB", "abc", "def", "failed")
+        journal.add_record("TEST-MIB", "abc", "def", "compiled", "123")
+
+        self.assertEqual(
+            BuildJournal(self.path).get_record("TEST-MIB")["status"], "compiled"
+        )
+
+    def testSameRecordNotRepeated(self):
+        for _ in range(2):
+            BuildJournal(self.path).add_record("TEST-MIB", "abc", "def", "compiled")
+
+        with open(self.path) as f:
+            self.assertEqual(len(f.readlines()), 1)
+
+    def testBrokenLastRecordIgnored(self):
+        BuildJournal(self.path).add_record("TEST-MIB", "abc", "def", "compiled")
+
+        with open(self.path, "a") as f:
+            f.write('{"mib": "OTHER-MIB", "sou')
+
+        journal = BuildJournal(self.path)
+
+        self.assertIsNone(journal.get_record("OTHER-MIB"))
+
+        journal.add_record("THIRD-MIB", "abc", "def", "compiled")
+
+        journal = BuildJournal(self.path)
+
+        self.assertIsNotNone(journal.get_record("TEST-MIB"))
+        self.assertIsNotNone(journal.get_record("THIRD-MIB"))
+
+    def testClear(self):
+        journal = BuildJournal(self.path)
+
+        journal.add_record("TEST-MIB", "abc", "def", "compiled")
+        journal.clear()
+
+        self.assertIsNone(journal.get_record("TEST-MIB"))
+        self.assertFalse(os.path.exists(self.path))
+
+    def testOutputDigest(self):
+        self.assertEqual(get_output_digest("abc"), get_output_digest(b"abc"))
+
+
+suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+
+if __name__ == "__main__":
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,199 @@
+#
+# This file is part of pysmi software.
+#
+# Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
+# License: https://www.pysnmp.com/pysmi/license.html
+#
+import glob
+import os
+import re
+import sys
+import textwrap
+
+try:
+    import unittest2 as unittest
+
+except ImportError:
+    import unittest
+
+import ply.lex as lex
+from pysmi import error
+from pysmi.lexer.smi import lexerFactory
+from pysmi.parser.dialect import smi_v1_relaxed
+from pysmi.parser.smi import parserFactory
+
+MIB = textwrap.dedent(
+    """
+    TEST-MIB DEFINITIONS ::= BEGIN
+    IMPORTS
+      Integer32
+        FROM SNMPv2-SMI;
+
+    -- a comment
+    testValue OBJECT IDENTIFIER ::= { 1 3 6 1 4 1 9999 }
+
+    END
+    """
+)
+
+
+class LexerResetTestCase(unittest.TestCase):
+    def setUp(self):
+        self.lexer = lexerFactory()()
+
+    def tokens(self, data):
+        self.lexer.lexer.input(data)
+
+        return [(t.type, t.value, t.lineno) for t in iter(self.lexer.lexer.token, None)]
+
+    def testLexerReused(self):
+        lexer = self.lexer.lexer
+
+        self.tokens(MIB)
+        self.lexer.reset()
+
+        self.assertIs(self.lexer.lexer, lexer)
+
+    def testLineNumbersReset(self):
+        tokens = self.tokens(MIB)
+
+        self.lexer.reset()
+
+        self.assertEqual(self.tokens(MIB), tokens)
+        self.assertEqual(tokens[0][2], 2)
+
+    def testStateReset(self):
+        # unterminated MACRO leaves the lexer in the "macro" state
+        self.tokens("TEST MACRO\n")
+
+        self.assertEqual(self.lexer.lexer.current_state(), "macro")
+
+        self.lexer.reset()
+
+        self.assertEqual(self.lexer.lexer.current_state(), "INITIAL")
+        self.assertEqual(self.lexer.lexer.lexstatestack, [])
+        self.assertEqual(self.tokens("TEST"), [("UPPERCASE_IDENTIFIER", "TEST", 1)])
+
+    def testResetAfterError(self):
+        self.assertRaises(error.PySmiLexerError, self.tokens, "\n\nTEST @")
+
+        self.lexer.reset()
+
+        self.assertEqual(self.tokens("TEST"), [("UPPERCASE_IDENTIFIER", "TEST", 1)])
+
+
+class FastLexerResetTestCase(LexerResetTestCase):
+    def setUp(self):
+        self.lexer = lexerFactory()(engine="fast")
+
+
+class LexerEnginesTestCase(unittest.TestCase):
+    TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+    EDGE_CASES = [
+        "A ::= B\r\nC -- comment -- still comment\rD\n\r\n-- last",
+        "T MACRO ::=\nBEGIN\n TYPE NOTATION ::= value\nEND\nx",
+        "T MACRO ::= BEGIN\n no end",
+        "EXPORTS a, b,\n c;\nD",
+        "EXPORTS a",
+        "T ::= CHOICE {\n a INTEGER,\r\n b OCTET STRING }\nx",
+        "T ::= CHOICE { a",
+        'd "multi\r\nline\rquoted\nstring" e',
+        "'0101'B '1'b '0AF'H 'ff'h '' x",
+        "1 -1 4294967296 -4294967296 18446744073709551616",
+        "0..10 1.3 {a(1)|b(2)} [APPLICATION 1] ::=",
+        "1abc lower-case Upper-Case",
+        "BIT STRING",
+        "OCTET STRING",
+        "trailing- x",
+        "Trailing- x",
+        "x\n\n@ y",
+        "x\n\u00e9",
+        "",
+        " \t\n",
+    ]
+
+    def setUp(self):
+        self.texts = list(self.EDGE_CASES)
+
+        for path in glob.glob(os.path.join(self.TESTS_DIR, "*.py")):
+            with open(path) as f:
+                self.texts.extend(
+                    x
+                    for x in re.findall(r'"""(.*?)"""', f.read(), re.S)
+                    if "DEFINITIONS" in x
+                )
+
+        for path in glob.glob(os.path.join(self.TESTS_DIR, "data", "asn1", "*")):
+            with open(path) as f:
+                text = f.read()
+
+            self.texts.extend((text, text.replace("\n", "\r\n")))
+
+    @staticmethod
+    def tokens(lexerClass, engine, data):
+        lexer = lexerClass(engine=engine).lexer
+
+        lexer.input(data)
+
+        tokens = []
+
+        try:
+            for t in iter(lexer.token, None):
+                tokens.append((t.type, t.value, t.lineno, t.lexpos))
+
+        except (error.PySmiLexerError, lex.LexError) as exc:
+            tokens.append((exc.__class__, str(exc)))
+
+        tokens.append((lexer.current_state(), lexer.lineno))
+
+        return tokens
+
+    def testUnknownEngine(self):
+        self.assertRaises(error.PySmiError, lexerFactory(), engine="none")
+
+    def testSameTokens(self):
+        for lexerClass in (lexerFactory(), lexerFactory(supportSmiV1Keywords=True)):
+            for text in self.texts:
+                self.assertEqual(
+                    self.tokens(lexerClass, "fast", text),
+                    self.tokens(lexerClass, "ply", text),
+                    text[:100],
+                )
+
+    def testSameTrees(self):
+        path = os.path.join(self.TESTS_DIR, "data", "asn1", "MIKROTIK-MIB")
+
+        with open(path) as f:
+            text = f.read()
+
+        parserClass = parserFactory(**smi_v1_relaxed)
+
+        self.assertEqual(
+            parserClass(lexerEngine="fast").parse(text), parserClass().parse(text)
+        )
+
+
+class ParserLexerResetTestCase(unittest.TestCase):
+    def testParsingAfterFailure(self):
+        parser = parserFactory()()
+
+        lexer = parser.lexer.lexer
+
+        self.assertRaises(error.PySmiError, parser.parse, MIB.replace("END", "?"))
+
+        mibTrees = parser.parse(MIB)
+
+        self.assertEqual(mibTrees[0][0], "TEST-MIB")
+        self.assertIs(parser.lexer.lexer, lexer)
+
+    def testSameTreesEachTime(self):
+        parser = parserFactory()()
+
+        self.assertEqual(parser.parse(MIB), parser.parse(MIB))
+
+
+suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+
+if __name__ == "__main__":
+    unittest.TextTestRunner(verbosity=2).run(suite)
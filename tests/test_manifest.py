@@ -0,0 +1,87 @@
+#
+# This file is part of pysmi software.
+#
+# Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
+# License: https://www.pysnmp.com/pysmi/license.html
+#
+import os
+import sys
+import tempfile
+
+try:
+    import unittest2 as unittest
+
+except ImportError:
+    import unittest
+
+from pysmi.codegen.symtable import SymtableCodeGen
+from pysmi.manifest import BuildManifest, get_symtable_digest
+from pysmi.parser.dialect import smi_v1_relaxed
+from pysmi.parser.smi import parserFactory
+
+
+class BuildManifestTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tempdir.name, "manifest.json")
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def testSaveAndLoad(self):
+        manifest = BuildManifest(self.path)
+
+        self.assertIsNone(manifest.get_signature("TEST-MIB"))
+
+        manifest.set_signature("TEST-MIB", "abc")
+        manifest.save()
+
+        self.assertEqual(BuildManifest(self.path).get_signature("TEST-MIB"), "abc")
+
+    def testNothingToSave(self):
+        BuildManifest(self.path).save()
+
+        self.assertFalse(os.path.exists(self.path))
+
+    def testBrokenManifestIgnored(self):
+        with open(self.path, "w") as f:
+            f.write("{")
+
+        self.assertIsNone(BuildManifest(self.path).get_signature("TEST-MIB"))
+
+    def testSymtableDigestIgnoresRowsOrder(self):
+        symtable = {"_symtable_rows": ["aEntry", "bEntry"], "x": {"type": "y"}}
+
+        self.assertEqual(
+            get_symtable_digest(symtable),
+            get_symtable_digest(
+                {"x": {"type": "y"}, "_symtable_rows": ["bEntry", "aEntry"]}
+            ),
+        )
+
+    def testSymtableDigest(self):
+        parser = parserFactory(**smi_v1_relaxed)()
+
+        mibInfo, symtable = SymtableCodeGen().gen_code(
+            parser.parse(
+                """
+THIRD-MIB DEFINITIONS ::= BEGIN
+
+thirdRoot OBJECT IDENTIFIER ::= { 1 3 6 1 4 1 9999 }
+
+END
+"""
+            )[0],
+            {},
+        )
+
+        self.assertEqual(
+            get_symtable_digest(symtable), get_symtable_digest(dict(symtable))
+        )
+        self.assertNotEqual(get_symtable_digest(symtable), get_symtable_digest({}))
+
+
+suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+
+if __name__ == "__main__":
+    unittest.TextTestRunner(verbosity=2).run(suite)
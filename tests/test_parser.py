@@ -0,0 +1,218 @@
+#
+# This file is part of pysmi software.
+#
+# Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
+# License: https://www.pysnmp.com/pysmi/license.html
+#
+import glob
+import os
+import re
+import sys
+import threading
+
+try:
+    import unittest2 as unittest
+
+except ImportError:
+    import unittest
+
+from pysmi import error
+from pysmi.lexer.smi import lexerFactory
+from pysmi.parser import dialect
+from pysmi.parser.dialect import smi_v1, smi_v1_relaxed, smi_v2
+from pysmi.parser.smi import get_parser, parserFactory, relaxedGrammar
+
+
+class ParserFactoryTestCase(unittest.TestCase):
+    def testSameClass(self):
+        self.assertIs(parserFactory(**smi_v1), parserFactory(**smi_v1))
+
+    def testNormalizedOptions(self):
+        self.assertIs(
+            parserFactory(supportIndex=True, supportSmiV1Keywords=True),
+            parserFactory(supportSmiV1Keywords=True, supportIndex=True, noCells=False),
+        )
+        self.assertIs(parserFactory(noCells=False), parserFactory(**smi_v2))
+
+    def testDifferentClasses(self):
+        self.assertIsNot(parserFactory(**smi_v1), parserFactory(**smi_v1_relaxed))
+        self.assertEqual(
+            parserFactory(**smi_v1).grammarOptions,
+            ("supportIndex", "supportSmiV1Keywords"),
+        )
+
+    def testUnknownOption(self):
+        self.assertRaises(error.PySmiError, parserFactory, noSuchOption=True)
+        self.assertRaises(error.PySmiError, parserFactory, noSuchOption=True)
+
+    def testLexerClass(self):
+        self.assertIs(lexerFactory(**smi_v1), lexerFactory(**smi_v1_relaxed))
+        self.assertIsNot(lexerFactory(**smi_v2), lexerFactory(**smi_v1))
+        self.assertIs(parserFactory(**smi_v1).defaultLexer, lexerFactory(**smi_v1))
+
+
+class SharedParserTestCase(unittest.TestCase):
+    def testSameParser(self):
+        parser = get_parser(**smi_v1_relaxed)
+
+        self.assertIs(get_parser(**smi_v1_relaxed), parser)
+        self.assertIsInstance(parser, parserFactory(**smi_v1_relaxed))
+
+    def testDialects(self):
+        self.assertIsNot(get_parser(**smi_v2), get_parser(**smi_v1))
+        self.assertIs(get_parser(), get_parser(**smi_v2))
+
+    def testThreads(self):
+        parsers = []
+
+        threads = [
+            threading.Thread(target=lambda: parsers.append(get_parser(**smi_v1)))
+            for _ in range(4)
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(parsers), 4)
+        self.assertTrue(all(x is get_parser(**smi_v1) for x in parsers))
+
+    def testParse(self):
+        mibTrees = get_parser(**smi_v2).parse(
+            """
+            TEST-MIB DEFINITIONS ::= BEGIN
+            END
+            """
+        )
+
+        self.assertEqual(mibTrees[0][0], "TEST-MIB")
+
+
+class ParserEnginesTestCase(unittest.TestCase):
+    TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+    # every variant of a test MIB is made by altering one of that many tokens
+    MUTATIONS = 5
+
+    def setUp(self):
+        self.texts = []
+
+        for path in glob.glob(os.path.join(self.TESTS_DIR, "*.py")):
+            with open(path) as f:
+                self.texts.extend(
+                    x
+                    for x in re.findall(r'"""(.*?)"""', f.read(), re.S)
+                    if "DEFINITIONS" in x
+                )
+
+        self.variants = []
+
+        for text in self.texts:
+            tokens = list(re.finditer(r'"[^"]*"|\S+', text))
+
+            for token in tokens[:: max(1, len(tokens) // self.MUTATIONS)]:
+                start, end = token.span()
+
+                self.variants.extend(
+                    (
+                        text[:start],
+                        text[:start] + text[end:],
+                        text[:end] + " " + text[start:],
+                        text[:end] + " , " + text[end:],
+                    )
+                )
+
+        for path in glob.glob(os.path.join(self.TESTS_DIR, "data", "asn1", "*")):
+            with open(path) as f:
+                self.texts.append(f.read())
+
+    @staticmethod
+    def parse(parser, data):
+        try:
+            return parser.parse(data)
+
+        except error.PySmiError as exc:
+            return exc.__class__, str(exc)
+
+    def assertSameTrees(self, parserClass, texts):
+        plyParser = parserClass()
+        descentParser = parserClass(engine="descent")
+
+        for text in texts:
+            self.assertEqual(
+                self.parse(descentParser, text),
+                self.parse(plyParser, text),
+                text[:100],
+            )
+
+    def testUnknownEngine(self):
+        self.assertRaises(error.PySmiError, parserFactory(), engine="none")
+
+    def testUnsupportedStartSymbol(self):
+        self.assertRaises(
+            error.PySmiError,
+            parserFactory(),
+            startSym="objectIdentifier",
+            engine="descent",
+        )
+
+    def testDialects(self):
+        for name in ("smi_v2", "smi_v1", "smi_v1_relaxed"):
+            parserClass = parserFactory(**getattr(dialect, name))
+
+            self.assertSameTrees(parserClass, self.texts + self.variants)
+
+    def testRelaxations(self):
+        for option in relaxedGrammar:
+            options = {option: True}
+
+            # NetworkAddress type of SMIv1 indices is a SMIv1 keyword
+            if option == "supportIndex":
+                options["supportSmiV1Keywords"] = True
+
+            parserClass = parserFactory(**options)
+
+            self.assertSameTrees(parserClass, self.texts)
+
+    def testErrors(self):
+        parser = parserFactory()(engine="descent")
+
+        self.assertEqual(parser.parse(""), [])
+        self.assertEqual(parser.parse("TEST-MIB DEFINITIONS ::= BEGIN"), [])
+
+        try:
+            parser.parse("TEST-MIB DEFINITIONS ::= BEGIN\n x END")
+
+        except error.PySmiParserError as exc:
+            self.assertEqual(exc.lineno, 2)
+
+        else:
+            self.fail("bad grammar not detected")
+
+    def testThreads(self):
+        parser = parserFactory(**smi_v1_relaxed)(engine="descent")
+
+        mibTrees = []
+
+        threads = [
+            threading.Thread(
+                target=lambda: mibTrees.append(parser.parse(self.texts[-1]))
+            )
+            for _ in range(4)
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(mibTrees, [parser.parse(self.texts[-1])] * 4)
+
+
+suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+
+if __name__ == "__main__":
+    unittest.TextTestRunner(verbosity=2).run(suite)
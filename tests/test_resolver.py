@@ -0,0 +1,217 @@
+#
+# This file is part of pysmi software.
+#
+# Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
+# License: https://www.pysnmp.com/pysmi/license.html
+#
+import asyncio
+import os
+import sys
+import tempfile
+
+try:
+    import unittest2 as unittest
+
+except ImportError:
+    import unittest
+
+from pysmi import error
+from pysmi.cache import FileCache, MemoryCache
+from pysmi.mibinfo import MibInfo
+from pysmi.reader.base import AbstractReader
+from pysmi.reader.httpclient import HttpReader
+from pysmi.resolver import MibResolver
+from requests import ConnectionError
+
+
+class DictReader(AbstractReader):
+    def __init__(self, files):
+        self.files = files
+        self.tried = []
+
+    def __str__(self):
+        return f"{self.__class__.__name__}{{}}"
+
+    def get_data(self, mibname, **options):
+        for mibalias, mibfile in self.get_mib_variants(mibname, **options):
+            self.tried.append(mibfile)
+
+            if mibfile in self.files:
+                return (
+                    MibInfo(path=mibfile, file=mibfile, name=mibalias),
+                    self.files[mibfile],
+                )
+
+        raise error.PySmiReaderFileNotFoundError(
+            f"source MIB {mibname} not found", reader=self
+        )
+
+
+class MibResolverTestCase(unittest.TestCase):
+    def setUp(self):
+        self.reader = DictReader({"test-mib.my": "TEST-MIB text"})
+        self.resolver = MibResolver(MemoryCache())
+
+    def testHitRecorded(self):
+        fileInfo, fileData = self.resolver.get_data(self.reader, "TEST-MIB")
+
+        self.assertEqual(fileData, "TEST-MIB text")
+        self.assertGreater(len(self.reader.tried), 1)
+
+        del self.reader.tried[:]
+
+        fileInfo, fileData = self.resolver.get_data(self.reader, "TEST-MIB")
+
+        self.assertEqual(fileData, "TEST-MIB text")
+        self.assertEqual(fileInfo.name, "test-mib")
+        self.assertEqual(self.reader.tried, ["test-mib.my"])
+
+    def testStaleHitDropped(self):
+        self.resolver.get_data(self.reader, "TEST-MIB")
+
+        self.reader.files = {"TEST-MIB.txt": "new TEST-MIB text"}
+
+        fileInfo, fileData = self.resolver.get_data(self.reader, "TEST-MIB")
+
+        self.assertEqual(fileData, "new TEST-MIB text")
+
+        del self.reader.tried[:]
+
+        self.resolver.get_data(self.reader, "TEST-MIB")
+
+        self.assertEqual(self.reader.tried, ["TEST-MIB.txt"])
+
+    def testMissRecorded(self):
+        self.assertRaises(
+            error.PySmiReaderFileNotFoundError,
+            self.resolver.get_data,
+            self.reader,
+            "OTHER-MIB",
+        )
+
+        del self.reader.tried[:]
+
+        self.assertRaises(
+            error.PySmiReaderFileNotFoundError,
+            self.resolver.get_data,
+            self.reader,
+            "OTHER-MIB",
+        )
+
+        self.assertEqual(self.reader.tried, [])
+
+    def testMissExpires(self):
+        resolver = MibResolver(MemoryCache(), missTtl=0)
+
+        self.assertRaises(
+            error.PySmiReaderFileNotFoundError,
+            resolver.get_data,
+            self.reader,
+            "OTHER-MIB",
+        )
+
+        self.reader.files["OTHER-MIB"] = "OTHER-MIB text"
+
+        fileInfo, fileData = resolver.get_data(self.reader, "OTHER-MIB")
+
+        self.assertEqual(fileData, "OTHER-MIB text")
+
+    def testMissNotRecorded(self):
+        with tempfile.TemporaryDirectory() as path:
+            resolver = MibResolver(FileCache(path), missTtl=0)
+
+            self.assertRaises(
+                error.PySmiReaderFileNotFoundError,
+                resolver.get_data,
+                self.reader,
+                "OTHER-MIB",
+            )
+
+            self.assertEqual(os.listdir(path), [])
+
+    def testAsync(self):
+        asyncio.run(self.resolver.get_data_async(self.reader, "TEST-MIB"))
+
+        del self.reader.tried[:]
+
+        fileInfo, fileData = asyncio.run(
+            self.resolver.get_data_async(self.reader, "TEST-MIB")
+        )
+
+        self.assertEqual(fileData, "TEST-MIB text")
+        self.assertEqual(self.reader.tried, ["test-mib.my"])
+
+    def testPersistent(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            MibResolver(FileCache(tempdir)).get_data(self.reader, "TEST-MIB")
+
+            del self.reader.tried[:]
+
+            MibResolver(FileCache(tempdir)).get_data(self.reader, "TEST-MIB")
+
+            self.assertEqual(self.reader.tried, ["test-mib.my"])
+
+
+class Response:
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+
+class Session:
+    def __init__(self, outcome):
+        self.outcome = outcome
+        self.urls = []
+
+    def get(self, url, headers):
+        self.urls.append(url)
+
+        if isinstance(self.outcome, Exception):
+            raise self.outcome
+
+        return Response(self.outcome)
+
+
+class HttpMibResolverTestCase(unittest.TestCase):
+    def setUp(self):
+        self.reader = HttpReader("https://mibs.pysnmp.com/asn1/@mib@")
+        self.resolver = MibResolver(MemoryCache())
+
+    def lookup(self, outcome):
+        self.reader.session = Session(outcome)
+
+        self.assertRaises(
+            error.PySmiReaderFileNotFoundError,
+            self.resolver.get_data,
+            self.reader,
+            "TEST-MIB",
+        )
+
+        return self.reader.session.urls
+
+    def testConnectionErrorNotRecorded(self):
+        self.lookup(ConnectionError("no route to host"))
+
+        self.assertTrue(self.lookup(404))
+
+    def testServerErrorNotRecorded(self):
+        self.lookup(503)
+
+        self.assertTrue(self.lookup(404))
+
+    def testNotFoundRecorded(self):
+        self.lookup(404)
+
+        self.assertFalse(self.lookup(404))
+
+    def testUnavailable(self):
+        self.reader.session = Session(ConnectionError("no route to host"))
+
+        self.assertRaises(
+            error.PySmiReaderUnavailableError, self.reader.get_data, "TEST-MIB"
+        )
+
+
+suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+
+if __name__ == "__main__":
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,179 @@
+#
+# This file is part of pysmi software.
+#
+# Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
+# License: https://www.pysnmp.com/pysmi/license.html
+#
+import os
+import socket
+import sys
+import tempfile
+import threading
+
+try:
+    import unittest2 as unittest
+
+except ImportError:
+    import unittest
+
+from pysmi import error
+from pysmi.codegen import JsonCodeGen
+from pysmi.compiler import MibCompiler
+from pysmi.parser.dialect import smi_v1_relaxed
+from pysmi.parser.smi import parserFactory
+from pysmi.reader import CallbackReader
+from pysmi.searcher import StubSearcher
+from pysmi.server import MibCompilerClient, MibCompilerServer
+from pysmi.writer import CallbackWriter
+
+
+MIBS = {
+    "SNMPv2-SMI": """
+SNMPv2-SMI DEFINITIONS ::= BEGIN
+END
+""",
+    "SNMPv2-TC": """
+SNMPv2-TC DEFINITIONS ::= BEGIN
+END
+""",
+    "SNMPv2-CONF": """
+SNMPv2-CONF DEFINITIONS ::= BEGIN
+END
+""",
+    "TEST-MIB": """
+TEST-MIB DEFINITIONS ::= BEGIN
+IMPORTS
+  Integer32
+    FROM SNMPv2-SMI;
+
+testRoot OBJECT IDENTIFIER ::= { 1 3 6 1 4 1 9999 }
+
+END
+""",
+    "BROKEN-MIB": """
+BROKEN-MIB DEFINITIONS ::= BEGIN
+
+brokenRoot OBJECT IDENTIFIER ::=
+END
+""",
+}
+
+
+@unittest.skipUnless(hasattr(socket, "AF_UNIX"), "UNIX sockets required")
+class MibCompilerServerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tempdir.name, "socket")
+        self.parsed = []
+        self.written = {}
+
+        parsed = self.parsed
+
+        class Parser(parserFactory(**smi_v1_relaxed)):
+            def parse(self, data, **kwargs):
+                mibTrees = super().parse(data, **kwargs)
+                parsed.extend(x[0] for x in mibTrees)
+                return mibTrees
+
+        self.mibCompiler = mibCompiler = MibCompiler(
+            Parser(),
+            JsonCodeGen(),
+            CallbackWriter(lambda m, d, c: self.written.__setitem__(m, d)),
+        )
+
+        mibCompiler.add_sources(CallbackReader(lambda m, c: MIBS.get(m)))
+        mibCompiler.add_searchers(StubSearcher(*JsonCodeGen.baseMibs))
+
+        self.server = MibCompilerServer(self.path, mibCompiler)
+
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.start()
+
+        self.client = MibCompilerClient(self.path)
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.thread.join()
+        self.server.server_close()
+        self.tempdir.cleanup()
+
+    def testCompile(self):
+        processed = self.client.compile("TEST-MIB")
+
+        self.assertEqual(processed["TEST-MIB"], "compiled")
+        self.assertEqual(processed["TEST-MIB"].alias, "TEST-MIB")
+        self.assertEqual(processed["SNMPv2-SMI"], "untouched")
+        self.assertIn("TEST-MIB", self.written)
+
+    def testBaseMibsParsedOnce(self):
+        self.client.compile("TEST-MIB")
+
+        self.assertIn("SNMPv2-SMI", self.parsed)
+
+        del self.parsed[:]
+
+        processed = self.client.compile("TEST-MIB")
+
+        self.assertEqual(processed["TEST-MIB"], "compiled")
+        self.assertEqual(self.parsed, ["TEST-MIB"])
+
+    def testCompileOptions(self):
+        processed = self.client.compile("TEST-MIB", writeMibs=False)
+
+        self.assertEqual(processed["TEST-MIB"], "compiled")
+        self.assertNotIn("TEST-MIB", self.written)
+
+    def testFailure(self):
+        processed = self.client.compile("TEST-MIB", "BROKEN-MIB")
+
+        self.assertEqual(processed["BROKEN-MIB"], "failed")
+        self.assertIsInstance(processed["BROKEN-MIB"].error, error.PySmiError)
+        self.assertIn("BROKEN-MIB", str(processed["BROKEN-MIB"].error))
+        self.assertEqual(processed["TEST-MIB"], "unprocessed")
+
+    def testMalformedOption(self):
+        try:
+            self.client.compile("TEST-MIB", jobs="x")
+
+        except error.PySmiError as exc:
+            self.assertIn("request failure", str(exc))
+
+        else:
+            self.fail("malformed option not reported")
+
+        # the server keeps serving
+        self.assertEqual(self.client.compile("TEST-MIB")["TEST-MIB"], "compiled")
+
+    def testMalformedRequest(self):
+        for mibnames, sources in (((1,), ()), (("TEST-MIB",), ({},))):
+            try:
+                self.client.compile(*mibnames, sources=sources)
+
+            except error.PySmiError as exc:
+                self.assertIn("malformed request", str(exc))
+
+            else:
+                self.fail("malformed request not reported")
+
+        responses = list(
+            self.server.serve_request(dict(mibs=["TEST-MIB"], options=["noDeps"]))
+        )
+
+        self.assertEqual(len(responses), 1)
+        self.assertIn("malformed request", responses[0]["error"])
+
+    def testServerAlreadyListening(self):
+        self.assertRaises(
+            error.PySmiError, MibCompilerServer, self.path, self.mibCompiler
+        )
+
+    def testNoServer(self):
+        client = MibCompilerClient(os.path.join(self.tempdir.name, "none"))
+
+        self.assertRaises(error.PySmiError, client.compile, "TEST-MIB")
+
+
+suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+
+if __name__ == "__main__":
+    unittest.TextTestRunner(verbosity=2).run(suite)
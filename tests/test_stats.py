@@ -0,0 +1,192 @@
+#
+# This file is part of pysmi software.
+#
+# Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
+# License: https://www.pysnmp.com/pysmi/license.html
+#
+import pickle
+import sys
+import threading
+
+try:
+    import unittest2 as unittest
+
+except ImportError:
+    import unittest
+
+from pysmi.observer import AbstractObserver
+from pysmi.stats import CompileStats
+
+
+class Observer(AbstractObserver):
+    def __init__(self):
+        self.calls = []
+
+    def phase_started(self, event):
+        self.calls.append(("started", event.phase, event.mibname))
+
+    def phase_finished(self, event):
+        self.calls.append(("finished", event.phase, event.mibname, event.size))
+
+
+class CompileStatsTestCase(unittest.TestCase):
+    def testTimer(self):
+        stats = CompileStats()
+
+        with stats.timer("parse", "TEST-MIB"):
+            sum(range(1000))
+
+        with stats.timer("parse"):
+            pass
+
+        self.assertEqual(stats.phases["parse"].calls, 2)
+        self.assertGreater(stats.phases["parse"].wallTime, 0)
+        self.assertEqual(stats.mibs["TEST-MIB"]["parse"].calls, 1)
+        self.assertEqual(list(stats.get_mib_stats("TEST-MIB")), ["parse"])
+        self.assertEqual(stats.get_mib_stats("OTHER-MIB"), {})
+
+    def testTimerOnFailure(self):
+        stats = CompileStats()
+
+        try:
+            with stats.timer("read", "TEST-MIB"):
+                raise ValueError()
+
+        except ValueError:
+            pass
+
+        self.assertEqual(stats.phases["read"].calls, 1)
+
+    def testUpdate(self):
+        stats = CompileStats()
+        stats.add("codegen", 1.0, 0.5, "TEST-MIB")
+        stats.count("sourceProbes", 2)
+
+        otherStats = CompileStats()
+        otherStats.add("codegen", 2.0, 1.5, "TEST-MIB")
+        otherStats.add("write", 1.0, 0.0)
+        otherStats.count("sourceProbes")
+
+        stats.update(otherStats)
+
+        self.assertEqual(stats.phases["codegen"].wallTime, 3.0)
+        self.assertEqual(stats.phases["codegen"].calls, 2)
+        self.assertEqual(stats.mibs["TEST-MIB"]["codegen"].cpuTime, 2.0)
+        self.assertEqual(stats.phases["write"].calls, 1)
+        self.assertEqual(stats.counters["sourceProbes"], 3)
+
+    def testPickle(self):
+        stats = CompileStats()
+        stats.add("parse", 1.0, 1.0, "TEST-MIB")
+        stats.count("searcherHits")
+
+        stats = pickle.loads(pickle.dumps(stats))
+
+        self.assertEqual(stats.mibs["TEST-MIB"]["parse"].wallTime, 1.0)
+        self.assertEqual(stats.counters["searcherHits"], 1)
+
+        # still collecting after unpickling
+        stats.add("parse", 1.0, 1.0, "OTHER-MIB")
+
+        self.assertEqual(stats.phases["parse"].calls, 2)
+
+    def testThreads(self):
+        stats = CompileStats()
+
+        def collect(mibname):
+            for _ in range(1000):
+                stats.add("read", 1.0, 0.0, mibname)
+                stats.count("sourceProbes")
+
+        threads = [
+            threading.Thread(target=collect, args=(f"TEST-MIB-{x % 2}",))
+            for x in range(4)
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(stats.phases["read"].calls, 4000)
+        self.assertEqual(stats.mibs["TEST-MIB-0"]["read"].calls, 2000)
+        self.assertEqual(stats.counters["sourceProbes"], 4000)
+
+    def testObservers(self):
+        observer = Observer()
+
+        stats = CompileStats([observer])
+
+        with stats.timer("read", "TEST-MIB") as event:
+            event.size = 10
+
+        self.assertEqual(
+            observer.calls,
+            [("started", "read", "TEST-MIB"), ("finished", "read", "TEST-MIB", 10)],
+        )
+
+    def testObserversOnFailure(self):
+        events = []
+
+        class FailureObserver(AbstractObserver):
+            def phase_finished(self, event):
+                events.append(event)
+
+        stats = CompileStats([FailureObserver()])
+
+        try:
+            with stats.timer("parse", "TEST-MIB"):
+                raise ValueError()
+
+        except ValueError:
+            pass
+
+        self.assertIsInstance(events[0].error, ValueError)
+        self.assertGreaterEqual(events[0].wallTime, 0)
+
+    def testEventsReplayed(self):
+        workerStats = CompileStats()
+        workerStats.events = []
+
+        with workerStats.timer("codegen", "TEST-MIB") as event:
+            event.size = 5
+
+        workerStats = pickle.loads(pickle.dumps(workerStats))
+
+        observer = Observer()
+
+        stats = CompileStats([observer])
+        stats.update(workerStats)
+
+        self.assertEqual(
+            observer.calls,
+            [
+                ("started", "codegen", "TEST-MIB"),
+                ("finished", "codegen", "TEST-MIB", 5),
+            ],
+        )
+
+    def testUnobserved(self):
+        stats = CompileStats()
+
+        with stats.timer("read", "TEST-MIB") as event:
+            event.size = 10
+
+        self.assertIsNone(stats.events)
+
+    def testSummary(self):
+        stats = CompileStats()
+        stats.add("parse", 1.0, 0.5)
+        stats.count("borrowAttempts")
+
+        self.assertEqual(
+            str(stats),
+            "parse: 1.000s wall, 0.500s CPU, 1 calls\nborrowAttempts: 1",
+        )
+
+
+suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+
+if __name__ == "__main__":
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,99 @@
+#
+# This file is part of pysmi software.
+#
+# Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
+# License: https://www.pysnmp.com/pysmi/license.html
+#
+import os
+import sys
+import tempfile
+
+try:
+    import unittest2 as unittest
+
+except ImportError:
+    import unittest
+
+from pysmi.symtablemap import SymbolTableMap
+
+
+class SymbolTableMapTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.symbolTableMap = SymbolTableMap(1, path=self.tempdir.name)
+
+    def tearDown(self):
+        self.symbolTableMap.close()
+        self.tempdir.cleanup()
+
+    def testSpilledTablesReadBack(self):
+        self.symbolTableMap["A-MIB"] = {"a": {"type": "x"}}
+        self.symbolTableMap["B-MIB"] = {"b": {"type": "y"}}
+
+        self.assertTrue(os.path.exists(os.path.join(self.tempdir.name, "A-MIB.pickle")))
+
+        self.assertEqual(self.symbolTableMap["A-MIB"], {"a": {"type": "x"}})
+        self.assertEqual(self.symbolTableMap["B-MIB"], {"b": {"type": "y"}})
+
+        self.assertEqual(sorted(self.symbolTableMap), ["A-MIB", "B-MIB"])
+        self.assertEqual(len(self.symbolTableMap), 2)
+
+    def testLastUsedTableKept(self):
+        self.symbolTableMap["A-MIB"] = {}
+        self.symbolTableMap["B-MIB"] = {}
+
+        self.assertEqual(
+            str(self.symbolTableMap), "SymbolTableMap{1 in memory, 1 spilled}"
+        )
+
+    def testTablesWithinBudgetKept(self):
+        symbolTableMap = SymbolTableMap(1024 * 1024, path=self.tempdir.name)
+
+        symbolTableMap["A-MIB"] = {}
+        symbolTableMap["B-MIB"] = {}
+
+        self.assertEqual(os.listdir(self.tempdir.name), [])
+        self.assertGreater(symbolTableMap.peakSize, 0)
+
+    def testMissingTable(self):
+        self.assertNotIn("A-MIB", self.symbolTableMap)
+        self.assertRaises(KeyError, self.symbolTableMap.__getitem__, "A-MIB")
+        self.assertIsNone(self.symbolTableMap.get("A-MIB"))
+
+    def testDelete(self):
+        self.symbolTableMap["A-MIB"] = {}
+        self.symbolTableMap["B-MIB"] = {}
+
+        del self.symbolTableMap["A-MIB"]
+        del self.symbolTableMap["B-MIB"]
+
+        self.assertEqual(len(self.symbolTableMap), 0)
+        self.assertEqual(os.listdir(self.tempdir.name), [])
+
+    def testCopy(self):
+        self.symbolTableMap["A-MIB"] = {"a": {}}
+        self.symbolTableMap["B-MIB"] = {"b": {}}
+
+        self.assertEqual(
+            self.symbolTableMap.copy(), {"A-MIB": {"a": {}}, "B-MIB": {"b": {}}}
+        )
+
+    def testTemporaryDirectoryRemoved(self):
+        symbolTableMap = SymbolTableMap(1)
+
+        symbolTableMap["A-MIB"] = {}
+        symbolTableMap["B-MIB"] = {}
+
+        path = symbolTableMap._path
+
+        self.assertTrue(os.path.isdir(path))
+
+        symbolTableMap.close()
+
+        self.assertFalse(os.path.exists(path))
+
+
+suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+
+if __name__ == "__main__":
+    unittest.TextTestRunner(verbosity=2).run(suite)
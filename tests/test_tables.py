@@ -0,0 +1,113 @@
+#
+# This file is part of pysmi software.
+#
+# Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
+# License: https://www.pysnmp.com/pysmi/license.html
+#
+import os
+import shutil
+import sys
+import tempfile
+
+try:
+    import unittest2 as unittest
+
+except ImportError:
+    import unittest
+
+import ply.yacc as yacc
+from pysmi.parser import dialect
+from pysmi.parser import tables
+from pysmi.parser.smi import parserFactory
+
+
+class LRTablesTestCase(unittest.TestCase):
+    def testTablesShipped(self):
+        for name in tables.DIALECTS:
+            parser = parserFactory(**getattr(dialect, name))()
+
+            self.assertIsNotNone(tables.get_table(parser, "mibFile"), name)
+
+    def testTablesUpToDate(self):
+        for name in tables.DIALECTS:
+            parser = parserFactory(**getattr(dialect, name))()
+
+            # no such table module, so tables are built from the grammar
+            built = yacc.yacc(
+                module=parser,
+                start="mibFile",
+                tabmodule="missing_parsetab",
+                write_tables=False,
+                debug=False,
+                errorlog=yacc.NullLogger(),
+            )
+
+            self.assertEqual(parser.parser.action, built.action, name)
+            # states with no gotos are left out of table modules
+            self.assertEqual(
+                parser.parser.goto, {k: v for k, v in built.goto.items() if v}, name
+            )
+            self.assertEqual(
+                [p.name for p in parser.parser.productions],
+                [p.name for p in built.productions],
+                name,
+            )
+
+    def testSignatures(self):
+        signatures = {
+            tables.get_signature(parserFactory(**getattr(dialect, name))(), "mibFile")
+            for name in tables.DIALECTS
+        }
+
+        self.assertEqual(len(signatures), len(tables.DIALECTS))
+
+    def testCustomGrammar(self):
+        parser = parserFactory(commaAtTheEndOfImport=True)()
+
+        self.assertIsNone(tables.get_table(parser, "mibFile"))
+        self.assertEqual(
+            parser.parse(
+                """
+                TEST-MIB DEFINITIONS ::= BEGIN
+                IMPORTS
+                  Integer32,
+                    FROM SNMPv2-SMI;
+                END
+                """
+            )[0][0],
+            "TEST-MIB",
+        )
+
+
+class WriteTablesTestCase(unittest.TestCase):
+    def setUp(self):
+        self.outputdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.outputdir)
+
+    def testWriteTables(self):
+        stale = os.path.join(self.outputdir, tables.TABLE_PREFIX + "0.py")
+
+        with open(stale, "w") as f:
+            f.write("")
+
+        filenames = tables.write_tables(self.outputdir)
+
+        self.assertFalse(os.path.exists(stale))
+        self.assertEqual(
+            sorted(os.path.join(self.outputdir, x) for x in os.listdir(self.outputdir)),
+            sorted(filenames),
+        )
+
+        # written tables are those shipped
+        shipped = os.listdir(os.path.dirname(tables.__file__))
+
+        for filename in filenames:
+            self.assertIn(os.path.basename(filename), shipped)
+
+
+suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+
+if __name__ == "__main__":
+    unittest.TextTestRunner(verbosity=2).run(suite)
@@ -0,0 +1,129 @@
+#
+# This file is part of pysmi software.
+#
+# Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
+# License: https://www.pysnmp.com/pysmi/license.html
+#
+import sys
+import textwrap
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import unittest2 as unittest
+
+except ImportError:
+    import unittest
+
+from pysmi import error
+from pysmi.codegen.jsondoc import JsonCodeGen
+from pysmi.codegen.symtable import SymtableCodeGen
+from pysmi.parser.dialect import smi_v1_relaxed
+from pysmi.parser.smi import parserFactory
+
+
+def make_mib(index):
+    return textwrap.dedent(
+        f"""
+        TEST{index}-MIB DEFINITIONS ::= BEGIN
+        IMPORTS
+          OBJECT-TYPE, Integer32
+            FROM SNMPv2-SMI;
+
+        testRoot OBJECT IDENTIFIER ::= {{ 1 3 6 1 4 1 {index} }}
+
+        testTable OBJECT-TYPE
+            SYNTAX SEQUENCE OF TestEntry
+            ACCESS not-accessible
+            STATUS mandatory
+            ::= {{ testRoot 1 }}
+
+        testEntry OBJECT-TYPE
+            SYNTAX TestEntry
+            ACCESS not-accessible
+            STATUS mandatory
+            INDEX {{ INTEGER }}
+            ::= {{ testTable 1 }}
+
+        TestEntry ::= SEQUENCE {{
+            testValue{index} Integer32
+        }}
+
+        testValue{index} OBJECT-TYPE
+            SYNTAX Integer32
+            ACCESS read-only
+            STATUS mandatory
+            ::= {{ testEntry 1 }}
+
+        END
+        """
+    )
+
+
+class SharedComponentsTestCase(unittest.TestCase):
+    def setUp(self):
+        self.parser = parserFactory(**smi_v1_relaxed)()
+        self.symbolgen = SymtableCodeGen()
+        self.codegen = JsonCodeGen()
+
+        self.mibs = [make_mib(x) for x in range(1, 33)]
+
+    def transform(self, mibText):
+        (mibTree,) = self.parser.parse(mibText)
+
+        mibInfo, symtable = self.symbolgen.gen_code(mibTree, {})
+
+        symbolTable = {
+            mibInfo.name: symtable,
+            "SNMPv2-SMI": {},
+        }
+
+        (mibTree,) = self.parser.parse(mibText)
+
+        self.symbolgen.gen_code(mibTree, {})
+
+        return self.codegen.gen_code(
+            mibTree, symbolTable, comments=["test"], genTexts=True
+        )
+
+    def testConcurrentMatchesSerial(self):
+        serial = [self.transform(x) for x in self.mibs]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            concurrent = list(executor.map(self.transform, self.mibs))
+
+        self.assertEqual(
+            [(x[0].name, x[1]) for x in serial],
+            [(x[0].name, x[1]) for x in concurrent],
+        )
+
+    def testInstanceStateUntouched(self):
+        self.transform(self.mibs[0])
+
+        self.assertEqual(self.codegen.moduleName, ["DUMMY"])
+        self.assertEqual(self.symbolgen.moduleName, ["DUMMY"])
+
+    def testFakeIndicesNumberedPerMib(self):
+        for mibText in self.mibs[:2]:
+            mibInfo, mibData = self.transform(mibText)
+
+            self.assertIn("pysmiFakeCol1", mibData)
+
+    def testParseErrorInThread(self):
+        def parse(mibText):
+            try:
+                self.parser.parse(mibText)
+
+            except error.PySmiParserError as exc:
+                return exc.lineno
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            linenos = list(executor.map(parse, ["\n\nBROKEN ::= {"] * 4))
+
+        # line numbers do not drift from one parse to another
+        self.assertEqual(len(set(linenos)), 1)
+
+
+suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+
+if __name__ == "__main__":
+    unittest.TextTestRunner(verbosity=2).run(suite)
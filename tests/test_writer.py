@@ -0,0 +1,127 @@
+#
+# This file is part of pysmi software.
+#
+# Copyright (c) 2015-2020, Ilya Etingof <etingof@gmail.com>
+# License: https://www.pysnmp.com/pysmi/license.html
+#
+import importlib.util
+import os
+import sys
+import tempfile
+
+try:
+    import unittest2 as unittest
+
+except ImportError:
+    import unittest
+
+from pysmi.journal import get_output_digest
+from pysmi.writer import FileWriter, PyFileWriter
+
+
+class FileWriterTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.writer = FileWriter(self.tempdir.name).set_options(
+            suffix=".json", skipUnchanged=True
+        )
+        self.filename = os.path.join(self.tempdir.name, "TEST-MIB.json")
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def testUnchangedDataNotWritten(self):
+        self.writer.put_data("TEST-MIB", "{}")
+
+        os.utime(self.filename, (0, 0))
+
+        self.writer.put_data("TEST-MIB", "{}")
+
+        self.assertEqual(os.stat(self.filename).st_mtime, 0)
+
+    def testChangedDataWritten(self):
+        self.writer.put_data("TEST-MIB", "{}")
+
+        os.utime(self.filename, (0, 0))
+
+        self.writer.put_data("TEST-MIB", "[]")
+
+        self.assertNotEqual(os.stat(self.filename).st_mtime, 0)
+        self.assertEqual(self.writer.get_data("TEST-MIB"), "[]")
+
+    def testAlwaysWrittenByDefault(self):
+        writer = FileWriter(self.tempdir.name).set_options(suffix=".json")
+
+        writer.put_data("TEST-MIB", "{}")
+
+        os.utime(self.filename, (0, 0))
+
+        writer.put_data("TEST-MIB", "{}")
+
+        self.assertNotEqual(os.stat(self.filename).st_mtime, 0)
+
+    def testDigest(self):
+        self.assertIsNone(self.writer.get_digest("TEST-MIB"))
+
+        self.writer.put_data("TEST-MIB", "{}")
+
+        self.assertEqual(self.writer.get_digest("TEST-MIB"), get_output_digest("{}"))
+
+
+class PyFileWriterTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.writer = PyFileWriter(self.tempdir.name).set_options(
+            pyOptimizationLevel=0, skipUnchanged=True
+        )
+        self.pyfile = os.path.join(self.tempdir.name, "TEST-MIB.py")
+        self.pycfile = importlib.util.cache_from_source(self.pyfile)
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def testUnchangedCodeNotCompiled(self):
+        self.writer.put_data("TEST-MIB", "x = 1\n")
+
+        os.utime(self.pyfile, (0, 0))
+        os.utime(self.pycfile, (0, 0))
+
+        self.writer.put_data("TEST-MIB", "x = 1\n")
+
+        self.assertEqual(os.stat(self.pyfile).st_mtime, 0)
+        self.assertEqual(os.stat(self.pycfile).st_mtime, 0)
+
+    def testChangedCodeCompiled(self):
+        self.writer.put_data("TEST-MIB", "x = 1\n")
+
+        os.utime(self.pycfile, (0, 0))
+
+        self.writer.put_data("TEST-MIB", "x = 2\n")
+
+        self.assertNotEqual(os.stat(self.pycfile).st_mtime, 0)
+
+    def testMissingByteCodeCompiled(self):
+        self.writer.put_data("TEST-MIB", "x = 1\n")
+
+        os.unlink(self.pycfile)
+        os.utime(self.pyfile, (0, 0))
+
+        self.writer.put_data("TEST-MIB", "x = 1\n")
+
+        self.assertEqual(os.stat(self.pyfile).st_mtime, 0)
+        self.assertTrue(os.path.exists(self.pycfile))
+
+    def testDigest(self):
+        self.assertIsNone(self.writer.get_digest("TEST-MIB"))
+
+        self.writer.put_data("TEST-MIB", "x = 1\n")
+
+        self.assertEqual(
+            self.writer.get_digest("TEST-MIB"), get_output_digest("x = 1\n")
+        )
+
+
+suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
+
+if __name__ == "__main__":
+    unittest.TextTestRunner(verbosity=2).run(suite)